@@ -0,0 +1,79 @@
+import streamlit as st
+from informe_Circuitor.almacen import obtener_Datos_Circuitor, marcar_Uso_Dataset_Almacen
+
+# Registro de las mediciones procesadas en la sesión del usuario, compartido por las páginas de informes y de gráficos
+# dinámicos: {huella: {'nombre': str, 'datos': dict}} en 'st.session_state', con la medición activa en 'dataset_Activo'
+
+def registrar_Dataset_Sesion(archivo_Minuto, archivo_Hora) -> str:
+    """
+    Procesa (o abre desde el almacén) el par de archivos subidos y lo agrega al registro de la sesión como medición
+    activa. El mismo par de archivos subido en otra página no se vuelve a procesar.
+
+    Args:
+        archivo_Minuto: Archivo .TXT de Minuto a Minuto subido con 'st.file_uploader'.
+        archivo_Hora: Archivo .TXT de Hora a Hora subido con 'st.file_uploader'.
+
+    Returns:
+        str: Huella de la medición registrada.
+    """
+    registro = st.session_state.setdefault('datasets_Sesion', {})
+    archivos_Registrados = st.session_state.setdefault('archivos_Registrados_Sesion', {})
+
+    # Identificador de la subida, para no volver a calcular la huella del contenido en cada interacción con la página
+    id_Subida = (getattr(archivo_Minuto, 'file_id', archivo_Minuto.name), archivo_Minuto.size, getattr(archivo_Hora, 'file_id', archivo_Hora.name), archivo_Hora.size)
+
+    huella = archivos_Registrados.get(id_Subida)
+
+    if huella is None or huella not in registro:
+        datos_Circuitor = obtener_Datos_Circuitor(archivo_Minuto, archivo_Hora)
+        huella = datos_Circuitor['huella']
+
+        if huella not in registro:
+            registro[huella] = {'nombre': f"{archivo_Minuto.name} | {archivo_Hora.name}", 'datos': datos_Circuitor}
+
+        archivos_Registrados[id_Subida] = huella
+
+        # Solo una subida nueva cambia la medición activa (no las interacciones siguientes con la página)
+        st.session_state['dataset_Activo'] = huella
+
+    return huella
+
+def seleccionar_Dataset_Sesion(clave_Pagina: str) -> dict:
+    """
+    Muestra la carga del par de archivos .TXT y la selección de la medición a utilizar entre las ya procesadas en la
+    sesión (en esta o en otra página), y devuelve los datos de la medición seleccionada.
+
+    Args:
+        clave_Pagina (str): Identificador de la página, para las claves de los componentes de carga.
+
+    Returns:
+        dict | None: Datos de la medición (ver 'obtener_Datos_Circuitor') con su nombre ('nombre'), o None si todavía no
+        hay mediciones en la sesión.
+    """
+    uploaded_file = st.file_uploader("Elige un archivo de .TXT (Minuto a Minuto)", type=["txt"], key=f"{clave_Pagina}_archivo_Minuto")
+    uploaded_file2 = st.file_uploader("Elige un archivo de .TXT (Hora a Hora)", type=["txt"], key=f"{clave_Pagina}_archivo_Hora")
+
+    if uploaded_file and uploaded_file2:
+        registrar_Dataset_Sesion(uploaded_file, uploaded_file2)
+
+    registro = st.session_state.get('datasets_Sesion', {})
+
+    if not registro:
+        return None
+
+    huellas = list(registro.keys())
+    huella_Activa = st.session_state.get('dataset_Activo')
+
+    huella_Seleccionada = st.selectbox(
+        "Medición a utilizar (archivos ya cargados en la sesión):",
+        huellas,
+        index=huellas.index(huella_Activa) if huella_Activa in registro else len(huellas) - 1,
+        format_func=lambda huella: registro[huella]['nombre']
+    )
+
+    st.session_state['dataset_Activo'] = huella_Seleccionada
+
+    # La medición reutilizada de la sesión cuenta como usada: se protege de la liberación de espacio del almacén
+    marcar_Uso_Dataset_Almacen(huella_Seleccionada)
+
+    return {**registro[huella_Seleccionada]['datos'], 'nombre': registro[huella_Seleccionada]['nombre']}
@@ -0,0 +1,196 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from .almacen import obtener_Datos_Circuitor
+from .calculos import calcular_Resultados_Informe
+from .cumplimiento import evaluar_Reglas_Cumplimiento, crear_Matriz_Resumen, REGLAS_CUMPLIMIENTO
+from .grupos import codificar_Grupos, calcular_Estadisticas_Grupos, ESTADISTICOS_GRUPOS
+from .ventanas import crear_Matriz_Resumen_Ventanas, calcular_Estadisticas_Ventanas, FRECUENCIAS_VENTANAS
+from .intervalos import calcular_Intervalos, combinar_Intervalos, calcular_Violaciones_Limites, VIOLACIONES_LIMITES
+from .perfiles import calcular_Perfiles_Carga, calcular_Claves_Tiempo, obtener_Perfiles_Proceso
+from .tarifas import agregar_Energias_Periodos, crear_Tabla_Energias_Periodos, crear_Tabla_Periodos, PERIODOS_TARIFARIOS
+from .penalizaciones import evaluar_Energia_Reactiva, crear_Tabla_Penalizacion_Reactiva, UMBRALES_ENERGIA_REACTIVA
+from .dispersas import extraer_Series_Dispersas, calcular_Medidas_Series_Dispersas, crear_Tabla_Cumplimiento_Series_Dispersas, crear_Tabla_Series_Dispersas, COLUMNAS_SERIES_DISPERSAS
+from .eventos import detectar_Eventos_Medicion, crear_Tabla_Eventos, EVENTOS_MEDICION
+from .factor_Potencia import contar_Signos_FactorPotencia, calcular_Medidas_FactorPotencia_Grupos
+from .graficos import generar_Graficos_Informe, TITULOS_GRAFICOS
+from .documento import crear_Registro_Informe, renderizar_Documento_Word
+from .exportacion import exportar_Excel_Informe, exportar_Tablas_Informe, crear_Zip_Informe, ArchivoZipInforme, FORMATOS_TABLAS, COMPRESIONES_ZIP, ARCHIVOS_ZIP_INFORME
+from .dataset import crear_DataFrame_Dataset, crear_Metadatos_Dataset, exportar_Dataset_Parquet, leer_Metadatos_Dataset
+from .plantillas import obtener_Plantilla_Informe, obtener_Plantilla_Memoria
+
+# Procedimiento de informes del Circuitor, sin dependencias de Streamlit. Cada etapa se puede ejecutar por separado:
+# lectura (lectura.py) -> cálculos (calculos.py) -> gráficos (graficos.py) -> documento y exportación (documento.py,
+# exportacion.py). Las páginas de Streamlit solo muestran los resultados que devuelve 'generar_Informe_Circuitor'.
+
+# Parámetros de entrada del informe (los mismos campos que se ingresan en las páginas de informes)
+PARAMETROS_INFORME: dict = {
+    'tension_Nominal': "Valor Nominal de Tensión",
+    'capacidad_Transformador': "Valor de la Capacidad del Transformador",
+    'ref_Desbalance_Tension': "Valor de Referencia - Desbalance de Tensión",
+    'ref_Desbalance_Corriente': "Valor de Referencia - Desbalance de Corriente",
+    'limite_THDV': "Valor de Límite Máximo de Distorsión Armónica de Tensión",
+    'impedancia_Cortocircuito': "Valor de Impedancia de Cortocircuito (Transformador)",
+    'ref_PLT': "Valor de Referencia - PLT (Flicker)"
+}
+
+def ejecutar_Etapa(funcion, *argumentos) -> tuple:
+    """
+    Ejecuta una etapa del informe y mide su duración (para las etapas que se ejecutan en hilos paralelos).
+
+    Args:
+        funcion (callable): Función de la etapa.
+        *argumentos: Argumentos de la función.
+
+    Returns:
+        tuple: Resultado de la función y duración en segundos.
+    """
+    inicio_Etapa = time.perf_counter()
+    resultado = funcion(*argumentos)
+
+    return resultado, time.perf_counter() - inicio_Etapa
+
+def exportar_Dataset_Informe(df, resultados: dict, parametros: dict, huella_Archivo: str = None) -> bytes:
+    """
+    Genera el dataset procesado de Minuto a Minuto (datos con columnas derivadas y metadatos del informe) en Parquet.
+
+    Args:
+        df (pd.DataFrame | DataFrameMapeado): DataFrame de Minuto a Minuto de la medición.
+        resultados (dict): Resultados del informe calculados con 'calcular_Resultados_Informe'.
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        huella_Archivo (str): Huella de la medición, opcional.
+
+    Returns:
+        bytes: Contenido del archivo Parquet.
+    """
+    df_Dataset = crear_DataFrame_Dataset(df, resultados)
+
+    return exportar_Dataset_Parquet(df_Dataset, crear_Metadatos_Dataset(df_Dataset, resultados, parametros, huella_Archivo))
+
+def generar_Informe_Circuitor(archivo_Minuto, archivo_Hora, parametros: dict, plantilla: str = "Vatia", formatos_Tablas: list = None, incluir_Dataset: bool = False, **opciones_Zip) -> dict:
+    """
+    Genera el informe completo (Word y Excel) a partir del par de archivos .TXT del Circuitor (Minuto a Minuto y Hora a Hora).
+    Es el mismo procedimiento que ejecutan las páginas de informes al presionar "Generar Informe Automatizado" y el modo
+    por lotes; no muestra nada en pantalla, solo devuelve los archivos generados y los resultados intermedios.
+
+    Args:
+        archivo_Minuto (file-like): Archivo .TXT de Minuto a Minuto (archivo subido, BytesIO o archivo abierto en modo binario).
+        archivo_Hora (file-like): Archivo .TXT de Hora a Hora (archivo subido, BytesIO o archivo abierto en modo binario).
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        plantilla (str): Nombre de la plantilla de Word ('Vatia' o 'GIGA').
+        formatos_Tablas (list): Formatos adicionales en los que se exportan las tablas del Excel ('csv' y/o 'parquet'), opcional.
+        incluir_Dataset (bool): Si es True, también se genera el dataset procesado de Minuto a Minuto en un archivo Parquet.
+        **opciones_Zip: 'destino_Zip', 'compresion_Zip' y 'nivel_Compresion_Zip' (ver 'generar_Informe_Datos'), opcionales.
+
+    Returns:
+        dict: Resultado del informe (ver 'generar_Informe_Datos'), con la duración de la lectura en 'tiempos'.
+    """
+    # La plantilla se carga primero para detectar una plantilla no disponible antes de leer los archivos
+    obtener_Plantilla_Memoria(plantilla)
+
+    # Lectura de los archivos y pirámide de resoluciones (5min / 15min / 1h / 1D) de todas las columnas numéricas; si el
+    # par de archivos ya se procesó antes, se abre desde el almacén local de datasets
+    inicio_Etapa = time.perf_counter()
+    datos_Circuitor = obtener_Datos_Circuitor(archivo_Minuto, archivo_Hora)
+    tiempo_Lectura = time.perf_counter() - inicio_Etapa
+
+    resultado_Informe = generar_Informe_Datos(datos_Circuitor, parametros, plantilla, formatos_Tablas, incluir_Dataset, **opciones_Zip)
+    resultado_Informe['tiempos'] = {'lectura': tiempo_Lectura, **resultado_Informe['tiempos']}
+
+    return resultado_Informe
+
+def generar_Informe_Datos(datos_Circuitor: dict, parametros: dict, plantilla: str = "Vatia", formatos_Tablas: list = None, incluir_Dataset: bool = False, destino_Zip=None, compresion_Zip: str = 'deflate', nivel_Compresion_Zip: int = None) -> dict:
+    """
+    Genera el informe completo (Word y Excel) a partir de una medición ya procesada, por ejemplo la que las páginas
+    toman del registro de mediciones de la sesión, sin volver a leer los archivos .TXT.
+
+    Las tablas en formatos adicionales y el dataset se generan en hilos paralelos mientras se escriben el Word y el
+    Excel. Si se indica 'destino_Zip', todos los archivos se escriben directamente en el ZIP de descarga a medida que se
+    generan (el Word y el Excel sin pasar por una copia completa en memoria) y no se devuelven por separado.
+
+    Args:
+        datos_Circuitor (dict): Datos de la medición, obtenidos con 'obtener_Datos_Circuitor'.
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        plantilla (str): Nombre de la plantilla de Word ('Vatia' o 'GIGA').
+        formatos_Tablas (list): Formatos adicionales en los que se exportan las tablas del Excel ('csv' y/o 'parquet'), opcional.
+        incluir_Dataset (bool): Si es True, también se genera el dataset procesado de Minuto a Minuto en un archivo Parquet.
+        destino_Zip (str | file-like): Ruta o buffer donde se escribe el ZIP con los archivos del informe, opcional.
+        compresion_Zip (str): Método de compresión del ZIP (llaves de 'COMPRESIONES_ZIP').
+        nivel_Compresion_Zip (int): Nivel de compresión del ZIP, opcional.
+
+    Returns:
+        dict: Diccionario con el documento de Word ('word', bytes), el Excel ('excel', bytes), la lista de tablas para
+        la vista previa ('vistas_Previas', lista de tuplas (título, DataFrame)), las imágenes de los gráficos
+        ('graficos', lista de tuplas (título, bytes PNG)), los archivos de las tablas en formatos adicionales ('tablas',
+        diccionario nombre -> bytes), el dataset procesado ('dataset', bytes del Parquet o None) y la duración en
+        segundos de cada etapa ('tiempos'). Con 'destino_Zip', 'word', 'excel' y 'dataset' son None y 'tablas' está vacío.
+    """
+    tiempos: dict = {}
+
+    # Plantilla del Documento de Word (se carga primero para detectar una plantilla no disponible antes de los cálculos)
+    inicio_Etapa = time.perf_counter()
+    doc = obtener_Plantilla_Informe(plantilla)
+    tiempos['plantilla'] = time.perf_counter() - inicio_Etapa
+
+    df, df_Energias, piramide_Medidas = datos_Circuitor['df'], datos_Circuitor['df_Energias'], datos_Circuitor['piramide']
+
+    inicio_Etapa = time.perf_counter()
+    resultados = calcular_Resultados_Informe(df, df_Energias, piramide_Medidas, parametros, datos_Circuitor.get('huella'), datos_Circuitor.get('series_Dispersas'))
+    tiempos['calculos'] = time.perf_counter() - inicio_Etapa
+
+    inicio_Etapa = time.perf_counter()
+    graficos = generar_Graficos_Informe(resultados)
+    tiempos['graficos'] = time.perf_counter() - inicio_Etapa
+
+    # ZIP de descarga en el que se escriben los archivos a medida que se generan, opcional
+    archivo_Zip = ArchivoZipInforme(destino_Zip, compresion_Zip, nivel_Compresion_Zip) if destino_Zip is not None else None
+
+    with ThreadPoolExecutor(max_workers=2) as ejecutor, (archivo_Zip or nullcontext()):
+        # Tablas en formatos adicionales y dataset procesado (opcional), en paralelo con el Word y el Excel
+        futuro_Tablas = ejecutor.submit(ejecutar_Etapa, exportar_Tablas_Informe, resultados['hojas_Excel'], formatos_Tablas or [])
+        futuro_Dataset = ejecutor.submit(ejecutar_Etapa, exportar_Dataset_Informe, df, resultados, parametros, datos_Circuitor['huella']) if incluir_Dataset else None
+
+        inicio_Etapa = time.perf_counter()
+        registro = crear_Registro_Informe(resultados, graficos, parametros, doc)
+
+        with (archivo_Zip.abrir_Miembro(ARCHIVOS_ZIP_INFORME['word']) if archivo_Zip else nullcontext()) as destino_Word:
+            word = renderizar_Documento_Word(doc, registro, destino_Word)
+
+        tiempos['documento'] = time.perf_counter() - inicio_Etapa
+
+        inicio_Etapa = time.perf_counter()
+
+        with (archivo_Zip.abrir_Miembro(ARCHIVOS_ZIP_INFORME['excel']) if archivo_Zip else nullcontext()) as destino_Excel:
+            excel = exportar_Excel_Informe(resultados['hojas_Excel'], destino=destino_Excel)
+
+        tiempos['excel'] = time.perf_counter() - inicio_Etapa
+
+        tablas, tiempos['tablas'] = futuro_Tablas.result()
+        dataset = None
+
+        if futuro_Dataset is not None:
+            dataset, tiempos['dataset'] = futuro_Dataset.result()
+
+        # Los archivos generados en paralelo se agregan al ZIP (y se liberan) apenas terminan el Word y el Excel
+        if archivo_Zip is not None:
+            for nombre_Archivo, contenido in tablas.items():
+                archivo_Zip.agregar(nombre_Archivo, contenido)
+
+            if dataset is not None:
+                archivo_Zip.agregar(ARCHIVOS_ZIP_INFORME['dataset'], dataset)
+
+            tablas, dataset = {}, None
+
+    # Imágenes de los gráficos para mostrarlas en las páginas: líneas de tiempo y luego las barras de energías por día
+    imagenes_Graficos: list = [(titulo, graficos[clave].getvalue()) for clave, titulo in TITULOS_GRAFICOS.items()]
+    imagenes_Graficos += [("Gráficos de Energías", buffer.getvalue()) for graficos_Dia in graficos['Barras_Energias'].values() for buffer in graficos_Dia.values()]
+
+    return {
+        'word': word,
+        'excel': excel,
+        'tablas': tablas,
+        'dataset': dataset,
+        'vistas_Previas': resultados['vistas_Previas'],
+        'graficos': imagenes_Graficos,
+        'tiempos': tiempos
+    }
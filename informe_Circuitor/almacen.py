@@ -0,0 +1,486 @@
+import hashlib
+import json
+import os
+import shutil
+import warnings
+import datetime
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+from .lectura import leer_Archivos_Circuitor
+from .piramide import construir_Piramide_Resolucion, NIVELES_PIRAMIDE
+from .columnas import guardar_Columnas_Mapeadas, DataFrameMapeado
+
+# Almacén local de datasets procesados: una carpeta por par de archivos (Minuto a Minuto y Hora a Hora), identificada
+# por la huella de su contenido, con los DataFrames ya organizados (el de Minuto a Minuto como columnas .npy mapeadas en
+# memoria), la pirámide de resoluciones, el resumen de columnas y las series dispersas
+DIRECTORIO_ALMACEN_DATOS: str = os.environ.get('CIRCUITOR_ALMACEN_DATOS', os.path.join(os.path.expanduser('~'), '.cache', 'circuitor', 'datasets'))
+
+# Espacio máximo del almacén en disco; al superarlo se eliminan los datasets usados hace más tiempo
+CUOTA_ALMACEN_DATOS: int = int(float(os.environ.get('CIRCUITOR_CUOTA_ALMACEN_MB', 2048)) * 1024 * 1024)
+
+# Versión del formato del almacén (los datasets de otra versión se vuelven a procesar)
+VERSION_ALMACEN: int = 3
+
+# Huellas de los datasets abiertos por este proceso: no se eliminan al liberar espacio, porque sus columnas mapeadas y
+# los niveles de su pirámide se leen del disco a medida que las sesiones los usan
+HUELLAS_PROCESO: set = set()
+
+def actualizar_Huella_Archivo(huella, archivo):
+    """
+    Agrega a la huella el contenido de un archivo. Los archivos subidos y los BytesIO se leen con 'getvalue'; los demás
+    archivos binarios se leen por bloques y se devuelven a su posición inicial, para que luego se puedan leer completos.
+
+    Args:
+        huella (hashlib._Hash): Huella que se está calculando.
+        archivo (file-like): Archivo subido, BytesIO o archivo abierto en modo binario.
+    """
+    if hasattr(archivo, 'getvalue'):
+        huella.update(archivo.getvalue())
+        return
+
+    posicion_Inicial = archivo.tell()
+
+    for bloque in iter(lambda: archivo.read(1024 * 1024), b''):
+        huella.update(bloque)
+
+    archivo.seek(posicion_Inicial)
+
+def calcular_Huella_Par_Archivos(archivo_Minuto, archivo_Hora) -> str:
+    """
+    Calcula la huella (hash SHA-256) del contenido del par de archivos del Circuitor, usada como clave del almacén.
+
+    Args:
+        archivo_Minuto (file-like): Archivo .TXT de Minuto a Minuto (archivo subido, BytesIO o archivo abierto en modo binario).
+        archivo_Hora (file-like): Archivo .TXT de Hora a Hora (archivo subido, BytesIO o archivo abierto en modo binario).
+
+    Returns:
+        str: Huella hexadecimal del par de archivos.
+    """
+    huella = hashlib.sha256()
+    actualizar_Huella_Archivo(huella, archivo_Minuto)
+    huella.update(b'\x00')
+    actualizar_Huella_Archivo(huella, archivo_Hora)
+
+    return huella.hexdigest()
+
+def construir_Piramide_Dataset(df, niveles: dict = None) -> dict:
+    """
+    Construye la pirámide de resoluciones de un dataset de Minuto a Minuto con todas sus columnas numéricas.
+
+    Args:
+        df (pd.DataFrame | DataFrameMapeado): DataFrame de Minuto a Minuto, ya organizado.
+        niveles (dict): Niveles a construir (por defecto, 'NIVELES_PIRAMIDE').
+
+    Returns:
+        dict: Pirámide {nivel: DataFrame}, como la de 'construir_Piramide_Resolucion'.
+    """
+    columnas_Numericas = [columna for columna, tipo in df.tipos_Columnas.items() if tipo == 'numero'] if isinstance(df, DataFrameMapeado) else df.select_dtypes(include=['number']).columns.tolist()
+
+    return construir_Piramide_Resolucion(df, 'Fecha/hora', columnas_Numericas, niveles, formato_Fecha='%d/%m/%y %H:%M:%S')
+
+def guardar_Nivel_Piramide(datos_Nivel: pd.DataFrame, ruta_Archivo: str):
+    """
+    Guarda un nivel de la pirámide en un archivo Parquet. Los niveles agregados tienen columnas (columna, estadística)
+    y se guardan con nombres planos 'columna|estadística'.
+
+    Args:
+        datos_Nivel (pd.DataFrame): Datos del nivel.
+        ruta_Archivo (str): Ruta del archivo Parquet.
+    """
+    datos_Guardar = datos_Nivel.copy()
+    if isinstance(datos_Guardar.columns, pd.MultiIndex):
+        datos_Guardar.columns = [f"{columna}|{estadistica}" for columna, estadistica in datos_Guardar.columns]
+    datos_Guardar.to_parquet(ruta_Archivo, compression='zstd')
+
+def crear_Resumen_Columnas(dataFrame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Crea el resumen de las columnas numéricas de un DataFrame (cantidad de valores, mínimo, promedio, percentil 95 y
+    máximo), calculado de una sola vez sobre la matriz de valores.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame con los datos de Minuto a Minuto.
+
+    Returns:
+        pd.DataFrame: Un DataFrame con una fila por columna numérica y las columnas 'Cantidad', 'Min', 'Media', 'Percentil' y 'Max'.
+    """
+    columnas_Numericas = dataFrame.select_dtypes(include=['number']).columns
+    valores = dataFrame[columnas_Numericas].to_numpy(dtype=np.float64)
+
+    if valores.shape[0] == 0:
+        return pd.DataFrame(index=columnas_Numericas, columns=['Cantidad', 'Min', 'Media', 'Percentil', 'Max'], dtype=np.float64)
+
+    # Las columnas sin ningún valor quedan en NaN (sin advertencias)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        return pd.DataFrame({
+            'Cantidad': (~np.isnan(valores)).sum(axis=0),
+            'Min': np.nanmin(valores, axis=0),
+            'Media': np.nanmean(valores, axis=0),
+            'Percentil': np.nanpercentile(valores, 95, axis=0),
+            'Max': np.nanmax(valores, axis=0)
+        }, index=columnas_Numericas)
+
+class PiramideAlmacen(Mapping):
+    """
+    Pirámide de resoluciones guardada en el almacén, que se usa igual que el diccionario {nivel: DataFrame} de
+    'construir_Piramide_Resolucion' pero lee cada nivel desde el disco solo la primera vez que se pide. Así, por
+    ejemplo, el informe solo carga los niveles '15min' y '1D' y nunca el nivel '1min' completo, que no se guarda en el
+    disco sino que se arma desde las columnas mapeadas de Minuto a Minuto. Si el archivo de un nivel agregado ya no
+    está (por ejemplo, porque otro proceso eliminó el dataset al liberar espacio), el nivel se vuelve a construir
+    desde los datos de Minuto a Minuto.
+    """
+
+    def __init__(self, directorio: str, niveles: list, datos_Minuto: DataFrameMapeado = None):
+        self.directorio = directorio
+        self.niveles = list(niveles)
+        self.datos_Minuto = datos_Minuto
+        self.niveles_Cargados = {}
+
+    def __getitem__(self, nivel: str) -> pd.DataFrame:
+        if nivel not in self.niveles:
+            raise KeyError(nivel)
+
+        if nivel not in self.niveles_Cargados and nivel == '1min' and self.datos_Minuto is not None:
+            # El nivel '1min' son los datos de Minuto a Minuto indexados por fecha: se arma desde las columnas mapeadas
+            self.niveles_Cargados[nivel] = construir_Piramide_Dataset(self.datos_Minuto, {})[nivel]
+
+        if nivel not in self.niveles_Cargados:
+            ruta_Nivel = os.path.join(self.directorio, f'piramide_{nivel}.parquet')
+
+            try:
+                datos_Nivel = pd.read_parquet(ruta_Nivel)
+
+                # Los niveles agregados se guardan con nombres planos 'columna|estadística'
+                if nivel != '1min':
+                    datos_Nivel.columns = pd.MultiIndex.from_tuples([tuple(columna.rsplit('|', 1)) for columna in datos_Nivel.columns])
+            except FileNotFoundError:
+                if self.datos_Minuto is None or nivel not in NIVELES_PIRAMIDE:
+                    raise
+
+                datos_Nivel = construir_Piramide_Dataset(self.datos_Minuto, {nivel: NIVELES_PIRAMIDE[nivel]})[nivel]
+
+                # El nivel reconstruido se vuelve a guardar si la carpeta del dataset todavía existe
+                try:
+                    guardar_Nivel_Piramide(datos_Nivel, ruta_Nivel)
+                except OSError:
+                    pass
+
+            self.niveles_Cargados[nivel] = datos_Nivel
+
+        return self.niveles_Cargados[nivel]
+
+    def __iter__(self):
+        return iter(self.niveles)
+
+    def __len__(self) -> int:
+        return len(self.niveles)
+
+def calcular_Tamano_Carpeta(directorio: str) -> int:
+    """
+    Calcula el tamaño en disco de una carpeta, incluyendo sus subcarpetas.
+
+    Args:
+        directorio (str): Ruta de la carpeta.
+
+    Returns:
+        int: Tamaño en bytes.
+    """
+    return sum(os.path.getsize(os.path.join(raiz, archivo)) for raiz, _, archivos in os.walk(directorio) for archivo in archivos)
+
+def obtener_Ruta_Almacen(huella: str) -> str:
+    """
+    Devuelve la carpeta del almacén de un dataset.
+
+    Args:
+        huella (str): Huella del par de archivos, obtenida con 'calcular_Huella_Par_Archivos'.
+
+    Returns:
+        str: Ruta de la carpeta del dataset.
+    """
+    return os.path.join(DIRECTORIO_ALMACEN_DATOS, huella)
+
+def verificar_Dataset_Almacen(ruta_Dataset: str) -> bool:
+    """
+    Verifica si la carpeta de un dataset contiene un dataset utilizable: un 'info.json' legible de la versión actual
+    del almacén y todos los archivos que se abren con 'abrir_Dataset_Almacen'.
+
+    Args:
+        ruta_Dataset (str): Ruta de la carpeta del dataset.
+
+    Returns:
+        bool: True si el dataset es de la versión actual y está completo, False si no existe, es de otra versión, le
+        faltan archivos o no se puede leer.
+    """
+    try:
+        with open(os.path.join(ruta_Dataset, 'info.json'), 'r', encoding='utf-8') as archivo:
+            info = json.load(archivo)
+
+        archivos_Dataset = ['hora.parquet', 'resumen.parquet', 'dispersas.parquet', os.path.join('minuto', 'columnas.json')] + [f'piramide_{nivel}.parquet' for nivel in info['niveles'] if nivel != '1min']
+
+        return info.get('version') == VERSION_ALMACEN and all(os.path.isfile(os.path.join(ruta_Dataset, archivo)) for archivo in archivos_Dataset)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+def reemplazar_Dataset_Almacen(ruta_Temporal: str, ruta_Dataset: str) -> bool:
+    """
+    Mueve la carpeta temporal de un dataset recién escrito a su carpeta definitiva. Si la carpeta definitiva ya existe
+    con un dataset de otra versión o dañado, primero se aparta (se renombra y se elimina), ya que 'os.replace' no
+    reemplaza carpetas que no están vacías.
+
+    Args:
+        ruta_Temporal (str): Carpeta temporal con el dataset completo.
+        ruta_Dataset (str): Carpeta definitiva del dataset.
+
+    Returns:
+        bool: True si la carpeta definitiva quedó con un dataset de la versión actual (el recién escrito o el que otro
+        proceso guardó a la vez), False si no se pudo reemplazar.
+    """
+    if os.path.isdir(ruta_Dataset) and not verificar_Dataset_Almacen(ruta_Dataset):
+        ruta_Apartada = f"{ruta_Dataset}.old-{os.getpid()}"
+
+        try:
+            os.replace(ruta_Dataset, ruta_Apartada)
+        except OSError:
+            # Otro proceso ya apartó o reemplazó la carpeta
+            pass
+
+        shutil.rmtree(ruta_Apartada, ignore_errors=True)
+
+    try:
+        os.replace(ruta_Temporal, ruta_Dataset)
+        return True
+    except OSError:
+        shutil.rmtree(ruta_Temporal, ignore_errors=True)
+
+        # Otro proceso pudo haber guardado el mismo dataset a la vez
+        return verificar_Dataset_Almacen(ruta_Dataset)
+
+def guardar_Dataset_Almacen(huella: str, df: pd.DataFrame, df_Energias: pd.DataFrame, piramide: dict, resumen: pd.DataFrame, series_Dispersas: pd.DataFrame, info: dict = None) -> bool:
+    """
+    Guarda un dataset procesado en el almacén (columnas .npy para los datos de Minuto a Minuto y archivos Parquet para
+    los datos de Hora a Hora, el resumen, las series dispersas y cada nivel agregado de la pirámide; el nivel '1min' no
+    se guarda porque 'PiramideAlmacen' lo arma desde las columnas .npy). Los archivos se
+    escriben en una carpeta temporal que luego se renombra, para no dejar datasets incompletos si el proceso se
+    interrumpe o si dos procesos guardan el mismo dataset a la vez; un dataset anterior de otra versión o dañado se
+    reemplaza. Después de guardar se libera espacio si se superó la cuota.
+
+    Args:
+        huella (str): Huella del par de archivos.
+        df (pd.DataFrame): DataFrame de Minuto a Minuto, ya organizado.
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora, ya organizado.
+        piramide (dict): Pirámide de resoluciones del archivo de Minuto a Minuto.
+        resumen (pd.DataFrame): Resumen de columnas creado con 'crear_Resumen_Columnas'.
+        series_Dispersas (pd.DataFrame): Muestras de las series de baja frecuencia, de 'extraer_Series_Dispersas'.
+        info (dict): Información adicional del dataset (por ejemplo, los nombres de los archivos), opcional.
+
+    Returns:
+        bool: True si el dataset quedó guardado, False si no se pudo escribir en el disco o reemplazar el anterior.
+    """
+    ruta_Dataset = obtener_Ruta_Almacen(huella)
+    ruta_Temporal = f"{ruta_Dataset}.tmp-{os.getpid()}"
+
+    try:
+        os.makedirs(ruta_Temporal, exist_ok=True)
+
+        guardar_Columnas_Mapeadas(df, os.path.join(ruta_Temporal, 'minuto'))
+        df_Energias.to_parquet(os.path.join(ruta_Temporal, 'hora.parquet'), compression='zstd')
+        resumen.to_parquet(os.path.join(ruta_Temporal, 'resumen.parquet'), compression='zstd')
+        series_Dispersas.to_parquet(os.path.join(ruta_Temporal, 'dispersas.parquet'), compression='zstd')
+
+        for nivel, datos_Nivel in piramide.items():
+            if nivel == '1min':
+                continue
+
+            guardar_Nivel_Piramide(datos_Nivel, os.path.join(ruta_Temporal, f'piramide_{nivel}.parquet'))
+
+        with open(os.path.join(ruta_Temporal, 'info.json'), 'w', encoding='utf-8') as archivo:
+            json.dump({
+                **(info or {}),
+                'version': VERSION_ALMACEN,
+                'guardado': datetime.datetime.now().isoformat(timespec='seconds'),
+                'filas': len(df),
+                'niveles': list(piramide.keys())
+            }, archivo, ensure_ascii=False)
+
+        if not reemplazar_Dataset_Almacen(ruta_Temporal, ruta_Dataset):
+            return False
+
+        liberar_Espacio_Almacen(conservar=huella)
+
+        return True
+    except OSError:
+        # Si el disco no permite escribir, el dataset se sigue usando desde la memoria
+        shutil.rmtree(ruta_Temporal, ignore_errors=True)
+        return False
+
+def marcar_Uso_Dataset_Almacen(huella: str) -> bool:
+    """
+    Marca el último uso de un dataset del almacén (la fecha de modificación de su 'info.json', que define el orden de
+    eliminación por antigüedad de uso) y lo protege de la liberación de espacio mientras este proceso siga activo. Se
+    llama cada vez que se usa un dataset, también cuando se reutiliza uno ya abierto en la sesión.
+
+    Args:
+        huella (str): Huella del par de archivos.
+
+    Returns:
+        bool: True si el dataset sigue en el almacén, False si ya no está.
+    """
+    HUELLAS_PROCESO.add(huella)
+
+    try:
+        os.utime(os.path.join(obtener_Ruta_Almacen(huella), 'info.json'))
+        return True
+    except OSError:
+        return False
+
+def abrir_Dataset_Almacen(huella: str) -> dict:
+    """
+    Abre un dataset del almacén y marca su último uso (para el orden de eliminación por antigüedad de uso). Los datos de
+    Minuto a Minuto se abren como 'DataFrameMapeado' y la pirámide como 'PiramideAlmacen', que leen del disco solo las
+    columnas y niveles que se usan.
+
+    Args:
+        huella (str): Huella del par de archivos.
+
+    Returns:
+        dict | None: Diccionario con 'df', 'df_Energias', 'piramide', 'resumen', 'series_Dispersas' e 'info', o None si el dataset no está
+        en el almacén, es de otra versión o no se puede leer.
+    """
+    ruta_Dataset = obtener_Ruta_Almacen(huella)
+    ruta_Info = os.path.join(ruta_Dataset, 'info.json')
+
+    try:
+        with open(ruta_Info, 'r', encoding='utf-8') as archivo:
+            info = json.load(archivo)
+
+        if info.get('version') != VERSION_ALMACEN:
+            return None
+
+        datos_Minuto = DataFrameMapeado(os.path.join(ruta_Dataset, 'minuto'))
+
+        dataset = {
+            'df': datos_Minuto,
+            'df_Energias': pd.read_parquet(os.path.join(ruta_Dataset, 'hora.parquet')),
+            'piramide': PiramideAlmacen(ruta_Dataset, info['niveles'], datos_Minuto),
+            'resumen': pd.read_parquet(os.path.join(ruta_Dataset, 'resumen.parquet')),
+            'series_Dispersas': pd.read_parquet(os.path.join(ruta_Dataset, 'dispersas.parquet')),
+            'info': info
+        }
+
+        marcar_Uso_Dataset_Almacen(huella)
+
+        return dataset
+    except (OSError, ValueError, KeyError):
+        return None
+
+def listar_Datasets_Almacen() -> pd.DataFrame:
+    """
+    Lista los datasets guardados en el almacén, del usado más recientemente al más antiguo.
+
+    Returns:
+        pd.DataFrame: Un DataFrame con la huella, la información guardada, el tamaño en disco (MB) y el último uso de cada dataset.
+    """
+    datasets = []
+
+    if os.path.isdir(DIRECTORIO_ALMACEN_DATOS):
+        for huella in os.listdir(DIRECTORIO_ALMACEN_DATOS):
+            ruta_Dataset = obtener_Ruta_Almacen(huella)
+            ruta_Info = os.path.join(ruta_Dataset, 'info.json')
+
+            if '.tmp-' in huella or '.old-' in huella or not os.path.isfile(ruta_Info):
+                continue
+
+            try:
+                with open(ruta_Info, 'r', encoding='utf-8') as archivo:
+                    info = json.load(archivo)
+
+                tamano = calcular_Tamano_Carpeta(ruta_Dataset)
+                ultimo_Uso = os.path.getmtime(ruta_Info)
+            except (OSError, ValueError):
+                continue
+
+            datasets.append({
+                'huella': huella,
+                **{llave: valor for llave, valor in info.items() if llave != 'niveles'},
+                'tamano_MB': round(tamano / (1024 * 1024), 2),
+                'ultimo_Uso': datetime.datetime.fromtimestamp(ultimo_Uso)
+            })
+
+    if not datasets:
+        return pd.DataFrame(columns=['huella', 'tamano_MB', 'ultimo_Uso'])
+
+    return pd.DataFrame(datasets).sort_values('ultimo_Uso', ascending=False).reset_index(drop=True)
+
+def liberar_Espacio_Almacen(cuota: int = None, conservar: str = None) -> list:
+    """
+    Elimina los datasets usados hace más tiempo hasta que el almacén ocupe como máximo la cuota indicada. Los datasets
+    abiertos por este proceso ('HUELLAS_PROCESO') no se eliminan, ya que las sesiones los siguen leyendo del disco.
+
+    Args:
+        cuota (int): Espacio máximo en bytes (por defecto, 'CUOTA_ALMACEN_DATOS').
+        conservar (str): Huella de un dataset que no se debe eliminar (por ejemplo, el que se acaba de guardar), opcional.
+
+    Returns:
+        list: Huellas de los datasets eliminados.
+    """
+    cuota = CUOTA_ALMACEN_DATOS if cuota is None else cuota
+
+    df_Datasets = listar_Datasets_Almacen()
+    espacio_Usado = df_Datasets['tamano_MB'].sum() * 1024 * 1024
+    eliminados = []
+
+    # Del menos reciente al más reciente
+    for huella in df_Datasets['huella'].iloc[::-1]:
+        if espacio_Usado <= cuota:
+            break
+
+        if huella == conservar or huella in HUELLAS_PROCESO:
+            continue
+
+        espacio_Usado -= df_Datasets.loc[df_Datasets['huella'] == huella, 'tamano_MB'].iloc[0] * 1024 * 1024
+        shutil.rmtree(obtener_Ruta_Almacen(huella), ignore_errors=True)
+        eliminados.append(huella)
+
+    return eliminados
+
+def obtener_Datos_Circuitor(archivo_Minuto, archivo_Hora) -> dict:
+    """
+    Devuelve los datos procesados del par de archivos del Circuitor. Si el par ya se procesó antes (en cualquier página
+    o proceso), se abre desde el almacén sin volver a leer ni organizar los .TXT; si no, se leen los archivos, se
+    construye la pirámide de resoluciones y el resumen de columnas, y se guarda todo en el almacén.
+
+    Args:
+        archivo_Minuto (file-like): Archivo .TXT de Minuto a Minuto (archivo subido, BytesIO o archivo abierto en modo binario).
+        archivo_Hora (file-like): Archivo .TXT de Hora a Hora (archivo subido, BytesIO o archivo abierto en modo binario).
+
+    Returns:
+        dict: Diccionario con la huella del par ('huella'), el DataFrame de Minuto a Minuto ('df'), el de Hora a Hora
+        ('df_Energias'), la pirámide ('piramide'), el resumen de columnas ('resumen'), las series dispersas de baja
+        frecuencia ('series_Dispersas') y el origen de los datos
+        ('origen': 'almacen' o 'archivos').
+    """
+    huella = calcular_Huella_Par_Archivos(archivo_Minuto, archivo_Hora)
+
+    dataset = abrir_Dataset_Almacen(huella)
+
+    if dataset is not None:
+        return {'huella': huella, **{llave: dataset[llave] for llave in ['df', 'df_Energias', 'piramide', 'resumen', 'series_Dispersas']}, 'origen': 'almacen'}
+
+    df, df_Energias, series_Dispersas = leer_Archivos_Circuitor(archivo_Minuto, archivo_Hora)
+    piramide = construir_Piramide_Dataset(df)
+    resumen = crear_Resumen_Columnas(df)
+
+    dataset_Guardado = guardar_Dataset_Almacen(huella, df, df_Energias, piramide, resumen, series_Dispersas, {
+        'archivo_Minuto': getattr(archivo_Minuto, 'name', ''),
+        'archivo_Hora': getattr(archivo_Hora, 'name', '')
+    })
+
+    # Una vez guardado, el dataset se usa desde el almacén (columnas mapeadas) y se liberan los datos leídos en memoria
+    dataset = abrir_Dataset_Almacen(huella) if dataset_Guardado else None
+
+    if dataset is not None:
+        return {'huella': huella, **{llave: dataset[llave] for llave in ['df', 'df_Energias', 'piramide', 'resumen', 'series_Dispersas']}, 'origen': 'archivos'}
+
+    return {'huella': huella, 'df': df, 'df_Energias': df_Energias, 'piramide': piramide, 'resumen': resumen, 'series_Dispersas': series_Dispersas, 'origen': 'archivos'}
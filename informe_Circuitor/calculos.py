@@ -0,0 +1,1855 @@
+import logging
+import numpy as np
+import pandas as pd
+from .piramide import crear_Resumen_Diario_Piramide, calcular_Demanda_Maxima_Piramide
+from .perfiles import obtener_Perfiles_Proceso
+from .tarifas import agregar_Energias_Periodos, crear_Tabla_Energias_Periodos
+from .penalizaciones import evaluar_Energia_Reactiva, crear_Tabla_Penalizacion_Reactiva
+from .cumplimiento import REGLAS_CUMPLIMIENTO, crear_Matriz_Resumen, evaluar_Reglas_Cumplimiento, crear_Observaciones_Informe
+from .ventanas import crear_Matriz_Resumen_Ventanas, crear_Tabla_Cumplimiento_Ventanas
+from .eventos import detectar_Eventos_Medicion, crear_Tabla_Eventos
+from .intervalos import calcular_Violaciones_Limites, crear_Tabla_Minutos_Violacion, calcular_Intervalo_Registro
+from .factor_Potencia import contar_Signos_FactorPotencia, calcular_Medidas_FactorPotencia_Grupos
+from .dispersas import extraer_Series_Dispersas, calcular_Medidas_Series_Dispersas, crear_Tabla_Cumplimiento_Series_Dispersas, crear_Tabla_Series_Dispersas
+
+logger = logging.getLogger(__name__)
+
+def calcular_Valor_Tension_Nominal(valor_Nominal: float):
+
+    """
+    Calcula el valor del Límite Superior e Inferior (+/- 10%) de acuerdo al valor nominal proporcionado.
+
+    Args:
+        valor_Nominal (float): Un número de tipo float que representa el valor nominal.
+
+    Returns:
+        list[float]: Una lista que contiene dos valores de tipo float, representando el límite superior (+10%) y el límite inferior (-10%).
+    """
+    var_Limite_Superior = valor_Nominal+(valor_Nominal*0.10)
+    var_Limite_Inferior = valor_Nominal-(valor_Nominal*0.10)
+
+    return [var_Limite_Inferior, var_Limite_Superior]
+
+def calcular_Valor_Corriente_Nominal(capacidad_Trafo: float, valor_Nominal: float):
+
+    """
+    Realiza el cálculo del valor de corriente nominal recibiendo como parámetros la capacidad del transformador y el valor nominal.
+
+    Args:
+        capacidad_Trafo (float): El número que representa el valor de la capacidad del transformador.
+        valor_Nominal (float): El número que representa el valor nominal del equipo.
+
+    Returns:
+        float: El resultado de la operación realizada con los valores de la capacidad del transformador y el valor nominal.
+    """
+    var_Corriente_Nominal = capacidad_Trafo/(np.sqrt(3)*valor_Nominal)
+
+    return var_Corriente_Nominal
+
+def filtrar_DataFrame_Por_Columnas(listado_Columnas: list, dataFrame: pd.DataFrame):
+
+    """
+    Recibe 2 parámetros, un listado de columnas y un DataFrame, filtrando así el parámetro del dataFrame con el parámetro del listado de Columnas.
+
+    Args:
+        listado_Columnas (list): El listado de columnas que contiene todas las columnas a filtrar.
+        dataFrame (pd.DataFrame): Hace referencia al dataFrame que va a ser filtrado.
+
+    Returns:
+        pd.DataFrame: El resultado de una copia del parámetro dataFrame, filtrado por el listado de las columnas que recibe como parámetro.
+    """
+    data_Set_Filtrado = dataFrame[listado_Columnas].copy()
+
+    return data_Set_Filtrado
+
+def crear_DataFrame_Desbalance_Tension(dataFrame: pd.DataFrame, val_Desb_Ten: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        val_Desb_Ten (float): Es el valor de Referencia del Desbalance de la Tensión.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    lista_Columnas_a_Promediar = ['Tensin L12', 'Tensin L23', 'Tensin L31']
+
+    dataFrameFinalDesbTension = dataFrame.copy()
+
+    dataFrameFinalDesbTension['Fecha/hora'] = dataFrameFinalDesbTension['Fecha/hora'].astype(str)
+    dataFrameFinalDesbTension['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalDesbTension['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalDesbTension['Promedio'] = dataFrameFinalDesbTension[lista_Columnas_a_Promediar].mean(axis=1)
+
+    dataFrameFinalDesbTension['delta_V1'] = abs(dataFrameFinalDesbTension['Promedio'] - dataFrameFinalDesbTension[lista_Columnas_a_Promediar[0]])
+    dataFrameFinalDesbTension['delta_V2'] = abs(dataFrameFinalDesbTension['Promedio'] - dataFrameFinalDesbTension[lista_Columnas_a_Promediar[1]])
+    dataFrameFinalDesbTension['delta_V3'] = abs(dataFrameFinalDesbTension['Promedio'] - dataFrameFinalDesbTension[lista_Columnas_a_Promediar[2]])
+
+    listado_Columnas_a_Comparar = ['delta_V1', 'delta_V2', 'delta_V3']
+
+    dataFrameFinalDesbTension['delta_Mayor'] = dataFrameFinalDesbTension[listado_Columnas_a_Comparar].max(axis=1)
+
+    # Realizar el cálculo: valor_mayor / otra_columna
+    dataFrameFinalDesbTension['Desbalance'] = dataFrameFinalDesbTension['delta_Mayor'] / dataFrameFinalDesbTension['Promedio'] * 100
+
+    dataFrameFinalDesbTension.loc[:,('var_Ref_Desbalance_Tension')] = val_Desb_Ten
+
+    return dataFrameFinalDesbTension
+
+def crear_DataFrame_Desbalance_Corriente(dataFrame: pd.DataFrame, val_Desb_Corr: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        val_Desb_Corr (float): Es el valor de Referencia del Desbalance de Corriente.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    lista_Columnas_a_Promediar = ['Corriente L1', 'Corriente L2', 'Corriente L3']
+
+    dataFrameFinalDesbCorr = dataFrame.copy()
+
+    dataFrameFinalDesbCorr['Fecha/hora'] = dataFrameFinalDesbCorr['Fecha/hora'].astype(str)
+    dataFrameFinalDesbCorr['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalDesbCorr['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalDesbCorr['Promedio'] = dataFrameFinalDesbCorr[lista_Columnas_a_Promediar].mean(axis=1)
+
+    listado_Columnas_a_Comparar = ['Corriente L1', 'Corriente L2', 'Corriente L3']
+
+    dataFrameFinalDesbCorr['max_Corrientes_Medias'] = dataFrameFinalDesbCorr[listado_Columnas_a_Comparar].max(axis=1)
+
+    # Realiza el cálculo: valor_mayor / otra_columna
+    dataFrameFinalDesbCorr['Desbalance'] = (dataFrameFinalDesbCorr['max_Corrientes_Medias'] - dataFrameFinalDesbCorr['Promedio']) / dataFrameFinalDesbCorr['Promedio'] * 100
+
+    dataFrameFinalDesbCorr.loc[:,('var_Ref_Desbalance_Corriente')] = val_Desb_Corr
+
+    return dataFrameFinalDesbCorr
+
+def crear_DataFrame_PQS_Potencias(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalPQS = dataFrame.copy()
+
+    dataFrameFinalPQS['Fecha/hora'] = dataFrameFinalPQS['Fecha/hora'].astype(str)
+    dataFrameFinalPQS['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalPQS['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFinalPQS
+
+def crear_DataFrame_FactPotencia(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalFactPotencia = dataFrame.copy()
+
+    dataFrameFinalFactPotencia['Fecha/hora'] = dataFrameFinalFactPotencia['Fecha/hora'].astype(str)
+    dataFrameFinalFactPotencia['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalFactPotencia['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFinalFactPotencia
+
+def crear_DataFrame_DistTension(dataFrame: pd.DataFrame, val_Dist_Arm_Tension: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        val_Dist_Arm_Tension (float): Es el valor de Referencia de Distorsión Armónica de Tensión.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalDistTension = dataFrame.copy()
+
+    dataFrameFinalDistTension['Fecha/hora'] = dataFrameFinalDistTension['Fecha/hora'].astype(str)
+    dataFrameFinalDistTension['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalDistTension['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalDistTension.loc[:,('var_Ref_Distorsion_Tension')] = val_Dist_Arm_Tension
+
+    return dataFrameFinalDistTension
+
+def crear_DataFrame_Armonicos_DistTension(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalArmonicosDistTension = dataFrame.copy()
+
+    dataFrameFinalArmonicosDistTension['Fecha/hora'] = dataFrameFinalArmonicosDistTension['Fecha/hora'].astype(str)
+    dataFrameFinalArmonicosDistTension['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalArmonicosDistTension['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFinalArmonicosDistTension
+
+def crear_DataFrame_DistCorriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalDistCorriente = dataFrame.copy()
+
+    dataFrameFinalDistCorriente['Fecha/hora'] = dataFrameFinalDistCorriente['Fecha/hora'].astype(str)
+    dataFrameFinalDistCorriente['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalDistCorriente['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFinalDistCorriente
+
+def crear_DataFrame_Armonicos_DistCorriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalArmonicosDistCorriente = dataFrame.copy()
+
+    dataFrameFinalArmonicosDistCorriente['Fecha/hora'] = dataFrameFinalArmonicosDistCorriente['Fecha/hora'].astype(str)
+    dataFrameFinalArmonicosDistCorriente['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalArmonicosDistCorriente['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFinalArmonicosDistCorriente
+
+def crear_DataFrame_Armonicos_CargabilidadTDD(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalArmonicosCargTDD = dataFrame.copy()
+
+    dataFrameFinalArmonicosCargTDD['Fecha/hora'] = dataFrameFinalArmonicosCargTDD['Fecha/hora'].astype(str)
+    dataFrameFinalArmonicosCargTDD['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalArmonicosCargTDD['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    valores_Maximos: dict = {
+    'val_Max_Corr_L1': dataFrameFinalArmonicosCargTDD['Corriente mx. L1'].max(),
+    'val_Max_Corr_L2': dataFrameFinalArmonicosCargTDD['Corriente mx. L2'].max(),
+    'val_Max_Corr_L3': dataFrameFinalArmonicosCargTDD['Corriente mx. L3'].max(),
+    }
+
+    dataFrameFinalArmonicosCargTDD['max_Corriente_L1'] = valores_Maximos.get('val_Max_Corr_L1')
+    dataFrameFinalArmonicosCargTDD['max_Corriente_L2'] = valores_Maximos.get('val_Max_Corr_L2')
+    dataFrameFinalArmonicosCargTDD['max_Corriente_L3'] = valores_Maximos.get('val_Max_Corr_L3')
+
+    dataFrameFinalArmonicosCargTDD['resultado_Division_L1'] = dataFrameFinalArmonicosCargTDD['Corriente mx. L1']/dataFrameFinalArmonicosCargTDD['max_Corriente_L1']
+    dataFrameFinalArmonicosCargTDD['resultado_Division_L2'] = dataFrameFinalArmonicosCargTDD['Corriente mx. L2']/dataFrameFinalArmonicosCargTDD['max_Corriente_L2']
+    dataFrameFinalArmonicosCargTDD['resultado_Division_L3'] = dataFrameFinalArmonicosCargTDD['Corriente mx. L3']/dataFrameFinalArmonicosCargTDD['max_Corriente_L3']
+
+    dataFrameFinalArmonicosCargTDD['resultado_TDD_L1'] = dataFrameFinalArmonicosCargTDD['A THD/d L1']*dataFrameFinalArmonicosCargTDD['resultado_Division_L1']
+    dataFrameFinalArmonicosCargTDD['resultado_TDD_L2'] = dataFrameFinalArmonicosCargTDD['A THD/d L2']*dataFrameFinalArmonicosCargTDD['resultado_Division_L2']
+    dataFrameFinalArmonicosCargTDD['resultado_TDD_L3'] = dataFrameFinalArmonicosCargTDD['A THD/d L3']*dataFrameFinalArmonicosCargTDD['resultado_Division_L3']
+
+    return dataFrameFinalArmonicosCargTDD
+
+def crear_DataFrame_FactorK_Final(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFactorKFinal = dataFrame.copy()
+
+    dataFrameFactorKFinal['Fecha/hora'] = dataFrameFactorKFinal['Fecha/hora'].astype(str)
+    dataFrameFactorKFinal['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFactorKFinal['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    return dataFrameFactorKFinal
+
+def crear_Medidas_DataFrame_Tension(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_Tensiones: list = ['Tensin mn. L12', 'Tensin L12', 'Tensin mx. L12', 'Tensin mn. L23', 'Tensin L23', 'Tensin mx. L23', 'Tensin mn. L31', 'Tensin L31', 'Tensin mx. L31']
+
+    dataFrame[columnas_var_Tabla_Tensiones] = dataFrame[columnas_var_Tabla_Tensiones].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_Tensiones].astype(float)
+
+    #Aplica a cada columna la función del Percentil (MIN, MED y MAX de cada Variable)
+    percentiles_95 = dataFrame[columnas_var_Tabla_Tensiones].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo (MIN, MED y MAX de cada Variable)
+    maximo = dataFrame[columnas_var_Tabla_Tensiones].max()
+
+    #Aplica a cada columna la función del Promedio (MIN, MED y MAX de cada Variable)
+    media = dataFrame[columnas_var_Tabla_Tensiones].mean()
+
+    #Aplica a cada columna la función del Mínimo (MIN, MED y MAX de cada Variable)
+    minimo = dataFrame[columnas_var_Tabla_Tensiones].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones (MIN, MED y MAX de cada Variable)
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_DesbTension(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_DesbTension: list = ['Tensin L12', 'Tensin L23', 'Tensin L31', 'Promedio', 'delta_V1', 'delta_V2', 'delta_V3', 'Desbalance']
+
+    dataFrame[columnas_var_Tabla_DesbTension] = dataFrame[columnas_var_Tabla_DesbTension].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_DesbTension].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_DesbTension].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_DesbTension].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_DesbTension].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_DesbTension].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_Corriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_Corriente: list = ['Corriente mn. L1', 'Corriente L1', 'Corriente mx. L1', 'Corriente mn. L2', 'Corriente L2', 'Corriente mx. L2', 'Corriente mn. L3', 'Corriente L3', 'Corriente mx. L3', 'Corriente de neutro mn.', 'Corriente de neutro', 'Corriente de neutro mx.']
+
+    dataFrame[columnas_var_Tabla_Corriente] = dataFrame[columnas_var_Tabla_Corriente].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_Corriente].astype(float)
+
+    #Aplica a cada columna la función del Percentil (MIN, MED y MAX de cada Variable)
+    percentiles_95 = dataFrame[columnas_var_Tabla_Corriente].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo (MIN, MED y MAX de cada Variable)
+    maximo = dataFrame[columnas_var_Tabla_Corriente].max()
+
+    #Aplica a cada columna la función del Promedio (MIN, MED y MAX de cada Variable)
+    media = dataFrame[columnas_var_Tabla_Corriente].mean()
+
+    #Aplica a cada columna la función del Mínimo (MIN, MED y MAX de cada Variable)
+    minimo = dataFrame[columnas_var_Tabla_Corriente].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones (MIN, MED y MAX de cada Variable)
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_DesbCorriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_DesbCorriente: list = ['Corriente L1', 'Corriente L2', 'Corriente L3', 'Promedio', 'max_Corrientes_Medias', 'Desbalance']
+
+    dataFrame[columnas_var_Tabla_DesbCorriente] = dataFrame[columnas_var_Tabla_DesbCorriente].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_DesbCorriente].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_DesbCorriente].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_DesbCorriente].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_DesbCorriente].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_DesbCorriente].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_PQS(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_PQS: list = ['P.Activa mn. III', 'P.Activa III', 'P.Activa mx. III', 'P.Capacitiva mn. III', 'P.Capacitiva III', 'P.Capacitiva mx. III', 'P.Inductiva mn. III', 'P.Inductiva III', 'P.Inductiva mx. III', 'P.Aparente mn. III', 'P.Aparente III', 'P.Aparente mx. III']
+
+    dataFrame[columnas_var_Tabla_PQS] = dataFrame[columnas_var_Tabla_PQS].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_PQS].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_PQS].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_PQS].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_PQS].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_PQS].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_FactorPotencia(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    #Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_FactPotencia: list = ['F.P. Mn. III -', 'F.P. III -', 'F.P. Mx. III -', 'F.P. Mn. III', 'F.P. III', 'F.P. Mx. III']
+
+    dataFrame[columnas_var_Tabla_FactPotencia] = dataFrame[columnas_var_Tabla_FactPotencia].fillna(abs(0))
+
+    #Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_FactPotencia].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_FactPotencia].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_FactPotencia].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_FactPotencia].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_FactPotencia].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_Distorsion_Tension(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_DistorsionTension: list = ['V THD/d Mx. L1', 'V THD/d Mx. L2', 'V THD/d Mx. L3', 'var_Ref_Distorsion_Tension']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_DistorsionTension] = dataFrame[columnas_var_Tabla_DistorsionTension].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_DistorsionTension].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_DistorsionTension].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_DistorsionTension].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_DistorsionTension].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_DistorsionTension].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_Armonicos_DistTension(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Armónicos de Distorsión de Tensión
+    columnas_var_Tabla_Armonicos_DistorsionTension: list = ['Arm. tensin 3 L1', 'Arm. tensin 5 L1', 'Arm. tensin 7 L1', 'Arm. tensin 9 L1', 'Arm. tensin 11 L1', 'Arm. tensin 13 L1', 'Arm. tensin 15 L1', 'Arm. tensin 3 L2', 'Arm. tensin 5 L2', 'Arm. tensin 7 L2', 'Arm. tensin 9 L2', 'Arm. tensin 11 L2', 'Arm. tensin 13 L2', 'Arm. tensin 15 L2', 'Arm. tensin 3 L3', 'Arm. tensin 5 L3', 'Arm. tensin 7 L3', 'Arm. tensin 9 L3', 'Arm. tensin 11 L3', 'Arm. tensin 13 L3', 'Arm. tensin 15 L3']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension] = dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_Armonicos_DistorsionTension].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_Distorsion_Corriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Distorsión de Corriente
+    columnas_var_Tabla_DistorsionCorriente: list = ['A THD/d L1', 'A THD/d L2', 'A THD/d L3']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_DistorsionCorriente] = dataFrame[columnas_var_Tabla_DistorsionCorriente].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_DistorsionCorriente].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_DistorsionCorriente].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_DistorsionCorriente].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_DistorsionCorriente].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_DistorsionCorriente].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_Armonicos_DistCorriente(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Armónicos de Distorsión de Corriente
+    columnas_var_Tabla_Armonicos_DistorsionCorriente: list = ['Arm. corriente 3 L1', 'Arm. corriente 5 L1', 'Arm. corriente 7 L1', 'Arm. corriente 9 L1', 'Arm. corriente 11 L1', 'Arm. corriente 13 L1', 'Arm. corriente 15 L1', 'Arm. corriente 3 L2', 'Arm. corriente 5 L2', 'Arm. corriente 7 L2', 'Arm. corriente 9 L2', 'Arm. corriente 11 L2', 'Arm. corriente 13 L2', 'Arm. corriente 15 L2', 'Arm. corriente 3 L3', 'Arm. corriente 5 L3', 'Arm. corriente 7 L3', 'Arm. corriente 9 L3', 'Arm. corriente 11 L3', 'Arm. corriente 13 L3', 'Arm. corriente 15 L3']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente] = dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_Armonicos_DistorsionCorriente].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_Medidas_DataFrame_FactorK(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Factor K
+    columnas_var_Tabla_FactorK: list = ['Factor K mn. L1', 'Factor K L1', 'Factor K mx. L1', 'Factor K mn. L2', 'Factor K L2', 'Factor K mx. L2', 'Factor K mn. L3', 'Factor K L3', 'Factor K mx. L3']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_FactorK] = dataFrame[columnas_var_Tabla_FactorK].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_FactorK].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_FactorK].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_FactorK].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_FactorK].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_FactorK].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+
+    return tabla_Con_Medidas_Por_Columna
+
+def calcular_Valor_Corriente_Cortacircuito(corriente_Nominal: float, valor_Impedancia_Cortocircuito: float):
+
+    """
+    Realiza el cálculo del valor de corriente cortacircuito recibiendo como parámetros el valor nominal y el valor de la impedancia cortacircuito.
+
+    Args:
+        corriente_Nominal (float): El número que representa el valor de la corriente nominal del equipo.
+        valor_Impedancia_Cortacircuito (float): El número que representa el valor de la impedancia cortacircuito.
+
+    Returns:
+        float: El resultado de la operación realizada con los valores de el valor nominal y el valor de impedancia cortacircuito.
+    """
+
+    return (corriente_Nominal/(valor_Impedancia_Cortocircuito/100))/1000
+
+def calcular_Valor_ISC_entre_IL(valor_Corriente_Cortacircuito: float, valor_Max_Corr_Max: float):
+
+    """
+    Realiza el cálculo del valor de isc entre il recibiendo como parámetros el valor de corriente cortacircuito y el valor máximo de corrientes máximas.
+
+    Args:
+        valor_Corriente_Cortacircuito (float): El número que representa el valor de corriente cortacircuito.
+        valor_Max_Corr_Max (float): El número que representa el valor máximo de corrientes máximas.
+
+    Returns:
+        float: El resultado de la operación realizada con los valores de el valor de corriente cortacircuito y el valor máximo de corrientes máximas.
+    """
+
+    return (valor_Corriente_Cortacircuito/valor_Max_Corr_Max)*1000
+
+def calcular_Valor_Limite_TDD(valor_ISC_sobre_IL: float):
+
+    """
+    Realiza el cálculo del valor del límite del TDD según el rango en el que cumpla el parámetro.
+
+    Args:
+        valor_ISC_sobre_IL (float): El número que representa el valor de ISC sobre IL.
+
+    Returns:
+        float: El resultado de la operación realizada con el valor_ISC_sobre_IL.
+    """
+    var_ISC: float = valor_ISC_sobre_IL
+
+    if var_ISC < 20:
+
+        var_Limite_TDD: float = 5.0
+
+    elif var_ISC >= 20 and var_ISC < 50:
+
+        var_Limite_TDD: float = 8.0
+
+    elif var_ISC >= 50 and var_ISC < 100:
+
+        var_Limite_TDD: float = 12.0
+
+    elif var_ISC >= 100 and var_ISC < 1000:
+
+        var_Limite_TDD: float = 15.0
+
+    elif var_ISC > 1000:
+
+        var_Limite_TDD: float = 20.0
+
+    return var_Limite_TDD
+
+def calcular_Valores_Limites_Armonicos(value_Limite_TDD: float):
+
+    """
+    Realiza el cálculo de los valores de los Límites de Armonicos según el rango que cumpla el parámetro.
+
+    Args:
+        value_Limite_TDD (float): El número que representa el valor del limite TDD.
+
+    Returns:
+        dict: El resultado de la operación realizada con el valor del Limite TDD determinando los valores de los límites de los armónicos.
+    """
+    var_TDD: float = value_Limite_TDD
+
+    if var_TDD == 5:
+
+        diccionario_Limites_Armonicos: dict = {
+            'ARM_0_10': 4.0,
+            'ARM_11_16': 2.0,
+            'ARM_17_22': 1.5,
+            'ARM_23_34': 0.6,
+            'ARM_35': 0.3
+        }
+
+    elif var_TDD == 8:
+
+        diccionario_Limites_Armonicos: dict = {
+            'ARM_0_10': 7.0,
+            'ARM_11_16': 3.5,
+            'ARM_17_22': 2.5,
+            'ARM_23_34': 1.0,
+            'ARM_35': 0.5
+        }
+
+    elif var_TDD == 12:
+
+        diccionario_Limites_Armonicos: dict = {
+            'ARM_0_10': 10.0,
+            'ARM_11_16': 4.5,
+            'ARM_17_22': 4.0,
+            'ARM_23_34': 1.5,
+            'ARM_35': 0.7
+        }
+
+    elif var_TDD == 15:
+
+        diccionario_Limites_Armonicos: dict = {
+            'ARM_0_10': 12.0,
+            'ARM_11_16': 5.5,
+            'ARM_17_22': 5.0,
+            'ARM_23_34': 2.0,
+            'ARM_35': 1.0
+        }
+
+    elif var_TDD == 20:
+
+        diccionario_Limites_Armonicos: dict = {
+            'ARM_0_10': 15.0,
+            'ARM_11_16': 7.0,
+            'ARM_17_22': 6.0,
+            'ARM_23_34': 2.5,
+            'ARM_35': 1.4
+        }
+
+    return diccionario_Limites_Armonicos
+
+def crear_DataFrame_CargabilidadTDD_Final(dataFrame: pd.DataFrame, val_Lim_CargTDD: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        val_Lim_CargTDD (float): Es el valor de Referencia para el Límite de Cargabilidad TDD.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalArmonicosCargTDDFinal = dataFrame.copy()
+
+    dataFrameFinalArmonicosCargTDDFinal['Fecha/hora'] = dataFrameFinalArmonicosCargTDDFinal['Fecha/hora'].astype(str)
+    dataFrameFinalArmonicosCargTDDFinal['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalArmonicosCargTDDFinal['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalArmonicosCargTDDFinal.loc[:,('var_Ref_Limite_Cargabilidad_TDD')] = val_Lim_CargTDD
+
+    return dataFrameFinalArmonicosCargTDDFinal
+
+def crear_Medidas_DataFrame_CargabilidadTDD(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Cargabilidad de TDD
+    columnas_var_Tabla_CargabilidadTDD: list = ['resultado_TDD_L1', 'resultado_TDD_L2', 'resultado_TDD_L3']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_CargabilidadTDD] = dataFrame[columnas_var_Tabla_CargabilidadTDD].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_CargabilidadTDD].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_CargabilidadTDD].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_CargabilidadTDD].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_CargabilidadTDD].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_CargabilidadTDD].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_DataFrame_Energias(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalEnergias = dataFrame.copy()
+
+    dataFrameFinalEnergias['Fecha/hora'] = dataFrameFinalEnergias['Fecha/hora'].astype(str)
+    dataFrameFinalEnergias['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalEnergias['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalEnergias['KWH'] = 100
+
+    dataFrameFinalEnergias['KARH_IND'] = np.where(
+        (dataFrameFinalEnergias['E.Inductiva T1'] != 0) & (dataFrameFinalEnergias['E.Activa T1'] != 0), 
+        (dataFrameFinalEnergias['E.Inductiva T1'] / dataFrameFinalEnergias['E.Activa T1'] * 100), 
+    0)
+
+    dataFrameFinalEnergias['KVARH_CAP'] = np.where(
+        (dataFrameFinalEnergias['E.Capacitiva T1'] != 0) & (dataFrameFinalEnergias['E.Activa T1'] != 0), 
+        (dataFrameFinalEnergias['E.Capacitiva T1'] / dataFrameFinalEnergias['E.Activa T1'] * 100), 
+    0)
+
+    dataFrameFinalEnergias = dataFrameFinalEnergias.round(3)
+
+    return dataFrameFinalEnergias
+
+def crear_Medidas_DataFrame_Energias(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso con las respectivas mediciones de Percentiles, Máximos, Promedios y Mínimos al listado de columnas correspondiente.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame en su Transpuesta con las respectivas mediciones aplicadas.
+    """
+    # Selecciona las columnas de la siguiente lista, aplicándolo al DataFrame que contiene TODAS las columnas de Tensión
+    columnas_var_Tabla_Energias: list = ['E.Activa T1', 'E.Capacitiva T1', 'E.Inductiva T1', 'KWH', 'KARH_IND', 'KVARH_CAP', 'F.P. III -', 'F.P. III']
+
+    # Filtra por todas las columnas el dataFrame del parámetro y además de eso, rellena los datos vacíos con 0 Absoluto
+    dataFrame[columnas_var_Tabla_Energias] = dataFrame[columnas_var_Tabla_Energias].fillna(abs(0))
+
+    # Convertir dataFrame a tipo Float
+    dataFrame[columnas_var_Tabla_Energias].astype(float)
+
+    #Aplica a cada columna la función del Percentil
+    percentiles_95 = dataFrame[columnas_var_Tabla_Energias].apply(lambda x: np.percentile(x, 95))
+
+    #Aplica a cada columna la función del Máximo
+    maximo = dataFrame[columnas_var_Tabla_Energias].max()
+
+    #Aplica a cada columna la función del Promedio
+    media = dataFrame[columnas_var_Tabla_Energias].mean()
+
+    #Aplica a cada columna la función del Mínimo
+    minimo = dataFrame[columnas_var_Tabla_Energias].min()
+
+    #Crea un DataFrame que contiene los resultados de las operaciones
+    tabla_Con_Medidas_Por_Columna = pd.DataFrame({
+                                    'Percentil' : percentiles_95,
+                                    'Media': media,
+                                    'Min': minimo,
+                                    'Max': maximo})
+
+    #Crea la Transpuesta de ese DataFrame para poder Visualizarlo a Forma de Título y los Datos
+    tabla_Con_Medidas_Por_Columna=tabla_Con_Medidas_Por_Columna.T
+
+    return tabla_Con_Medidas_Por_Columna
+
+def crear_DataFrame_Tension(dataFrame: pd.DataFrame, var_Lim_Inf_Ten: float, val_Nom: float, var_Lim_Sup_Ten: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        var_Lim_Inf_Ten (float): Es el valor del límite inferior de la tensión.
+        var_Nom (float): Es el Valor Nominal.
+        var_Lim_Sup_Ten (float): Es el valor del límite superior de la tensión.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalTension = dataFrame.copy()
+
+    dataFrameFinalTension['Fecha/hora'] = dataFrameFinalTension['Fecha/hora'].astype(str)
+    dataFrameFinalTension['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalTension['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalTension.loc[:,('var_Limite_Inferior_Tension')] = var_Lim_Inf_Ten
+    dataFrameFinalTension.loc[:,('valor_Nominal')] = val_Nom
+    dataFrameFinalTension.loc[:,('var_Limite_Superior_Tension')] = var_Lim_Sup_Ten
+
+    return dataFrameFinalTension
+
+def crear_DataFrame_Corriente(dataFrame: pd.DataFrame, var_Lim_Corr_Nom: float):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso agregando nuevas columnas de los nuevos parámetros que recibe.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+        var_Lim_Corr_Nom (float): Es el valor del límite de corriente nominal.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameFinalCorriente = dataFrame.copy()
+
+    dataFrameFinalCorriente['Fecha/hora'] = dataFrameFinalCorriente['Fecha/hora'].astype(str)
+    dataFrameFinalCorriente['fecha_y_Hora'] = pd.to_datetime(
+        dataFrameFinalCorriente['Fecha/hora'],
+        format='%d/%m/%y %H:%M:%S',
+        errors='coerce'
+    )
+
+    dataFrameFinalCorriente.loc[:,('var_Limite_Corriente_Nominal')] = var_Lim_Corr_Nom
+
+    return dataFrameFinalCorriente
+
+def calcular_Variacion_Tension(lista_Percentiles: list, val_Nom: float):
+    """
+    Realiza la operación: ((valor / divisor) - 100) * 100 para cada elemento de la lista.
+
+    Args:
+        lista_Percentiles (list): Lista de valores numéricos.
+        val_Nom (float): Valor único por el cual se dividirán los elementos de la lista.
+
+    Returns:
+        list: Lista con los resultados de la operación para cada elemento.
+    """
+    if val_Nom == 0:
+        raise ValueError("El divisor no puede ser cero.")
+
+    return [((valor / val_Nom) - 1) * 100 for valor in lista_Percentiles]
+
+def calcular_Valor_Cargabilidad_Disponibilidad(capacidad_Trafo: float, perc_Max_Pot_Apa: float):
+
+    """
+    Crea una lista que contiene los valores de la cargabilidad máxima y la disponibilidad de carga.
+
+    Args:
+        capacidad_Trafo (float): El número que representa la capacidad del transformador.
+        perc_Max_Pot_Apa (float): El número que representa el percentil máximo de la potencia aparente.
+
+    Returns:
+        list[float]: Una lista con dos elementos de tipo float, correspondientes a los valores de la cargabilidad máxima y la disponibilidad de carga.
+    """
+    var_Cargabilidad_Max = perc_Max_Pot_Apa/capacidad_Trafo*100
+    var_Disponibilidad = 100-var_Cargabilidad_Max
+
+    return [var_Cargabilidad_Max, var_Disponibilidad]
+
+def calcular_Resultados_Informe(df: pd.DataFrame, df_Energias: pd.DataFrame, piramide_Medidas: dict, parametros: dict, huella_Archivo: str = None, series_Dispersas: pd.DataFrame = None) -> dict:
+    """
+    Calcula todas las tablas, medidas, percentiles y observaciones del informe a partir de los DataFrames ya organizados.
+
+    Args:
+        df (pd.DataFrame): DataFrame de Minuto a Minuto, organizado con 'organizar_DataFrame_M_a_M'.
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora, organizado con 'organizar_DataFrame_H_a_H'.
+        piramide_Medidas (dict): Pirámide de resoluciones del archivo de Minuto a Minuto.
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        huella_Archivo (str): Huella de la medición, opcional (los perfiles de carga se guardan por huella en el proceso).
+        series_Dispersas (pd.DataFrame): Muestras de las series de baja frecuencia (Plt del Flicker), de
+            'extraer_Series_Dispersas'; si no se proporcionan, el Flicker queda sin datos.
+
+    Returns:
+        dict: Diccionario con los resultados que usan las etapas de gráficos, documento y exportación, incluyendo la
+        lista de tablas para la vista previa ('vistas_Previas') y las tablas del Excel por hoja ('hojas_Excel').
+    """
+    # Valores de entrada del informe
+    var1 = float(parametros['tension_Nominal'])
+    var2 = float(parametros['capacidad_Transformador'])
+    var3 = float(parametros['ref_Desbalance_Tension'])
+    var4 = float(parametros['ref_Desbalance_Corriente'])
+    var5 = float(parametros['limite_THDV'])
+    var6 = float(parametros['impedancia_Cortocircuito'])
+    var7 = float(parametros['ref_PLT'])
+
+    # Tablas que se muestran como vista previa en la página de informes
+    vistas_Previas: list = []
+
+    var_Limite_Inferior_Tension = calcular_Valor_Tension_Nominal(var1)[0]
+    var_Limite_Superior_Tension = calcular_Valor_Tension_Nominal(var1)[1]
+
+    logger.debug("Límites de Tensión - Inferior (%s) y Superior (%s)", var_Limite_Inferior_Tension, var_Limite_Superior_Tension)
+
+    var_Corriente_Nominal_Value = calcular_Valor_Corriente_Nominal((var2 * 1000), var1)
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para la tensión
+    list_Columns_Grafico_Tension: list = ['Tensin L12', 'Tensin L23', 'Tensin L31']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Desbalance de Tensión
+    list_Columns_Grafico_DesbTension: list = ['Desbalance']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para la corriente
+    list_Columns_Grafico_Corriente: list = ['Corriente mx. L1', 'Corriente mx. L2', 'Corriente mx. L3', 'Corriente de neutro']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Desbalance de Tensión
+    list_Columns_Grafico_DesbCorriente: list = ['Desbalance']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el PQS - N1
+    list_Columns_Grafico_DesbCorriente_ActApa: list = ['P.Activa III', 'P.Aparente III']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el PQS - N2
+    list_Columns_Grafico_DesbCorriente_CapInd: list = ['P.Capacitiva III', 'P.Inductiva III']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Factor de Potencia
+    list_Columns_Grafico_FactorPot: list = ['F.P. III -', 'F.P. III']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis de Energías
+    list_Columns_Graficos_Consolidado_Energia: list = ['E.Activa T1', 'E.Capacitiva T1', 'E.Inductiva T1', 'KVARH_CAP', 'KARH_IND']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis de Distorsión de Tensión
+    list_Columns_Distorsion_Tension: list = ['V THD/d Mx. L1', 'V THD/d Mx. L2', 'V THD/d Mx. L3']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis de Distorsión de Corriente
+    list_Columns_Distorsion_Corriente: list = ['A THD/d L1', 'A THD/d L2', 'A THD/d L3']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis del Listado de Armónicos de Cargabilidad TDD
+    list_Columns_Armonicos_Cargabilidad_TDD: list = ['resultado_TDD_L1', 'resultado_TDD_L2', 'resultado_TDD_L3']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis del Flicker
+    list_Columns_Flicker: list = ['Plt L1', 'Plt L2', 'Plt L3']
+
+    # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para el Análisis del Factor K
+    list_Columns_FactorK: list = ['Factor K L1', 'Factor K L2', 'Factor K L3']
+
+
+
+    # Declaración de todos los DataFrames filtrando por las columnas que se van a Utilizar para generar el Documento y Realizar los Cálculos o Gráficos
+
+    df_Tabla_Tension = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Tensin mn. L12', 'Tensin L12', 'Tensin mx. L12', 'Tensin mn. L23', 'Tensin L23', 'Tensin mx. L23', 'Tensin mn. L31', 'Tensin L31', 'Tensin mx. L31'], df)
+
+    df_Tabla_Corriente = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Corriente mn. L1', 'Corriente L1', 'Corriente mx. L1', 'Corriente mn. L2', 'Corriente L2', 'Corriente mx. L2', 'Corriente mn. L3', 'Corriente L3', 'Corriente mx. L3', 'Corriente de neutro mn.', 'Corriente de neutro', 'Corriente de neutro mx.'], df)
+
+    df_Tabla_Desbalance_Tension = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Tensin L12', 'Tensin L23', 'Tensin L31'], df)
+
+    df_Tabla_Desbalance_Corriente = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Corriente L1', 'Corriente L2', 'Corriente L3'], df)
+
+    df_Tabla_PQS_Potencias = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'P.Activa mn. III', 'P.Activa III', 'P.Activa mx. III', 'P.Capacitiva mn. III', 'P.Capacitiva III', 'P.Capacitiva mx. III', 'P.Inductiva mn. III', 'P.Inductiva III', 'P.Inductiva mx. III', 'P.Aparente mn. III', 'P.Aparente III', 'P.Aparente mx. III'], df)
+
+    df_Tabla_FactorPotencia = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'F.P. Mn. III -', 'F.P. III -', 'F.P. Mx. III -', 'F.P. Mn. III', 'F.P. III', 'F.P. Mx. III'], df)
+
+    df_Tabla_Distorsion_Tension = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'V THD/d Mx. L1', 'V THD/d Mx. L2', 'V THD/d Mx. L3'], df)
+
+    df_Tabla_Armonicos_Distorsion_Tension = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Arm. tensin 3 L1', 'Arm. tensin 5 L1', 'Arm. tensin 7 L1', 'Arm. tensin 9 L1', 'Arm. tensin 11 L1', 'Arm. tensin 13 L1', 'Arm. tensin 15 L1', 'Arm. tensin 3 L2', 'Arm. tensin 5 L2', 'Arm. tensin 7 L2', 'Arm. tensin 9 L2', 'Arm. tensin 11 L2', 'Arm. tensin 13 L2', 'Arm. tensin 15 L2', 'Arm. tensin 3 L3', 'Arm. tensin 5 L3', 'Arm. tensin 7 L3', 'Arm. tensin 9 L3', 'Arm. tensin 11 L3', 'Arm. tensin 13 L3', 'Arm. tensin 15 L3'], df)
+
+    df_Tabla_Distorsion_Corriente = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'A THD/d L1', 'A THD/d L2', 'A THD/d L3'], df)
+
+    df_Tabla_Armonicos_Distorsion_Corriente = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Arm. corriente 3 L1', 'Arm. corriente 5 L1', 'Arm. corriente 7 L1', 'Arm. corriente 9 L1', 'Arm. corriente 11 L1', 'Arm. corriente 13 L1', 'Arm. corriente 15 L1', 'Arm. corriente 3 L2', 'Arm. corriente 5 L2', 'Arm. corriente 7 L2', 'Arm. corriente 9 L2', 'Arm. corriente 11 L2', 'Arm. corriente 13 L2', 'Arm. corriente 15 L2', 'Arm. corriente 3 L3', 'Arm. corriente 5 L3', 'Arm. corriente 7 L3', 'Arm. corriente 9 L3', 'Arm. corriente 11 L3', 'Arm. corriente 13 L3', 'Arm. corriente 15 L3'], df)
+
+    df_Tabla_Armonicos_Cargabilidad_TDD = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'A THD/d L1', 'A THD/d L2', 'A THD/d L3', 'Corriente mx. L1', 'Corriente mx. L2', 'Corriente mx. L3'], df)
+
+    df_Tabla_FactorK = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'Factor K mn. L1', 'Factor K L1', 'Factor K mx. L1', 'Factor K mn. L2', 'Factor K L2', 'Factor K mx. L2', 'Factor K mn. L3', 'Factor K L3', 'Factor K mx. L3'], df)
+
+    df_Tabla_FactorPotencia_Grupos = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'F.P. Mn. III', 'F.P. III', 'F.P. Mx. III'], df)
+
+
+
+
+    # En este paso se realizan los pasos adicionales como cálculos de nuevas columnas u operaciones entre columnas
+
+
+    var_Tabla_Tensiones = crear_DataFrame_Tension(dataFrame=df_Tabla_Tension, var_Lim_Inf_Ten=var_Limite_Inferior_Tension, val_Nom=var1, var_Lim_Sup_Ten=var_Limite_Superior_Tension)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Tensión Final", var_Tabla_Tensiones.head(5)))
+
+
+    var_Tabla_Corrientes = crear_DataFrame_Corriente(dataFrame=df_Tabla_Corriente, var_Lim_Corr_Nom=var_Corriente_Nominal_Value)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Corriente Final", var_Tabla_Corrientes.head(5)))
+
+
+    df_Tabla_Desb_Tension = crear_DataFrame_Desbalance_Tension(df_Tabla_Desbalance_Tension, var3)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Desbalance de Tensión Final", df_Tabla_Desb_Tension.head(5)))
+
+
+    df_Tabla_Desb_Corriente = crear_DataFrame_Desbalance_Corriente(df_Tabla_Desbalance_Corriente, var4)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Desbalance de Corriente Final", df_Tabla_Desb_Corriente.head(5)))
+
+
+    df_Tabla_PQS_Final = crear_DataFrame_PQS_Potencias(df_Tabla_PQS_Potencias)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Potencias Final", df_Tabla_PQS_Final.head(5)))
+
+
+    df_Tabla_FactPotenciaFinal = crear_DataFrame_FactPotencia(df_Tabla_FactorPotencia)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Factor de Potencia Final", df_Tabla_FactPotenciaFinal.head(5)))
+
+
+
+
+    df_Tabla_Distorsion_TensionFinal = crear_DataFrame_DistTension(df_Tabla_Distorsion_Tension, var5)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Distorsión de Tensión Final", df_Tabla_Distorsion_TensionFinal.head(5)))
+
+
+    df_Tabla_Armonicos_Distorsion_Tension_Final = crear_DataFrame_Armonicos_DistTension(df_Tabla_Armonicos_Distorsion_Tension)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Armónicos de Distorsión de Tensión Final", df_Tabla_Armonicos_Distorsion_Tension_Final.head(5)))
+
+
+    df_Tabla_Distorsion_CorrienteFinal = crear_DataFrame_DistCorriente(df_Tabla_Distorsion_Corriente)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Distorsión de Corriente Final", df_Tabla_Distorsion_CorrienteFinal.head(5)))
+
+
+    df_Tabla_Armonicos_Distorsion_Corriente_Final = crear_DataFrame_Armonicos_DistCorriente(df_Tabla_Armonicos_Distorsion_Corriente)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Armónicos de Distorsión de Corriente Final", df_Tabla_Armonicos_Distorsion_Corriente_Final.head(5)))
+
+
+    df_Tabla_Armonicos_Cargabilidad_TDDFinal = crear_DataFrame_Armonicos_CargabilidadTDD(df_Tabla_Armonicos_Cargabilidad_TDD)
+
+    vistas_Previas.append(("Cabecera - DataFrame de Armónicos de Cargabilidad TDD Final", df_Tabla_Armonicos_Cargabilidad_TDDFinal.head(5)))
+
+
+    # El Flicker (Plt) se registra una vez cada 2 horas: se analiza solo con sus muestras válidas (series dispersas), no
+    # con las columnas del DataFrame de Minuto a Minuto, donde los vacíos quedan rellenados
+
+    series_Flicker = series_Dispersas if series_Dispersas is not None else extraer_Series_Dispersas(pd.DataFrame(columns=['Fecha/hora']), list_Columns_Flicker)
+
+    df_Tabla_FlickerFinal = crear_Tabla_Series_Dispersas(series_Flicker)
+
+    df_Tabla_FactorKFinal = crear_DataFrame_FactorK_Final(df_Tabla_FactorK)
+
+    vistas_Previas.append(("Cabecera - DataFrame de FactorK Final", df_Tabla_FactorKFinal.head(5)))
+
+
+
+    # En este paso se están realizando los cálculos de las tablas con Percentiles, Máximos, Promedios y Mínimos.
+
+    df_Tabla_Calculos_Tension = crear_Medidas_DataFrame_Tension(df_Tabla_Tension)
+
+    vistas_Previas.append(("Medidas - DataFrame de Tensión", df_Tabla_Calculos_Tension))
+
+
+    df_Tabla_Calculos_Desb_Tension = crear_Medidas_DataFrame_DesbTension(df_Tabla_Desb_Tension)
+
+    vistas_Previas.append(("Medidas - DataFrame de Desbalance de Tensión", df_Tabla_Calculos_Desb_Tension))
+
+
+    df_Tabla_Calculos_Corriente = crear_Medidas_DataFrame_Corriente(df_Tabla_Corriente)
+
+    vistas_Previas.append(("Medidas - DataFrame de Corriente", df_Tabla_Calculos_Corriente))
+
+
+    df_Tabla_Calculos_Desb_Corriente = crear_Medidas_DataFrame_DesbCorriente(df_Tabla_Desb_Corriente)
+
+    vistas_Previas.append(("Medidas - DataFrame de Desbalance de Corriente", df_Tabla_Calculos_Desb_Corriente))
+
+
+    df_Tabla_Calculos_PQS_Potencias = crear_Medidas_DataFrame_PQS(df_Tabla_PQS_Final)
+
+    vistas_Previas.append(("Medidas - DataFrame de Potencias", df_Tabla_Calculos_PQS_Potencias))
+
+
+    df_Tabla_Calculos_FactorPotencia = crear_Medidas_DataFrame_FactorPotencia(df_Tabla_FactPotenciaFinal)
+
+    vistas_Previas.append(("Medidas - DataFrame de Factor de Potencia", df_Tabla_Calculos_FactorPotencia))
+
+
+    # Medidas del Factor de Potencia inductivo y capacitivo, con reducciones enmascaradas sobre las columnas (sin separar
+    # el DataFrame por grupo)
+    df_Tabla_Calculos_FactorPotenciaGeneral = calcular_Medidas_FactorPotencia_Grupos(df_Tabla_FactorPotencia_Grupos)
+
+    #st.markdown("""
+    #> ## Medidas - DataFrame de Factor de Potencia (Generado/Consumido)
+    #""")
+
+    #st.dataframe(df_Tabla_Calculos_FactorPotenciaGeneral)
+
+
+    df_Tabla_Calculos_DistTension = crear_Medidas_DataFrame_Distorsion_Tension(df_Tabla_Distorsion_TensionFinal)
+
+    vistas_Previas.append(("Medidas - DataFrame de Distorsión de Tensión", df_Tabla_Calculos_DistTension))
+
+
+    df_Tabla_Calculos_Armonicos_DistTension = crear_Medidas_DataFrame_Armonicos_DistTension(df_Tabla_Armonicos_Distorsion_Tension_Final)
+
+    vistas_Previas.append(("Medidas - DataFrame de Armónicos de Distorsión de Tensión", df_Tabla_Calculos_Armonicos_DistTension))
+
+
+    df_Tabla_Calculos_DistCorriente = crear_Medidas_DataFrame_Distorsion_Corriente(df_Tabla_Distorsion_CorrienteFinal)
+
+    vistas_Previas.append(("Medidas - DataFrame de Distorsión de Corriente", df_Tabla_Calculos_DistCorriente))
+
+
+    df_Tabla_Calculos_Armonicos_DistCorriente = crear_Medidas_DataFrame_Armonicos_DistCorriente(df_Tabla_Armonicos_Distorsion_Corriente_Final)
+
+    vistas_Previas.append(("Medidas - DataFrame de Armónicos de Distorsión de Corriente", df_Tabla_Calculos_Armonicos_DistCorriente))
+
+
+    df_Tabla_Calculos_Flicker = calcular_Medidas_Series_Dispersas(series_Flicker).reindex(columns=list_Columns_Flicker)
+
+    vistas_Previas.append(("Medidas - Flicker (Plt)", df_Tabla_Calculos_Flicker))
+
+    df_Cumplimiento_Flicker = crear_Tabla_Cumplimiento_Series_Dispersas(series_Flicker, var7)
+
+    vistas_Previas.append(("Cumplimiento del Flicker (Plt)", df_Cumplimiento_Flicker))
+
+    df_Tabla_Calculos_FactorK = crear_Medidas_DataFrame_FactorK(df_Tabla_FactorKFinal)
+
+    vistas_Previas.append(("Medidas - DataFrame de FactorK", df_Tabla_Calculos_FactorK))
+
+
+
+
+
+    # Separamos esta sección ya que es importante distinguir el uso del DataFrame que está compuesto por los datos del TDD Final y poder hacer los cálculos correspondientes
+
+    valor_Maximo_Corrientes = df[list_Columns_Grafico_Corriente[0:3]].max().max()
+
+    logger.debug("Valor Máximo de las Corrientes: %s", valor_Maximo_Corrientes)
+
+    valor_Corriente_Cortacircuito = calcular_Valor_Corriente_Cortacircuito(var_Corriente_Nominal_Value, var6)
+
+    logger.debug("Valor de Corriente Cortacircuito: %s", valor_Corriente_Cortacircuito)
+
+    valor_ISC_sobre_IL = calcular_Valor_ISC_entre_IL(valor_Corriente_Cortacircuito, valor_Maximo_Corrientes)
+
+    logger.debug("Valor de ISC/IL: %s", valor_ISC_sobre_IL)
+
+    valor_Limite_TDD: float = calcular_Valor_Limite_TDD(valor_ISC_sobre_IL)
+
+    logger.debug("Valor del Limite del TDD: %s", valor_Limite_TDD)
+
+    valores_Limites_Armonicos = calcular_Valores_Limites_Armonicos(valor_Limite_TDD)
+
+    logger.debug("Valores de los Límites de los Armónicos: %s", list(valores_Limites_Armonicos.values()))
+
+    df_Tabla_TDD = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'fecha_y_Hora', 'resultado_TDD_L1', 'resultado_TDD_L2', 'resultado_TDD_L3'], df_Tabla_Armonicos_Cargabilidad_TDDFinal)
+
+    df_Tabla_TDDFinal = crear_DataFrame_CargabilidadTDD_Final(df_Tabla_TDD, valor_Limite_TDD)
+
+    df_Tabla_Calculos_CargabilidadTDD = crear_Medidas_DataFrame_CargabilidadTDD(df_Tabla_TDDFinal)
+
+
+
+    # Separamos esta sección ya que es importante distinguir el uso del DataFrame que está compuesto por los datos del .TXT que va de Hora a Hora
+
+    df_Tabla_Energias = filtrar_DataFrame_Por_Columnas(['Fecha/hora', 'E.Activa T1', 'E.Capacitiva T1', 'E.Inductiva T1', 'KWH', 'KARH_IND', 'KVARH_CAP', 'F.P. III -', 'F.P. III'], crear_DataFrame_Energias(df_Energias))
+
+    df_Tabla_Calculos_Energias = crear_Medidas_DataFrame_Energias(df_Tabla_Energias)
+
+    # Convertimos la información del DataFrame que contiene las energías para luego convertirlo en un diccionario con los registros de cada una de las columnas y poder mostrarlos en una tabla de Word
+
+    table_Data_Energy_Info = df_Tabla_Energias.to_dict(orient="records")
+
+    # Energías por mes y periodo tarifario (punta, intermedio y base), como en un resumen de facturación
+
+    df_Energias_Periodos = crear_Tabla_Energias_Periodos(agregar_Energias_Periodos(df_Energias))
+
+    vistas_Previas.append(("Energías por Periodo Tarifario", df_Energias_Periodos))
+
+    # Energía reactiva penalizada: exceso hora a hora sobre los umbrales de energía inductiva y capacitiva, acumulado por
+    # día y por mes
+
+    df_Penalizacion_Reactiva = crear_Tabla_Penalizacion_Reactiva(evaluar_Energia_Reactiva(df_Energias))
+
+    vistas_Previas.append(("Penalización por Energía Reactiva", df_Penalizacion_Reactiva))
+
+    # Resumen diario y demanda máxima (15 minutos) leídos de los niveles agregados de la pirámide
+    df_Resumen_Diario = crear_Resumen_Diario_Piramide(piramide_Medidas, ['Tensin L12', 'Tensin L23', 'Tensin L31', 'Corriente L1', 'Corriente L2', 'Corriente L3', 'P.Activa III', 'P.Aparente III'])
+
+    vistas_Previas.append(("Resumen Diario", df_Resumen_Diario))
+
+    demanda_Maxima = calcular_Demanda_Maxima_Piramide(piramide_Medidas, 'P.Activa III', '15min')
+
+    vistas_Previas.append(("Demanda Máxima (15 minutos)", pd.DataFrame({
+        'Demanda Máxima - P.Activa III': [round(demanda_Maxima['valor'], 2)],
+        'Inicio del Intervalo': [demanda_Maxima['fecha'].strftime('%d/%m/%Y %H:%M') if demanda_Maxima['fecha'] is not None else '']
+    })))
+
+    # Perfiles de carga típicos (promedio y percentil 95 por hora del día y por día de la semana) de las potencias y
+    # corrientes del nivel de demanda de la pirámide y de las energías de Hora a Hora
+
+    perfiles_Carga = obtener_Perfiles_Proceso(huella_Archivo, piramide_Medidas, df_Energias, '15min')
+
+    df_Perfil_Horario = perfiles_Carga['df_Perfil_Horario']
+    df_Perfil_Semanal = perfiles_Carga['df_Perfil_Semanal']
+
+    vistas_Previas.append(("Perfil de Carga por Hora del Día", df_Perfil_Horario))
+    vistas_Previas.append(("Perfil de Carga por Día de la Semana", df_Perfil_Semanal))
+
+
+
+    # En este lugar declaramos un diccionario con los Valores negativos, ceros y positivos del Factor de Potencia (conteo
+    # por signo de las dos columnas en una sola pasada)
+
+    data_Cantidad_NEG_POS_FactorPotencia: dict = contar_Signos_FactorPotencia(df_Tabla_FactPotenciaFinal)
+
+
+
+    # En este lugar declaramos diccionarios con los percentiles para utilizarlos luego en gráficos o en otras partes del código
+
+    data_Percentiles_Tension: dict = {
+        'PERCENTIL_TENSIN_L12': round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[0], 2),
+        'PERCENTIL_TENSIN_L23': round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[0], 2),
+        'PERCENTIL_TENSIN_L31': round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[0], 2)
+    }
+
+    data_Percentiles_Corriente: dict = {
+        'PERCENTIL_CORR_MAX_L1': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[0], 2),
+        'PERCENTIL_CORR_MAX_L2': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[0], 2),
+        'PERCENTIL_CORR_MAX_L3': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[0], 2),
+        'PERCENTIL_CORR_MED_LN': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[0], 2)
+    }
+
+    data_Percentiles_DesbTension: dict = {
+        'PERCENTIL_DESBALANCE_DESBTEN': round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[0], 2)
+    }
+
+    data_Percentiles_DesbCorriente: dict = {
+        'PERCENTIL_DESBALANCE_DESBCORR': round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[0], 2)
+    }
+
+    data_Percentiles_PQS_ActApa: dict = {
+        'PERCENTIL_PQS_ACT': round(df_Tabla_Calculos_PQS_Potencias['P.Activa III'].iloc[0], 2),
+        'PERCENTIL_PQS_APA': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente III'].iloc[0], 2)
+    }
+
+    data_Percentiles_PQS_CapInd: dict = {
+        'PERCENTIL_PQS_CAP': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva III'].iloc[0], 2),
+        'PERCENTIL_PQS_IND': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva III'].iloc[0], 2)
+    }
+
+    data_Percentiles_FactorPotencia: dict = {
+        'PERCENTIL_FACTOR_POTENCIA_NEG': round(df_Tabla_Calculos_FactorPotencia['F.P. III -'].iloc[0], 2),
+        'PERCENTIL_FACTOR_POTENCIA_POS': round(df_Tabla_Calculos_FactorPotencia['F.P. III'].iloc[0], 2)
+    }
+
+    data_Percentiles_Energia: dict = {
+        'PERCENTIL_ENERGIA_ACTIVA_MED': round(df_Tabla_Calculos_Energias['E.Activa T1'].iloc[0], 2),
+        'PERCENTIL_ENERGIA_CAPACITIVA_MED': round(df_Tabla_Calculos_Energias['E.Capacitiva T1'].iloc[0], 2),
+        'PERCENTIL_ENERGIA_INDUCTIVA_MED': round(df_Tabla_Calculos_Energias['E.Inductiva T1'].iloc[0], 2)
+    }
+
+    data_Percentiles_DistorsionTension: dict = {
+        'PERCENTIL_THDV_MAX_L1': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[0],2),
+        'PERCENTIL_THDV_MAX_L2': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[0],2),
+        'PERCENTIL_THDV_MAX_L3': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[0],2)
+    }
+
+    data_Percentiles_DistorsionCorriente: dict = {
+        'PERCENTIL_THDI_MAX_L1': round(df_Tabla_Calculos_DistCorriente['A THD/d L1'].iloc[0],2),
+        'PERCENTIL_THDI_MAX_L2': round(df_Tabla_Calculos_DistCorriente['A THD/d L2'].iloc[0],2),
+        'PERCENTIL_THDI_MAX_L3': round(df_Tabla_Calculos_DistCorriente['A THD/d L3'].iloc[0],2)
+    }
+
+    data_Percentiles_CargabilidadTDD: dict = {
+        'PERCENTIL_TDD_L1': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[0],2),
+        'PERCENTIL_TDD_L2': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[0],2),
+        'PERCENTIL_TDD_L3': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[0],2)
+    }
+
+    data_Percentiles_Flicker: dict = {
+        'PERCENTIL_FLICKER_PLT_L1_MED': round(df_Tabla_Calculos_Flicker['Plt L1'].iloc[0],2),
+        'PERCENTIL_FLICKER_PLT_L2_MED': round(df_Tabla_Calculos_Flicker['Plt L2'].iloc[0],2),
+        'PERCENTIL_FLICKER_PLT_L3_MED': round(df_Tabla_Calculos_Flicker['Plt L3'].iloc[0],2)
+    }
+
+    data_Percentiles_FactorK: dict = {
+        'PERCENTIL_FACTORK_L1_MED': round(df_Tabla_Calculos_FactorK['Factor K L1'].iloc[0], 2),
+        'PERCENTIL_FACTORK_L2_MED': round(df_Tabla_Calculos_FactorK['Factor K L2'].iloc[0], 2),
+        'PERCENTIL_FACTORK_L3_MED': round(df_Tabla_Calculos_FactorK['Factor K L3'].iloc[0], 2)
+    }
+
+
+
+    # Tablas finales que se exportan al Excel, una hoja por métrica (la llave es el nombre de la hoja). Se exportan los
+    # mismos DataFrames finales, sin copias, ya que las etapas de gráficos y documento no los modifican
+    hojas_Excel: dict = {
+        'Tensión': var_Tabla_Tensiones,
+        'Desbalance de Tensión': df_Tabla_Desb_Tension,
+        'Corriente': var_Tabla_Corrientes,
+        'Desbalance de Corriente': df_Tabla_Desb_Corriente,
+        'Potencias': df_Tabla_PQS_Final,
+        'Factor de Potencia': df_Tabla_FactPotenciaFinal,
+        'Distorsión de Tensión': df_Tabla_Distorsion_TensionFinal,
+        'Armónicos de Tensión': df_Tabla_Armonicos_Distorsion_Tension_Final,
+        'Distorsión de Corriente': df_Tabla_Distorsion_CorrienteFinal,
+        'Armónicos de Corriente': df_Tabla_Armonicos_Distorsion_Corriente_Final,
+        'Armónicos Cargabilidad TDD': df_Tabla_Armonicos_Cargabilidad_TDDFinal,
+        'Cargabilidad TDD': df_Tabla_TDDFinal,
+        'Flicker': df_Tabla_FlickerFinal,
+        'Cumplimiento Flicker': df_Cumplimiento_Flicker,
+        'Factor K': df_Tabla_FactorKFinal,
+        'Energías': df_Tabla_Energias,
+        'Energías por Periodo': df_Energias_Periodos,
+        'Penalización Reactiva': df_Penalizacion_Reactiva,
+        'Resumen Diario': df_Resumen_Diario,
+        'Perfil Horario': df_Perfil_Horario,
+        'Perfil Semanal': df_Perfil_Semanal
+    }
+
+
+    # Aquí hay una lista que almacena cada uno de los valores de la Variación para cada Percentil de las Tensiones
+
+    var_Lista_Variaciones = calcular_Variacion_Tension(lista_Percentiles=[df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[0], df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[0], df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[0], df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[0], df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[0], df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[0]], val_Nom=var1)
+
+    var_Lista_PQS_Carg_Disp = [calcular_Valor_Cargabilidad_Disponibilidad(var2, df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[0])[0], calcular_Valor_Cargabilidad_Disponibilidad(var2, df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[0])[1]]
+
+    logger.debug("Listado de Variaciones: %s", var_Lista_Variaciones)
+
+
+
+    # Aquí vamos a determinar los resultados de cada una de las Observaciones, con las reglas de cumplimiento evaluadas
+    # sobre la matriz de resumen de las tablas de medidas
+
+    matriz_Resumen = crear_Matriz_Resumen({
+        'df_Tabla_Calculos_Tension': df_Tabla_Calculos_Tension,
+        'df_Tabla_Calculos_Corriente': df_Tabla_Calculos_Corriente,
+        'df_Tabla_Calculos_Desb_Tension': df_Tabla_Calculos_Desb_Tension,
+        'df_Tabla_Calculos_Desb_Corriente': df_Tabla_Calculos_Desb_Corriente,
+        'df_Tabla_Calculos_DistTension': df_Tabla_Calculos_DistTension,
+        'df_Tabla_Calculos_Armonicos_DistCorriente': df_Tabla_Calculos_Armonicos_DistCorriente,
+        'df_Tabla_Calculos_CargabilidadTDD': df_Tabla_Calculos_CargabilidadTDD
+    })
+
+    valor_Referencia_THDV = var5
+
+    listado_Limites_Armonicos_Corriente: list = list(valores_Limites_Armonicos.values())[:2]
+
+    limites_Cumplimiento: dict = {
+        'tension_Inferior': var_Limite_Inferior_Tension,
+        'tension_Superior': var_Limite_Superior_Tension,
+        'corriente_Nominal': var_Corriente_Nominal_Value,
+        'ref_Desbalance_Tension': var3,
+        'ref_Desbalance_Corriente': var4,
+        'limite_THDV': valor_Referencia_THDV,
+        'limite_Armonicos_3_9': listado_Limites_Armonicos_Corriente[0],
+        'limite_Armonicos_11': listado_Limites_Armonicos_Corriente[1],
+        'limite_TDD': valor_Limite_TDD
+    }
+
+    tabla_Cumplimiento, mascaras_No_Cumplen = evaluar_Reglas_Cumplimiento(matriz_Resumen, limites_Cumplimiento)
+
+    observaciones_Informe = crear_Observaciones_Informe(matriz_Resumen, tabla_Cumplimiento, mascaras_No_Cumplen)
+
+    observaciones_Tension = observaciones_Informe['observaciones_Tension']
+    observaciones_Corriente = observaciones_Informe['observaciones_Corriente']
+    observaciones_DesbTension = observaciones_Informe['observaciones_DesbTension']
+    observaciones_DesbCorriente = observaciones_Informe['observaciones_DesbCorriente']
+    observaciones_THDV = observaciones_Informe['observaciones_THDV']
+    observaciones_ArmonicosCorriente = observaciones_Informe['observaciones_ArmonicosCorriente']
+    observaciones_TDD = observaciones_Informe['observaciones_TDD']
+
+    logger.debug("Observaciones de Tensión: %s", observaciones_Tension)
+
+    logger.debug("Observaciones de Corriente: %s", observaciones_Corriente)
+
+    logger.debug("Observaciones del Desbalance de Tensión: %s", observaciones_DesbTension)
+
+    logger.debug("Observaciones del Desbalance de Corriente: %s", observaciones_DesbCorriente)
+
+    logger.debug("Observaciones del THDV: %s", observaciones_THDV)
+
+    logger.debug("Listado de Límites de los Armónicos de Corriente: %s", listado_Limites_Armonicos_Corriente)
+
+    logger.debug("Observaciones de los Armónicos de Corriente: %s", observaciones_ArmonicosCorriente)
+
+    logger.debug("Observaciones del TDD: %s", observaciones_TDD)
+
+
+
+    # Cumplimiento por ventana de tiempo (por día y por semana): las mismas reglas evaluadas sobre los estadísticos de los
+    # registros de Minuto a Minuto de cada ventana, calculados en una sola pasada para todas las medidas
+
+    fechas_Registros = pd.to_datetime(df['Fecha/hora'].astype(str), format='%d/%m/%y %H:%M:%S', errors='coerce')
+
+    tablas_Registros: dict = {
+        'df_Tabla_Calculos_Tension': df_Tabla_Tension,
+        'df_Tabla_Calculos_Corriente': df_Tabla_Corriente,
+        'df_Tabla_Calculos_Desb_Tension': df_Tabla_Desb_Tension,
+        'df_Tabla_Calculos_Desb_Corriente': df_Tabla_Desb_Corriente,
+        'df_Tabla_Calculos_DistTension': df_Tabla_Distorsion_TensionFinal,
+        'df_Tabla_Calculos_Armonicos_DistCorriente': df_Tabla_Armonicos_Distorsion_Corriente_Final,
+        'df_Tabla_Calculos_CargabilidadTDD': df_Tabla_TDDFinal
+    }
+
+    matriz_Resumen_Ventanas, registros_Ventanas = crear_Matriz_Resumen_Ventanas(
+        {llave: tabla[matriz_Resumen[llave].columns.get_level_values('columna').unique()] for llave, tabla in tablas_Registros.items()},
+        fechas_Registros
+    )
+
+    tabla_Cumplimiento_Ventanas, _ = evaluar_Reglas_Cumplimiento(matriz_Resumen_Ventanas, limites_Cumplimiento)
+
+    df_Cumplimiento_Ventanas = crear_Tabla_Cumplimiento_Ventanas(tabla_Cumplimiento_Ventanas, registros_Ventanas, REGLAS_CUMPLIMIENTO, tabla_Cumplimiento)
+
+    vistas_Previas.append(("Cumplimiento por Ventana (Día y Semana)", df_Cumplimiento_Ventanas))
+
+    hojas_Excel['Cumplimiento por Ventana'] = df_Cumplimiento_Ventanas
+
+
+
+    # Eventos de la medición (huecos de tensión, sobretensiones y sobrecorrientes): cuándo y cuánto tiempo estuvieron
+    # los registros de Minuto a Minuto fuera de los mismos límites de cumplimiento
+
+    indice_Eventos = detectar_Eventos_Medicion(df, limites_Cumplimiento)
+
+    df_Eventos = crear_Tabla_Eventos(indice_Eventos, fechas_Registros)
+
+    vistas_Previas.append(("Eventos de la Medición", df_Eventos))
+
+    hojas_Excel['Eventos'] = df_Eventos
+
+
+
+    # Intervalos de violación de los límites (codificados por rachas), calculados una sola vez por medida y límite para
+    # el sombreado de los gráficos y el conteo de minutos fuera de límite del informe
+
+    intervalos_Violacion = calcular_Violaciones_Limites({
+        'var_Tabla_Tensiones': var_Tabla_Tensiones,
+        'var_Tabla_Corrientes': var_Tabla_Corrientes,
+        'df_Tabla_Desb_Tension': df_Tabla_Desb_Tension,
+        'df_Tabla_Desb_Corriente': df_Tabla_Desb_Corriente,
+        'df_Tabla_Distorsion_TensionFinal': df_Tabla_Distorsion_TensionFinal,
+        'df_Tabla_TDDFinal': df_Tabla_TDDFinal
+    }, limites_Cumplimiento)
+
+    df_Minutos_Violacion = crear_Tabla_Minutos_Violacion(intervalos_Violacion, calcular_Intervalo_Registro(fechas_Registros))
+
+    vistas_Previas.append(("Tiempo Fuera de Límite", df_Minutos_Violacion))
+
+    hojas_Excel['Tiempo Fuera de Límite'] = df_Minutos_Violacion
+
+
+
+    return {
+        'vistas_Previas': vistas_Previas,
+        'var_Limite_Inferior_Tension': var_Limite_Inferior_Tension,
+        'var_Limite_Superior_Tension': var_Limite_Superior_Tension,
+        'var_Corriente_Nominal_Value': var_Corriente_Nominal_Value,
+        'list_Columns_Grafico_Tension': list_Columns_Grafico_Tension,
+        'list_Columns_Grafico_DesbTension': list_Columns_Grafico_DesbTension,
+        'list_Columns_Grafico_Corriente': list_Columns_Grafico_Corriente,
+        'list_Columns_Grafico_DesbCorriente': list_Columns_Grafico_DesbCorriente,
+        'list_Columns_Grafico_DesbCorriente_ActApa': list_Columns_Grafico_DesbCorriente_ActApa,
+        'list_Columns_Grafico_DesbCorriente_CapInd': list_Columns_Grafico_DesbCorriente_CapInd,
+        'list_Columns_Grafico_FactorPot': list_Columns_Grafico_FactorPot,
+        'list_Columns_Graficos_Consolidado_Energia': list_Columns_Graficos_Consolidado_Energia,
+        'list_Columns_Distorsion_Tension': list_Columns_Distorsion_Tension,
+        'list_Columns_Distorsion_Corriente': list_Columns_Distorsion_Corriente,
+        'list_Columns_Armonicos_Cargabilidad_TDD': list_Columns_Armonicos_Cargabilidad_TDD,
+        'list_Columns_FactorK': list_Columns_FactorK,
+        'list_Columns_Flicker': list_Columns_Flicker,
+        'var_Tabla_Tensiones': var_Tabla_Tensiones,
+        'var_Tabla_Corrientes': var_Tabla_Corrientes,
+        'df_Tabla_Desb_Tension': df_Tabla_Desb_Tension,
+        'df_Tabla_Desb_Corriente': df_Tabla_Desb_Corriente,
+        'df_Tabla_PQS_Final': df_Tabla_PQS_Final,
+        'df_Tabla_FactPotenciaFinal': df_Tabla_FactPotenciaFinal,
+        'df_Tabla_Distorsion_TensionFinal': df_Tabla_Distorsion_TensionFinal,
+        'df_Tabla_Distorsion_CorrienteFinal': df_Tabla_Distorsion_CorrienteFinal,
+        'df_Tabla_FactorKFinal': df_Tabla_FactorKFinal,
+        'series_Flicker': series_Flicker,
+        'df_Tabla_FlickerFinal': df_Tabla_FlickerFinal,
+        'df_Tabla_Calculos_Flicker': df_Tabla_Calculos_Flicker,
+        'df_Cumplimiento_Flicker': df_Cumplimiento_Flicker,
+        'valor_Referencia_PLT': var7,
+        'df_Tabla_Calculos_Tension': df_Tabla_Calculos_Tension,
+        'df_Tabla_Calculos_Desb_Tension': df_Tabla_Calculos_Desb_Tension,
+        'df_Tabla_Calculos_Corriente': df_Tabla_Calculos_Corriente,
+        'df_Tabla_Calculos_Desb_Corriente': df_Tabla_Calculos_Desb_Corriente,
+        'df_Tabla_Calculos_PQS_Potencias': df_Tabla_Calculos_PQS_Potencias,
+        'df_Tabla_Calculos_FactorPotencia': df_Tabla_Calculos_FactorPotencia,
+        'df_Tabla_Calculos_FactorPotenciaGeneral': df_Tabla_Calculos_FactorPotenciaGeneral,
+        'df_Tabla_Calculos_DistTension': df_Tabla_Calculos_DistTension,
+        'df_Tabla_Calculos_Armonicos_DistTension': df_Tabla_Calculos_Armonicos_DistTension,
+        'df_Tabla_Calculos_DistCorriente': df_Tabla_Calculos_DistCorriente,
+        'df_Tabla_Calculos_Armonicos_DistCorriente': df_Tabla_Calculos_Armonicos_DistCorriente,
+        'df_Tabla_Calculos_FactorK': df_Tabla_Calculos_FactorK,
+        'valor_Maximo_Corrientes': valor_Maximo_Corrientes,
+        'valor_Corriente_Cortacircuito': valor_Corriente_Cortacircuito,
+        'valor_ISC_sobre_IL': valor_ISC_sobre_IL,
+        'valor_Limite_TDD': valor_Limite_TDD,
+        'valores_Limites_Armonicos': valores_Limites_Armonicos,
+        'df_Tabla_TDDFinal': df_Tabla_TDDFinal,
+        'df_Tabla_Calculos_CargabilidadTDD': df_Tabla_Calculos_CargabilidadTDD,
+        'df_Tabla_Energias': df_Tabla_Energias,
+        'df_Tabla_Calculos_Energias': df_Tabla_Calculos_Energias,
+        'table_Data_Energy_Info': table_Data_Energy_Info,
+        'df_Energias_Periodos': df_Energias_Periodos,
+        'df_Penalizacion_Reactiva': df_Penalizacion_Reactiva,
+        'df_Resumen_Diario': df_Resumen_Diario,
+        'df_Perfil_Horario': df_Perfil_Horario,
+        'df_Perfil_Semanal': df_Perfil_Semanal,
+        'df_Cumplimiento_Ventanas': df_Cumplimiento_Ventanas,
+        'indice_Eventos': indice_Eventos,
+        'df_Eventos': df_Eventos,
+        'intervalos_Violacion': intervalos_Violacion,
+        'df_Minutos_Violacion': df_Minutos_Violacion,
+        'demanda_Maxima': demanda_Maxima,
+        'data_Cantidad_NEG_POS_FactorPotencia': data_Cantidad_NEG_POS_FactorPotencia,
+        'data_Percentiles_Tension': data_Percentiles_Tension,
+        'data_Percentiles_Corriente': data_Percentiles_Corriente,
+        'data_Percentiles_DesbTension': data_Percentiles_DesbTension,
+        'data_Percentiles_DesbCorriente': data_Percentiles_DesbCorriente,
+        'data_Percentiles_PQS_ActApa': data_Percentiles_PQS_ActApa,
+        'data_Percentiles_PQS_CapInd': data_Percentiles_PQS_CapInd,
+        'data_Percentiles_FactorPotencia': data_Percentiles_FactorPotencia,
+        'data_Percentiles_Energia': data_Percentiles_Energia,
+        'data_Percentiles_DistorsionTension': data_Percentiles_DistorsionTension,
+        'data_Percentiles_DistorsionCorriente': data_Percentiles_DistorsionCorriente,
+        'data_Percentiles_CargabilidadTDD': data_Percentiles_CargabilidadTDD,
+        'data_Percentiles_FactorK': data_Percentiles_FactorK,
+        'data_Percentiles_Flicker': data_Percentiles_Flicker,
+        'hojas_Excel': hojas_Excel,
+        'var_Lista_Variaciones': var_Lista_Variaciones,
+        'var_Lista_PQS_Carg_Disp': var_Lista_PQS_Carg_Disp,
+        'observaciones_Tension': observaciones_Tension,
+        'observaciones_Corriente': observaciones_Corriente,
+        'observaciones_DesbTension': observaciones_DesbTension,
+        'observaciones_DesbCorriente': observaciones_DesbCorriente,
+        'valor_Referencia_THDV': valor_Referencia_THDV,
+        'observaciones_THDV': observaciones_THDV,
+        'observaciones_ArmonicosCorriente': observaciones_ArmonicosCorriente,
+        'observaciones_TDD': observaciones_TDD,
+        'matriz_Resumen': matriz_Resumen,
+        'tabla_Cumplimiento': tabla_Cumplimiento,
+        'tabla_Cumplimiento_Ventanas': tabla_Cumplimiento_Ventanas
+    }
@@ -0,0 +1,155 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+def guardar_Columnas_Mapeadas(dataFrame: pd.DataFrame, directorio: str):
+    """
+    Guarda cada columna del DataFrame en su propio archivo .npy (columnas numéricas como float64 y columnas de texto
+    como texto de ancho fijo), junto con un archivo 'columnas.json' con el nombre y el tipo de cada columna. Así las
+    columnas se pueden abrir mapeadas en memoria con 'DataFrameMapeado'.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame a guardar.
+        directorio (str): Carpeta donde se guardan los archivos (se crea si no existe).
+    """
+    os.makedirs(directorio, exist_ok=True)
+
+    columnas_Numericas = set(dataFrame.select_dtypes(include=['number']).columns)
+    descripcion_Columnas = []
+
+    for posicion, columna in enumerate(dataFrame.columns):
+        # Los nombres de las columnas tienen caracteres como '/' o '.', por eso los archivos se nombran por posición
+        archivo_Columna = f"{posicion:04d}.npy"
+
+        if columna in columnas_Numericas:
+            valores = dataFrame[columna].to_numpy(dtype=np.float64)
+            tipo_Columna = 'numero'
+        else:
+            valores = np.array(dataFrame[columna].astype(str).tolist(), dtype=str)
+            tipo_Columna = 'texto'
+
+        np.save(os.path.join(directorio, archivo_Columna), valores, allow_pickle=False)
+
+        descripcion_Columnas.append({'nombre': columna, 'archivo': archivo_Columna, 'tipo': tipo_Columna})
+
+    with open(os.path.join(directorio, 'columnas.json'), 'w', encoding='utf-8') as archivo:
+        json.dump({'filas': len(dataFrame), 'columnas': descripcion_Columnas}, archivo, ensure_ascii=False)
+
+class DataFrameMapeado:
+    """
+    DataFrame de solo lectura cuyas columnas están en archivos .npy mapeados en memoria (ver 'guardar_Columnas_Mapeadas').
+
+    Las columnas no se cargan al abrirlo: cada selección ('df[columna]' o 'df[lista_De_Columnas]') lee solo las columnas
+    pedidas y devuelve una Serie o un DataFrame de pandas normal. Como los archivos se abren con 'mmap', los datos que se
+    leen quedan en la caché de páginas del sistema operativo y se comparten entre sesiones y procesos que abren el
+    mismo dataset, en lugar de tener una copia completa del archivo en la memoria de cada sesión.
+    """
+
+    def __init__(self, directorio: str):
+        """
+        Abre las columnas guardadas en una carpeta.
+
+        Args:
+            directorio (str): Carpeta con los archivos .npy y 'columnas.json'.
+
+        Raises:
+            OSError: Si la carpeta o alguno de sus archivos no se puede leer.
+        """
+        with open(os.path.join(directorio, 'columnas.json'), 'r', encoding='utf-8') as archivo:
+            descripcion = json.load(archivo)
+
+        self.directorio = directorio
+        self.tipos_Columnas: dict = {columna['nombre']: columna['tipo'] for columna in descripcion['columnas']}
+        self.valores_Columnas: dict = {
+            columna['nombre']: np.load(os.path.join(directorio, columna['archivo']), mmap_mode='r', allow_pickle=False)
+            for columna in descripcion['columnas']
+        }
+        self.filas: int = descripcion['filas']
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(list(self.valores_Columnas.keys()))
+
+    @property
+    def index(self) -> pd.RangeIndex:
+        return pd.RangeIndex(self.filas)
+
+    @property
+    def shape(self) -> tuple:
+        return (self.filas, len(self.valores_Columnas))
+
+    def __len__(self) -> int:
+        return self.filas
+
+    def __contains__(self, columna) -> bool:
+        return columna in self.valores_Columnas
+
+    def leer_Columna(self, columna: str, inicio: int = None, fin: int = None) -> pd.Series:
+        """
+        Lee una columna (o un rango de filas de ella) desde su archivo mapeado.
+
+        Args:
+            columna (str): Nombre de la columna.
+            inicio (int): Primera fila del rango, opcional.
+            fin (int): Fila final del rango (no incluida), opcional.
+
+        Returns:
+            pd.Series: Valores de la columna en el rango, en memoria.
+        """
+        if columna not in self.valores_Columnas:
+            raise KeyError(columna)
+
+        posiciones = slice(inicio, fin)
+        valores = np.array(self.valores_Columnas[columna][posiciones])
+
+        if self.tipos_Columnas[columna] == 'texto':
+            valores = valores.astype(object)
+
+        return pd.Series(valores, index=self.index[posiciones], name=columna)
+
+    def leer_Filas(self, inicio: int = None, fin: int = None, columnas: list = None) -> pd.DataFrame:
+        """
+        Lee un rango de filas de las columnas indicadas (por defecto, de todas).
+
+        Args:
+            inicio (int): Primera fila del rango, opcional.
+            fin (int): Fila final del rango (no incluida), opcional.
+            columnas (list): Columnas a leer, opcional.
+
+        Returns:
+            pd.DataFrame: Datos del rango, en memoria.
+        """
+        columnas = list(self.valores_Columnas.keys()) if columnas is None else list(columnas)
+
+        return pd.DataFrame({columna: self.leer_Columna(columna, inicio, fin) for columna in columnas}, columns=columnas)
+
+    def __getitem__(self, columnas):
+        if isinstance(columnas, str):
+            return self.leer_Columna(columnas)
+
+        return self.leer_Filas(columnas=columnas)
+
+    def select_dtypes(self, include: list = None) -> pd.DataFrame:
+        """
+        Lee las columnas numéricas ('include=["number"]') o de texto ('include=["object"]'), como 'DataFrame.select_dtypes'.
+
+        Args:
+            include (list): Tipos a incluir ('number' y/o 'object').
+
+        Returns:
+            pd.DataFrame: Columnas de los tipos indicados, en memoria.
+        """
+        tipos_Incluidos = {'number': 'numero', 'object': 'texto'}
+        tipos = {tipos_Incluidos[tipo] for tipo in (include or ['number', 'object']) if tipo in tipos_Incluidos}
+
+        return self.leer_Filas(columnas=[columna for columna, tipo in self.tipos_Columnas.items() if tipo in tipos])
+
+    def copy(self) -> pd.DataFrame:
+        """
+        Devuelve una copia completa en memoria, como DataFrame de pandas, para los procesos que modifican los datos.
+
+        Returns:
+            pd.DataFrame: Copia de todos los datos.
+        """
+        return self.leer_Filas()
@@ -0,0 +1,250 @@
+import numpy as np
+import pandas as pd
+
+# Evaluación del cumplimiento del informe a partir de reglas definidas como datos. Cada regla indica su título, las medidas que
+# evalúa (tabla de medidas del informe y columnas, con la etiqueta que se muestra en el informe), el estadístico de la
+# tabla ('Percentil', 'Media', 'Min' o 'Max'), el comparador, los límites que usa y las etiquetas de salida cuando la
+# regla se cumple y cuando no se cumple. Las reglas se evalúan juntas con comparaciones de NumPy sobre la matriz de
+# resumen (una fila por medición o por ventana de tiempo), por lo que evaluar cientos de filas cuesta lo mismo que una.
+
+# Comparadores de las reglas: devuelven True en las medidas que NO cumplen la regla. 'mayor_O_Igual' se escribe como
+# la negación de la condición de cumplimiento ('valor < límite'), de modo que una medida vacía (NaN) no cumple
+COMPARADORES_CUMPLIMIENTO: dict = {
+    'fuera_De_Rango': lambda valores, limites: (valores < limites[0]) | (valores > limites[1]),
+    'mayor': lambda valores, limites: valores > limites[0],
+    'mayor_O_Igual': lambda valores, limites: ~(valores < limites[0])
+}
+
+# Reglas de cumplimiento del informe (las mismas condiciones de las observaciones del documento de Word)
+REGLAS_CUMPLIMIENTO: dict = {
+    'tension': {
+        'titulo': "Tensión",
+        'tabla': 'df_Tabla_Calculos_Tension',
+        'columnas': {
+            'TENSION_L12_MIN': 'Tensin mn. L12', 'TENSION_L12_MED': 'Tensin L12', 'TENSION_L12_MAX': 'Tensin mx. L12',
+            'TENSION_L23_MIN': 'Tensin mn. L23', 'TENSION_L23_MED': 'Tensin L23', 'TENSION_L23_MAX': 'Tensin mx. L23',
+            'TENSION_L31_MIN': 'Tensin mn. L31', 'TENSION_L31_MED': 'Tensin L31', 'TENSION_L31_MAX': 'Tensin mx. L31'
+        },
+        'estadistico': 'Percentil',
+        'comparador': 'fuera_De_Rango',
+        'limites': ('tension_Inferior', 'tension_Superior'),
+        'etiquetas': {'cumple': ("SÍ", "NO", "BUEN"), 'no_Cumple': ("NO", "SÍ", "MAL")}
+    },
+    'corriente': {
+        'titulo': "Corriente",
+        'tabla': 'df_Tabla_Calculos_Corriente',
+        'columnas': {
+            'CORRIENTE_L1_MIN': 'Corriente mn. L1', 'CORRIENTE_L1_MED': 'Corriente L1', 'CORRIENTE_L1_MAX': 'Corriente mx. L1',
+            'CORRIENTE_L2_MIN': 'Corriente mn. L2', 'CORRIENTE_L2_MED': 'Corriente L2', 'CORRIENTE_L2_MAX': 'Corriente mx. L2',
+            'CORRIENTE_L3_MIN': 'Corriente mn. L3', 'CORRIENTE_L3_MED': 'Corriente L3', 'CORRIENTE_L3_MAX': 'Corriente mx. L3'
+        },
+        'estadistico': 'Percentil',
+        'comparador': 'mayor',
+        'limites': ('corriente_Nominal',),
+        'etiquetas': {'cumple': ("DENTRO",), 'no_Cumple': ("FUERA",)}
+    },
+    'desbalance_Tension': {
+        'titulo': "Desbalance de Tensión",
+        'tabla': 'df_Tabla_Calculos_Desb_Tension',
+        'columnas': {'DESBALANCE_TENSION': 'Desbalance'},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor',
+        'limites': ('ref_Desbalance_Tension',),
+        'etiquetas': {'cumple': ("NO", "NO SUPERA", "SÍ CUMPLE"), 'no_Cumple': ("SÍ", "SÍ SUPERA", "NO CUMPLE")}
+    },
+    'desbalance_Corriente': {
+        'titulo': "Desbalance de Corriente",
+        'tabla': 'df_Tabla_Calculos_Desb_Corriente',
+        'columnas': {'DESBALANCE_CORRIENTE': 'Desbalance'},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor',
+        'limites': ('ref_Desbalance_Corriente',),
+        'etiquetas': {'cumple': ("NO", "NO SUPERA", "SÍ CUMPLE"), 'no_Cumple': ("SÍ", "SÍ SUPERA", "NO CUMPLE")}
+    },
+    'thdv': {
+        'titulo': "THDv",
+        'tabla': 'df_Tabla_Calculos_DistTension',
+        'columnas': {'THDV_DISTTENSION_L1': 'V THD/d Mx. L1', 'THDV_DISTTENSION_L2': 'V THD/d Mx. L2', 'THDV_DISTTENSION_L3': 'V THD/d Mx. L3'},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor_O_Igual',
+        'limites': ('limite_THDV',),
+        'etiquetas': {'cumple': ("SÍ CUMPLE",), 'no_Cumple': ("NO CUMPLE",)}
+    },
+    'armonicos_3_9': {
+        'titulo': "Armónicos de Corriente 3-9",
+        'tabla': 'df_Tabla_Calculos_Armonicos_DistCorriente',
+        'columnas': {f"ARMONICO_{armonico}_{fase}": f"Arm. corriente {armonico} {fase}" for armonico in (3, 5, 7, 9) for fase in ('L1', 'L2', 'L3')},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor',
+        'limites': ('limite_Armonicos_3_9',),
+        'etiquetas': {'cumple': ("SÍ CUMPLEN",), 'no_Cumple': ("NO CUMPLEN",)}
+    },
+    'armonicos_11': {
+        'titulo': "Armónicos de Corriente 11",
+        'tabla': 'df_Tabla_Calculos_Armonicos_DistCorriente',
+        'columnas': {f"ARMONICO_11_{fase}": f"Arm. corriente 11 {fase}" for fase in ('L1', 'L2', 'L3')},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor',
+        'limites': ('limite_Armonicos_11',),
+        'etiquetas': {'cumple': ("SÍ CUMPLEN",), 'no_Cumple': ("NO CUMPLEN",)}
+    },
+    'tdd': {
+        'titulo': "TDD",
+        'tabla': 'df_Tabla_Calculos_CargabilidadTDD',
+        'columnas': {'TDD_PERCENTIL_L1': 'resultado_TDD_L1', 'TDD_PERCENTIL_L2': 'resultado_TDD_L2', 'TDD_PERCENTIL_L3': 'resultado_TDD_L3'},
+        'estadistico': 'Percentil',
+        'comparador': 'mayor_O_Igual',
+        'limites': ('limite_TDD',),
+        'etiquetas': {'cumple': ("SÍ CUMPLEN", "NO SUPERAN"), 'no_Cumple': ("NO CUMPLEN", "SÍ SUPERAN")}
+    }
+}
+
+# Medidas de la corriente de neutro (se informa su máximo junto con la observación de corriente)
+COLUMNAS_CORRIENTE_NEUTRA: dict = {
+    'CORRIENTE_NEUTRA_MIN': 'Corriente de neutro mn.',
+    'CORRIENTE_NEUTRA_MED': 'Corriente de neutro',
+    'CORRIENTE_NEUTRA_MAX': 'Corriente de neutro mx.'
+}
+
+def crear_Matriz_Resumen(tablas_Medidas: dict) -> pd.DataFrame:
+    """
+    Crea la matriz de resumen de una medición (una sola fila) a partir de las tablas de medidas del informe (filas
+    'Percentil', 'Media', 'Min' y 'Max' por columna). Las matrices de varias mediciones o ventanas se unen con 'pd.concat'.
+
+    Args:
+        tablas_Medidas (dict): Tablas de medidas por llave (por ejemplo {'df_Tabla_Calculos_Tension': DataFrame}).
+
+    Returns:
+        pd.DataFrame: Matriz de una fila con columnas (tabla, columna, estadístico).
+    """
+    valores_Medidas = pd.concat({llave: tabla.unstack() for llave, tabla in tablas_Medidas.items()})
+    valores_Medidas.index = valores_Medidas.index.set_names(['tabla', 'columna', 'estadistico'])
+
+    return valores_Medidas.to_frame().T.reset_index(drop=True)
+
+def obtener_Valores_Regla(matriz_Resumen: pd.DataFrame, regla: dict) -> np.ndarray:
+    """
+    Obtiene los valores de las medidas de una regla (redondeados a 2 decimales, como se muestran en el informe).
+
+    Args:
+        matriz_Resumen (pd.DataFrame): Matriz de resumen creada con 'crear_Matriz_Resumen'.
+        regla (dict): Regla de 'REGLAS_CUMPLIMIENTO'.
+
+    Returns:
+        np.ndarray: Matriz (filas de la matriz de resumen x medidas de la regla).
+    """
+    columnas_Regla = [(regla['tabla'], columna, regla['estadistico']) for columna in regla['columnas'].values()]
+
+    return np.round(matriz_Resumen[columnas_Regla].to_numpy(dtype=np.float64), 2)
+
+def evaluar_Reglas_Cumplimiento(matriz_Resumen: pd.DataFrame, limites: dict, reglas: dict = None) -> tuple:
+    """
+    Evalúa todas las reglas de cumplimiento sobre todas las filas de la matriz de resumen.
+
+    Args:
+        matriz_Resumen (pd.DataFrame): Matriz de resumen (una fila por medición o ventana), creada con 'crear_Matriz_Resumen'.
+        limites (dict): Límites por nombre; cada valor es un número o un arreglo con un límite por fila.
+        reglas (dict): Reglas a evaluar (por defecto, 'REGLAS_CUMPLIMIENTO').
+
+    Returns:
+        tuple: Tabla de cumplimiento (pd.DataFrame con el índice de la matriz y columnas (regla, 'cumple') y (regla,
+        'etiqueta_N')) y diccionario regla -> máscara booleana (filas x medidas) con las medidas que no cumplen.
+
+    Raises:
+        ValueError: Si una regla usa un comparador que no existe o un límite que no se indicó.
+    """
+    reglas = REGLAS_CUMPLIMIENTO if reglas is None else reglas
+    cantidad_Filas = len(matriz_Resumen)
+
+    columnas_Cumplimiento: dict = {}
+    mascaras_No_Cumplen: dict = {}
+
+    for nombre_Regla, regla in reglas.items():
+        if regla['comparador'] not in COMPARADORES_CUMPLIMIENTO:
+            raise ValueError(f"La regla '{nombre_Regla}' usa un comparador no válido: {regla['comparador']}.")
+
+        if any(limite not in limites for limite in regla['limites']):
+            raise ValueError(f"Faltan límites para la regla '{nombre_Regla}': {', '.join(regla['limites'])}.")
+
+        # Límites como columnas (un valor por fila) para compararlos con todas las medidas de la regla a la vez
+        limites_Regla = [np.broadcast_to(np.asarray(limites[limite], dtype=np.float64), (cantidad_Filas,))[:, None] for limite in regla['limites']]
+
+        mascara_No_Cumple = COMPARADORES_CUMPLIMIENTO[regla['comparador']](obtener_Valores_Regla(matriz_Resumen, regla), limites_Regla)
+        no_Cumple = mascara_No_Cumple.any(axis=1)
+
+        columnas_Cumplimiento[(nombre_Regla, 'cumple')] = ~no_Cumple
+
+        for posicion, (etiqueta_Cumple, etiqueta_No_Cumple) in enumerate(zip(regla['etiquetas']['cumple'], regla['etiquetas']['no_Cumple']), start=1):
+            columnas_Cumplimiento[(nombre_Regla, f"etiqueta_{posicion}")] = np.where(no_Cumple, etiqueta_No_Cumple, etiqueta_Cumple)
+
+        mascaras_No_Cumplen[nombre_Regla] = mascara_No_Cumple
+
+    return pd.DataFrame(columnas_Cumplimiento, index=matriz_Resumen.index), mascaras_No_Cumplen
+
+def obtener_Maximo_Medidas(matriz_Resumen: pd.DataFrame, tabla: str, columnas: dict, estadistico: str = 'Percentil') -> list:
+    """
+    Obtiene, para cada fila de la matriz de resumen, la medida con el valor más alto y su valor (redondeado a 2 decimales).
+
+    Args:
+        matriz_Resumen (pd.DataFrame): Matriz de resumen creada con 'crear_Matriz_Resumen'.
+        tabla (str): Llave de la tabla de medidas.
+        columnas (dict): Etiqueta -> columna de la tabla.
+        estadistico (str): Estadístico de la tabla.
+
+    Returns:
+        list: Diccionario {etiqueta: valor} por fila.
+    """
+    valores = obtener_Valores_Regla(matriz_Resumen, {'tabla': tabla, 'columnas': columnas, 'estadistico': estadistico})
+    etiquetas = list(columnas.keys())
+
+    # Los valores vacíos no se toman como máximo (como en la comparación de Python, la primera medida gana los empates)
+    posiciones_Maximo = np.where(np.isnan(valores), -np.inf, valores).argmax(axis=1)
+
+    return [{etiquetas[posicion]: valores[fila, posicion]} for fila, posicion in enumerate(posiciones_Maximo)]
+
+def crear_Observaciones_Informe(matriz_Resumen: pd.DataFrame, tabla_Cumplimiento: pd.DataFrame, mascaras_No_Cumplen: dict, fila: int = 0) -> dict:
+    """
+    Arma las observaciones de una fila de la matriz de resumen con la estructura que usa el documento de Word.
+
+    Args:
+        matriz_Resumen (pd.DataFrame): Matriz de resumen creada con 'crear_Matriz_Resumen'.
+        tabla_Cumplimiento (pd.DataFrame): Tabla de cumplimiento de 'evaluar_Reglas_Cumplimiento'.
+        mascaras_No_Cumplen (dict): Máscaras de las medidas que no cumplen, de 'evaluar_Reglas_Cumplimiento'.
+        fila (int): Posición de la fila.
+
+    Returns:
+        dict: Observaciones de tensión, corriente, desbalances, THDV, armónicos de corriente y TDD.
+    """
+    def etiquetas_Regla(nombre_Regla: str) -> list:
+        return [str(tabla_Cumplimiento[columna].iloc[fila]) for columna in tabla_Cumplimiento.columns if columna[0] == nombre_Regla and columna[1] != 'cumple']
+
+    def valores_No_Cumplen(nombre_Regla: str) -> list:
+        valores = obtener_Valores_Regla(matriz_Resumen.iloc[[fila]], REGLAS_CUMPLIMIENTO[nombre_Regla])[0]
+        return list(valores[mascaras_No_Cumplen[nombre_Regla][fila]])
+
+    etiquetas_Tension = etiquetas_Regla('tension')
+    regla_Corriente = REGLAS_CUMPLIMIENTO['corriente']
+
+    return {
+        'observaciones_Tension': {
+            "valores_No_Cumplen": valores_No_Cumplen('tension'),
+            "cumple_Condicion": etiquetas_Tension[0],
+            "cumple_Condicion_2": etiquetas_Tension[1],
+            "cumple_Condicion_3": etiquetas_Tension[2]
+        },
+        'observaciones_Corriente': {
+            'val_Maximo_Corriente': obtener_Maximo_Medidas(matriz_Resumen.iloc[[fila]], regla_Corriente['tabla'], regla_Corriente['columnas'])[0],
+            'resultado_Comparacion_Corriente': etiquetas_Regla('corriente')[0],
+            'val_Maximo_CorrienteNeutra': obtener_Maximo_Medidas(matriz_Resumen.iloc[[fila]], regla_Corriente['tabla'], COLUMNAS_CORRIENTE_NEUTRA)[0]
+        },
+        'observaciones_DesbTension': etiquetas_Regla('desbalance_Tension'),
+        'observaciones_DesbCorriente': etiquetas_Regla('desbalance_Corriente'),
+        'observaciones_THDV': etiquetas_Regla('thdv')[0],
+        'observaciones_ArmonicosCorriente': {
+            "resultado_Arm_3_9": etiquetas_Regla('armonicos_3_9')[0],
+            "no_Cumplen_Arm_3_9": valores_No_Cumplen('armonicos_3_9'),
+            "resultado_Arm_11": etiquetas_Regla('armonicos_11')[0],
+            "no_Cumplen_Arm_11": valores_No_Cumplen('armonicos_11')
+        },
+        'observaciones_TDD': etiquetas_Regla('tdd')
+    }
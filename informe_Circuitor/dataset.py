@@ -0,0 +1,151 @@
+import io
+import json
+import datetime
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Versión del formato del dataset procesado (se guarda en los metadatos del archivo)
+VERSION_DATASET: int = 1
+
+# Columnas derivadas que se agregan a los datos de Minuto a Minuto: nombre en el dataset -> (llave de la tabla en los
+# resultados del informe, columna de esa tabla)
+COLUMNAS_DERIVADAS_DATASET: dict = {
+    'Desbalance Tension': ('df_Tabla_Desb_Tension', 'Desbalance'),
+    'Desbalance Corriente': ('df_Tabla_Desb_Corriente', 'Desbalance'),
+    'resultado_TDD_L1': ('df_Tabla_TDDFinal', 'resultado_TDD_L1'),
+    'resultado_TDD_L2': ('df_Tabla_TDDFinal', 'resultado_TDD_L2'),
+    'resultado_TDD_L3': ('df_Tabla_TDDFinal', 'resultado_TDD_L3')
+}
+
+# Relaciones de energía del archivo de Hora a Hora que se asignan a cada minuto de la hora correspondiente
+COLUMNAS_ENERGIA_DATASET: list = ['KARH_IND', 'KVARH_CAP']
+
+def crear_DataFrame_Dataset(df: pd.DataFrame, resultados: dict) -> pd.DataFrame:
+    """
+    Arma el DataFrame del dataset procesado: los datos limpios de Minuto a Minuto (solo columnas numéricas, con la fecha
+    como marca de tiempo y el día), las columnas derivadas del informe (desbalances y TDD) y las relaciones de energía
+    de la hora a la que pertenece cada minuto. Las filas quedan ordenadas por fecha.
+
+    Args:
+        df (pd.DataFrame): DataFrame de Minuto a Minuto, organizado con 'organizar_DataFrame_M_a_M'.
+        resultados (dict): Resultados del informe calculados con 'calcular_Resultados_Informe'.
+
+    Returns:
+        pd.DataFrame: DataFrame del dataset.
+    """
+    fechas = pd.to_datetime(df['Fecha/hora'].astype(str), format='%d/%m/%y %H:%M:%S', errors='coerce')
+
+    df_Dataset = pd.concat([
+        pd.DataFrame({'fecha_y_Hora': fechas, 'dia': fechas.dt.date}, index=df.index),
+        df.select_dtypes(include=['number'])
+    ], axis=1)
+
+    # Las tablas del informe conservan el índice del DataFrame de Minuto a Minuto, por lo que se alinean por índice
+    for nombre_Columna, (llave_Tabla, columna_Tabla) in COLUMNAS_DERIVADAS_DATASET.items():
+        df_Dataset[nombre_Columna] = resultados[llave_Tabla][columna_Tabla]
+
+    # Relaciones de energía por hora (una sola búsqueda por minuto a partir del inicio de su hora)
+    df_Tabla_Energias = resultados['df_Tabla_Energias']
+    horas_Energias = pd.to_datetime(df_Tabla_Energias['Fecha/hora'], format='%d/%m/%y %H:%M:%S', errors='coerce')
+    df_Energias_Hora = df_Tabla_Energias[COLUMNAS_ENERGIA_DATASET].set_axis(horas_Energias.dt.floor('h'), axis=0)
+    df_Energias_Hora = df_Energias_Hora[df_Energias_Hora.index.notna() & ~df_Energias_Hora.index.duplicated()]
+
+    posiciones_Hora = df_Energias_Hora.index.get_indexer(fechas.dt.floor('h'))
+
+    # Los minutos sin hora en el archivo de Hora a Hora tienen posición -1 y toman el NaN agregado al final
+    for columna in COLUMNAS_ENERGIA_DATASET:
+        valores_Energia = np.append(df_Energias_Hora[columna].to_numpy(dtype=np.float64), np.nan)
+        df_Dataset[columna] = valores_Energia[posiciones_Hora]
+
+    return df_Dataset.sort_values('fecha_y_Hora', kind='stable', na_position='last').reset_index(drop=True)
+
+def crear_Metadatos_Dataset(df_Dataset: pd.DataFrame, resultados: dict, parametros: dict, huella_Archivo: str = None) -> dict:
+    """
+    Crea los metadatos del informe que se guardan dentro del archivo del dataset (parámetros de entrada, límites
+    calculados y descripción de las columnas derivadas).
+
+    Args:
+        df_Dataset (pd.DataFrame): DataFrame del dataset, creado con 'crear_DataFrame_Dataset'.
+        resultados (dict): Resultados del informe calculados con 'calcular_Resultados_Informe'.
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        huella_Archivo (str): Huella del archivo de Minuto a Minuto, opcional.
+
+    Returns:
+        dict: Metadatos del dataset.
+    """
+    return {
+        'version': VERSION_DATASET,
+        'generado': datetime.datetime.now().isoformat(timespec='seconds'),
+        'huella_Archivo': huella_Archivo,
+        'filas': len(df_Dataset),
+        'fecha_Inicial': str(df_Dataset['fecha_y_Hora'].min()),
+        'fecha_Final': str(df_Dataset['fecha_y_Hora'].max()),
+        'parametros': {llave: float(valor) for llave, valor in parametros.items()},
+        'limites': {
+            'tension_Inferior': float(resultados['var_Limite_Inferior_Tension']),
+            'tension_Superior': float(resultados['var_Limite_Superior_Tension']),
+            'corriente_Nominal': float(resultados['var_Corriente_Nominal_Value']),
+            'limite_TDD': float(resultados['valor_Limite_TDD'])
+        },
+        'columnas_Derivadas': {
+            'Desbalance Tension': "Desbalance de tensión (%) entre las tensiones L12, L23 y L31.",
+            'Desbalance Corriente': "Desbalance de corriente (%) entre las corrientes L1, L2 y L3.",
+            'resultado_TDD_L1': "TDD (%) de la fase L1.",
+            'resultado_TDD_L2': "TDD (%) de la fase L2.",
+            'resultado_TDD_L3': "TDD (%) de la fase L3.",
+            'KARH_IND': "Relación energía inductiva / energía activa (%) de la hora del registro.",
+            'KVARH_CAP': "Relación energía capacitiva / energía activa (%) de la hora del registro."
+        }
+    }
+
+def exportar_Dataset_Parquet(df_Dataset: pd.DataFrame, metadatos: dict, nivel_Compresion: int = 3) -> bytes:
+    """
+    Escribe el dataset procesado en un único archivo Parquet comprimido con zstd, con un grupo de filas por día para
+    que se pueda leer un rango de días sin leer el archivo completo (por ejemplo, con el filtro ('dia', '==', fecha)).
+    Los metadatos del informe se guardan en el esquema del archivo, bajo la llave 'circuitor'.
+
+    Args:
+        df_Dataset (pd.DataFrame): DataFrame del dataset ordenado por fecha, creado con 'crear_DataFrame_Dataset'.
+        metadatos (dict): Metadatos del dataset, creados con 'crear_Metadatos_Dataset'.
+        nivel_Compresion (int): Nivel de compresión de zstd.
+
+    Returns:
+        bytes: Contenido del archivo Parquet.
+    """
+    tabla_Dataset = pa.Table.from_pandas(df_Dataset, preserve_index=False)
+    tabla_Dataset = tabla_Dataset.set_column(
+        tabla_Dataset.schema.get_field_index('fecha_y_Hora'), 'fecha_y_Hora', tabla_Dataset['fecha_y_Hora'].cast(pa.timestamp('ms'))
+    )
+    tabla_Dataset = tabla_Dataset.replace_schema_metadata({
+        **(tabla_Dataset.schema.metadata or {}),
+        b'circuitor': json.dumps(metadatos, ensure_ascii=False).encode('utf-8')
+    })
+
+    # Posiciones donde empieza cada día (las filas ya están ordenadas por fecha; las fechas vacías quedan al final)
+    dias = df_Dataset['fecha_y_Hora'].dt.floor('D').to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    inicios_Dias = np.flatnonzero(np.r_[True, dias[1:] != dias[:-1]]) if len(dias) else np.array([0])
+    finales_Dias = np.r_[inicios_Dias[1:], len(dias)]
+
+    buffer_Dataset = io.BytesIO()
+
+    with pq.ParquetWriter(buffer_Dataset, tabla_Dataset.schema, compression='zstd', compression_level=nivel_Compresion) as escritor_Parquet:
+        for inicio_Dia, final_Dia in zip(inicios_Dias, finales_Dias):
+            escritor_Parquet.write_table(tabla_Dataset.slice(inicio_Dia, final_Dia - inicio_Dia), row_group_size=max(final_Dia - inicio_Dia, 1))
+
+    return buffer_Dataset.getvalue()
+
+def leer_Metadatos_Dataset(archivo_Dataset) -> dict:
+    """
+    Lee los metadatos del informe guardados en un archivo del dataset, sin leer los datos.
+
+    Args:
+        archivo_Dataset (str | file-like): Ruta o archivo Parquet del dataset.
+
+    Returns:
+        dict: Metadatos del dataset (diccionario vacío si el archivo no los tiene).
+    """
+    metadatos_Esquema = pq.read_schema(archivo_Dataset).metadata or {}
+
+    return json.loads(metadatos_Esquema[b'circuitor']) if b'circuitor' in metadatos_Esquema else {}
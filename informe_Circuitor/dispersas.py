@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from .grupos import calcular_Estadisticas_Grupos
+
+# Columnas de baja frecuencia del archivo de Minuto a Minuto (el Plt del Flicker se registra una vez cada 2 horas):
+# se guardan como series dispersas, solo con sus muestras válidas, porque el relleno de los vacíos del Minuto a Minuto
+# (promedio y 0) las distorsiona
+COLUMNAS_SERIES_DISPERSAS: list = ['Plt L1', 'Plt L2', 'Plt L3']
+
+def extraer_Series_Dispersas(dataFrame: pd.DataFrame, columnas: list = None, fecha_col: str = 'Fecha/hora', formato_Fecha: str = '%d/%m/%y %H:%M:%S') -> pd.DataFrame:
+    """
+    Extrae las muestras válidas (con valor y fecha) de las columnas de baja frecuencia, antes de rellenar los vacíos del
+    DataFrame de Minuto a Minuto. Las muestras de todas las columnas se guardan juntas en formato largo, ordenadas por
+    columna y fecha, de modo que cada columna queda en un bloque contiguo.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame de Minuto a Minuto tal como se leyó del archivo (sin organizar).
+        columnas (list): Columnas a extraer (por defecto, 'COLUMNAS_SERIES_DISPERSAS'); las que no están en el archivo se omiten.
+        fecha_col (str): Columna con la Fecha y Hora.
+        formato_Fecha (str): Formato de la Fecha y Hora.
+
+    Returns:
+        pd.DataFrame: Muestras con las columnas 'Columna' (categórica, con todas las columnas extraídas como categorías),
+        'fecha_y_Hora' y 'Valor'.
+    """
+    columnas = [columna for columna in (COLUMNAS_SERIES_DISPERSAS if columnas is None else columnas) if columna in dataFrame.columns]
+
+    fechas = pd.to_datetime(dataFrame[fecha_col].astype(str), format=formato_Fecha, errors='coerce').to_numpy()
+    valores = dataFrame[columnas].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+
+    # Posiciones (columna, registro) de las muestras válidas, ordenadas por columna y fecha
+    posiciones_Columnas, posiciones_Registros = np.nonzero((~np.isnan(valores) & ~np.isnat(fechas)[:, None]).T)
+    orden = np.lexsort((fechas[posiciones_Registros], posiciones_Columnas))
+    posiciones_Columnas, posiciones_Registros = posiciones_Columnas[orden], posiciones_Registros[orden]
+
+    return pd.DataFrame({
+        'Columna': pd.Categorical.from_codes(posiciones_Columnas, categories=columnas),
+        'fecha_y_Hora': fechas[posiciones_Registros],
+        'Valor': valores[posiciones_Registros, posiciones_Columnas]
+    })
+
+def calcular_Medidas_Series_Dispersas(series_Dispersas: pd.DataFrame, percentil: float = 95) -> pd.DataFrame:
+    """
+    Calcula el percentil, la media, el mínimo y el máximo de cada serie dispersa solo con sus muestras, en una sola
+    reducción agrupada por columna.
+
+    Args:
+        series_Dispersas (pd.DataFrame): Muestras de las series, de 'extraer_Series_Dispersas'.
+        percentil (float): Percentil a calcular.
+
+    Returns:
+        pd.DataFrame: Tabla con las filas 'Percentil', 'Media', 'Min' y 'Max' (como las tablas de medidas del informe) y
+        una columna por serie; las series sin muestras quedan vacías (NaN).
+    """
+    columnas = list(series_Dispersas['Columna'].cat.categories)
+
+    estadisticas = calcular_Estadisticas_Grupos(series_Dispersas['Valor'].to_numpy(), series_Dispersas['Columna'].cat.codes.to_numpy(), len(columnas), percentil)
+
+    return pd.DataFrame([estadisticas[estadistico][:, 0] for estadistico in ('Percentil', 'Media', 'Min', 'Max')], index=['Percentil', 'Media', 'Min', 'Max'], columns=columnas)
+
+def crear_Tabla_Cumplimiento_Series_Dispersas(series_Dispersas: pd.DataFrame, limite: float, percentil: float = 95) -> pd.DataFrame:
+    """
+    Evalúa cada serie dispersa contra su límite solo con las muestras registradas: cantidad de muestras, muestras por
+    encima del límite (contadas con 'np.bincount' sobre los códigos de columna) y cumplimiento según el percentil.
+
+    Args:
+        series_Dispersas (pd.DataFrame): Muestras de las series, de 'extraer_Series_Dispersas'.
+        limite (float): Valor límite de las series (por ejemplo, la referencia del Plt).
+        percentil (float): Percentil que se compara con el límite.
+
+    Returns:
+        pd.DataFrame: Tabla con una fila por serie y las columnas 'Columna', 'Muestras', 'Muestras Fuera de Límite',
+        '% Fuera de Límite', 'P<percentil>', 'Límite' y 'Cumplimiento' ("CUMPLE", "NO CUMPLE" o "SIN DATOS").
+    """
+    columnas = list(series_Dispersas['Columna'].cat.categories)
+    codigos = series_Dispersas['Columna'].cat.codes.to_numpy()
+
+    muestras = np.bincount(codigos, minlength=len(columnas))
+    muestras_Fuera = np.bincount(codigos[series_Dispersas['Valor'].to_numpy() > limite], minlength=len(columnas))
+    percentiles = calcular_Medidas_Series_Dispersas(series_Dispersas, percentil).loc['Percentil'].to_numpy()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        porcentajes_Fuera = np.where(muestras > 0, muestras_Fuera / muestras * 100, 0)
+
+    return pd.DataFrame({
+        'Columna': columnas,
+        'Muestras': muestras.astype(np.int64),
+        'Muestras Fuera de Límite': muestras_Fuera.astype(np.int64),
+        '% Fuera de Límite': porcentajes_Fuera.round(2),
+        f"P{percentil:g}": percentiles.round(3),
+        'Límite': limite,
+        'Cumplimiento': np.where(muestras == 0, "SIN DATOS", np.where(percentiles <= limite, "CUMPLE", "NO CUMPLE"))
+    })
+
+def crear_Tabla_Series_Dispersas(series_Dispersas: pd.DataFrame) -> pd.DataFrame:
+    """
+    Arma la tabla de las series dispersas para el Excel del informe: una fila por fecha con muestra (no por minuto) y
+    una columna por serie.
+
+    Args:
+        series_Dispersas (pd.DataFrame): Muestras de las series, de 'extraer_Series_Dispersas'.
+
+    Returns:
+        pd.DataFrame: Tabla con la columna 'fecha_y_Hora' y una columna por serie.
+    """
+    df_Series = series_Dispersas.pivot_table(index='fecha_y_Hora', columns='Columna', values='Valor', aggfunc='first', observed=False)
+    df_Series.columns = list(df_Series.columns)
+
+    return df_Series.reindex(columns=list(series_Dispersas['Columna'].cat.categories)).reset_index()
@@ -0,0 +1,700 @@
+import io
+from docxtpl import InlineImage
+from docx.shared import Cm
+
+def crear_Registro_Informe(resultados: dict, graficos: dict, parametros: dict, doc) -> dict:
+    """
+    Crea el registro (contexto) del documento de Word con los valores, tablas, observaciones e imágenes del informe.
+
+    Args:
+        resultados (dict): Resultados devueltos por 'calcular_Resultados_Informe'.
+        graficos (dict): Gráficos devueltos por 'generar_Graficos_Informe'.
+        parametros (dict): Valores de entrada del informe, con las llaves de 'PARAMETROS_INFORME'.
+        doc (DocxTemplate): Plantilla del documento de Word, necesaria para crear los InlineImages.
+
+    Returns:
+        dict: Registro que recibe la plantilla de Word (se accede a él usando el nombre de la llave del diccionario).
+    """
+    # Valores de entrada del informe
+    var1 = float(parametros['tension_Nominal'])
+    var2 = float(parametros['capacidad_Transformador'])
+
+    # Resultados de la etapa de cálculo que se usan en el documento
+    var_Limite_Inferior_Tension = resultados['var_Limite_Inferior_Tension']
+    var_Limite_Superior_Tension = resultados['var_Limite_Superior_Tension']
+    var_Corriente_Nominal_Value = resultados['var_Corriente_Nominal_Value']
+    df_Tabla_Calculos_Tension = resultados['df_Tabla_Calculos_Tension']
+    df_Tabla_Calculos_Desb_Tension = resultados['df_Tabla_Calculos_Desb_Tension']
+    df_Tabla_Calculos_Corriente = resultados['df_Tabla_Calculos_Corriente']
+    df_Tabla_Calculos_Desb_Corriente = resultados['df_Tabla_Calculos_Desb_Corriente']
+    df_Tabla_Calculos_PQS_Potencias = resultados['df_Tabla_Calculos_PQS_Potencias']
+    df_Tabla_Calculos_FactorPotencia = resultados['df_Tabla_Calculos_FactorPotencia']
+    df_Tabla_Calculos_FactorPotenciaGeneral = resultados['df_Tabla_Calculos_FactorPotenciaGeneral']
+    df_Tabla_Calculos_DistTension = resultados['df_Tabla_Calculos_DistTension']
+    df_Tabla_Calculos_Armonicos_DistTension = resultados['df_Tabla_Calculos_Armonicos_DistTension']
+    df_Tabla_Calculos_DistCorriente = resultados['df_Tabla_Calculos_DistCorriente']
+    df_Tabla_Calculos_Armonicos_DistCorriente = resultados['df_Tabla_Calculos_Armonicos_DistCorriente']
+    df_Tabla_Calculos_FactorK = resultados['df_Tabla_Calculos_FactorK']
+    df_Tabla_Calculos_Flicker = resultados['df_Tabla_Calculos_Flicker']
+    valor_Maximo_Corrientes = resultados['valor_Maximo_Corrientes']
+    valor_Corriente_Cortacircuito = resultados['valor_Corriente_Cortacircuito']
+    valor_ISC_sobre_IL = resultados['valor_ISC_sobre_IL']
+    valor_Limite_TDD = resultados['valor_Limite_TDD']
+    valores_Limites_Armonicos = resultados['valores_Limites_Armonicos']
+    df_Tabla_Calculos_CargabilidadTDD = resultados['df_Tabla_Calculos_CargabilidadTDD']
+    df_Tabla_Calculos_Energias = resultados['df_Tabla_Calculos_Energias']
+    table_Data_Energy_Info = resultados['table_Data_Energy_Info']
+    var_Lista_Variaciones = resultados['var_Lista_Variaciones']
+    var_Lista_PQS_Carg_Disp = resultados['var_Lista_PQS_Carg_Disp']
+    observaciones_Tension = resultados['observaciones_Tension']
+    observaciones_Corriente = resultados['observaciones_Corriente']
+    observaciones_DesbTension = resultados['observaciones_DesbTension']
+    observaciones_DesbCorriente = resultados['observaciones_DesbCorriente']
+    valor_Referencia_THDV = resultados['valor_Referencia_THDV']
+    observaciones_THDV = resultados['observaciones_THDV']
+    observaciones_ArmonicosCorriente = resultados['observaciones_ArmonicosCorriente']
+    observaciones_TDD = resultados['observaciones_TDD']
+
+    # Buffers de las Imágenes de la etapa de gráficos
+    img_buffer_Timeline_Tension = graficos['Tension']
+    img_buffer_Timeline_Corriente = graficos['Corriente']
+    img_buffer_Timeline_DesbTension = graficos['DesbTension']
+    img_buffer_Timeline_DesbCorriente = graficos['DesbCorriente']
+    img_buffer_Timeline_PQS_ActApa = graficos['PQS_ActApa']
+    img_buffer_Timeline_PQS_CapInd = graficos['PQS_CapInd']
+    img_buffer_Timeline_FactorPotencia = graficos['FactorPotencia']
+    img_buffer_Timeline_DistTension = graficos['DistTension']
+    img_buffer_Timeline_DistCorriente = graficos['DistCorriente']
+    img_buffer_Timeline_CargabilidadTDD = graficos['CargabilidadTDD']
+    img_buffer_Timeline_Flicker = graficos['Flicker']
+    img_buffer_Timeline_FactorK = graficos['FactorK']
+
+    # Gráficos de barras de las energías en formato InlineImage (diccionario anidado por día)
+    graficos_Barras_Energias: dict = {dia: {clave: InlineImage(doc, buffer, Cm(18)) for clave, buffer in graficos_Dia.items()} for dia, graficos_Dia in graficos['Barras_Energias'].items()}
+
+    # Agregar datos y el gráfico al contexto
+    img_Timeline_Tension = InlineImage(doc, img_buffer_Timeline_Tension, Cm(18))
+    img_Timeline_Corriente = InlineImage(doc, img_buffer_Timeline_Corriente, Cm(18))
+    img_Timeline_DesbTension = InlineImage(doc, img_buffer_Timeline_DesbTension, Cm(18))
+    img_Timeline_DesbCorriente = InlineImage(doc, img_buffer_Timeline_DesbCorriente, Cm(18))
+    img_Timeline_PQS_ActInd = InlineImage(doc, img_buffer_Timeline_PQS_ActApa, Cm(18))
+    img_Timeline_PQS_CapApa = InlineImage(doc, img_buffer_Timeline_PQS_CapInd, Cm(18))
+    img_Timeline_FactPotencia = InlineImage(doc, img_buffer_Timeline_FactorPotencia, Cm(18))
+    img_Timeline_DistorsionTension = InlineImage(doc, img_buffer_Timeline_DistTension, Cm(18))
+    img_Timeline_DistorsionCorriente = InlineImage(doc, img_buffer_Timeline_DistCorriente, Cm(18))
+    img_Timeline_CargabilidadTDD = InlineImage(doc, img_buffer_Timeline_CargabilidadTDD, Cm(18))
+    img_Timeline_Flicker = InlineImage(doc, img_buffer_Timeline_Flicker, Cm(18))
+    img_Timeline_FactorK = InlineImage(doc, img_buffer_Timeline_FactorK, Cm(18))
+
+    # Contexto básico que recibe el documento de Word (Se accede a él usando el nombre de la llave del diccionario)
+    registro = {
+        'var_Lim_Inf_Tension': round(var_Limite_Inferior_Tension, 2),
+        'var_Nominal_Value': round(var1, 2),
+        'var_Lim_Sup_Tension': round(var_Limite_Superior_Tension, 2),
+        'var_Cap_Trafo': round(var2, 2),
+        'var_Corr_Nominal_Value': round(var_Corriente_Nominal_Value, 2),
+        'imagen_Linea_Tiempo_Tension': img_Timeline_Tension,
+        'imagen_Linea_Tiempo_Corriente': img_Timeline_Corriente,
+        'imagen_Linea_Tiempo_DesbTension': img_Timeline_DesbTension,
+        'imagen_Linea_Tiempo_DesbCorriente': img_Timeline_DesbCorriente,
+        'imagen_Linea_Tiempo_PQS_ActApa': img_Timeline_PQS_ActInd,
+        'imagen_Linea_Tiempo_PQS_CapInd': img_Timeline_PQS_CapApa,
+        'imagen_Linea_Tiempo_FactorPotencia': img_Timeline_FactPotencia,
+        'graficos_Barras_Energias': graficos_Barras_Energias,
+        'imagen_Linea_Tiempo_DistTension': img_Timeline_DistorsionTension,
+        'imagen_Linea_Tiempo_DistCorriente': img_Timeline_DistorsionCorriente,
+        'imagen_Linea_Tiempo_CargTDD': img_Timeline_CargabilidadTDD,
+        'imagen_Linea_Tiempo_Flicker': img_Timeline_Flicker,
+        'imagen_Linea_Tiempo_FactorK': img_Timeline_FactorK,
+        'table_Data_Energy': table_Data_Energy_Info,
+        'L12_MIN_PR': round(df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[0], 2),
+        'L12_MED_PR': round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[0], 2),
+        'L12_MAX_PR': round(df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[0], 2),
+        'L23_MIN_PR': round(df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[0], 2),
+        'L23_MED_PR': round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[0], 2),
+        'L23_MAX_PR': round(df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[0], 2),
+        'L31_MIN_PR': round(df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[0], 2),
+        'L31_MED_PR': round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[0], 2),
+        'L31_MAX_PR': round(df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[0], 2),
+        'L1_CORR_MIN_PR': round(df_Tabla_Calculos_Corriente['Corriente mn. L1'].iloc[0], 2),
+        'L1_CORR_MED_PR': round(df_Tabla_Calculos_Corriente['Corriente L1'].iloc[0], 2),
+        'L1_CORR_MAX_PR': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[0], 2),
+        'L2_CORR_MIN_PR': round(df_Tabla_Calculos_Corriente['Corriente mn. L2'].iloc[0], 2),
+        'L2_CORR_MED_PR': round(df_Tabla_Calculos_Corriente['Corriente L2'].iloc[0], 2),
+        'L2_CORR_MAX_PR': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[0], 2),
+        'L3_CORR_MIN_PR': round(df_Tabla_Calculos_Corriente['Corriente mn. L3'].iloc[0], 2),
+        'L3_CORR_MED_PR': round(df_Tabla_Calculos_Corriente['Corriente L3'].iloc[0], 2),
+        'L3_CORR_MAX_PR': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[0], 2),
+        'LN_CORR_MIN_PR': round(df_Tabla_Calculos_Corriente['Corriente de neutro mn.'].iloc[0], 2),
+        'LN_CORR_MED_PR': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[0], 2),
+        'LN_CORR_MAX_PR': round(df_Tabla_Calculos_Corriente['Corriente de neutro mx.'].iloc[0], 2),
+        'L12_MIN_MX': round(df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[3], 2),
+        'L12_MED_MX': round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[3], 2),
+        'L12_MAX_MX': round(df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[3], 2),
+        'L23_MIN_MX': round(df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[3], 2),
+        'L23_MED_MX': round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[3], 2),
+        'L23_MAX_MX': round(df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[3], 2),
+        'L31_MIN_MX': round(df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[3], 2),
+        'L31_MED_MX': round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[3], 2),
+        'L31_MAX_MX': round(df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[3], 2),
+        'L1_CORR_MIN_MX': round(df_Tabla_Calculos_Corriente['Corriente mn. L1'].iloc[3], 2),
+        'L1_CORR_MED_MX': round(df_Tabla_Calculos_Corriente['Corriente L1'].iloc[3], 2),
+        'L1_CORR_MAX_MX': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[3], 2),
+        'L2_CORR_MIN_MX': round(df_Tabla_Calculos_Corriente['Corriente mn. L2'].iloc[3], 2),
+        'L2_CORR_MED_MX': round(df_Tabla_Calculos_Corriente['Corriente L2'].iloc[3], 2),
+        'L2_CORR_MAX_MX': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[3], 2),
+        'L3_CORR_MIN_MX': round(df_Tabla_Calculos_Corriente['Corriente mn. L3'].iloc[3], 2),
+        'L3_CORR_MED_MX': round(df_Tabla_Calculos_Corriente['Corriente L3'].iloc[3], 2),
+        'L3_CORR_MAX_MX': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[3], 2),
+        'LN_CORR_MIN_MX': round(df_Tabla_Calculos_Corriente['Corriente de neutro mn.'].iloc[3], 2),
+        'LN_CORR_MED_MX': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[3], 2),
+        'LN_CORR_MAX_MX': round(df_Tabla_Calculos_Corriente['Corriente de neutro mx.'].iloc[3], 2),
+        'L12_MIN_PM': round(df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[1], 2),
+        'L12_MED_PM': round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[1], 2),
+        'L12_MAX_PM': round(df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[1], 2),
+        'L23_MIN_PM': round(df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[1], 2),
+        'L23_MED_PM': round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[1], 2),
+        'L23_MAX_PM': round(df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[1], 2),
+        'L31_MIN_PM': round(df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[1], 2),
+        'L31_MED_PM': round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[1], 2),
+        'L31_MAX_PM': round(df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[1], 2),
+        'L1_CORR_MIN_PM': round(df_Tabla_Calculos_Corriente['Corriente mn. L1'].iloc[1], 2),
+        'L1_CORR_MED_PM': round(df_Tabla_Calculos_Corriente['Corriente L1'].iloc[1], 2),
+        'L1_CORR_MAX_PM': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[1], 2),
+        'L2_CORR_MIN_PM': round(df_Tabla_Calculos_Corriente['Corriente mn. L2'].iloc[1], 2),
+        'L2_CORR_MED_PM': round(df_Tabla_Calculos_Corriente['Corriente L2'].iloc[1], 2),
+        'L2_CORR_MAX_PM': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[1], 2),
+        'L3_CORR_MIN_PM': round(df_Tabla_Calculos_Corriente['Corriente mn. L3'].iloc[1], 2),
+        'L3_CORR_MED_PM': round(df_Tabla_Calculos_Corriente['Corriente L3'].iloc[1], 2),
+        'L3_CORR_MAX_PM': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[1], 2),
+        'LN_CORR_MIN_PM': round(df_Tabla_Calculos_Corriente['Corriente de neutro mn.'].iloc[1], 2),
+        'LN_CORR_MED_PM': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[1], 2),
+        'LN_CORR_MAX_PM': round(df_Tabla_Calculos_Corriente['Corriente de neutro mx.'].iloc[1], 2),
+        'L12_MIN_MN': round(df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[2], 2),
+        'L12_MED_MN': round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[2], 2),
+        'L12_MAX_MN': round(df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[2], 2),
+        'L23_MIN_MN': round(df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[2], 2),
+        'L23_MED_MN': round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[2], 2),
+        'L23_MAX_MN': round(df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[2], 2),
+        'L31_MIN_MN': round(df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[2], 2),
+        'L31_MED_MN': round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[2], 2),
+        'L31_MAX_MN': round(df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[2], 2),
+        'L1_CORR_MIN_MN': round(df_Tabla_Calculos_Corriente['Corriente mn. L1'].iloc[2], 2),
+        'L1_CORR_MED_MN': round(df_Tabla_Calculos_Corriente['Corriente L1'].iloc[2], 2),
+        'L1_CORR_MAX_MN': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[2], 2),
+        'L2_CORR_MIN_MN': round(df_Tabla_Calculos_Corriente['Corriente mn. L2'].iloc[2], 2),
+        'L2_CORR_MED_MN': round(df_Tabla_Calculos_Corriente['Corriente L2'].iloc[2], 2),
+        'L2_CORR_MAX_MN': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[2], 2),
+        'L3_CORR_MIN_MN': round(df_Tabla_Calculos_Corriente['Corriente mn. L3'].iloc[2], 2),
+        'L3_CORR_MED_MN': round(df_Tabla_Calculos_Corriente['Corriente L3'].iloc[2], 2),
+        'L3_CORR_MAX_MN': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[2], 2),
+        'LN_CORR_MIN_MN': round(df_Tabla_Calculos_Corriente['Corriente de neutro mn.'].iloc[2], 2),
+        'LN_CORR_MED_MN': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[2], 2),
+        'LN_CORR_MAX_MN': round(df_Tabla_Calculos_Corriente['Corriente de neutro mx.'].iloc[2], 2),
+        'val_Pct_Max_VL1': round(var_Lista_Variaciones[3], 2),
+        'val_Pct_Max_VL2': round(var_Lista_Variaciones[4], 2),
+        'val_Pct_Max_VL3': round(var_Lista_Variaciones[5], 2),
+        'val_Pct_Min_VL1': round(var_Lista_Variaciones[0], 2),
+        'val_Pct_Min_VL2': round(var_Lista_Variaciones[1], 2),
+        'val_Pct_Min_VL3': round(var_Lista_Variaciones[2], 2),
+        'V1_DESBTEN_MED_PR': round(df_Tabla_Calculos_Desb_Tension['Tensin L12'].iloc[0], 2),
+        'V2_DESBTEN_MED_PR': round(df_Tabla_Calculos_Desb_Tension['Tensin L23'].iloc[0], 2),
+        'V3_DESBTEN_MED_PR': round(df_Tabla_Calculos_Desb_Tension['Tensin L31'].iloc[0], 2),
+        'DESBTEN_PROMEDIO_PR': round(df_Tabla_Calculos_Desb_Tension['Promedio'].iloc[0], 2),
+        'V1_DESBTEN_DELTA_PR': round(df_Tabla_Calculos_Desb_Tension['delta_V1'].iloc[0], 2),
+        'V2_DESBTEN_DELTA_PR': round(df_Tabla_Calculos_Desb_Tension['delta_V2'].iloc[0], 2),
+        'V3_DESBTEN_DELTA_PR': round(df_Tabla_Calculos_Desb_Tension['delta_V3'].iloc[0], 2),
+        'VALUE_DESBTEN_PR': round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[0], 2),
+        'V1_DESBTEN_MED_MX': round(df_Tabla_Calculos_Desb_Tension['Tensin L12'].iloc[3], 2),
+        'V2_DESBTEN_MED_MX': round(df_Tabla_Calculos_Desb_Tension['Tensin L23'].iloc[3], 2),
+        'V3_DESBTEN_MED_MX': round(df_Tabla_Calculos_Desb_Tension['Tensin L31'].iloc[3], 2),
+        'DESBTEN_PROMEDIO_MX': round(df_Tabla_Calculos_Desb_Tension['Promedio'].iloc[3], 2),
+        'V1_DESBTEN_DELTA_MX': round(df_Tabla_Calculos_Desb_Tension['delta_V1'].iloc[3], 2),
+        'V2_DESBTEN_DELTA_MX': round(df_Tabla_Calculos_Desb_Tension['delta_V2'].iloc[3], 2),
+        'V3_DESBTEN_DELTA_MX': round(df_Tabla_Calculos_Desb_Tension['delta_V3'].iloc[3], 2),
+        'VALUE_DESBTEN_MX': round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[3], 2),
+        'V1_DESBTEN_MED_PM': round(df_Tabla_Calculos_Desb_Tension['Tensin L12'].iloc[1], 2),
+        'V2_DESBTEN_MED_PM': round(df_Tabla_Calculos_Desb_Tension['Tensin L23'].iloc[1], 2),
+        'V3_DESBTEN_MED_PM': round(df_Tabla_Calculos_Desb_Tension['Tensin L31'].iloc[1], 2),
+        'DESBTEN_PROMEDIO_PM': round(df_Tabla_Calculos_Desb_Tension['Promedio'].iloc[1], 2),
+        'V1_DESBTEN_DELTA_PM': round(df_Tabla_Calculos_Desb_Tension['delta_V1'].iloc[1], 2),
+        'V2_DESBTEN_DELTA_PM': round(df_Tabla_Calculos_Desb_Tension['delta_V2'].iloc[1], 2),
+        'V3_DESBTEN_DELTA_PM': round(df_Tabla_Calculos_Desb_Tension['delta_V3'].iloc[1], 2),
+        'VALUE_DESBTEN_PM': round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[1], 2),
+        'V1_DESBTEN_MED_MN': round(df_Tabla_Calculos_Desb_Tension['Tensin L12'].iloc[2], 2),
+        'V2_DESBTEN_MED_MN': round(df_Tabla_Calculos_Desb_Tension['Tensin L23'].iloc[2], 2),
+        'V3_DESBTEN_MED_MN': round(df_Tabla_Calculos_Desb_Tension['Tensin L31'].iloc[2], 2),
+        'DESBTEN_PROMEDIO_MN': round(df_Tabla_Calculos_Desb_Tension['Promedio'].iloc[2], 2),
+        'V1_DESBTEN_DELTA_MN': round(df_Tabla_Calculos_Desb_Tension['delta_V1'].iloc[2], 2),
+        'V2_DESBTEN_DELTA_MN': round(df_Tabla_Calculos_Desb_Tension['delta_V2'].iloc[2], 2),
+        'V3_DESBTEN_DELTA_MN': round(df_Tabla_Calculos_Desb_Tension['delta_V3'].iloc[2], 2),
+        'VALUE_DESBTEN_MN': round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[2], 2),
+        'V1_DESBCORR_MED_PR': round(df_Tabla_Calculos_Desb_Corriente['Corriente L1'].iloc[0], 2),
+        'V2_DESBCORR_MED_PR': round(df_Tabla_Calculos_Desb_Corriente['Corriente L2'].iloc[0], 2),
+        'V3_DESBCORR_MED_PR': round(df_Tabla_Calculos_Desb_Corriente['Corriente L3'].iloc[0], 2),
+        'DESBCORR_PROMEDIO_PR': round(df_Tabla_Calculos_Desb_Corriente['Promedio'].iloc[0], 2),
+        'DESBCORR_MAXMED_PR': round(df_Tabla_Calculos_Desb_Corriente['max_Corrientes_Medias'].iloc[0], 2),
+        'VALUE_DESBCORR_PR': round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[0], 2),
+        'V1_DESBCORR_MED_MX': round(df_Tabla_Calculos_Desb_Corriente['Corriente L1'].iloc[3], 2),
+        'V2_DESBCORR_MED_MX': round(df_Tabla_Calculos_Desb_Corriente['Corriente L2'].iloc[3], 2),
+        'V3_DESBCORR_MED_MX': round(df_Tabla_Calculos_Desb_Corriente['Corriente L3'].iloc[3], 2),
+        'DESBCORR_PROMEDIO_MX': round(df_Tabla_Calculos_Desb_Corriente['Promedio'].iloc[3], 2),
+        'DESBCORR_MAXMED_MX': round(df_Tabla_Calculos_Desb_Corriente['max_Corrientes_Medias'].iloc[3], 2),
+        'VALUE_DESBCORR_MX': round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[3], 2),
+        'V1_DESBCORR_MED_PM': round(df_Tabla_Calculos_Desb_Corriente['Corriente L1'].iloc[1], 2),
+        'V2_DESBCORR_MED_PM': round(df_Tabla_Calculos_Desb_Corriente['Corriente L2'].iloc[1], 2),
+        'V3_DESBCORR_MED_PM': round(df_Tabla_Calculos_Desb_Corriente['Corriente L3'].iloc[1], 2),
+        'DESBCORR_PROMEDIO_PM': round(df_Tabla_Calculos_Desb_Corriente['Promedio'].iloc[1], 2),
+        'DESBCORR_MAXMED_PM': round(df_Tabla_Calculos_Desb_Corriente['max_Corrientes_Medias'].iloc[1], 2),
+        'VALUE_DESBCORR_PM': round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[1], 2),
+        'V1_DESBCORR_MED_MN': round(df_Tabla_Calculos_Desb_Corriente['Corriente L1'].iloc[2], 2),
+        'V2_DESBCORR_MED_MN': round(df_Tabla_Calculos_Desb_Corriente['Corriente L2'].iloc[2], 2),
+        'V3_DESBCORR_MED_MN': round(df_Tabla_Calculos_Desb_Corriente['Corriente L3'].iloc[2], 2),
+        'DESBCORR_PROMEDIO_MN': round(df_Tabla_Calculos_Desb_Corriente['Promedio'].iloc[2], 2),
+        'DESBCORR_MAXMED_MN': round(df_Tabla_Calculos_Desb_Corriente['max_Corrientes_Medias'].iloc[2], 2),
+        'VALUE_DESBCORR_MN': round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[2], 2),
+        'PQS_POT_ACT_MIN_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mn. III'].iloc[0], 2),
+        'PQS_POT_ACT_MED_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Activa III'].iloc[0], 2),
+        'PQS_POT_ACT_MAX_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mx. III'].iloc[0], 2),
+        'PQS_POT_CAP_MIN_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mn. III'].iloc[0], 2),
+        'PQS_POT_CAP_MED_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva III'].iloc[0], 2),
+        'PQS_POT_CAP_MAX_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mx. III'].iloc[0], 2),
+        'PQS_POT_IND_MIN_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mn. III'].iloc[0], 2),
+        'PQS_POT_IND_MED_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva III'].iloc[0], 2),
+        'PQS_POT_IND_MAX_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mx. III'].iloc[0], 2),
+        'PQS_POT_APA_MIN_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mn. III'].iloc[0], 2),
+        'PQS_POT_APA_MED_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente III'].iloc[0], 2),
+        'PQS_POT_APA_MAX_PR': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[0], 2),
+        'PQS_POT_ACT_MIN_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mn. III'].iloc[3], 2),
+        'PQS_POT_ACT_MED_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Activa III'].iloc[3], 2),
+        'PQS_POT_ACT_MAX_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mx. III'].iloc[3], 2),
+        'PQS_POT_CAP_MIN_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mn. III'].iloc[3], 2),
+        'PQS_POT_CAP_MED_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva III'].iloc[3], 2),
+        'PQS_POT_CAP_MAX_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mx. III'].iloc[3], 2),
+        'PQS_POT_IND_MIN_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mn. III'].iloc[3], 2),
+        'PQS_POT_IND_MED_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva III'].iloc[3], 2),
+        'PQS_POT_IND_MAX_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mx. III'].iloc[3], 2),
+        'PQS_POT_APA_MIN_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mn. III'].iloc[3], 2),
+        'PQS_POT_APA_MED_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente III'].iloc[3], 2),
+        'PQS_POT_APA_MAX_MX': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[3], 2),
+        'PQS_POT_ACT_MIN_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mn. III'].iloc[1], 2),
+        'PQS_POT_ACT_MED_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Activa III'].iloc[1], 2),
+        'PQS_POT_ACT_MAX_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mx. III'].iloc[1], 2),
+        'PQS_POT_CAP_MIN_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mn. III'].iloc[1], 2),
+        'PQS_POT_CAP_MED_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva III'].iloc[1], 2),
+        'PQS_POT_CAP_MAX_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mx. III'].iloc[1], 2),
+        'PQS_POT_IND_MIN_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mn. III'].iloc[1], 2),
+        'PQS_POT_IND_MED_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva III'].iloc[1], 2),
+        'PQS_POT_IND_MAX_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mx. III'].iloc[1], 2),
+        'PQS_POT_APA_MIN_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mn. III'].iloc[1], 2),
+        'PQS_POT_APA_MED_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente III'].iloc[1], 2),
+        'PQS_POT_APA_MAX_PM': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[1], 2),
+        'PQS_POT_ACT_MIN_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mn. III'].iloc[2], 2),
+        'PQS_POT_ACT_MED_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Activa III'].iloc[2], 2),
+        'PQS_POT_ACT_MAX_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Activa mx. III'].iloc[2], 2),
+        'PQS_POT_CAP_MIN_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mn. III'].iloc[2], 2),
+        'PQS_POT_CAP_MED_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva III'].iloc[2], 2),
+        'PQS_POT_CAP_MAX_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Capacitiva mx. III'].iloc[2], 2),
+        'PQS_POT_IND_MIN_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mn. III'].iloc[2], 2),
+        'PQS_POT_IND_MED_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva III'].iloc[2], 2),
+        'PQS_POT_IND_MAX_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Inductiva mx. III'].iloc[2], 2),
+        'PQS_POT_APA_MIN_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mn. III'].iloc[2], 2),
+        'PQS_POT_APA_MED_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente III'].iloc[2], 2),
+        'PQS_POT_APA_MAX_MN': round(df_Tabla_Calculos_PQS_Potencias['P.Aparente mx. III'].iloc[2], 2),
+        'PQS_CARGABILIDAD_MAX': round(var_Lista_PQS_Carg_Disp[0], 2),
+        'DISPONIBILIDAD_CARGA': round(var_Lista_PQS_Carg_Disp[1], 2),
+        'FP_POT_CAP_MIN_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III -'].iloc[0], 2),
+        'FP_POT_CAP_MED_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. III -'].iloc[0], 2),
+        'FP_POT_CAP_MAX_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III -'].iloc[0], 2),
+        'FP_POT_IND_MIN_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III'].iloc[0], 2),
+        'FP_POT_IND_MED_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. III'].iloc[0], 2),
+        'FP_POT_IND_MAX_PR': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III'].iloc[0], 2),
+        'FP_POT_CAP_MIN_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III -'].iloc[3], 2),
+        'FP_POT_CAP_MED_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. III -'].iloc[3], 2),
+        'FP_POT_CAP_MAX_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III -'].iloc[3], 2),
+        'FP_POT_IND_MIN_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III'].iloc[3], 2),
+        'FP_POT_IND_MED_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. III'].iloc[3], 2),
+        'FP_POT_IND_MAX_MX': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III'].iloc[3], 2),
+        'FP_POT_CAP_MIN_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III -'].iloc[1], 2),
+        'FP_POT_CAP_MED_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. III -'].iloc[1], 2),
+        'FP_POT_CAP_MAX_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III -'].iloc[1], 2),
+        'FP_POT_IND_MIN_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III'].iloc[1], 2),
+        'FP_POT_IND_MED_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. III'].iloc[1], 2),
+        'FP_POT_IND_MAX_PM': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III'].iloc[1], 2),
+        'FP_POT_CAP_MIN_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III -'].iloc[2], 2),
+        'FP_POT_CAP_MED_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. III -'].iloc[2], 2),
+        'FP_POT_CAP_MAX_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III -'].iloc[2], 2),
+        'FP_POT_IND_MIN_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. Mn. III'].iloc[2], 2),
+        'FP_POT_IND_MED_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. III'].iloc[2], 2),
+        'FP_POT_IND_MAX_MN': round(df_Tabla_Calculos_FactorPotencia['F.P. Mx. III'].iloc[2], 2),
+        'FACT_PO_CAP_MIN_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Cap']['F.P. Mn. III']['Percentil'], 2),
+        'FACT_PO_CAP_MED_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Cap']['F.P. III']['Percentil'], 2),
+        'FACT_PO_CAP_MAX_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Cap']['F.P. Mx. III']['Percentil'], 2),
+        'FACT_PO_IND_MIN_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Ind']['F.P. Mn. III']['Percentil'], 2),
+        'FACT_PO_IND_MED_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Ind']['F.P. III']['Percentil'], 2),
+        'FACT_PO_IND_MAX_PR': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Ind']['F.P. Mx. III']['Percentil'], 2),
+        'FACT_PO_CAP_MIN_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Cap']['F.P. Mn. III']['Maximo'], 2),
+        'FACT_PO_CAP_MED_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Cap']['F.P. III']['Maximo'], 2),
+        'FACT_PO_CAP_MAX_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Cap']['F.P. Mx. III']['Maximo'], 2),
+        'FACT_PO_IND_MIN_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Ind']['F.P. Mn. III']['Maximo'], 2),
+        'FACT_PO_IND_MED_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Ind']['F.P. III']['Maximo'], 2),
+        'FACT_PO_IND_MAX_MX': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Ind']['F.P. Mx. III']['Maximo'], 2),
+        'FACT_PO_CAP_MIN_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Cap']['F.P. Mn. III']['Promedio'], 2),
+        'FACT_PO_CAP_MED_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Cap']['F.P. III']['Promedio'], 2),
+        'FACT_PO_CAP_MAX_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Cap']['F.P. Mx. III']['Promedio'], 2),
+        'FACT_PO_IND_MIN_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Ind']['F.P. Mn. III']['Promedio'], 2),
+        'FACT_PO_IND_MED_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Ind']['F.P. III']['Promedio'], 2),
+        'FACT_PO_IND_MAX_PM': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Ind']['F.P. Mx. III']['Promedio'], 2),
+        'FACT_PO_CAP_MIN_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Cap']['F.P. Mn. III']['Minimo'], 2),
+        'FACT_PO_CAP_MED_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Cap']['F.P. III']['Minimo'], 2),
+        'FACT_PO_CAP_MAX_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Cap']['F.P. Mx. III']['Minimo'], 2),
+        'FACT_PO_IND_MIN_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mn. III - Ind']['F.P. Mn. III']['Minimo'], 2),
+        'FACT_PO_IND_MED_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. III - Ind']['F.P. III']['Minimo'], 2),
+        'FACT_PO_IND_MAX_MN': round(df_Tabla_Calculos_FactorPotenciaGeneral['F.P. Mx. III - Ind']['F.P. Mx. III']['Minimo'], 2),
+        'EN_ACTIVA_MED_PR': round(df_Tabla_Calculos_Energias['E.Activa T1'].iloc[0], 2),
+        'EN_CAPACITIVA_MED_PR': round(df_Tabla_Calculos_Energias['E.Capacitiva T1'].iloc[0], 2),
+        'EN_INDUCTIVA_MED_PR': round(df_Tabla_Calculos_Energias['E.Inductiva T1'].iloc[0], 2),
+        'EN_KWH_PR': round(df_Tabla_Calculos_Energias['KWH'].iloc[0], 2),
+        'EN_KARH_IND_PR': round(df_Tabla_Calculos_Energias['KARH_IND'].iloc[0], 2),
+        'EN_KVARH_CAP_PR': round(df_Tabla_Calculos_Energias['KVARH_CAP'].iloc[0], 2),
+        'EN_FACT_POTENCIA_NEG_PR': round(df_Tabla_Calculos_Energias['F.P. III -'].iloc[0], 2),
+        'EN_FACT_POTENCIA_POS_PR': round(df_Tabla_Calculos_Energias['F.P. III'].iloc[0], 2),
+        'EN_ACTIVA_MED_MX': round(df_Tabla_Calculos_Energias['E.Activa T1'].iloc[3], 2),
+        'EN_CAPACITIVA_MED_MX': round(df_Tabla_Calculos_Energias['E.Capacitiva T1'].iloc[3], 2),
+        'EN_INDUCTIVA_MED_MX': round(df_Tabla_Calculos_Energias['E.Inductiva T1'].iloc[3], 2),
+        'EN_KWH_MX': round(df_Tabla_Calculos_Energias['KWH'].iloc[3], 2),
+        'EN_KARH_IND_MX': round(df_Tabla_Calculos_Energias['KARH_IND'].iloc[3], 2),
+        'EN_KVARH_CAP_MX': round(df_Tabla_Calculos_Energias['KVARH_CAP'].iloc[3], 2),
+        'EN_FACT_POTENCIA_NEG_MX': round(df_Tabla_Calculos_Energias['F.P. III -'].iloc[3], 2),
+        'EN_FACT_POTENCIA_POS_MX': round(df_Tabla_Calculos_Energias['F.P. III'].iloc[3], 2),
+        'EN_ACTIVA_MED_PM': round(df_Tabla_Calculos_Energias['E.Activa T1'].iloc[1], 2),
+        'EN_CAPACITIVA_MED_PM': round(df_Tabla_Calculos_Energias['E.Capacitiva T1'].iloc[1], 2),
+        'EN_INDUCTIVA_MED_PM': round(df_Tabla_Calculos_Energias['E.Inductiva T1'].iloc[1], 2),
+        'EN_KWH_PM': round(df_Tabla_Calculos_Energias['KWH'].iloc[1], 2),
+        'EN_KARH_IND_PM': round(df_Tabla_Calculos_Energias['KARH_IND'].iloc[1], 2),
+        'EN_KVARH_CAP_PM': round(df_Tabla_Calculos_Energias['KVARH_CAP'].iloc[1], 2),
+        'EN_FACT_POTENCIA_NEG_PM': round(df_Tabla_Calculos_Energias['F.P. III -'].iloc[1], 2),
+        'EN_FACT_POTENCIA_POS_PM': round(df_Tabla_Calculos_Energias['F.P. III'].iloc[1], 2),
+        'EN_ACTIVA_MED_MN': round(df_Tabla_Calculos_Energias['E.Activa T1'].iloc[2], 2),
+        'EN_CAPACITIVA_MED_MN': round(df_Tabla_Calculos_Energias['E.Capacitiva T1'].iloc[2], 2),
+        'EN_INDUCTIVA_MED_MN': round(df_Tabla_Calculos_Energias['E.Inductiva T1'].iloc[2], 2),
+        'EN_KWH_MN': round(df_Tabla_Calculos_Energias['KWH'].iloc[2], 2),
+        'EN_KARH_IND_MN': round(df_Tabla_Calculos_Energias['KARH_IND'].iloc[2], 2),
+        'EN_KVARH_CAP_MN': round(df_Tabla_Calculos_Energias['KVARH_CAP'].iloc[2], 2),
+        'EN_FACT_POTENCIA_NEG_MN': round(df_Tabla_Calculos_Energias['F.P. III -'].iloc[2], 2),
+        'EN_FACT_POTENCIA_POS_MN': round(df_Tabla_Calculos_Energias['F.P. III'].iloc[2], 2),
+        'THD_DIST_TENSION_L1_MAX_PR': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[0], 2),
+        'THD_DIST_TENSION_L2_MAX_PR': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[0], 2),
+        'THD_DIST_TENSION_L3_MAX_PR': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[0], 2),
+        'THD_DIST_TENSION_DIST_ARM_PR': round(df_Tabla_Calculos_DistTension['var_Ref_Distorsion_Tension'].iloc[0], 2),
+        'THD_DIST_TENSION_L1_MAX_MX': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[3], 2),
+        'THD_DIST_TENSION_L2_MAX_MX': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[3], 2),
+        'THD_DIST_TENSION_L3_MAX_MX': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[3], 2),
+        'THD_DIST_TENSION_DIST_ARM_MX': round(df_Tabla_Calculos_DistTension['var_Ref_Distorsion_Tension'].iloc[3], 2),
+        'THD_DIST_TENSION_L1_MAX_PM': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[1], 2),
+        'THD_DIST_TENSION_L2_MAX_PM': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[1], 2),
+        'THD_DIST_TENSION_L3_MAX_PM': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[1], 2),
+        'THD_DIST_TENSION_DIST_ARM_PM': round(df_Tabla_Calculos_DistTension['var_Ref_Distorsion_Tension'].iloc[1], 2),
+        'THD_DIST_TENSION_L1_MAX_MN': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[2], 2),
+        'THD_DIST_TENSION_L2_MAX_MN': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[2], 2),
+        'THD_DIST_TENSION_L3_MAX_MN': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[2], 2),
+        'THD_DIST_TENSION_DIST_ARM_MN': round(df_Tabla_Calculos_DistTension['var_Ref_Distorsion_Tension'].iloc[2], 2),
+        'THDV_ARM_N3_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L1'].iloc[0], 2),
+        'THDV_ARM_N5_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L1'].iloc[0], 2),
+        'THDV_ARM_N7_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L1'].iloc[0], 2),
+        'THDV_ARM_N9_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L1'].iloc[0], 2),
+        'THDV_ARM_N11_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L1'].iloc[0], 2),
+        'THDV_ARM_N13_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L1'].iloc[0], 2),
+        'THDV_ARM_N15_L1_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L1'].iloc[0], 2),
+        'THDV_ARM_N3_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L1'].iloc[3], 2),
+        'THDV_ARM_N5_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L1'].iloc[3], 2),
+        'THDV_ARM_N7_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L1'].iloc[3], 2),
+        'THDV_ARM_N9_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L1'].iloc[3], 2),
+        'THDV_ARM_N11_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L1'].iloc[3], 2),
+        'THDV_ARM_N13_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L1'].iloc[3], 2),
+        'THDV_ARM_N15_L1_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L1'].iloc[3], 2),
+        'THDV_ARM_N3_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L1'].iloc[1], 2),
+        'THDV_ARM_N5_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L1'].iloc[1], 2),
+        'THDV_ARM_N7_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L1'].iloc[1], 2),
+        'THDV_ARM_N9_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L1'].iloc[1], 2),
+        'THDV_ARM_N11_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L1'].iloc[1], 2),
+        'THDV_ARM_N13_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L1'].iloc[1], 2),
+        'THDV_ARM_N15_L1_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L1'].iloc[1], 2),
+        'THDV_ARM_N3_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L1'].iloc[2], 2),
+        'THDV_ARM_N5_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L1'].iloc[2], 2),
+        'THDV_ARM_N7_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L1'].iloc[2], 2),
+        'THDV_ARM_N9_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L1'].iloc[2], 2),
+        'THDV_ARM_N11_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L1'].iloc[2], 2),
+        'THDV_ARM_N13_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L1'].iloc[2], 2),
+        'THDV_ARM_N15_L1_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L1'].iloc[2], 2),
+        'THDV_ARM_N3_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L2'].iloc[0], 2),
+        'THDV_ARM_N5_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L2'].iloc[0], 2),
+        'THDV_ARM_N7_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L2'].iloc[0], 2),
+        'THDV_ARM_N9_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L2'].iloc[0], 2),
+        'THDV_ARM_N11_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L2'].iloc[0], 2),
+        'THDV_ARM_N13_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L2'].iloc[0], 2),
+        'THDV_ARM_N15_L2_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L2'].iloc[0], 2),
+        'THDV_ARM_N3_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L2'].iloc[3], 2),
+        'THDV_ARM_N5_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L2'].iloc[3], 2),
+        'THDV_ARM_N7_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L2'].iloc[3], 2),
+        'THDV_ARM_N9_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L2'].iloc[3], 2),
+        'THDV_ARM_N11_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L2'].iloc[3], 2),
+        'THDV_ARM_N13_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L2'].iloc[3], 2),
+        'THDV_ARM_N15_L2_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L2'].iloc[3], 2),
+        'THDV_ARM_N3_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L2'].iloc[1], 2),
+        'THDV_ARM_N5_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L2'].iloc[1], 2),
+        'THDV_ARM_N7_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L2'].iloc[1], 2),
+        'THDV_ARM_N9_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L2'].iloc[1], 2),
+        'THDV_ARM_N11_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L2'].iloc[1], 2),
+        'THDV_ARM_N13_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L2'].iloc[1], 2),
+        'THDV_ARM_N15_L2_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L2'].iloc[1], 2),
+        'THDV_ARM_N3_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L2'].iloc[2], 2),
+        'THDV_ARM_N5_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L2'].iloc[2], 2),
+        'THDV_ARM_N7_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L2'].iloc[2], 2),
+        'THDV_ARM_N9_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L2'].iloc[2], 2),
+        'THDV_ARM_N11_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L2'].iloc[2], 2),
+        'THDV_ARM_N13_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L2'].iloc[2], 2),
+        'THDV_ARM_N15_L2_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L2'].iloc[2], 2),
+        'THDV_ARM_N3_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L3'].iloc[0], 2),
+        'THDV_ARM_N5_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L3'].iloc[0], 2),
+        'THDV_ARM_N7_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L3'].iloc[0], 2),
+        'THDV_ARM_N9_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L3'].iloc[0], 2),
+        'THDV_ARM_N11_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L3'].iloc[0], 2),
+        'THDV_ARM_N13_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L3'].iloc[0], 2),
+        'THDV_ARM_N15_L3_PR': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L3'].iloc[0], 2),
+        'THDV_ARM_N3_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L3'].iloc[3], 2),
+        'THDV_ARM_N5_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L3'].iloc[3], 2),
+        'THDV_ARM_N7_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L3'].iloc[3], 2),
+        'THDV_ARM_N9_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L3'].iloc[3], 2),
+        'THDV_ARM_N11_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L3'].iloc[3], 2),
+        'THDV_ARM_N13_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L3'].iloc[3], 2),
+        'THDV_ARM_N15_L3_MX': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L3'].iloc[3], 2),
+        'THDV_ARM_N3_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L3'].iloc[1], 2),
+        'THDV_ARM_N5_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L3'].iloc[1], 2),
+        'THDV_ARM_N7_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L3'].iloc[1], 2),
+        'THDV_ARM_N9_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L3'].iloc[1], 2),
+        'THDV_ARM_N11_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L3'].iloc[1], 2),
+        'THDV_ARM_N13_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L3'].iloc[1], 2),
+        'THDV_ARM_N15_L3_PM': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L3'].iloc[1], 2),
+        'THDV_ARM_N3_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 3 L3'].iloc[2], 2),
+        'THDV_ARM_N5_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 5 L3'].iloc[2], 2),
+        'THDV_ARM_N7_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 7 L3'].iloc[2], 2),
+        'THDV_ARM_N9_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 9 L3'].iloc[2], 2),
+        'THDV_ARM_N11_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 11 L3'].iloc[2], 2),
+        'THDV_ARM_N13_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 13 L3'].iloc[2], 2),
+        'THDV_ARM_N15_L3_MN': round(df_Tabla_Calculos_Armonicos_DistTension['Arm. tensin 15 L3'].iloc[2], 2),
+        'THD_DIST_CORRIENTE_L1_MED_PR': round(df_Tabla_Calculos_DistCorriente['A THD/d L1'].iloc[0], 2),
+        'THD_DIST_CORRIENTE_L2_MED_PR': round(df_Tabla_Calculos_DistCorriente['A THD/d L2'].iloc[0], 2),
+        'THD_DIST_CORRIENTE_L3_MED_PR': round(df_Tabla_Calculos_DistCorriente['A THD/d L3'].iloc[0], 2),
+        'THD_DIST_CORRIENTE_L1_MED_MX': round(df_Tabla_Calculos_DistCorriente['A THD/d L1'].iloc[3], 2),
+        'THD_DIST_CORRIENTE_L2_MED_MX': round(df_Tabla_Calculos_DistCorriente['A THD/d L2'].iloc[3], 2),
+        'THD_DIST_CORRIENTE_L3_MED_MX': round(df_Tabla_Calculos_DistCorriente['A THD/d L3'].iloc[3], 2),
+        'THD_DIST_CORRIENTE_L1_MED_PM': round(df_Tabla_Calculos_DistCorriente['A THD/d L1'].iloc[1], 2),
+        'THD_DIST_CORRIENTE_L2_MED_PM': round(df_Tabla_Calculos_DistCorriente['A THD/d L2'].iloc[1], 2),
+        'THD_DIST_CORRIENTE_L3_MED_PM': round(df_Tabla_Calculos_DistCorriente['A THD/d L3'].iloc[1], 2),
+        'THD_DIST_CORRIENTE_L1_MED_MN': round(df_Tabla_Calculos_DistCorriente['A THD/d L1'].iloc[2], 2),
+        'THD_DIST_CORRIENTE_L2_MED_MN': round(df_Tabla_Calculos_DistCorriente['A THD/d L2'].iloc[2], 2),
+        'THD_DIST_CORRIENTE_L3_MED_MN': round(df_Tabla_Calculos_DistCorriente['A THD/d L3'].iloc[2], 2),
+        'DHIT_ARM_N3_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L1'].iloc[0], 2),
+        'DHIT_ARM_N5_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L1'].iloc[0], 2),
+        'DHIT_ARM_N7_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L1'].iloc[0], 2),
+        'DHIT_ARM_N9_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L1'].iloc[0], 2),
+        'DHIT_ARM_N11_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L1'].iloc[0], 2),
+        'DHIT_ARM_N13_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L1'].iloc[0], 2),
+        'DHIT_ARM_N15_L1_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L1'].iloc[0], 2),
+        'DHIT_ARM_N3_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L1'].iloc[3], 2),
+        'DHIT_ARM_N5_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L1'].iloc[3], 2),
+        'DHIT_ARM_N7_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L1'].iloc[3], 2),
+        'DHIT_ARM_N9_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L1'].iloc[3], 2),
+        'DHIT_ARM_N11_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L1'].iloc[3], 2),
+        'DHIT_ARM_N13_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L1'].iloc[3], 2),
+        'DHIT_ARM_N15_L1_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L1'].iloc[3], 2),
+        'DHIT_ARM_N3_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L1'].iloc[1], 2),
+        'DHIT_ARM_N5_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L1'].iloc[1], 2),
+        'DHIT_ARM_N7_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L1'].iloc[1], 2),
+        'DHIT_ARM_N9_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L1'].iloc[1], 2),
+        'DHIT_ARM_N11_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L1'].iloc[1], 2),
+        'DHIT_ARM_N13_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L1'].iloc[1], 2),
+        'DHIT_ARM_N15_L1_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L1'].iloc[1], 2),
+        'DHIT_ARM_N3_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L1'].iloc[2], 2),
+        'DHIT_ARM_N5_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L1'].iloc[2], 2),
+        'DHIT_ARM_N7_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L1'].iloc[2], 2),
+        'DHIT_ARM_N9_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L1'].iloc[2], 2),
+        'DHIT_ARM_N11_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L1'].iloc[2], 2),
+        'DHIT_ARM_N13_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L1'].iloc[2], 2),
+        'DHIT_ARM_N15_L1_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L1'].iloc[2], 2),
+        'DHIT_ARM_N3_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L2'].iloc[0], 2),
+        'DHIT_ARM_N5_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L2'].iloc[0], 2),
+        'DHIT_ARM_N7_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L2'].iloc[0], 2),
+        'DHIT_ARM_N9_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L2'].iloc[0], 2),
+        'DHIT_ARM_N11_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L2'].iloc[0], 2),
+        'DHIT_ARM_N13_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L2'].iloc[0], 2),
+        'DHIT_ARM_N15_L2_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L2'].iloc[0], 2),
+        'DHIT_ARM_N3_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L2'].iloc[3], 2),
+        'DHIT_ARM_N5_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L2'].iloc[3], 2),
+        'DHIT_ARM_N7_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L2'].iloc[3], 2),
+        'DHIT_ARM_N9_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L2'].iloc[3], 2),
+        'DHIT_ARM_N11_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L2'].iloc[3], 2),
+        'DHIT_ARM_N13_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L2'].iloc[3], 2),
+        'DHIT_ARM_N15_L2_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L2'].iloc[3], 2),
+        'DHIT_ARM_N3_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L2'].iloc[1], 2),
+        'DHIT_ARM_N5_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L2'].iloc[1], 2),
+        'DHIT_ARM_N7_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L2'].iloc[1], 2),
+        'DHIT_ARM_N9_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L2'].iloc[1], 2),
+        'DHIT_ARM_N11_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L2'].iloc[1], 2),
+        'DHIT_ARM_N13_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L2'].iloc[1], 2),
+        'DHIT_ARM_N15_L2_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L2'].iloc[1], 2),
+        'DHIT_ARM_N3_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L2'].iloc[2], 2),
+        'DHIT_ARM_N5_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L2'].iloc[2], 2),
+        'DHIT_ARM_N7_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L2'].iloc[2], 2),
+        'DHIT_ARM_N9_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L2'].iloc[2], 2),
+        'DHIT_ARM_N11_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L2'].iloc[2], 2),
+        'DHIT_ARM_N13_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L2'].iloc[2], 2),
+        'DHIT_ARM_N15_L2_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L2'].iloc[2], 2),
+        'DHIT_ARM_N3_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L3'].iloc[0], 2),
+        'DHIT_ARM_N5_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L3'].iloc[0], 2),
+        'DHIT_ARM_N7_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L3'].iloc[0], 2),
+        'DHIT_ARM_N9_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L3'].iloc[0], 2),
+        'DHIT_ARM_N11_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L3'].iloc[0], 2),
+        'DHIT_ARM_N13_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L3'].iloc[0], 2),
+        'DHIT_ARM_N15_L3_PR': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L3'].iloc[0], 2),
+        'DHIT_ARM_N3_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L3'].iloc[3], 2),
+        'DHIT_ARM_N5_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L3'].iloc[3], 2),
+        'DHIT_ARM_N7_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L3'].iloc[3], 2),
+        'DHIT_ARM_N9_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L3'].iloc[3], 2),
+        'DHIT_ARM_N11_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L3'].iloc[3], 2),
+        'DHIT_ARM_N13_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L3'].iloc[3], 2),
+        'DHIT_ARM_N15_L3_MX': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L3'].iloc[3], 2),
+        'DHIT_ARM_N3_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L3'].iloc[1], 2),
+        'DHIT_ARM_N5_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L3'].iloc[1], 2),
+        'DHIT_ARM_N7_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L3'].iloc[1], 2),
+        'DHIT_ARM_N9_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L3'].iloc[1], 2),
+        'DHIT_ARM_N11_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L3'].iloc[1], 2),
+        'DHIT_ARM_N13_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L3'].iloc[1], 2),
+        'DHIT_ARM_N15_L3_PM': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L3'].iloc[1], 2),
+        'DHIT_ARM_N3_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L3'].iloc[2], 2),
+        'DHIT_ARM_N5_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L3'].iloc[2], 2),
+        'DHIT_ARM_N7_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L3'].iloc[2], 2),
+        'DHIT_ARM_N9_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L3'].iloc[2], 2),
+        'DHIT_ARM_N11_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L3'].iloc[2], 2),
+        'DHIT_ARM_N13_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 13 L3'].iloc[2], 2),
+        'DHIT_ARM_N15_L3_MN': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 15 L3'].iloc[2], 2),
+        'TDD_LINEA_1_PR': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[0], 2),
+        'TDD_LINEA_2_PR': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[0], 2),
+        'TDD_LINEA_3_PR': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[0], 2),
+        'TDD_LINEA_1_MX': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[3], 2),
+        'TDD_LINEA_2_MX': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[3], 2),
+        'TDD_LINEA_3_MX': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[3], 2),
+        'TDD_LINEA_1_PM': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[1], 2),
+        'TDD_LINEA_2_PM': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[1], 2),
+        'TDD_LINEA_3_PM': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[1], 2),
+        'TDD_LINEA_1_MN': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[2], 2),
+        'TDD_LINEA_2_MN': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[2], 2),
+        'TDD_LINEA_3_MN': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[2], 2),
+        'PLT_FLICKER_L1_MED_PR': round(df_Tabla_Calculos_Flicker['Plt L1'].iloc[0], 2),
+        'PLT_FLICKER_L2_MED_PR': round(df_Tabla_Calculos_Flicker['Plt L2'].iloc[0], 2),
+        'PLT_FLICKER_L3_MED_PR': round(df_Tabla_Calculos_Flicker['Plt L3'].iloc[0], 2),
+        'PLT_FLICKER_L1_MED_MX': round(df_Tabla_Calculos_Flicker['Plt L1'].iloc[3], 2),
+        'PLT_FLICKER_L2_MED_MX': round(df_Tabla_Calculos_Flicker['Plt L2'].iloc[3], 2),
+        'PLT_FLICKER_L3_MED_MX': round(df_Tabla_Calculos_Flicker['Plt L3'].iloc[3], 2),
+        'PLT_FLICKER_L1_MED_PM': round(df_Tabla_Calculos_Flicker['Plt L1'].iloc[1], 2),
+        'PLT_FLICKER_L2_MED_PM': round(df_Tabla_Calculos_Flicker['Plt L2'].iloc[1], 2),
+        'PLT_FLICKER_L3_MED_PM': round(df_Tabla_Calculos_Flicker['Plt L3'].iloc[1], 2),
+        'PLT_FLICKER_L1_MED_MN': round(df_Tabla_Calculos_Flicker['Plt L1'].iloc[2], 2),
+        'PLT_FLICKER_L2_MED_MN': round(df_Tabla_Calculos_Flicker['Plt L2'].iloc[2], 2),
+        'PLT_FLICKER_L3_MED_MN': round(df_Tabla_Calculos_Flicker['Plt L3'].iloc[2], 2),
+        'FACTOR_K_L1_MIN_PR': round(df_Tabla_Calculos_FactorK['Factor K mn. L1'].iloc[0], 2),
+        'FACTOR_K_L2_MIN_PR': round(df_Tabla_Calculos_FactorK['Factor K mn. L2'].iloc[0], 2),
+        'FACTOR_K_L3_MIN_PR': round(df_Tabla_Calculos_FactorK['Factor K mn. L3'].iloc[0], 2),
+        'FACTOR_K_L1_MED_PR': round(df_Tabla_Calculos_FactorK['Factor K L1'].iloc[0], 2),
+        'FACTOR_K_L2_MED_PR': round(df_Tabla_Calculos_FactorK['Factor K L2'].iloc[0], 2),
+        'FACTOR_K_L3_MED_PR': round(df_Tabla_Calculos_FactorK['Factor K L3'].iloc[0], 2),
+        'FACTOR_K_L1_MAX_PR': round(df_Tabla_Calculos_FactorK['Factor K mx. L1'].iloc[0], 2),
+        'FACTOR_K_L2_MAX_PR': round(df_Tabla_Calculos_FactorK['Factor K mx. L2'].iloc[0], 2),
+        'FACTOR_K_L3_MAX_PR': round(df_Tabla_Calculos_FactorK['Factor K mx. L3'].iloc[0], 2),
+        'FACTOR_K_L1_MIN_MX': round(df_Tabla_Calculos_FactorK['Factor K mn. L1'].iloc[3], 2),
+        'FACTOR_K_L2_MIN_MX': round(df_Tabla_Calculos_FactorK['Factor K mn. L2'].iloc[3], 2),
+        'FACTOR_K_L3_MIN_MX': round(df_Tabla_Calculos_FactorK['Factor K mn. L3'].iloc[3], 2),
+        'FACTOR_K_L1_MED_MX': round(df_Tabla_Calculos_FactorK['Factor K L1'].iloc[3], 2),
+        'FACTOR_K_L2_MED_MX': round(df_Tabla_Calculos_FactorK['Factor K L2'].iloc[3], 2),
+        'FACTOR_K_L3_MED_MX': round(df_Tabla_Calculos_FactorK['Factor K L3'].iloc[3], 2),
+        'FACTOR_K_L1_MAX_MX': round(df_Tabla_Calculos_FactorK['Factor K mx. L1'].iloc[3], 2),
+        'FACTOR_K_L2_MAX_MX': round(df_Tabla_Calculos_FactorK['Factor K mx. L2'].iloc[3], 2),
+        'FACTOR_K_L3_MAX_MX': round(df_Tabla_Calculos_FactorK['Factor K mx. L3'].iloc[3], 2),
+        'FACTOR_K_L1_MIN_PM': round(df_Tabla_Calculos_FactorK['Factor K mn. L1'].iloc[1], 2),
+        'FACTOR_K_L2_MIN_PM': round(df_Tabla_Calculos_FactorK['Factor K mn. L2'].iloc[1], 2),
+        'FACTOR_K_L3_MIN_PM': round(df_Tabla_Calculos_FactorK['Factor K mn. L3'].iloc[1], 2),
+        'FACTOR_K_L1_MED_PM': round(df_Tabla_Calculos_FactorK['Factor K L1'].iloc[1], 2),
+        'FACTOR_K_L2_MED_PM': round(df_Tabla_Calculos_FactorK['Factor K L2'].iloc[1], 2),
+        'FACTOR_K_L3_MED_PM': round(df_Tabla_Calculos_FactorK['Factor K L3'].iloc[1], 2),
+        'FACTOR_K_L1_MAX_PM': round(df_Tabla_Calculos_FactorK['Factor K mx. L1'].iloc[1], 2),
+        'FACTOR_K_L2_MAX_PM': round(df_Tabla_Calculos_FactorK['Factor K mx. L2'].iloc[1], 2),
+        'FACTOR_K_L3_MAX_PM': round(df_Tabla_Calculos_FactorK['Factor K mx. L3'].iloc[1], 2),
+        'FACTOR_K_L1_MIN_MN': round(df_Tabla_Calculos_FactorK['Factor K mn. L1'].iloc[2], 2),
+        'FACTOR_K_L2_MIN_MN': round(df_Tabla_Calculos_FactorK['Factor K mn. L2'].iloc[2], 2),
+        'FACTOR_K_L3_MIN_MN': round(df_Tabla_Calculos_FactorK['Factor K mn. L3'].iloc[2], 2),
+        'FACTOR_K_L1_MED_MN': round(df_Tabla_Calculos_FactorK['Factor K L1'].iloc[2], 2),
+        'FACTOR_K_L2_MED_MN': round(df_Tabla_Calculos_FactorK['Factor K L2'].iloc[2], 2),
+        'FACTOR_K_L3_MED_MN': round(df_Tabla_Calculos_FactorK['Factor K L3'].iloc[2], 2),
+        'FACTOR_K_L1_MAX_MN': round(df_Tabla_Calculos_FactorK['Factor K mx. L1'].iloc[2], 2),
+        'FACTOR_K_L2_MAX_MN': round(df_Tabla_Calculos_FactorK['Factor K mx. L2'].iloc[2], 2),
+        'FACTOR_K_L3_MAX_MN': round(df_Tabla_Calculos_FactorK['Factor K mx. L3'].iloc[2], 2),
+        'var_valor_Maximo_Corrientes_Max': round(valor_Maximo_Corrientes, 2),
+        'var_valor_Corriente_Cortacircuito': round(valor_Corriente_Cortacircuito, 2),
+        'var_valor_ISC_sobre_IL': round(valor_ISC_sobre_IL, 2),
+        'var_valor_Limite_TDD': round(valor_Limite_TDD, 2),
+        'LIMITE_ARMONICO_0_10': round(valores_Limites_Armonicos['ARM_0_10'], 2),
+        'LIMITE_ARMONICO_11_16': round(valores_Limites_Armonicos['ARM_11_16'], 2),
+        'LIMITE_ARMONICO_17_22': round(valores_Limites_Armonicos['ARM_17_22'], 2),
+        'LIMITE_ARMONICO_23_34': round(valores_Limites_Armonicos['ARM_23_34'], 2),
+        'LIMITE_ARMONICO_35': round(valores_Limites_Armonicos['ARM_35'], 2),
+        'OBSERVACION_TENSION_NUM_1': observaciones_Tension['cumple_Condicion'],
+        'OBSERVACION_TENSION_NUM_2': observaciones_Tension['cumple_Condicion_2'],
+        'OBSERVACION_TENSION_NUM_3': observaciones_Tension['cumple_Condicion_3'],
+        'OBSERVACION_CORRIENTE_NUM_1': list(observaciones_Corriente['val_Maximo_Corriente'].keys())[0],
+        'OBSERVACION_CORRIENTE_NUM_2': list(observaciones_Corriente['val_Maximo_Corriente'].values())[0],
+        'OBSERVACION_CORRIENTE_NUM_3': observaciones_Corriente['resultado_Comparacion_Corriente'],
+        'OBSERVACION_CORRIENTE_NUM_4': list(observaciones_Corriente['val_Maximo_CorrienteNeutra'].values())[0],
+        'OBSERVACION_DESBTENSION_NUM_1': f"{observaciones_DesbTension[0]}, {observaciones_DesbTension[1]}",
+        'OBSERVACION_DESBTENSION_NUM_2': f"{observaciones_DesbTension[2]}",
+        'OBSERVACION_DESBCORRIENTE_NUM_1': f"{observaciones_DesbCorriente[0]}, {observaciones_DesbCorriente[1]}",
+        'OBSERVACION_DESBCORRIENTE_NUM_2': f"{observaciones_DesbCorriente[2]}",
+        'OBSERVACION_THDV_NUM_1': f"{observaciones_THDV}",
+        'OBSERVACION_THDV_NUM_2': f"{valor_Referencia_THDV}",
+        'OBSERVACION_ARMCORRIENTE_NUM_1': f"{observaciones_ArmonicosCorriente['resultado_Arm_3_9']}",
+        'OBSERVACION_ARMCORRIENTE_NUM_2': f"{observaciones_ArmonicosCorriente['resultado_Arm_11']}",
+        'OBSERVACION_TDD_NUM_1': f"{observaciones_TDD[0]}",
+        'OBSERVACION_TDD_NUM_2': f"{observaciones_TDD[1]}"
+    }
+
+
+    #graficar_Timeline_Tension_Plotly(dataFrame=var_Tabla_Tensiones, variables=list_Columns_Grafico_Tension, fecha_col='fecha_y_Hora', limites=[var_Tabla_Tensiones['var_Limite_Inferior_Tension'].iloc[0], var_Tabla_Tensiones['var_Limite_Superior_Tension'].iloc[0]], titulo='REGISTROS DE TENSIÓN')
+
+    return registro
+
+def renderizar_Documento_Word(doc, registro: dict, destino=None) -> bytes:
+    """
+    Renderiza la plantilla de Word con el registro del informe y devuelve el documento generado.
+
+    Args:
+        doc (DocxTemplate): Plantilla del documento de Word.
+        registro (dict): Registro creado con 'crear_Registro_Informe'.
+        destino (file-like): Archivo donde se guarda el documento (por ejemplo, un miembro de 'ArchivoZipInforme'), opcional.
+
+    Returns:
+        bytes: Contenido del documento de Word (.docx), o None si se guardó en 'destino'.
+    """
+    # Aquí enviamos el contexto final con toda la información que va a contener el documento (Imágenes, datos, etc)
+    context = {'registro': registro}
+
+    # Guardar el documento en un buffer para descarga (o directamente en el destino indicado)
+    doc.render(context)
+
+    if destino is not None:
+        doc.save(destino)
+        return None
+
+    buffer_Word = io.BytesIO()
+    doc.save(buffer_Word)
+
+    return buffer_Word.getvalue()
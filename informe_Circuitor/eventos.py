@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from .intervalos import calcular_Intervalos, calcular_Intervalo_Registro
+
+# Eventos de la medición: rachas de registros consecutivos de Minuto a Minuto fuera del límite. Cada tipo de evento
+# indica su título, las columnas que revisa (por fase), el límite que usa (llave de los límites de cumplimiento) y el
+# sentido de la violación: -1 si el evento ocurre por debajo del límite (el valor extremo es el mínimo) y 1 si ocurre
+# por encima (el valor extremo es el máximo)
+EVENTOS_MEDICION: dict = {
+    'hueco_Tension': {
+        'titulo': "Hueco de Tensión",
+        'columnas': {'L12': 'Tensin mn. L12', 'L23': 'Tensin mn. L23', 'L31': 'Tensin mn. L31'},
+        'limite': 'tension_Inferior',
+        'sentido': -1
+    },
+    'sobretension': {
+        'titulo': "Sobretensión",
+        'columnas': {'L12': 'Tensin mx. L12', 'L23': 'Tensin mx. L23', 'L31': 'Tensin mx. L31'},
+        'limite': 'tension_Superior',
+        'sentido': 1
+    },
+    'sobrecorriente': {
+        'titulo': "Sobrecorriente",
+        'columnas': {'L1': 'Corriente mx. L1', 'L2': 'Corriente mx. L2', 'L3': 'Corriente mx. L3'},
+        'limite': 'corriente_Nominal',
+        'sentido': 1
+    }
+}
+
+def detectar_Eventos_Medicion(df: pd.DataFrame, limites: dict, eventos: dict = None) -> dict:
+    """
+    Detecta los eventos de la medición (huecos de tensión, sobretensiones y sobrecorrientes) en una sola pasada: todas
+    las columnas se comparan juntas contra su límite y las rachas fuera del límite se obtienen con una codificación por
+    longitud de racha (RLE) vectorizada sobre la matriz de máscaras, sin recorrer los registros.
+
+    Args:
+        df (pd.DataFrame): DataFrame de Minuto a Minuto con las columnas de los eventos.
+        limites (dict): Valor de cada límite, con las llaves de los límites de cumplimiento (ver 'REGLAS_CUMPLIMIENTO').
+        eventos (dict): Tipos de evento a detectar (por defecto, 'EVENTOS_MEDICION').
+
+    Returns:
+        dict: Índice de eventos como arreglos compactos de igual longitud: 'tipo', 'fase' y 'columna' (posición en
+        'tipos', 'fases' y 'columnas'), 'inicio' y 'fin' (posición del primer y del último registro del evento),
+        'registros' y 'extremo' (valor más alejado del límite), además de 'tipos', 'fases', 'columnas' y 'limites' (un
+        valor por columna revisada).
+
+    Raises:
+        ValueError: Si falta el valor de alguno de los límites.
+    """
+    eventos = EVENTOS_MEDICION if eventos is None else eventos
+
+    tipos = list(eventos)
+    tipos_Columnas = [(tipo, fase, columna) for tipo in tipos for fase, columna in eventos[tipo]['columnas'].items()]
+
+    for tipo in tipos:
+        if eventos[tipo]['limite'] not in limites:
+            raise ValueError(f"Falta el límite '{eventos[tipo]['limite']}' del evento '{tipo}'.")
+
+    # Valores con signo (registros x columnas): la violación siempre es 'valor_Signo > limite_Signo'
+    sentidos = np.array([eventos[tipo]['sentido'] for tipo, _, _ in tipos_Columnas], dtype=np.float64)
+    limites_Columnas = np.array([limites[eventos[tipo]['limite']] for tipo, _, _ in tipos_Columnas], dtype=np.float64)
+
+    valores_Signo = df[[columna for _, _, columna in tipos_Columnas]].to_numpy(dtype=np.float64).T * sentidos[:, None]
+    mascaras = valores_Signo > (limites_Columnas * sentidos)[:, None]
+
+    # Rachas fuera del límite de todas las columnas a la vez (codificación RLE compartida con los intervalos de violación)
+    columnas_Eventos, inicios, finales = calcular_Intervalos(mascaras)
+
+    # Valor extremo de cada evento: máximo de los valores con signo en el rango de la racha (cada columna termina con un
+    # valor de relleno para que el final exclusivo de la última racha siga dentro del arreglo)
+    ancho_Fila = valores_Signo.shape[1] + 1
+    valores_Relleno = np.pad(valores_Signo, ((0, 0), (0, 1))).ravel()
+    extremos = np.maximum.reduceat(valores_Relleno, np.column_stack([columnas_Eventos * ancho_Fila + inicios, columnas_Eventos * ancho_Fila + finales]).ravel())[::2] if len(inicios) else np.zeros(0)
+
+    fases = list(dict.fromkeys(fase for _, fase, _ in tipos_Columnas))
+
+    return {
+        'tipo': np.array([tipos.index(tipo) for tipo, _, _ in tipos_Columnas], dtype=np.int8)[columnas_Eventos],
+        'fase': np.array([fases.index(fase) for _, fase, _ in tipos_Columnas], dtype=np.int8)[columnas_Eventos],
+        'columna': columnas_Eventos.astype(np.int16),
+        'inicio': inicios.astype(np.int32),
+        'fin': (finales - 1).astype(np.int32),
+        'registros': (finales - inicios).astype(np.int32),
+        'extremo': (extremos * sentidos[columnas_Eventos]).astype(np.float32),
+        'tipos': tipos,
+        'fases': fases,
+        'columnas': [columna for _, _, columna in tipos_Columnas],
+        'limites': limites_Columnas
+    }
+
+def crear_Tabla_Eventos(indice_Eventos: dict, fechas: pd.Series, eventos: dict = None) -> pd.DataFrame:
+    """
+    Arma la tabla de eventos del informe a partir del índice de 'detectar_Eventos_Medicion', ordenada por fecha de inicio.
+
+    La duración va desde el inicio del primer registro hasta el final del último (se suma el intervalo de registro de
+    la medición, la mediana entre registros consecutivos).
+
+    Args:
+        indice_Eventos (dict): Índice de eventos de 'detectar_Eventos_Medicion'.
+        fechas (pd.Series): Fecha y hora de los registros de Minuto a Minuto.
+        eventos (dict): Tipos de evento detectados (por defecto, 'EVENTOS_MEDICION').
+
+    Returns:
+        pd.DataFrame: Tabla con las columnas 'Evento', 'Fase', 'Inicio', 'Fin', 'Duración (min)', 'Registros',
+        'Valor Extremo' y 'Límite'.
+    """
+    eventos = EVENTOS_MEDICION if eventos is None else eventos
+
+    fechas = pd.to_datetime(fechas).to_numpy(dtype='datetime64[s]')
+    intervalo_Registro = calcular_Intervalo_Registro(fechas)
+
+    orden = np.lexsort((indice_Eventos['fase'], indice_Eventos['tipo'], indice_Eventos['inicio']))
+
+    inicios = fechas[indice_Eventos['inicio'][orden]]
+    finales = fechas[indice_Eventos['fin'][orden]]
+
+    return pd.DataFrame({
+        'Evento': [eventos[indice_Eventos['tipos'][tipo]]['titulo'] for tipo in indice_Eventos['tipo'][orden]],
+        'Fase': [indice_Eventos['fases'][fase] for fase in indice_Eventos['fase'][orden]],
+        'Inicio': pd.to_datetime(inicios).strftime('%d/%m/%Y %H:%M'),
+        'Fin': pd.to_datetime(finales).strftime('%d/%m/%Y %H:%M'),
+        'Duración (min)': np.round((finales - inicios).astype(np.float64) / 60 + intervalo_Registro, 2),
+        'Registros': indice_Eventos['registros'][orden],
+        'Valor Extremo': np.round(indice_Eventos['extremo'][orden].astype(np.float64), 2),
+        'Límite': np.round(indice_Eventos['limites'][indice_Eventos['columna'][orden]], 2)
+    })
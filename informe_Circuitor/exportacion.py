@@ -0,0 +1,252 @@
+import io
+import re
+import time
+import zipfile
+import pandas as pd
+from openpyxl import Workbook
+
+try:
+    import xlsxwriter
+except ImportError:
+    # Sin xlsxwriter el Excel se escribe con openpyxl en modo de solo escritura
+    xlsxwriter = None
+
+# Formatos adicionales en los que se pueden exportar las tablas del Excel (extensión del archivo por formato)
+FORMATOS_TABLAS: dict = {
+    'csv': '.csv',
+    'parquet': '.parquet'
+}
+
+# Métodos de compresión del ZIP del informe (zstd solo existe en 'zipfile' a partir de Python 3.14)
+COMPRESIONES_ZIP: dict = {
+    'sin_compresion': zipfile.ZIP_STORED,
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA
+}
+
+if hasattr(zipfile, 'ZIP_ZSTANDARD'):
+    COMPRESIONES_ZIP['zstd'] = zipfile.ZIP_ZSTANDARD
+
+# Nombres de los archivos del informe dentro del ZIP de descarga
+ARCHIVOS_ZIP_INFORME: dict = {
+    'word': "word_Circuitor_Automatizado.docx",
+    'excel': "excel_Circuitor.xlsx",
+    'dataset': "dataset_Circuitor.parquet"
+}
+
+# Archivos que ya vienen comprimidos por dentro: se guardan en el ZIP sin volver a comprimirlos
+EXTENSIONES_COMPRIMIDAS: tuple = ('.docx', '.xlsx', '.parquet', '.png', '.zip')
+
+class ArchivoZipInforme:
+    """
+    Archivo ZIP que se escribe por partes, a medida que se generan los archivos del informe. Cada archivo se puede
+    escribir directamente dentro del ZIP ('abrir_Miembro'), sin crear antes una copia completa en memoria, y los
+    archivos que ya vienen comprimidos (Word, Excel, Parquet) se guardan sin volver a comprimirlos.
+    """
+
+    def __init__(self, destino, compresion: str = 'deflate', nivel: int = None, prefijo: str = ''):
+        """
+        Crea el archivo ZIP.
+
+        Args:
+            destino (str | file-like): Ruta o buffer donde se escribe el ZIP.
+            compresion (str): Método de compresión (llaves de 'COMPRESIONES_ZIP').
+            nivel (int): Nivel de compresión del método (por defecto, el del método), opcional.
+            prefijo (str): Carpeta dentro del ZIP en la que se guardan los archivos (por ejemplo 'Sitio_1/'), opcional.
+
+        Raises:
+            ValueError: Si el método de compresión no es válido.
+        """
+        if compresion not in COMPRESIONES_ZIP:
+            raise ValueError(f"La compresión '{compresion}' no es válida. Use: {', '.join(COMPRESIONES_ZIP)}.")
+
+        self.archivo_Zip = zipfile.ZipFile(destino, 'w', COMPRESIONES_ZIP[compresion], allowZip64=True, compresslevel=nivel)
+        self.prefijo = prefijo
+
+    def abrir_Miembro(self, nombre_Archivo: str):
+        """
+        Abre un archivo dentro del ZIP para escribir su contenido por partes.
+
+        Args:
+            nombre_Archivo (str): Nombre del archivo dentro del ZIP.
+
+        Returns:
+            file-like: Archivo de escritura (se debe cerrar, por ejemplo con 'with', antes de abrir el siguiente).
+        """
+        nombre_Miembro = self.prefijo + nombre_Archivo
+
+        if nombre_Archivo.lower().endswith(EXTENSIONES_COMPRIMIDAS):
+            info_Miembro = zipfile.ZipInfo(nombre_Miembro, date_time=time.localtime()[:6])
+            info_Miembro.compress_type = zipfile.ZIP_STORED
+            return self.archivo_Zip.open(info_Miembro, 'w', force_zip64=True)
+
+        return self.archivo_Zip.open(nombre_Miembro, 'w', force_zip64=True)
+
+    def agregar(self, nombre_Archivo: str, contenido: bytes):
+        """
+        Agrega al ZIP un archivo ya generado.
+
+        Args:
+            nombre_Archivo (str): Nombre del archivo dentro del ZIP.
+            contenido (bytes | str): Contenido del archivo.
+        """
+        with self.abrir_Miembro(nombre_Archivo) as miembro:
+            miembro.write(contenido.encode('utf-8') if isinstance(contenido, str) else contenido)
+
+    def cerrar(self):
+        self.archivo_Zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_Error, error, traza):
+        self.cerrar()
+
+def convertir_Columna_Excel(serie: pd.Series) -> list:
+    """
+    Convierte una columna del DataFrame en una lista de valores de Python que se pueden escribir en el Excel.
+    Los valores vacíos (NaN / NaT) se escriben como celdas vacías.
+
+    Args:
+        serie (pd.Series): Columna a convertir.
+
+    Returns:
+        list: Valores de la columna.
+    """
+    if serie.isna().any():
+        return serie.astype(object).where(serie.notna(), None).tolist()
+
+    return serie.tolist()
+
+def obtener_Filas_Excel(dataFrame: pd.DataFrame):
+    """
+    Recorre las filas del DataFrame (encabezado incluido) como tuplas de valores listos para escribir en el Excel.
+    Las filas se arman a partir de las columnas ya convertidas, sin recorrer el DataFrame fila por fila.
+
+    Args:
+        dataFrame (pd.DataFrame): Tabla a escribir.
+
+    Returns:
+        generator: Generador de tuplas, una por fila.
+    """
+    yield tuple(str(columna) for columna in dataFrame.columns)
+
+    yield from zip(*[convertir_Columna_Excel(dataFrame[columna]) for columna in dataFrame.columns])
+
+def exportar_Excel_Informe(hojas_Excel: dict, motor: str = None, destino=None) -> bytes:
+    """
+    Exporta las tablas finales del informe a un archivo Excel, con una hoja por cada métrica.
+    Las filas se escriben en secuencia con un escritor por flujo (xlsxwriter en modo 'constant_memory' o, si no está
+    instalado, openpyxl en modo de solo escritura), en lugar de crear en memoria una celda con estilos por cada valor
+    como hace 'DataFrame.to_excel'.
+
+    Args:
+        hojas_Excel (dict): Diccionario con el nombre de la hoja y el DataFrame que contiene, en el orden de las hojas.
+        motor (str): 'xlsxwriter' u 'openpyxl' (por defecto, xlsxwriter si está instalado).
+        destino (file-like): Archivo donde se escribe el Excel (por ejemplo, un miembro de 'ArchivoZipInforme'), opcional.
+
+    Returns:
+        bytes: Contenido del archivo Excel (.xlsx), o None si se escribió en 'destino'.
+
+    Raises:
+        ValueError: Si el motor no es válido o no está instalado.
+    """
+    motor = motor or ('xlsxwriter' if xlsxwriter is not None else 'openpyxl')
+
+    if motor not in ('xlsxwriter', 'openpyxl') or (motor == 'xlsxwriter' and xlsxwriter is None):
+        raise ValueError(f"El motor de Excel '{motor}' no es válido o no está instalado.")
+
+    # Los nombres de las hojas de Excel tienen un máximo de 31 caracteres y no admiten algunos símbolos
+    nombres_Hojas = {nombre_Hoja: re.sub(r'[\\/*?:\[\]]', '_', nombre_Hoja)[:31] for nombre_Hoja in hojas_Excel}
+
+    # Crear un buffer en memoria (si no se indicó un destino)
+    buffer_Excel = io.BytesIO() if destino is None else destino
+
+    if motor == 'xlsxwriter':
+        libro_Excel = xlsxwriter.Workbook(buffer_Excel, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss', 'nan_inf_to_errors': True, 'strings_to_formulas': False, 'strings_to_urls': False})
+
+        for nombre_Hoja, dataFrame in hojas_Excel.items():
+            hoja = libro_Excel.add_worksheet(nombres_Hojas[nombre_Hoja])
+
+            for numero_Fila, fila in enumerate(obtener_Filas_Excel(dataFrame)):
+                hoja.write_row(numero_Fila, 0, fila)
+
+        libro_Excel.close()
+    else:
+        libro_Excel = Workbook(write_only=True)
+
+        for nombre_Hoja, dataFrame in hojas_Excel.items():
+            hoja = libro_Excel.create_sheet(title=nombres_Hojas[nombre_Hoja])
+
+            for fila in obtener_Filas_Excel(dataFrame):
+                hoja.append(fila)
+
+        libro_Excel.save(buffer_Excel)
+
+    return buffer_Excel.getvalue() if destino is None else None
+
+def exportar_Tablas_Informe(hojas_Excel: dict, formatos: list) -> dict:
+    """
+    Exporta cada tabla del Excel también como archivo individual en los formatos indicados (CSV y/o Parquet), para
+    cargar los datos en otras herramientas sin abrir el libro de Excel.
+
+    Args:
+        hojas_Excel (dict): Diccionario con el nombre de la hoja y el DataFrame que contiene.
+        formatos (list): Formatos a exportar (llaves de 'FORMATOS_TABLAS').
+
+    Returns:
+        dict: Diccionario con el nombre del archivo (carpeta 'tablas/') y su contenido en bytes.
+
+    Raises:
+        ValueError: Si alguno de los formatos no es válido.
+    """
+    formatos_Invalidos = [formato for formato in formatos if formato not in FORMATOS_TABLAS]
+
+    if formatos_Invalidos:
+        raise ValueError(f"Formatos de tablas no válidos: {', '.join(formatos_Invalidos)}. Use: {', '.join(FORMATOS_TABLAS)}.")
+
+    archivos_Tablas = {}
+
+    for nombre_Hoja, dataFrame in hojas_Excel.items():
+        nombre_Base = f"tablas/{nombre_Hoja.replace(' ', '_')}"
+
+        if 'csv' in formatos:
+            archivos_Tablas[nombre_Base + FORMATOS_TABLAS['csv']] = dataFrame.to_csv(index=False, sep=';').encode('utf-8-sig')
+
+        if 'parquet' in formatos:
+            archivos_Tablas[nombre_Base + FORMATOS_TABLAS['parquet']] = dataFrame.to_parquet(index=False)
+
+    return archivos_Tablas
+
+def crear_Zip_Informe(word: bytes, excel: bytes, tablas: dict = None, dataset: bytes = None, compresion: str = 'deflate', nivel: int = None) -> bytes:
+    """
+    Crea el archivo ZIP de descarga del informe con el documento de Word, el Excel y, si se exportaron, las tablas en
+    formatos adicionales y el dataset procesado.
+
+    Args:
+        word (bytes): Contenido del documento de Word.
+        excel (bytes): Contenido del archivo Excel.
+        tablas (dict): Archivos de las tablas creados con 'exportar_Tablas_Informe', opcional.
+        dataset (bytes): Archivo Parquet del dataset creado con 'exportar_Dataset_Parquet', opcional.
+        compresion (str): Método de compresión del ZIP (llaves de 'COMPRESIONES_ZIP').
+        nivel (int): Nivel de compresión, opcional.
+
+    Returns:
+        bytes: Contenido del archivo ZIP.
+    """
+    # Crear un buffer para el archivo ZIP en memoria
+    zip_buffer = io.BytesIO()
+
+    # Crear el archivo ZIP y agregar los archivos
+    with ArchivoZipInforme(zip_buffer, compresion, nivel) as archivo_Zip:
+        archivo_Zip.agregar(ARCHIVOS_ZIP_INFORME['word'], word)
+        archivo_Zip.agregar(ARCHIVOS_ZIP_INFORME['excel'], excel)
+
+        for nombre_Archivo, contenido in (tablas or {}).items():
+            archivo_Zip.agregar(nombre_Archivo, contenido)
+
+        if dataset is not None:
+            archivo_Zip.agregar(ARCHIVOS_ZIP_INFORME['dataset'], dataset)
+
+    return zip_buffer.getvalue()
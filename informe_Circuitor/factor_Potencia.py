@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from .grupos import calcular_Estadisticas_Grupos
+
+# Columnas del Factor de Potencia cuyo signo se cuenta (sufijo de la llave -> columna). 'FP_POS' es el Factor de
+# Potencia consumido y 'FP_NEG' el generado
+COLUMNAS_SIGNOS_FACTOR_POTENCIA: dict = {
+    'FP_POS': 'F.P. III',
+    'FP_NEG': 'F.P. III -'
+}
+
+# Columnas del Factor de Potencia que se separan en inductivo y capacitivo (mínimo, medio y máximo)
+COLUMNAS_GRUPOS_FACTOR_POTENCIA: list = ['F.P. Mn. III', 'F.P. III', 'F.P. Mx. III']
+
+# Grupos del Factor de Potencia según su signo: inductivo (positivo) y capacitivo (negativo)
+GRUPOS_FACTOR_POTENCIA: dict = {
+    'Ind': 1,
+    'Cap': -1
+}
+
+# Etiquetas de los conteos por signo, en el orden de 'np.sign' + 1 (negativo, cero y positivo)
+ETIQUETAS_SIGNOS: tuple = ('NEGATIVOS', 'CEROS', 'POSITIVOS')
+
+def contar_Signos_FactorPotencia(dataFrame: pd.DataFrame, columnas: dict = None) -> dict:
+    """
+    Cuenta los valores positivos, ceros y negativos de las columnas del Factor de Potencia en una sola pasada: el signo
+    de cada valor y su columna se combinan en un código, y 'np.bincount' cuenta todos los códigos a la vez. Los valores
+    vacíos no se cuentan.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame con las columnas del Factor de Potencia.
+        columnas (dict): Sufijo de la llave -> columna (por defecto, 'COLUMNAS_SIGNOS_FACTOR_POTENCIA').
+
+    Returns:
+        dict: Cantidades con las llaves 'CANT_POSITIVOS_<sufijo>', 'CANT_CEROS_<sufijo>' y 'CANT_NEGATIVOS_<sufijo>'.
+    """
+    columnas = COLUMNAS_SIGNOS_FACTOR_POTENCIA if columnas is None else columnas
+
+    signos = np.sign(dataFrame[list(columnas.values())].to_numpy(dtype=np.float64))
+    filas_Validas, columnas_Validas = np.nonzero(~np.isnan(signos))
+
+    # Código = columna * 3 + (signo + 1)
+    codigos = columnas_Validas * 3 + signos[filas_Validas, columnas_Validas].astype(np.int64) + 1
+    conteos = np.bincount(codigos, minlength=3 * len(columnas)).reshape(len(columnas), 3)
+
+    return {
+        f"CANT_{ETIQUETAS_SIGNOS[signo]}_{sufijo}": int(conteos[posicion, signo])
+        for posicion, sufijo in enumerate(columnas) for signo in (2, 1, 0)
+    }
+
+def calcular_Medidas_FactorPotencia_Grupos(dataFrame: pd.DataFrame, columnas: list = None, percentil: float = 95) -> dict:
+    """
+    Calcula el percentil, el máximo, el promedio y el mínimo del Factor de Potencia inductivo (positivo) y capacitivo
+    (negativo) de cada columna sin crear DataFrames filtrados por grupo: los valores de todas las columnas se etiquetan
+    con su grupo (columna y signo) y se resumen juntos con 'calcular_Estadisticas_Grupos'. Si un grupo no tiene valores,
+    sus medidas quedan vacías (NaN).
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame con las columnas del Factor de Potencia.
+        columnas (list): Columnas a separar (por defecto, 'COLUMNAS_GRUPOS_FACTOR_POTENCIA').
+        percentil (float): Percentil a calcular.
+
+    Returns:
+        dict: Por grupo y columna ('<columna> - Ind' o '<columna> - Cap'), un diccionario {columna: {'Percentil',
+        'Maximo', 'Promedio', 'Minimo'}}.
+    """
+    columnas = COLUMNAS_GRUPOS_FACTOR_POTENCIA if columnas is None else columnas
+    grupos = list(GRUPOS_FACTOR_POTENCIA)
+
+    valores = dataFrame[columnas].to_numpy(dtype=np.float64)
+    signos = np.sign(valores)
+
+    # Etiqueta = posición del grupo * cantidad de columnas + posición de la columna (-1 para los ceros y los vacíos)
+    etiquetas = np.full(valores.shape, -1, dtype=np.int64)
+
+    for posicion_Grupo, signo in enumerate(GRUPOS_FACTOR_POTENCIA.values()):
+        etiquetas = np.where(signos == signo, posicion_Grupo * len(columnas) + np.arange(len(columnas)), etiquetas)
+
+    estadisticas = calcular_Estadisticas_Grupos(valores.ravel(), etiquetas.ravel(), len(grupos) * len(columnas), percentil)
+
+    return {
+        f"{columna} - {grupo}": {
+            columna: {
+                medida: float(estadisticas[estadistico][posicion_Grupo * len(columnas) + posicion, 0])
+                for medida, estadistico in (('Percentil', 'Percentil'), ('Maximo', 'Max'), ('Promedio', 'Media'), ('Minimo', 'Min'))
+            }
+        }
+        for posicion_Grupo, grupo in enumerate(grupos) for posicion, columna in enumerate(columnas)
+    }
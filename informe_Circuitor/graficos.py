@@ -0,0 +1,1507 @@
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+from io import BytesIO
+from PIL import Image, ImageOps
+
+def graficar_Timeline_Tension(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limites=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limites (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [V]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limites:
+        ax.axhline(y=limites[0], color='red', linestyle='-', label=f'Límite Superior ({limites[0]}), [V]')
+        ax.axhline(y=limites[1], color='red', linestyle='-', label=f'Límite Inferior ({limites[1]}), [V]')
+        ax.set_ylim(-30,limites[0]+100)
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Tensión de Línea [V]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_Tension_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_Tension_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_Tension_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_Tension = Image.open(img_buffer_Tension_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_Tension, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_Tension_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_Tension_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_Tension_Con_Borde.seek(0)
+
+    return img_buffer_Tension_Con_Borde
+
+def graficar_Timeline_Corriente(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [A]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Corriente Nominal ({round(limite, 2)}), [A]')
+        ax.set_ylim(-30,limite+500)
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Corriente de Línea [A]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_Corriente_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_Corriente_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_Corriente_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_Corriente = Image.open(img_buffer_Corriente_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_Corriente, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_Corriente_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_Corriente_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_Corriente_Con_Borde.seek(0)
+
+    return img_buffer_Corriente_Con_Borde
+
+def graficar_Timeline_DesbTension(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [%]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Valor de Referencia ({limite}), [%]')
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Desbalance de Tensión [%]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_DesbTension = BytesIO()
+    plt.savefig(img_buffer_DesbTension, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_DesbTension.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_DesbTension = Image.open(img_buffer_DesbTension)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_DesbTension, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_DesbTension_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_DesbTension_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_DesbTension_Con_Borde.seek(0)
+
+    return img_buffer_DesbTension_Con_Borde
+
+def graficar_Timeline_DesbCorriente(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [%]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Valor de Referencia ({limite}), [%]')
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Desbalance de Corriente [%]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_DesbCorriente_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_DesbCorriente_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_DesbCorriente_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_DesbCorriente = Image.open(img_buffer_DesbCorriente_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_DesbCorriente, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_Corriente_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_Corriente_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_Corriente_Con_Borde.seek(0)
+
+
+    return img_buffer_Corriente_Con_Borde
+
+def graficar_Timeline_PQS_ActApa(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, titulo=''):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'yellow']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [kW / kVA]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Potencias')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_PQSActApa_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_PQSActApa_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_PQSActApa_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_ActApa = Image.open(img_buffer_PQSActApa_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_ActApa, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_PQSActApa_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_PQSActApa_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_PQSActApa_Con_Borde.seek(0)
+
+    return img_buffer_PQSActApa_Con_Borde
+
+def graficar_Timeline_PQS_CapInd(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, titulo=''):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'yellow']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [kVAR]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Potencias')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_PQSCapInd_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_PQSCapInd_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_PQSCapInd_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_CapInd = Image.open(img_buffer_PQSCapInd_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_CapInd, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_PQSCapInd_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_PQSCapInd_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_PQSCapInd_Con_Borde.seek(0)
+
+    return img_buffer_PQSCapInd_Con_Borde
+
+def graficar_Timeline_FactPotencia(dataFrame: pd.DataFrame, variables: list, percentiles: dict, medidas_dataFrame: dict, fecha_col: str, titulo=''):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        medidas_dataFrame (dict): Un diccionario para agregar a los títulos de las variables la cantidad de valores positivos, ceros o negativos.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['blue', 'red', 'green', 'yellow']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Creamos una lista de Listas y que contiene 2 Listas Individuales con los Valores de cada Factor de Potencia (+ y -) y sus Mediciones (+,0,-)
+    list_Mediciones_FP: list = [[medidas_dataFrame.get('CANT_POSITIVOS_FP_NEG'), medidas_dataFrame.get('CANT_CEROS_FP_NEG'), medidas_dataFrame.get('CANT_NEGATIVOS_FP_NEG')], [medidas_dataFrame.get('CANT_POSITIVOS_FP_POS'), medidas_dataFrame.get('CANT_CEROS_FP_POS'), medidas_dataFrame.get('CANT_NEGATIVOS_FP_POS')]]
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), + : ( {list_Mediciones_FP[i][0]} ), 0 : ( {list_Mediciones_FP[i][1]} ), - : ( {list_Mediciones_FP[i][2]} )", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Factor de Potencia')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_FactPotencia_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_FactPotencia_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_FactPotencia_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_FactPotencia = Image.open(img_buffer_FactPotencia_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_FactPotencia, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_FactPotencia_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_FactPotencia_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_FactPotencia_Con_Borde.seek(0)
+
+    return img_buffer_FactPotencia_Con_Borde
+
+def graficar_Timeline_Distorsion_Tension(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [%]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Distorsión Armónico de Tensión ({round(limite, 2)}), [%]')
+        ax.set_ylim(-5,limite+40)
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Distorsión Armónica de Tensión [%]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_DistTension_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_DistTension_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_DistTension_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_DistTension = Image.open(img_buffer_DistTension_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_DistTension, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_DistTension_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_DistTension_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_DistTension_Con_Borde.seek(0)
+
+    return img_buffer_DistTension_Con_Borde
+
+def graficar_Timeline_Distorsion_Corriente(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo=''):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [%]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Distorsión Armónica de Corriente ({round(limite, 2)})')
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Distorsión Armónica de Corriente [%]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_DistCorriente_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_DistCorriente_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_DistCorriente_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_DistCorriente = Image.open(img_buffer_DistCorriente_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_DistCorriente, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_DistCorriente_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_DistCorriente_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_DistCorriente_Con_Borde.seek(0)
+
+    return img_buffer_DistCorriente_Con_Borde
+
+def graficar_Timeline_CargabilidadTDD(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo='', intervalos=None):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+        intervalos (tuple): Intervalos de violación del límite (inicios, finales) en posiciones de registro, para sombrear los tramos fuera de límite.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} ), [%]", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Armónicos de Cargabilidad TDD ({round(limite, 2)}), [%]')
+        ax.set_ylim(-5,limite+40)
+
+    # Sombrear los tramos fuera de límite si se proporcionan
+    if intervalos is not None:
+        sombrear_Intervalos_Violacion(ax, dataFrame[fecha_col], intervalos)
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('TDD [%]')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_CargTDD_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_CargTDD_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_CargTDD_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_CargTDD = Image.open(img_buffer_CargTDD_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_CargTDD, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_CargTDD_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_CargTDD_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_CargTDD_Con_Borde.seek(0)
+
+    return img_buffer_CargTDD_Con_Borde
+
+def graficar_Timeline_FactorK(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo=''):
+
+    """
+    Genera un gráfico a partir de los parámetros proporcionados y devuelve un buffer con la imagen en memoria.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame que contiene los datos a graficar.
+        variables (list): Una lista de valores que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (list): Una lista utilizada para los datos que contienen los límites en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    # Crear figura y eje
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Colores para la Figura
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Valores del Diccionario con los datos de los Percentiles
+    valores_Percentiles = percentiles.values()
+
+    # Graficar cada variable
+    for i, (var, var_Pr) in enumerate(zip(variables, valores_Percentiles)):
+        ax.plot(dataFrame[fecha_col], dataFrame[var], label=f"{var}, (PR: {var_Pr} )", alpha=0.45, linewidth=1.2, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - Factor K ({round(limite, 2)})')
+
+    # Configurar etiquetas y títulos
+    ax.set_ylabel('Factor K')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    # Crear un buffer para la imagen en memoria
+    img_buffer_Factork_Sin_Borde = BytesIO()
+    plt.savefig(img_buffer_Factork_Sin_Borde, format='png')  # Guardar la imagen en el buffer
+    plt.close()
+    img_buffer_Factork_Sin_Borde.seek(0)  # Reiniciar el puntero al principio del buffer
+
+    # Cargar la imagen desde el buffer
+    imagen_Factork = Image.open(img_buffer_Factork_Sin_Borde)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(imagen_Factork, border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_Factork_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_Factork_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_Factork_Con_Borde.seek(0)
+
+    return img_buffer_Factork_Con_Borde
+
+
+def obtener_nombre_mes(mes):
+
+    """
+    Convierte el número entero del mes en una representación de texto con el equivalente al nombre del mes.
+
+    Args:
+        mes (int): Un número entero que representa el número del mes.
+
+    Returns:
+        str: La representación en cadena del mes para el número proporcionado.
+    """
+    meses = {
+        1: "Enero", 2: "Febrero", 3: "Marzo", 4: "Abril",
+        5: "Mayo", 6: "Junio", 7: "Julio", 8: "Agosto",
+        9: "Septiembre", 10: "Octubre", 11: "Noviembre", 12: "Diciembre"
+    }
+    return meses.get(mes, "Mes inválido")
+
+
+def sombrear_Intervalos_Violacion(ax, fechas: pd.Series, intervalos: tuple, color: str = 'red'):
+    """
+    Sombrea en el gráfico los tramos fuera de límite a partir de los intervalos de violación ya calculados, con una
+    sola colección de barras (sin volver a revisar la serie).
+
+    Args:
+        ax (matplotlib.axes.Axes): Eje del gráfico.
+        fechas (pd.Series): Fecha y hora de los registros graficados (eje X).
+        intervalos (tuple): Arreglos (inicios, finales) en posiciones de registro, con final exclusivo.
+        color (str): Color del sombreado.
+    """
+    inicios, finales = intervalos
+
+    if len(inicios) == 0:
+        return
+
+    # Cada tramo va desde el primer registro hasta el siguiente al último (o un intervalo de registro más, al final)
+    posiciones_Fechas = mdates.date2num(pd.to_datetime(fechas).to_numpy())
+    intervalo_Registro = np.median(np.diff(posiciones_Fechas)) if len(posiciones_Fechas) > 1 else 0
+    posiciones_Fechas = np.r_[posiciones_Fechas, posiciones_Fechas[-1] + intervalo_Registro]
+
+    x_Inicios = posiciones_Fechas[inicios]
+    anchos = posiciones_Fechas[finales] - x_Inicios
+
+    ax.broken_barh(list(zip(x_Inicios, anchos)), (0, 1), transform=ax.get_xaxis_transform(), facecolors=color, alpha=0.12, label='Tramos fuera de límite')
+
+def guardar_Figura_Con_Borde(fig, dpi: int = 100):
+    """
+    Guarda la figura de Matplotlib en formato PNG y le agrega el borde verde que llevan las imágenes del informe.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figura a guardar.
+        dpi (int): Resolución de la imagen.
+
+    Returns:
+        BytesIO: Buffer con la imagen PNG con borde, posicionado al inicio.
+    """
+    # Guardar el gráfico en un buffer
+    buffer_Sin_Borde = BytesIO()
+    fig.savefig(buffer_Sin_Borde, format="png", dpi=dpi)
+    buffer_Sin_Borde.seek(0)
+
+    # Definir el color y ancho del borde
+    color_Borde = (0, 176, 80)  # Verde
+    ancho_Borde = 4
+
+    # Agregar el borde a la imagen
+    imagen_Con_Borde = ImageOps.expand(Image.open(buffer_Sin_Borde), border=ancho_Borde, fill=color_Borde)
+
+    # Guardar la imagen con borde en un nuevo buffer
+    img_buffer_Con_Borde = BytesIO()
+    imagen_Con_Borde.save(img_buffer_Con_Borde, format='png')
+
+    # Reiniciar el puntero del nuevo buffer
+    img_buffer_Con_Borde.seek(0)
+
+    return img_buffer_Con_Borde
+
+def dibujar_Grafico_Barras_Energia(ax, x_values, barras_Activa: pd.Series, barras_Reactiva: pd.Series, linea_Porcentaje: pd.Series, etiquetas: list, color_Reactiva: str, titulo: str):
+    """
+    Dibuja sobre un eje ya existente el gráfico diario de barras de energía (activa y reactiva) con la línea de porcentaje.
+    Las etiquetas de valores se agregan con 'ax.bar_label' por contenedor, en lugar de un 'ax.text' por cada barra.
+
+    Args:
+        ax (matplotlib.axes.Axes): Eje sobre el que se dibuja (se limpia antes de dibujar).
+        x_values (pd.Series): Fechas y horas del día, ya formateadas como texto.
+        barras_Activa (pd.Series): Valores de la energía activa.
+        barras_Reactiva (pd.Series): Valores de la energía reactiva (capacitiva o inductiva).
+        linea_Porcentaje (pd.Series): Valores de la línea de porcentaje (KVARH_CAP o KARH_IND).
+        etiquetas (list): Etiquetas de la leyenda para [barras_Activa, barras_Reactiva, linea_Porcentaje].
+        color_Reactiva (str): Color de las barras de energía reactiva.
+        titulo (str): Título del gráfico.
+
+    Returns:
+        dict: Referencias a los elementos dibujados (barras, línea y etiquetas), para poder actualizarlos en sitio.
+    """
+    bar_width = 0.4
+    x_indexes = np.arange(len(x_values))
+
+    # Calcula el valor Máximo de las Barras o Líneas de la Energía
+    max_Value = max(barras_Activa.max(), barras_Reactiva.max(), linea_Porcentaje.max())
+
+    # Ajustar el límite superior del eje Y dinámicamente con un margen adicional
+    y_margin = max_Value * 0.3  # 30% del valor máximo como margen superior
+
+    ax.clear()
+
+    # Agregar las barras de ambas columnas y sus valores (un 'bar_label' por serie)
+    barras_1 = ax.bar(x_indexes, barras_Activa, width=bar_width, label=etiquetas[0], color='#66BB6A', align="center")
+    barras_2 = ax.bar(x_indexes + bar_width, barras_Reactiva, width=bar_width, label=etiquetas[1], color=color_Reactiva, align="center")
+
+    etiquetas_1 = ax.bar_label(barras_1, fmt='%.1f', fontsize=6.5, padding=4)
+    etiquetas_2 = ax.bar_label(barras_2, fmt='%.1f', fontsize=6.5, padding=4)
+
+    # Agregar la Línea al gráfico de Barras
+    linea, = ax.plot(x_indexes + bar_width / 2, linea_Porcentaje, label=etiquetas[2], color='red', linestyle='-', linewidth=1)
+
+    # Los valores de la línea se etiquetan con un contenedor de barras invisibles (ancho cero) en los mismos puntos
+    puntos_Linea = ax.bar(x_indexes + bar_width / 2, linea_Porcentaje, width=0, alpha=0)
+    etiquetas_Linea = ax.bar_label(puntos_Linea, fmt='%.3f%%', fontsize=5.5, rotation=50, color='red', padding=18)
+
+    # Formatear el eje X
+    ax.set_xticks(x_indexes + bar_width / 2)
+    ax.set_xticklabels(x_values, rotation=45, ha='right')
+
+    # Configurar el resto del gráfico
+    ax.set_title(titulo, fontsize=12)
+    ax.set_xlabel("Hora del Día", fontsize=10)
+    ax.set_ylabel("Valores [kWh - kVARh]", fontsize=10)
+    ax.set_ylim(0, max_Value + y_margin)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+
+    return {
+        'barras': [(barras_1, etiquetas_1, '%.1f'), (barras_2, etiquetas_2, '%.1f'), (puntos_Linea, etiquetas_Linea, '%.3f%%')],
+        'linea': linea,
+        'leyenda': [barras_1, barras_2, linea]
+    }
+
+class PoolFigurasEnergia:
+    """
+    Conjunto de figuras plantilla (una por tipo de gráfico de energía) que se reutilizan para todos los días.
+
+    La primera vez que se usa un tipo de gráfico se dibuja completo y se resuelve el 'constrained_layout'; en los días
+    siguientes solo se actualizan en sitio las alturas de las barras, los datos de la línea, las etiquetas y los textos,
+    y el diseño se congela. El diseño solo se vuelve a resolver cuando cambia la extensión de las etiquetas (número de
+    barras, largo de las etiquetas del eje X, dígitos del eje Y o textos de la leyenda).
+    """
+
+    def __init__(self, figsize: tuple = (10, 6)):
+        self.figsize = figsize
+        self.plantillas = {}
+
+    @staticmethod
+    def _firma_Diseno(x_values, etiquetas: list, y_Max: float) -> tuple:
+        """
+        Calcula la firma que determina si el diseño resuelto de la figura sigue siendo válido.
+        """
+        largo_Etiquetas_X = max((len(str(valor)) for valor in x_values), default=0)
+        return (len(x_values), largo_Etiquetas_X, len(f"{y_Max:.0f}"), tuple(etiquetas))
+
+    @staticmethod
+    def _actualizar_Barras(barras, etiquetas_Barras: list, valores: np.ndarray, fmt: str):
+        """
+        Actualiza en sitio la altura de cada barra y la posición y texto de su etiqueta ('bar_label').
+        """
+        for barra, etiqueta, valor in zip(barras, etiquetas_Barras, valores):
+            barra.set_height(valor)
+            etiqueta.xy = (etiqueta.xy[0], valor)
+            etiqueta.set_text('' if np.isnan(valor) else fmt % valor)
+
+    def dibujar(self, tipo: str, x_values, barras_Activa: pd.Series, barras_Reactiva: pd.Series, linea_Porcentaje: pd.Series, etiquetas: list, color_Reactiva: str, titulo: str):
+        """
+        Dibuja el gráfico de un tipo dado reutilizando su figura plantilla y devuelve la figura lista para guardar.
+
+        Args:
+            tipo (str): Identificador del tipo de gráfico (por ejemplo 'ActCap' o 'ActInd').
+            x_values (pd.Series): Fechas y horas del día, ya formateadas como texto.
+            barras_Activa (pd.Series): Valores de la energía activa.
+            barras_Reactiva (pd.Series): Valores de la energía reactiva (capacitiva o inductiva).
+            linea_Porcentaje (pd.Series): Valores de la línea de porcentaje (KVARH_CAP o KARH_IND).
+            etiquetas (list): Etiquetas de la leyenda para [barras_Activa, barras_Reactiva, linea_Porcentaje].
+            color_Reactiva (str): Color de las barras de energía reactiva.
+            titulo (str): Título del gráfico.
+
+        Returns:
+            matplotlib.figure.Figure: Figura con el gráfico del día.
+        """
+        series = [np.asarray(serie, dtype=float) for serie in (barras_Activa, barras_Reactiva, linea_Porcentaje)]
+        y_Max = max(np.nanmax(serie) if len(serie) else 0 for serie in series)
+        firma = self._firma_Diseno(x_values, etiquetas, y_Max * 1.3)
+
+        plantilla = self.plantillas.get(tipo)
+
+        if plantilla is None:
+            fig, ax = plt.subplots(figsize=self.figsize, constrained_layout=True)
+            plantilla = self.plantillas[tipo] = {'fig': fig, 'ax': ax, 'elementos': None, 'firma': None, 'color': None}
+
+        fig, ax = plantilla['fig'], plantilla['ax']
+
+        # La actualización en sitio solo aplica si se conserva la cantidad de barras y no hay valores negativos
+        # (las etiquetas de valores negativos cambian de alineación en 'bar_label')
+        actualizable = (
+            plantilla['elementos'] is not None
+            and plantilla['color'] == color_Reactiva
+            and len(plantilla['elementos']['linea'].get_xdata()) == len(x_values)
+            and not any((serie < 0).any() for serie in series)
+        )
+
+        if actualizable:
+            for (barras, etiquetas_Barras, fmt), valores in zip(plantilla['elementos']['barras'], series):
+                self._actualizar_Barras(barras, etiquetas_Barras, valores, fmt)
+
+            plantilla['elementos']['linea'].set_ydata(series[2])
+
+            ax.set_xticklabels(x_values, rotation=45, ha='right')
+            ax.set_title(titulo, fontsize=12)
+            ax.set_ylim(0, y_Max * 1.3)
+
+            # Actualizar las etiquetas de la leyenda respetando el orden en que la leyenda agrupa los elementos
+            for artista, etiqueta in zip(plantilla['elementos']['leyenda'], etiquetas):
+                artista.set_label(etiqueta)
+
+            for texto, etiqueta in zip(ax.get_legend().get_texts(), ax.get_legend_handles_labels()[1]):
+                texto.set_text(etiqueta)
+        else:
+            plantilla['elementos'] = dibujar_Grafico_Barras_Energia(ax, x_values, barras_Activa, barras_Reactiva, linea_Porcentaje, etiquetas, color_Reactiva, titulo)
+            plantilla['color'] = color_Reactiva
+            plantilla['firma'] = None
+
+        # Resolver el diseño solo si cambió la extensión de las etiquetas; en otro caso se congela el último diseño
+        if plantilla['firma'] != firma:
+            fig.set_layout_engine('constrained')
+            plantilla['firma'] = firma
+        else:
+            fig.set_layout_engine('none')
+
+        return fig
+
+    def cerrar(self):
+        """
+        Cierra todas las figuras plantilla del pool.
+        """
+        for plantilla in self.plantillas.values():
+            plt.close(plantilla['fig'])
+
+        self.plantillas = {}
+
+def crear_Graficos_Barras_Energias(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str) -> dict:
+    """
+    Genera gráficos de barras por cada día, mostrando las columnas a lo largo del tiempo (hora).
+    Se reutiliza una figura plantilla por tipo de gráfico para todos los días ('PoolFigurasEnergia'): los datos se
+    actualizan en sitio y el diseño solo se vuelve a resolver cuando cambia la extensión de las etiquetas.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame con los datos.
+        variables (list): Lista de columnas a graficar (Energías).
+        percentiles (dict): Diccionario con los percentiles de las energías que se agregan a la leyenda.
+        fecha_col (str): Nombre de la columna que contiene las fechas y horas.
+
+    Returns:
+        dict: Diccionario anidado (día -> nombre del gráfico) con los buffers PNG de cada gráfico.
+    """
+    # Crear un diccionario para guardar los gráficos
+    graficos_dict = {}
+
+    # Asegurar que la columna de fecha esté en formato datetime (sobre una copia, la tabla original se exporta tal cual)
+    dataFrame = dataFrame.assign(**{fecha_col: pd.to_datetime(dataFrame[fecha_col], format="%d/%m/%y %H:%M:%S", errors='coerce')})
+
+    # Extraer los días únicos
+    dias = dataFrame[fecha_col].dt.date.unique()
+
+    # Figuras plantilla reutilizadas por tipo de gráfico: Activa - Capacitiva y Activa - Inductiva
+    pool_Figuras = PoolFigurasEnergia(figsize=(10, 6))
+
+    # Iterar por cada día
+    for dia in dias:
+        dia_data = dataFrame[dataFrame[fecha_col].dt.date == dia]
+        graficos_dict[str(dia)] = {}
+
+        year = dia_data[fecha_col].dt.year.iloc[0]
+        month = dia_data[fecha_col].dt.month.iloc[0]
+        day_number = dia_data[fecha_col].dt.day.iloc[0]
+        month_name = obtener_nombre_mes(month)
+
+        x_values = dia_data[fecha_col].dt.strftime("%d/%m/%y %H:%M:%S")
+
+        # Generar gráficos para las combinaciones de columnas
+        # Gráfico 1: Columna 0 y Columna 1
+        if len(variables) >= 2:  # Asegurarse de que hay suficientes columnas
+            fig_ActCap = pool_Figuras.dibujar(
+                'ActCap', x_values, dia_data[variables[0]], dia_data[variables[1]], dia_data[variables[3]],
+                [f"{variables[0]}, (PR: {percentiles.get('PERCENTIL_ENERGIA_ACTIVA_MED')} ), [kWh]", f"{variables[1]}, (PR: {percentiles.get('PERCENTIL_ENERGIA_CAPACITIVA_MED')} ), [kVARh]", f"{variables[3]}, [%]"],
+                '#FFA726',
+                f"REGISTROS DE ENERGÍA ({variables[0]}) Y ENERGÍA ({variables[1]}) - {day_number} de {month_name} del {year}"
+            )
+
+            graficos_dict[str(dia)][f"Graf_{variables[0]}_{variables[1]}"] = guardar_Figura_Con_Borde(fig_ActCap)
+
+        # Gráfico 2: Columna 0 y Columna 2
+        if len(variables) >= 3:  # Asegurarse de que hay suficientes columnas
+            fig_ActInd = pool_Figuras.dibujar(
+                'ActInd', x_values, dia_data[variables[0]], dia_data[variables[2]], dia_data[variables[4]],
+                [f"{variables[0]}, (PR: {percentiles.get('PERCENTIL_ENERGIA_ACTIVA_MED')} ), [kWh]", f"{variables[2]}, (PR: {percentiles.get('PERCENTIL_ENERGIA_INDUCTIVA_MED')} ), [kVARh]", f"{variables[4]}, [%]"],
+                '#AB47BC',
+                f"REGISTROS DE ENERGÍA ({variables[0]}) Y ENERGÍA ({variables[2]}) - {day_number} de {month_name} del {year}"
+            )
+
+            graficos_dict[str(dia)][f"Graf_{variables[0]}_{variables[2]}"] = guardar_Figura_Con_Borde(fig_ActInd)
+
+    pool_Figuras.cerrar()
+
+    return graficos_dict
+
+def graficar_Perfil_Horario(dataFrame: pd.DataFrame, variables: list, nombre_Percentil: str = 'P95', tipos_Dia: tuple = ("Laborable", "Fin de Semana"), titulo=''):
+    """
+    Genera el gráfico del perfil de carga por hora del día: el promedio (línea continua) y el percentil (línea
+    discontinua) de cada variable, por tipo de día.
+
+    Args:
+        dataFrame (pd.DataFrame): Tabla del perfil horario (ver 'calcular_Perfiles_Carga').
+        variables (list): Columnas del perfil a graficar.
+        nombre_Percentil (str): Nombre del percentil en las columnas de la tabla (por ejemplo 'P95').
+        tipos_Dia (tuple): Tipos de día de la tabla.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    # Un color por variable y tipo de día
+    colores = ['#1565C0', '#EF6C00', '#2E7D32', '#6A1B9A', '#C62828', '#00838F']
+    horas = np.arange(len(dataFrame))
+
+    for i, (var, tipo_Dia) in enumerate((var, tipo_Dia) for var in variables for tipo_Dia in tipos_Dia):
+        color = colores[i % len(colores)]
+        ax.plot(horas, dataFrame[f"{var} - {tipo_Dia} (Prom)"], label=f"{var} - {tipo_Dia} (Promedio)", color=color, linewidth=1.6, marker='o', markersize=3)
+        ax.plot(horas, dataFrame[f"{var} - {tipo_Dia} ({nombre_Percentil})"], label=f"{var} - {tipo_Dia} ({nombre_Percentil})", color=color, linewidth=1.2, linestyle='--')
+
+    ax.set_xticks(horas)
+    ax.set_xticklabels(dataFrame['Hora'], rotation=45)
+
+    ax.set_ylabel('Potencias')
+    ax.set_xlabel('Hora del Día')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    img_buffer_Perfil_Horario = guardar_Figura_Con_Borde(fig)
+    plt.close(fig)
+
+    return img_buffer_Perfil_Horario
+
+def graficar_Perfil_Semanal(dataFrame: pd.DataFrame, variables: list, nombre_Percentil: str = 'P95', titulo=''):
+    """
+    Genera el gráfico del perfil de carga por día de la semana: el promedio de cada variable en barras y el percentil
+    como marcadores sobre las barras.
+
+    Args:
+        dataFrame (pd.DataFrame): Tabla del perfil semanal (ver 'calcular_Perfiles_Carga').
+        variables (list): Columnas del perfil a graficar.
+        nombre_Percentil (str): Nombre del percentil en las columnas de la tabla (por ejemplo 'P95').
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    colores = ['#66BB6A', '#42A5F5', '#FFA726', '#AB47BC']
+    colores_Percentil = ['#C62828', '#1565C0', '#EF6C00', '#6A1B9A']
+    x_indexes = np.arange(len(dataFrame))
+    bar_width = 0.8 / max(len(variables), 1)
+
+    for i, var in enumerate(variables):
+        desplazamiento = x_indexes + (i - (len(variables) - 1) / 2) * bar_width
+        barras = ax.bar(desplazamiento, dataFrame[f"{var} (Prom)"], width=bar_width, label=f"{var} (Promedio)", color=colores[i % len(colores)])
+        ax.bar_label(barras, fmt='%.1f', fontsize=6.5, padding=2)
+        ax.plot(desplazamiento, dataFrame[f"{var} ({nombre_Percentil})"], linestyle='none', marker='_', markersize=18, markeredgewidth=2, color=colores_Percentil[i % len(colores_Percentil)], label=f"{var} ({nombre_Percentil})")
+
+    ax.set_xticks(x_indexes)
+    ax.set_xticklabels(dataFrame['Día'])
+
+    ax.set_ylabel('Potencias')
+    ax.set_xlabel('Día de la Semana')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+
+    img_buffer_Perfil_Semanal = guardar_Figura_Con_Borde(fig)
+    plt.close(fig)
+
+    return img_buffer_Perfil_Semanal
+
+def graficar_Penalizacion_Reactiva(dataFrame: pd.DataFrame, titulo=''):
+    """
+    Genera el gráfico diario de la energía reactiva penalizada: el exceso de cada umbral en barras, con la cantidad de
+    horas con exceso en la leyenda.
+
+    Args:
+        dataFrame (pd.DataFrame): Tabla de penalización por energía reactiva (ver 'crear_Tabla_Penalizacion_Reactiva').
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    colores = ['#AB47BC', '#FFA726', '#42A5F5']
+
+    datos_Dias = dataFrame[dataFrame['Periodo'] == "Día"]
+    columnas_Exceso = [columna for columna in dataFrame.columns if columna.startswith("Exceso ")]
+
+    x_indexes = np.arange(len(datos_Dias))
+    bar_width = 0.8 / max(len(columnas_Exceso), 1)
+
+    for i, columna in enumerate(columnas_Exceso):
+        horas_Exceso = int(dataFrame.loc[dataFrame['Periodo'] == "Medición completa", f"Horas {columna}"].sum())
+        barras = ax.bar(x_indexes + (i - (len(columnas_Exceso) - 1) / 2) * bar_width, datos_Dias[columna], width=bar_width, label=f"{columna} [kVARh], ({horas_Exceso} horas con exceso)", color=colores[i % len(colores)])
+        ax.bar_label(barras, fmt='%.1f', fontsize=6.5, padding=2)
+
+    ax.set_xticks(x_indexes)
+    ax.set_xticklabels(datos_Dias['Fecha'], rotation=45, ha='right')
+
+    ax.set_ylabel('Energía Reactiva Penalizada [kVARh]')
+    ax.set_xlabel('Día')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+
+    img_buffer_Penalizacion = guardar_Figura_Con_Borde(fig)
+    plt.close(fig)
+
+    return img_buffer_Penalizacion
+
+def graficar_Timeline_Flicker(dataFrame: pd.DataFrame, variables: list, percentiles: dict, fecha_col: str, limite=None, titulo=''):
+    """
+    Genera la línea de tiempo del Flicker (Plt) solo con las muestras registradas de cada serie dispersa (una cada 2
+    horas), con un marcador por muestra, en lugar de graficar las columnas de Minuto a Minuto con los vacíos rellenados.
+
+    Args:
+        dataFrame (pd.DataFrame): Muestras de las series dispersas (ver 'extraer_Series_Dispersas'), ordenadas por columna y fecha.
+        variables (list): Una lista de las series que se van a visualizar en el gráfico.
+        percentiles (dict): Un diccionario para agregar al título los percentiles de forma específica por cada una de las variables.
+        fecha_col (str): Identifica el nombre de la columna que contiene la Fecha y Hora a graficar en el eje X.
+        limite (float): Valor de referencia del Plt, en caso de aplicar al gráfico.
+        titulo (str): Identifica el nombre que se va a agregar en el gráfico.
+
+    Returns:
+        io.BytesIO: Un buffer en memoria que contiene la imagen del gráfico generado.
+    """
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+    colores = ['#FFD700', 'blue', 'green', 'purple']
+
+    # Las muestras de cada serie forman un bloque contiguo: se ubican los límites de los bloques con 'searchsorted'
+    categorias = list(dataFrame['Columna'].cat.categories)
+    codigos = dataFrame['Columna'].cat.codes.to_numpy()
+    fechas = dataFrame[fecha_col].to_numpy()
+    valores = dataFrame['Valor'].to_numpy()
+
+    for i, (var, var_Pr) in enumerate(zip(variables, percentiles.values())):
+        if var not in categorias:
+            continue
+
+        inicio, fin = np.searchsorted(codigos, [categorias.index(var), categorias.index(var) + 1])
+        ax.plot(fechas[inicio:fin], valores[inicio:fin], label=f"{var}, (PR: {var_Pr} )", alpha=0.7, linewidth=1.0, marker='o', markersize=3, color=colores[i % len(colores)])
+
+    # Configurar espaciado de etiquetas y formato de fechas
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))  # Formato de fecha
+    plt.xticks(rotation=45)  # Rotar etiquetas
+
+    # Agregar límites si se proporcionan
+    if limite:
+        ax.axhline(y=limite, color='red', linestyle='-', label=f'Límite - PLT ({round(limite, 2)})')
+
+    ax.set_ylabel('Plt')
+    ax.set_xlabel('Fechas')
+    ax.set_title(titulo)
+
+    # Ajustar la leyenda (Variables Evaluadas) por fuera del gráfico y ajustar el tamaño del texto
+    ax.legend(ncol=1, bbox_to_anchor=(1.02,1.02,0.25,0.25), loc='center', fontsize='x-small')
+
+    ax.grid(True)
+
+    img_buffer_Flicker = guardar_Figura_Con_Borde(fig)
+    plt.close(fig)
+
+    return img_buffer_Flicker
+
+# Títulos de las líneas de tiempo, los perfiles de carga y la penalización por energía reactiva del informe, en el orden en que se generan (se usan como leyenda en las páginas)
+TITULOS_GRAFICOS: dict = {
+    'Tension': "Gráfico de Tensión",
+    'Corriente': "Gráfico de Corriente",
+    'DesbTension': "Gráfico de Desbalance de Tensión",
+    'DesbCorriente': "Gráfico de Desbalance de Corriente",
+    'PQS_ActApa': "Gráfico de Potencias (Activa/Aparente)",
+    'PQS_CapInd': "Gráfico de Potencias (Capacitiva/Inductiva)",
+    'FactorPotencia': "Gráfico de Factor de Potencia",
+    'DistTension': "Gráfico de Distorsión de Tensión",
+    'DistCorriente': "Gráfico de Distorsión de Corriente",
+    'CargabilidadTDD': "Gráfico de Armónicos de Cargabilidad TDD",
+    'Flicker': "Gráfico de Flicker (Plt)",
+    'FactorK': "Gráfico de FactorK",
+    'PerfilHorario': "Gráfico del Perfil de Carga por Hora del Día",
+    'PerfilSemanal': "Gráfico del Perfil de Carga por Día de la Semana",
+    'PenalizacionReactiva': "Gráfico de Energía Reactiva Penalizada"
+}
+
+def generar_Graficos_Informe(resultados: dict) -> dict:
+    """
+    Genera todos los gráficos del informe (líneas de tiempo y barras diarias de energías) a partir de los resultados
+    de la etapa de cálculo. Los gráficos se devuelven como buffers PNG, sin mostrarlos en ninguna interfaz.
+
+    Args:
+        resultados (dict): Resultados devueltos por 'calcular_Resultados_Informe'.
+
+    Returns:
+        dict: Diccionario con un buffer por cada línea de tiempo (llaves de 'TITULOS_GRAFICOS') y el diccionario
+        anidado de las barras de energías por día ('Barras_Energias').
+    """
+    # Resultados de la etapa de cálculo que se usan en los gráficos
+    list_Columns_Grafico_Tension = resultados['list_Columns_Grafico_Tension']
+    list_Columns_Grafico_DesbTension = resultados['list_Columns_Grafico_DesbTension']
+    list_Columns_Grafico_Corriente = resultados['list_Columns_Grafico_Corriente']
+    list_Columns_Grafico_DesbCorriente = resultados['list_Columns_Grafico_DesbCorriente']
+    list_Columns_Grafico_DesbCorriente_ActApa = resultados['list_Columns_Grafico_DesbCorriente_ActApa']
+    list_Columns_Grafico_DesbCorriente_CapInd = resultados['list_Columns_Grafico_DesbCorriente_CapInd']
+    list_Columns_Grafico_FactorPot = resultados['list_Columns_Grafico_FactorPot']
+    list_Columns_Distorsion_Tension = resultados['list_Columns_Distorsion_Tension']
+    list_Columns_Distorsion_Corriente = resultados['list_Columns_Distorsion_Corriente']
+    list_Columns_Armonicos_Cargabilidad_TDD = resultados['list_Columns_Armonicos_Cargabilidad_TDD']
+    list_Columns_FactorK = resultados['list_Columns_FactorK']
+    list_Columns_Flicker = resultados['list_Columns_Flicker']
+    var_Tabla_Tensiones = resultados['var_Tabla_Tensiones']
+    var_Tabla_Corrientes = resultados['var_Tabla_Corrientes']
+    df_Tabla_Desb_Tension = resultados['df_Tabla_Desb_Tension']
+    df_Tabla_Desb_Corriente = resultados['df_Tabla_Desb_Corriente']
+    df_Tabla_PQS_Final = resultados['df_Tabla_PQS_Final']
+    df_Tabla_FactPotenciaFinal = resultados['df_Tabla_FactPotenciaFinal']
+    df_Tabla_Distorsion_TensionFinal = resultados['df_Tabla_Distorsion_TensionFinal']
+    df_Tabla_Distorsion_CorrienteFinal = resultados['df_Tabla_Distorsion_CorrienteFinal']
+    df_Tabla_FactorKFinal = resultados['df_Tabla_FactorKFinal']
+    series_Flicker = resultados['series_Flicker']
+    valor_Referencia_PLT = resultados['valor_Referencia_PLT']
+    valor_Limite_TDD = resultados['valor_Limite_TDD']
+    df_Tabla_TDDFinal = resultados['df_Tabla_TDDFinal']
+    data_Cantidad_NEG_POS_FactorPotencia = resultados['data_Cantidad_NEG_POS_FactorPotencia']
+    data_Percentiles_Tension = resultados['data_Percentiles_Tension']
+    data_Percentiles_Corriente = resultados['data_Percentiles_Corriente']
+    data_Percentiles_DesbTension = resultados['data_Percentiles_DesbTension']
+    data_Percentiles_DesbCorriente = resultados['data_Percentiles_DesbCorriente']
+    data_Percentiles_PQS_ActApa = resultados['data_Percentiles_PQS_ActApa']
+    data_Percentiles_PQS_CapInd = resultados['data_Percentiles_PQS_CapInd']
+    data_Percentiles_FactorPotencia = resultados['data_Percentiles_FactorPotencia']
+    data_Percentiles_DistorsionTension = resultados['data_Percentiles_DistorsionTension']
+    data_Percentiles_DistorsionCorriente = resultados['data_Percentiles_DistorsionCorriente']
+    data_Percentiles_CargabilidadTDD = resultados['data_Percentiles_CargabilidadTDD']
+    data_Percentiles_FactorK = resultados['data_Percentiles_FactorK']
+    data_Percentiles_Flicker = resultados['data_Percentiles_Flicker']
+    df_Tabla_Energias = resultados['df_Tabla_Energias']
+    list_Columns_Graficos_Consolidado_Energia = resultados['list_Columns_Graficos_Consolidado_Energia']
+    data_Percentiles_Energia = resultados['data_Percentiles_Energia']
+    intervalos_Violacion = resultados['intervalos_Violacion']
+    df_Perfil_Horario = resultados['df_Perfil_Horario']
+    df_Perfil_Semanal = resultados['df_Perfil_Semanal']
+    df_Penalizacion_Reactiva = resultados['df_Penalizacion_Reactiva']
+
+    # Buffer de la Imagen para la Línea de Tiempo de la Tensión (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_Tension = graficar_Timeline_Tension(var_Tabla_Tensiones, list_Columns_Grafico_Tension, data_Percentiles_Tension, 'fecha_y_Hora', limites=[var_Tabla_Tensiones['var_Limite_Inferior_Tension'].iloc[0], var_Tabla_Tensiones['var_Limite_Superior_Tension'].iloc[0]], titulo='REGISTROS DE TENSIÓN', intervalos=intervalos_Violacion['tension']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo de la Corriente (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_Corriente = graficar_Timeline_Corriente(var_Tabla_Corrientes, list_Columns_Grafico_Corriente, data_Percentiles_Corriente, 'fecha_y_Hora', limite=var_Tabla_Corrientes['var_Limite_Corriente_Nominal'].iloc[0], titulo='REGISTROS DE CORRIENTE', intervalos=intervalos_Violacion['corriente']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo del Desbalance de Tensión (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_DesbTension = graficar_Timeline_DesbTension(df_Tabla_Desb_Tension, list_Columns_Grafico_DesbTension, data_Percentiles_DesbTension, 'fecha_y_Hora', limite=df_Tabla_Desb_Tension['var_Ref_Desbalance_Tension'].iloc[0], titulo='REGISTROS DESBALANCE DE TENSIÓN', intervalos=intervalos_Violacion['desbalance_Tension']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo del Desbalance de Tensión (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_DesbCorriente = graficar_Timeline_DesbCorriente(df_Tabla_Desb_Corriente, list_Columns_Grafico_DesbCorriente, data_Percentiles_DesbCorriente, 'fecha_y_Hora', limite=df_Tabla_Desb_Corriente['var_Ref_Desbalance_Corriente'].iloc[0], titulo='REGISTROS DESBALANCE DE CORRIENTE', intervalos=intervalos_Violacion['desbalance_Corriente']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo del PQS - Activa Aparente (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_PQS_ActApa = graficar_Timeline_PQS_ActApa(df_Tabla_PQS_Final, list_Columns_Grafico_DesbCorriente_ActApa, data_Percentiles_PQS_ActApa, 'fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Activa / Aparente (kW / kVA)')
+
+    # Buffer de la Imagen para la Línea de Tiempo del PQS - Capacitiva Inductiva (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_PQS_CapInd = graficar_Timeline_PQS_CapInd(df_Tabla_PQS_Final, list_Columns_Grafico_DesbCorriente_CapInd, data_Percentiles_PQS_CapInd, 'fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Capacitiva / Inductiva (kVAR)')
+
+    # Buffer de la Imagen para la Línea de Tiempo del Factor de Potencia (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_FactorPotencia = graficar_Timeline_FactPotencia(df_Tabla_FactPotenciaFinal, list_Columns_Grafico_FactorPot, data_Percentiles_FactorPotencia, data_Cantidad_NEG_POS_FactorPotencia, 'fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Factor de Potencia')
+
+    # Buffer de la Imagen para la Línea de Tiempo de la Distorsión de la Tensión (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_DistTension = graficar_Timeline_Distorsion_Tension(df_Tabla_Distorsion_TensionFinal, list_Columns_Distorsion_Tension, data_Percentiles_DistorsionTension, 'fecha_y_Hora', limite=df_Tabla_Distorsion_TensionFinal['var_Ref_Distorsion_Tension'].iloc[0], titulo='REGISTROS DISTORSIÓN ARMÓNICA DE TENSIÓN - THDV', intervalos=intervalos_Violacion['thdv']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo de la Distorsión de la Corriente (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_DistCorriente = graficar_Timeline_Distorsion_Corriente(df_Tabla_Distorsion_CorrienteFinal, list_Columns_Distorsion_Corriente, data_Percentiles_DistorsionCorriente, 'fecha_y_Hora', limite=None, titulo='REGISTROS DISTORSIÓN ARMÓNICA DE CORRIENTE - THDI')
+
+    # Buffer de la Imagen para la Línea de Tiempo de la Cargabilidad de TDD (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_CargabilidadTDD = graficar_Timeline_CargabilidadTDD(df_Tabla_TDDFinal, list_Columns_Armonicos_Cargabilidad_TDD, data_Percentiles_CargabilidadTDD, 'fecha_y_Hora', limite=valor_Limite_TDD, titulo='REGISTROS DISTORSIÓN TOTAL DE DEMANDA', intervalos=intervalos_Violacion['tdd']['union'])
+
+    # Buffer de la Imagen para la Línea de Tiempo del Flicker (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_Flicker = graficar_Timeline_Flicker(series_Flicker, list_Columns_Flicker, data_Percentiles_Flicker, 'fecha_y_Hora', limite=valor_Referencia_PLT, titulo='REGISTRO DE FLICKER')
+
+    # Buffer de la Imagen para la Línea de Tiempo del FactorK (Aquí se almacena el gráfico en la memoria local)
+    img_buffer_Timeline_FactorK = graficar_Timeline_FactorK(df_Tabla_FactorKFinal, list_Columns_FactorK, data_Percentiles_FactorK, 'fecha_y_Hora', limite=None, titulo='REGISTROS DE FACTOR K')
+
+    # Buffers de las Imágenes de los perfiles de carga (potencia activa y aparente por hora del día y por día de la semana)
+    variables_Perfiles = [var for var in ['P.Activa III', 'P.Aparente III'] if f"{var} (Prom)" in df_Perfil_Semanal.columns]
+
+    img_buffer_Perfil_Horario = graficar_Perfil_Horario(df_Perfil_Horario, variables_Perfiles, titulo='PERFIL DE CARGA POR HORA DEL DÍA (kW / kVA)')
+
+    img_buffer_Perfil_Semanal = graficar_Perfil_Semanal(df_Perfil_Semanal, variables_Perfiles, titulo='PERFIL DE CARGA POR DÍA DE LA SEMANA (kW / kVA)')
+
+    # Buffer de la Imagen de la energía reactiva penalizada por día
+    img_buffer_Penalizacion_Reactiva = graficar_Penalizacion_Reactiva(df_Penalizacion_Reactiva, titulo='ENERGÍA REACTIVA PENALIZADA POR DÍA')
+
+    # Buffers de las Imágenes de los gráficos de barras de las energías (uno por día y combinación de columnas)
+    graficos_Barras_Energias = crear_Graficos_Barras_Energias(dataFrame=df_Tabla_Energias, variables=list_Columns_Graficos_Consolidado_Energia, percentiles=data_Percentiles_Energia, fecha_col='Fecha/hora')
+
+
+    #graficar_Timeline_Corriente_Plotly(dataFrame=var_Tabla_Corrientes, variables=list_Columns_Grafico_Corriente, fecha_col='fecha_y_Hora', limite=var_Tabla_Corrientes['var_Limite_Corriente_Nominal'].iloc[0], titulo='REGISTROS DE CORRIENTE')
+
+    #graficar_Timeline_DesbTension_Plotly(dataFrame=df_Tabla_Desb_Tension, variables=list_Columns_Grafico_DesbTension, fecha_col='fecha_y_Hora', limite=df_Tabla_Desb_Tension['var_Ref_Desbalance_Tension'].iloc[0], titulo='REGISTROS DESBALANCE DE TENSIÓN')
+
+    #graficar_Timeline_DesbCorriente_Plotly(dataFrame=df_Tabla_Desb_Corriente, variables=list_Columns_Grafico_DesbCorriente, fecha_col='fecha_y_Hora', limite=df_Tabla_Desb_Corriente['var_Ref_Desbalance_Corriente'].iloc[0], titulo='REGISTROS DESBALANCE DE CORRIENTE')
+
+    #graficar_Timeline_PQS_ActApa_Plotly(dataFrame=df_Tabla_PQS_Final, variables=list_Columns_Grafico_DesbCorriente_ActApa, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Activa / Aparente (kW / kVA)')
+
+    #graficar_Timeline_PQS_CapInd_Plotly(dataFrame=df_Tabla_PQS_Final, variables=list_Columns_Grafico_DesbCorriente_CapInd, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Capacitiva / Inductiva (kVAR)')
+
+    #graficar_Timeline_FactPotencia_Plotly(dataFrame=df_Tabla_FactPotenciaFinal, variables=list_Columns_Grafico_FactorPot, medidas_dataFrame=data_Cantidad_NEG_POS_FactorPotencia, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Factor de Potencia')
+
+    #graficar_Timeline_Distorsion_Tension_Plotly(dataFrame=df_Tabla_Distorsion_TensionFinal, variables=list_Columns_Distorsion_Tension, fecha_col='fecha_y_Hora', limite=df_Tabla_Distorsion_TensionFinal['var_Ref_Distorsion_Tension'].iloc[0], titulo='REGISTROS DISTORSIÓN ARMÓNICA DE TENSIÓN - THDV')
+
+    #graficar_Timeline_Distorsion_Corriente_Plotly(dataFrame=df_Tabla_Distorsion_CorrienteFinal, variables=list_Columns_Distorsion_Corriente, fecha_col='fecha_y_Hora', limite=None, titulo='REGISTROS DISTORSIÓN ARMÓNICA DE CORRIENTE - THDI')
+
+    #graficar_Timeline_CargabilidadTDD_Plotly(dataFrame=df_Tabla_TDDFinal, variables=list_Columns_Armonicos_Cargabilidad_TDD, fecha_col='fecha_y_Hora', limite=valor_Limite_TDD, titulo='REGISTROS DISTORSIÓN TOTAL DE DEMANDA')
+
+    #graficar_Timeline_FactorK_Plotly(dataFrame=df_Tabla_FactorKFinal, variables=list_Columns_FactorK, fecha_col='fecha_y_Hora', limite=None, titulo='REGISTROS DE FACTOR K')
+
+    #generar_Graficos_Barras_Energias_Plotly(dataFrame=df_Tabla_Energias, variables=list_Columns_Graficos_Consolidado_Energia, fecha_col='Fecha/hora')
+
+    return {
+        'Tension': img_buffer_Timeline_Tension,
+        'Corriente': img_buffer_Timeline_Corriente,
+        'DesbTension': img_buffer_Timeline_DesbTension,
+        'DesbCorriente': img_buffer_Timeline_DesbCorriente,
+        'PQS_ActApa': img_buffer_Timeline_PQS_ActApa,
+        'PQS_CapInd': img_buffer_Timeline_PQS_CapInd,
+        'FactorPotencia': img_buffer_Timeline_FactorPotencia,
+        'DistTension': img_buffer_Timeline_DistTension,
+        'DistCorriente': img_buffer_Timeline_DistCorriente,
+        'CargabilidadTDD': img_buffer_Timeline_CargabilidadTDD,
+        'Flicker': img_buffer_Timeline_Flicker,
+        'FactorK': img_buffer_Timeline_FactorK,
+        'PerfilHorario': img_buffer_Perfil_Horario,
+        'PerfilSemanal': img_buffer_Perfil_Semanal,
+        'PenalizacionReactiva': img_buffer_Penalizacion_Reactiva,
+        'Barras_Energias': graficos_Barras_Energias
+    }
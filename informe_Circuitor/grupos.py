@@ -0,0 +1,96 @@
+import numpy as np
+
+# Estadísticos que se calculan por grupo (los mismos de las tablas de medidas del informe)
+ESTADISTICOS_GRUPOS: list = ['Percentil', 'Media', 'Min', 'Max']
+
+def codificar_Grupos(claves) -> tuple:
+    """
+    Convierte las claves de agrupación de cada registro (días, horas, periodos tarifarios, etc.) en etiquetas enteras
+    consecutivas para 'calcular_Estadisticas_Grupos'.
+
+    Args:
+        claves (np.ndarray | pd.Series): Clave de grupo de cada registro.
+
+    Returns:
+        tuple: Claves distintas, ordenadas (np.ndarray), y etiqueta de cada registro (posición de su clave, np.ndarray).
+    """
+    grupos, etiquetas = np.unique(np.asarray(claves), return_inverse=True)
+
+    return grupos, etiquetas.reshape(-1).astype(np.int64)
+
+def calcular_Estadisticas_Grupos(valores: np.ndarray, etiquetas: np.ndarray, cantidad_Grupos: int = None, percentil: float = 95) -> dict:
+    """
+    Calcula el percentil, la media, el mínimo y el máximo de cada columna en cada grupo con un solo ordenamiento por
+    grupo y valor ('np.lexsort' de todas las columnas a la vez): cada grupo queda en un bloque contiguo, con sus valores
+    ordenados, y el mínimo, el máximo y la suma se obtienen con 'reduceat'. El percentil se interpola (como
+    'np.percentile') a partir de la posición del percentil en cada bloque.
+
+    Los valores vacíos (NaN) no se tienen en cuenta y los registros con etiqueta negativa no pertenecen a ningún grupo.
+    Los grupos sin valores quedan vacíos (NaN).
+
+    Args:
+        valores (np.ndarray): Valores de una serie (registros) o de varias columnas (registros x columnas).
+        etiquetas (np.ndarray): Grupo de cada registro (entero de 0 a 'cantidad_Grupos' - 1, o negativo para excluirlo).
+        cantidad_Grupos (int): Cantidad de grupos (por defecto, la etiqueta más alta + 1).
+        percentil (float): Percentil que se calcula en cada grupo.
+
+    Returns:
+        dict: Cantidad de valores por grupo y columna ('registros') y una matriz (grupos x columnas) por estadístico de
+        'ESTADISTICOS_GRUPOS'.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    valores = valores[:, None] if valores.ndim == 1 else valores
+    etiquetas = np.asarray(etiquetas, dtype=np.int64).reshape(-1)
+
+    if cantidad_Grupos is None:
+        cantidad_Grupos = int(etiquetas.max()) + 1 if len(etiquetas) else 0
+
+    cantidad_Columnas = valores.shape[1]
+
+    estadisticas_Grupos: dict = {'registros': np.zeros((cantidad_Grupos, cantidad_Columnas), dtype=np.int64)}
+    estadisticas_Grupos.update({estadistico: np.full((cantidad_Grupos, cantidad_Columnas), np.nan) for estadistico in ESTADISTICOS_GRUPOS})
+
+    # Los registros sin grupo se descartan antes de ordenar
+    registros_Validos = (etiquetas >= 0) & (etiquetas < cantidad_Grupos)
+    etiquetas = etiquetas[registros_Validos]
+    valores = valores[registros_Validos]
+
+    if len(etiquetas) == 0 or cantidad_Columnas == 0:
+        return estadisticas_Grupos
+
+    # Un solo ordenamiento por grupo y, dentro de cada grupo, por valor (los vacíos quedan al final del bloque). Las
+    # etiquetas ordenadas son las mismas en todas las columnas, así que los bloques empiezan en las mismas filas
+    orden = np.lexsort((valores, np.broadcast_to(etiquetas[:, None], valores.shape)), axis=0)
+
+    etiquetas_Ordenadas = etiquetas[orden[:, 0]]
+    valores_Ordenados = np.take_along_axis(valores, orden, axis=0)
+
+    inicios_Grupos = np.flatnonzero(np.r_[True, etiquetas_Ordenadas[1:] != etiquetas_Ordenadas[:-1]])
+    grupos_Presentes = etiquetas_Ordenadas[inicios_Grupos]
+
+    valores_Vacios = np.isnan(valores_Ordenados)
+    cantidades = np.add.reduceat((~valores_Vacios).astype(np.int64), inicios_Grupos, axis=0)
+    grupos_Vacios = cantidades == 0
+
+    # 'fmin' y 'fmax' ignoran los valores vacíos mientras el bloque tenga al menos un valor
+    medias = np.add.reduceat(np.where(valores_Vacios, 0.0, valores_Ordenados), inicios_Grupos, axis=0) / np.maximum(cantidades, 1)
+    minimos = np.fmin.reduceat(valores_Ordenados, inicios_Grupos, axis=0)
+    maximos = np.fmax.reduceat(valores_Ordenados, inicios_Grupos, axis=0)
+
+    # Posición del percentil dentro de cada bloque (entre los valores no vacíos)
+    posiciones = (np.maximum(cantidades, 1) - 1) * (percentil / 100)
+    posiciones_Inferiores = np.floor(posiciones).astype(np.int64)
+    posiciones_Superiores = np.minimum(posiciones_Inferiores + 1, np.maximum(cantidades, 1) - 1)
+    fracciones = posiciones - posiciones_Inferiores
+
+    valores_Inferiores = np.take_along_axis(valores_Ordenados, inicios_Grupos[:, None] + posiciones_Inferiores, axis=0)
+    valores_Superiores = np.take_along_axis(valores_Ordenados, inicios_Grupos[:, None] + posiciones_Superiores, axis=0)
+    percentiles = valores_Inferiores + (valores_Superiores - valores_Inferiores) * fracciones
+
+    for estadistico, resultado in zip(ESTADISTICOS_GRUPOS, (percentiles, medias, minimos, maximos)):
+        resultado[grupos_Vacios] = np.nan
+        estadisticas_Grupos[estadistico][grupos_Presentes] = resultado
+
+    estadisticas_Grupos['registros'][grupos_Presentes] = cantidades
+
+    return estadisticas_Grupos
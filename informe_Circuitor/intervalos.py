@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+from .cumplimiento import COMPARADORES_CUMPLIMIENTO
+
+# Intervalos de violación de los límites: rachas de registros consecutivos fuera del límite, guardadas como arreglos
+# de inicio y final (posiciones de registro, final exclusivo) codificados por longitud de racha (RLE). Se calculan una
+# sola vez por medida y límite, y los comparten los gráficos (sombreado de los tramos), los eventos y el conteo de
+# minutos fuera de límite del informe. Cada medida indica su título, la tabla de Minuto a Minuto que revisa, las
+# columnas por fase, el comparador (ver 'COMPARADORES_CUMPLIMIENTO') y los límites que usa.
+VIOLACIONES_LIMITES: dict = {
+    'tension': {
+        'titulo': "Tensión",
+        'tabla': 'var_Tabla_Tensiones',
+        'columnas': {'L12': 'Tensin L12', 'L23': 'Tensin L23', 'L31': 'Tensin L31'},
+        'comparador': 'fuera_De_Rango',
+        'limites': ('tension_Inferior', 'tension_Superior')
+    },
+    'corriente': {
+        'titulo': "Corriente",
+        'tabla': 'var_Tabla_Corrientes',
+        'columnas': {'L1': 'Corriente mx. L1', 'L2': 'Corriente mx. L2', 'L3': 'Corriente mx. L3'},
+        'comparador': 'mayor',
+        'limites': ('corriente_Nominal',)
+    },
+    'desbalance_Tension': {
+        'titulo': "Desbalance de Tensión",
+        'tabla': 'df_Tabla_Desb_Tension',
+        'columnas': {'III': 'Desbalance'},
+        'comparador': 'mayor',
+        'limites': ('ref_Desbalance_Tension',)
+    },
+    'desbalance_Corriente': {
+        'titulo': "Desbalance de Corriente",
+        'tabla': 'df_Tabla_Desb_Corriente',
+        'columnas': {'III': 'Desbalance'},
+        'comparador': 'mayor',
+        'limites': ('ref_Desbalance_Corriente',)
+    },
+    'thdv': {
+        'titulo': "THDv",
+        'tabla': 'df_Tabla_Distorsion_TensionFinal',
+        'columnas': {'L1': 'V THD/d Mx. L1', 'L2': 'V THD/d Mx. L2', 'L3': 'V THD/d Mx. L3'},
+        'comparador': 'mayor',
+        'limites': ('limite_THDV',)
+    },
+    'tdd': {
+        'titulo': "TDD",
+        'tabla': 'df_Tabla_TDDFinal',
+        'columnas': {'L1': 'resultado_TDD_L1', 'L2': 'resultado_TDD_L2', 'L3': 'resultado_TDD_L3'},
+        'comparador': 'mayor',
+        'limites': ('limite_TDD',)
+    }
+}
+
+def calcular_Intervalos(mascaras: np.ndarray) -> tuple:
+    """
+    Codifica por longitud de racha (RLE) las máscaras de violación de varias series a la vez: cada serie se rodea de un
+    registro sin violación, de modo que las rachas no se unen entre series, y los cambios 0 -> 1 y 1 -> 0 de la matriz
+    aplanada son los inicios y los finales de todas las rachas.
+
+    Args:
+        mascaras (np.ndarray): Máscara booleana de una serie (registros) o de varias series (series x registros).
+
+    Returns:
+        tuple: Arreglos 'filas' (serie de cada intervalo), 'inicios' y 'finales' (posición del primer registro y del
+        siguiente al último), ordenados por serie y por inicio.
+    """
+    mascaras = np.atleast_2d(np.asarray(mascaras, dtype=bool))
+    ancho_Fila = mascaras.shape[1] + 2
+
+    cambios = np.diff(np.pad(mascaras, ((0, 0), (1, 1))).ravel().view(np.int8))
+    inicios_Planos = np.flatnonzero(cambios == 1)
+    finales_Planos = np.flatnonzero(cambios == -1)
+
+    return inicios_Planos // ancho_Fila, inicios_Planos % ancho_Fila, finales_Planos % ancho_Fila
+
+def combinar_Intervalos(intervalos: list, minimo: int = 1) -> tuple:
+    """
+    Combina varios conjuntos de intervalos con un barrido de los puntos de inicio y final: los tramos cubiertos por al
+    menos 'minimo' conjuntos. Con 'minimo=1' es la unión (violación en cualquier fase) y con 'minimo' igual a la
+    cantidad de conjuntos es la intersección (violación en todas las fases).
+
+    Args:
+        intervalos (list): Lista de tuplas (inicios, finales), una por conjunto (los intervalos de un mismo conjunto no
+            se solapan, como los de 'calcular_Intervalos').
+        minimo (int): Cantidad mínima de conjuntos que deben cubrir un tramo.
+
+    Returns:
+        tuple: Arreglos 'inicios' y 'finales' de los intervalos combinados.
+    """
+    inicios = np.concatenate([np.asarray(inicio, dtype=np.int64) for inicio, _ in intervalos]) if intervalos else np.zeros(0, dtype=np.int64)
+    finales = np.concatenate([np.asarray(final, dtype=np.int64) for _, final in intervalos]) if intervalos else np.zeros(0, dtype=np.int64)
+
+    puntos = np.concatenate([inicios, finales])
+    deltas = np.concatenate([np.ones(len(inicios), dtype=np.int64), -np.ones(len(finales), dtype=np.int64)])
+
+    # En un mismo punto los inicios van antes que los finales, para que los intervalos contiguos queden unidos
+    orden = np.lexsort((-deltas, puntos))
+    activos = np.cumsum(deltas[orden]) >= minimo
+
+    # El tramo empieza en el punto que alcanza el mínimo y termina en el punto que baja de él
+    cambios = np.diff(np.r_[False, activos].view(np.int8))
+    inicios_Combinados = puntos[orden][np.flatnonzero(cambios == 1)]
+    finales_Combinados = puntos[orden][np.flatnonzero(cambios == -1)]
+
+    tramos_Validos = finales_Combinados > inicios_Combinados
+
+    return inicios_Combinados[tramos_Validos], finales_Combinados[tramos_Validos]
+
+def calcular_Intervalo_Registro(fechas) -> float:
+    """
+    Calcula el intervalo de registro de la medición (mediana entre registros consecutivos), en minutos.
+
+    Args:
+        fechas (pd.Series | np.ndarray): Fecha y hora de los registros.
+
+    Returns:
+        float: Intervalo de registro en minutos (1 si no se puede calcular).
+    """
+    diferencias = np.diff(pd.to_datetime(fechas).to_numpy(dtype='datetime64[s]')).astype(np.float64)
+    diferencias = diferencias[np.isfinite(diferencias) & (diferencias > 0)]
+
+    return float(np.median(diferencias)) / 60 if len(diferencias) else 1.0
+
+def calcular_Violaciones_Limites(tablas: dict, limites: dict, violaciones: dict = None) -> dict:
+    """
+    Calcula los intervalos de violación de cada medida y límite (una codificación RLE por medida, con todas sus fases
+    juntas), junto con la unión y la intersección de las fases.
+
+    Args:
+        tablas (dict): Tablas de Minuto a Minuto por llave (ver 'tabla' en 'VIOLACIONES_LIMITES').
+        limites (dict): Valor de cada límite, con las llaves de los límites de cumplimiento.
+        violaciones (dict): Medidas a revisar (por defecto, 'VIOLACIONES_LIMITES').
+
+    Returns:
+        dict: Por medida, las fases revisadas ('fases'), la cantidad de registros ('registros_Totales'), los intervalos
+        por fase ('fila', 'inicios' y 'finales', con 'fila' como posición en 'fases'), la unión ('union') y la
+        intersección ('interseccion') de las fases como tuplas (inicios, finales).
+
+    Raises:
+        ValueError: Si el comparador no es válido o falta el valor de alguno de los límites.
+    """
+    violaciones = VIOLACIONES_LIMITES if violaciones is None else violaciones
+
+    intervalos_Violacion: dict = {}
+
+    for nombre, violacion in violaciones.items():
+        if violacion['comparador'] not in COMPARADORES_CUMPLIMIENTO:
+            raise ValueError(f"El comparador '{violacion['comparador']}' de '{nombre}' no es válido.")
+
+        faltantes = [limite for limite in violacion['limites'] if limite not in limites]
+
+        if faltantes:
+            raise ValueError(f"Faltan los límites {faltantes} de '{nombre}'.")
+
+        valores = tablas[violacion['tabla']][list(violacion['columnas'].values())].to_numpy(dtype=np.float64).T
+        mascaras = COMPARADORES_CUMPLIMIENTO[violacion['comparador']](valores, [limites[limite] for limite in violacion['limites']])
+
+        filas, inicios, finales = calcular_Intervalos(mascaras)
+
+        intervalos_Fases = [(inicios[filas == fila], finales[filas == fila]) for fila in range(len(violacion['columnas']))]
+
+        intervalos_Violacion[nombre] = {
+            'fases': list(violacion['columnas']),
+            'registros_Totales': valores.shape[1],
+            'fila': filas.astype(np.int8),
+            'inicios': inicios.astype(np.int32),
+            'finales': finales.astype(np.int32),
+            'union': combinar_Intervalos(intervalos_Fases, 1),
+            'interseccion': combinar_Intervalos(intervalos_Fases, len(intervalos_Fases))
+        }
+
+    return intervalos_Violacion
+
+def crear_Tabla_Minutos_Violacion(intervalos_Violacion: dict, intervalo_Registro: float = 1.0, violaciones: dict = None) -> pd.DataFrame:
+    """
+    Arma la tabla de tiempo fuera de límite del informe a partir de los intervalos ya calculados (sin volver a revisar
+    las series): una fila por medida y fase, más las filas de cualquier fase y de todas las fases.
+
+    Args:
+        intervalos_Violacion (dict): Resultado de 'calcular_Violaciones_Limites'.
+        intervalo_Registro (float): Intervalo de registro de la medición, en minutos.
+        violaciones (dict): Medidas revisadas (por defecto, 'VIOLACIONES_LIMITES').
+
+    Returns:
+        pd.DataFrame: Tabla con las columnas 'Medida', 'Fase', 'Intervalos', 'Registros', 'Minutos' y '% del Tiempo'.
+    """
+    violaciones = VIOLACIONES_LIMITES if violaciones is None else violaciones
+
+    filas_Tabla: list = []
+
+    for nombre, intervalos in intervalos_Violacion.items():
+        duraciones = intervalos['finales'].astype(np.int64) - intervalos['inicios']
+
+        conjuntos = [
+            (fase, np.count_nonzero(intervalos['fila'] == fila), duraciones[intervalos['fila'] == fila].sum())
+            for fila, fase in enumerate(intervalos['fases'])
+        ]
+
+        # Con una sola columna la unión y la intersección son la misma serie
+        if len(intervalos['fases']) > 1:
+            conjuntos += [
+                (titulo_Conjunto, len(intervalos[conjunto][0]), (intervalos[conjunto][1] - intervalos[conjunto][0]).sum())
+                for titulo_Conjunto, conjunto in (("Cualquier fase", 'union'), ("Todas las fases", 'interseccion'))
+            ]
+
+        for fase, cantidad_Intervalos, registros in conjuntos:
+            filas_Tabla.append({
+                'Medida': violaciones[nombre]['titulo'],
+                'Fase': fase,
+                'Intervalos': int(cantidad_Intervalos),
+                'Registros': int(registros),
+                'Minutos': round(float(registros) * intervalo_Registro, 2),
+                '% del Tiempo': round(100 * float(registros) / intervalos['registros_Totales'], 2) if intervalos['registros_Totales'] else 0.0
+            })
+
+    return pd.DataFrame(filas_Tabla, columns=['Medida', 'Fase', 'Intervalos', 'Registros', 'Minutos', '% del Tiempo'])
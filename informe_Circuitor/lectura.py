@@ -0,0 +1,125 @@
+import logging
+import pandas as pd
+from .dispersas import extraer_Series_Dispersas
+
+logger = logging.getLogger(__name__)
+
+def organizar_DataFrame_M_a_M(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso limpiar los datos y agregar 0 a los valores vacíos.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameMinutoaMinuto = dataFrame.copy()
+
+    dataFrameMinutoaMinuto['Fecha/hora'] = dataFrameMinutoaMinuto['Fecha/hora'].astype(str)
+
+    columnas_numericas = dataFrameMinutoaMinuto.select_dtypes(include=['number']).columns.tolist()
+
+    dataFrameMinutoaMinuto[columnas_numericas] = dataFrameMinutoaMinuto[columnas_numericas].astype(float)
+
+    columnas_categoricas = dataFrameMinutoaMinuto.select_dtypes(include=['object', 'datetime']).columns.tolist()
+
+    fill_values = {}
+
+    # Iterar sobre las columnas del DataFrame
+    for columna in dataFrameMinutoaMinuto.columns:
+        if dataFrameMinutoaMinuto[columna].dtype in ['int', 'float']:
+            # Si la columna es numérica, agregar el promedio
+            fill_values[columna] = dataFrameMinutoaMinuto[columna].mean()
+        elif dataFrameMinutoaMinuto[columna].dtype in ['object', 'datetime']:
+            # Si la columna es categórica, agregar ""
+            fill_values[columna] = ""
+        else:
+
+            break
+
+    # Llenar los valores faltantes con el diccionario generado
+    dataFrameMinutoaMinuto.fillna(fill_values, inplace=True)
+
+    # Los valores que siguen vacíos (columnas sin ningún valor) se reemplazan por 0
+    dataFrameMinutoaMinutoFinal = dataFrameMinutoaMinuto.fillna(0)
+
+    logger.debug("DataFrame de Minuto a Minuto organizado: %d filas, %d columnas", *dataFrameMinutoaMinutoFinal.shape)
+
+    return dataFrameMinutoaMinutoFinal
+
+def organizar_DataFrame_H_a_H(dataFrame: pd.DataFrame):
+
+    """
+    Procesa un DataFrame y devuelve un nuevo DataFrame con modificaciones específicas, en este caso limpiar los datos y agregar 0 a los valores vacíos.
+
+    Args:
+        dataFrame (pd.DataFrame): El DataFrame de entrada que se desea procesar.
+
+    Returns:
+        pd.DataFrame: Un nuevo DataFrame con las modificaciones aplicadas.
+    """
+    dataFrameHoraaHora = dataFrame.copy()
+
+    dataFrameHoraaHora['Fecha/hora'] = dataFrameHoraaHora['Fecha/hora'].astype(str)
+
+    columnas_numericas = dataFrameHoraaHora.select_dtypes(include=['number']).columns.tolist()
+
+    dataFrameHoraaHora[columnas_numericas] = dataFrameHoraaHora[columnas_numericas].astype(float)
+
+    columnas_categoricas = dataFrameHoraaHora.select_dtypes(include=['object', 'datetime']).columns.tolist()
+
+    fill_values = {}
+
+    # Iterar sobre las columnas del DataFrame
+    for columna in dataFrameHoraaHora.columns:
+        if dataFrameHoraaHora[columna].dtype in ['int', 'float']:
+            # Si la columna es numérica, agregar el promedio
+            fill_values[columna] = dataFrameHoraaHora[columna].mean()
+        elif dataFrameHoraaHora[columna].dtype in ['object', 'datetime']:
+            # Si la columna es categórica, agregar ""
+            fill_values[columna] = ""
+        else:
+
+            break
+
+    # Llenar los valores faltantes con el diccionario generado
+    dataFrameHoraaHora.fillna(fill_values, inplace=True)
+
+    # Los valores que siguen vacíos (columnas sin ningún valor) se reemplazan por 0
+    dataFrameHoraaHoraFinal = dataFrameHoraaHora.fillna(0)
+
+    logger.debug("DataFrame de Hora a Hora organizado: %d filas, %d columnas", *dataFrameHoraaHoraFinal.shape)
+
+    return dataFrameHoraaHoraFinal
+
+def leer_Archivos_Circuitor(archivo_Minuto, archivo_Hora) -> tuple:
+    """
+    Lee y organiza el par de archivos .TXT del Circuitor (Minuto a Minuto y Hora a Hora).
+
+    Args:
+        archivo_Minuto (str | file-like): Archivo .TXT de Minuto a Minuto (ruta, archivo subido o BytesIO).
+        archivo_Hora (str | file-like): Archivo .TXT de Hora a Hora (ruta, archivo subido o BytesIO).
+
+    Returns:
+        tuple: DataFrame de Minuto a Minuto y DataFrame de Hora a Hora, ya organizados, y las series dispersas de baja
+        frecuencia del Minuto a Minuto (solo sus muestras válidas, extraídas antes de rellenar los vacíos).
+    """
+    #df = pd.read_parquet(archivo_Minuto)
+    df_Read = pd.read_csv(archivo_Minuto, delimiter=';', encoding="UTF-8-SIG", encoding_errors='ignore')
+    #st.dataframe(df_Read.head(5))
+
+    # Las columnas de baja frecuencia (Plt) se extraen antes de rellenar los vacíos, que las distorsionan
+    series_Dispersas = extraer_Series_Dispersas(df_Read)
+
+    df = organizar_DataFrame_M_a_M(df_Read)
+    #st.dataframe(df.head(5))
+
+    df_Energias_Read = pd.read_csv(archivo_Hora, delimiter=';', encoding="UTF-8-SIG", encoding_errors='ignore')
+    #st.dataframe(df_Energias_Read.head(5))
+
+    df_Energias = organizar_DataFrame_H_a_H(df_Energias_Read)
+    #st.dataframe(df_Energias.head(5))
+
+    return df, df_Energias, series_Dispersas
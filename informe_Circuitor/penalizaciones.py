@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+# Umbrales de energía reactiva por hora: título, columna de energía reactiva del archivo de Hora a Hora y porcentaje
+# de la energía activa de la misma hora que se admite sin penalización (el exceso sobre ese porcentaje se penaliza)
+UMBRALES_ENERGIA_REACTIVA: dict = {
+    'inductiva': {
+        'titulo': "Inductiva",
+        'columna': 'E.Inductiva T1',
+        'porcentaje': 50
+    },
+    'capacitiva': {
+        'titulo': "Capacitiva",
+        'columna': 'E.Capacitiva T1',
+        'porcentaje': 0
+    }
+}
+
+def evaluar_Energia_Reactiva(df_Energias: pd.DataFrame, umbrales: dict = None, columna_Activa: str = 'E.Activa T1') -> dict:
+    """
+    Evalúa hora a hora la energía reactiva contra los umbrales en una sola pasada vectorizada (exceso = reactiva menos
+    el porcentaje admitido de la activa, si es positivo) y acumula por día y por mes la energía activa, la reactiva, el
+    exceso y las horas con exceso. Los registros se ordenan una sola vez por día y cada acumulado es un 'np.add.reduceat'
+    sobre los bloques (los meses se reducen a partir de los días).
+
+    Args:
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora, organizado con 'organizar_DataFrame_H_a_H'.
+        umbrales (dict): Umbrales de energía reactiva (por defecto, 'UMBRALES_ENERGIA_REACTIVA').
+        columna_Activa (str): Columna de energía activa.
+
+    Returns:
+        dict: Acumulados por 'dia', 'mes' y 'total', cada uno con las fechas de inicio ('fechas', datetime64[D]) y una
+        matriz (grupos x columnas) en 'sumas', con las columnas de 'columnas': energía activa y, por umbral, energía
+        reactiva, exceso y horas con exceso.
+    """
+    umbrales = UMBRALES_ENERGIA_REACTIVA if umbrales is None else umbrales
+
+    fechas = pd.to_datetime(df_Energias['Fecha/hora'].astype(str), format='%d/%m/%y %H:%M:%S', errors='coerce')
+    registros_Validos = fechas.notna().to_numpy()
+
+    energia_Activa = np.nan_to_num(df_Energias[columna_Activa].to_numpy(dtype=np.float64)[registros_Validos], nan=0.0)
+    energias_Reactivas = np.nan_to_num(df_Energias[[umbral['columna'] for umbral in umbrales.values()]].to_numpy(dtype=np.float64)[registros_Validos], nan=0.0)
+
+    # Exceso de cada hora sobre el porcentaje admitido de la energía activa, para todos los umbrales a la vez
+    porcentajes = np.array([umbral['porcentaje'] for umbral in umbrales.values()], dtype=np.float64)
+    excesos = np.maximum(energias_Reactivas - energia_Activa[:, None] * porcentajes / 100, 0.0)
+
+    columnas = [columna_Activa] + [f"{nombre_Columna} {umbral['titulo']}" for nombre_Columna in ("Energía", "Exceso", "Horas Exceso") for umbral in umbrales.values()]
+    valores = np.column_stack([energia_Activa, energias_Reactivas, excesos, (excesos > 0).astype(np.float64)])
+
+    # Un solo ordenamiento por día; los meses se acumulan a partir de los bloques diarios
+    dias = fechas.to_numpy(dtype='datetime64[D]')[registros_Validos]
+    orden = np.argsort(dias, kind='stable')
+    dias_Ordenados = dias[orden]
+
+    if len(dias_Ordenados) == 0:
+        vacio = {'fechas': dias_Ordenados, 'sumas': np.zeros((0, len(columnas)))}
+        return {'dia': vacio, 'mes': vacio, 'total': {'fechas': dias_Ordenados, 'sumas': np.zeros((1, len(columnas)))}, 'columnas': columnas}
+
+    inicios_Dias = np.flatnonzero(np.r_[True, dias_Ordenados[1:] != dias_Ordenados[:-1]])
+    sumas_Dias = np.add.reduceat(valores[orden], inicios_Dias, axis=0)
+    fechas_Dias = dias_Ordenados[inicios_Dias]
+
+    meses_Dias = fechas_Dias.astype('datetime64[M]')
+    inicios_Meses = np.flatnonzero(np.r_[True, meses_Dias[1:] != meses_Dias[:-1]])
+
+    return {
+        'dia': {'fechas': fechas_Dias, 'sumas': sumas_Dias},
+        'mes': {'fechas': meses_Dias[inicios_Meses].astype('datetime64[D]'), 'sumas': np.add.reduceat(sumas_Dias, inicios_Meses, axis=0)},
+        'total': {'fechas': fechas_Dias[:1], 'sumas': sumas_Dias.sum(axis=0, keepdims=True)},
+        'columnas': columnas
+    }
+
+def crear_Tabla_Penalizacion_Reactiva(evaluacion: dict) -> pd.DataFrame:
+    """
+    Arma la tabla de penalización por energía reactiva del informe: una fila por día, una por mes y una con la medición
+    completa.
+
+    Args:
+        evaluacion (dict): Resultado de 'evaluar_Energia_Reactiva'.
+
+    Returns:
+        pd.DataFrame: Tabla con las columnas 'Periodo', 'Fecha' y los acumulados de 'evaluacion["columnas"]' (energías y
+        excesos en kWh / kVARh, horas con exceso como enteros).
+    """
+    formatos_Fechas: dict = {'dia': ("Día", '%d/%m/%Y'), 'mes': ("Mes", '%m/%Y'), 'total': ("Medición completa", None)}
+
+    tablas: list = []
+
+    for nivel, (titulo_Nivel, formato_Fecha) in formatos_Fechas.items():
+        acumulados = evaluacion[nivel]
+
+        df_Nivel = pd.DataFrame(acumulados['sumas'], columns=evaluacion['columnas'])
+        df_Nivel.insert(0, 'Fecha', pd.to_datetime(acumulados['fechas']).strftime(formato_Fecha) if formato_Fecha else '')
+        df_Nivel.insert(0, 'Periodo', titulo_Nivel)
+
+        tablas.append(df_Nivel)
+
+    df_Penalizacion = pd.concat(tablas, ignore_index=True)
+
+    for columna in evaluacion['columnas']:
+        df_Penalizacion[columna] = df_Penalizacion[columna].astype(np.int64) if columna.startswith("Horas Exceso") else df_Penalizacion[columna].round(3)
+
+    return df_Penalizacion
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+from .grupos import calcular_Estadisticas_Grupos
+
+# Columnas de demanda (potencias y corrientes) cuyos perfiles se calculan sobre los promedios del nivel de demanda de
+# la pirámide, y columnas de energía que se toman del archivo de Hora a Hora
+COLUMNAS_PERFILES_DEMANDA: list = ['P.Activa III', 'P.Aparente III', 'P.Inductiva III', 'P.Capacitiva III', 'Corriente L1', 'Corriente L2', 'Corriente L3']
+COLUMNAS_PERFILES_ENERGIA: list = ['E.Activa T1', 'E.Inductiva T1', 'E.Capacitiva T1']
+
+# Tipos de día (posición = clave 'tipo_Dia') y días de la semana (posición = clave 'dia_Semana', 0 = lunes)
+TIPOS_DIA: tuple = ("Laborable", "Fin de Semana")
+DIAS_SEMANA: tuple = ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo")
+
+# Perfiles ya calculados en el proceso, por huella de archivo (se descartan los más antiguos al superar el máximo)
+PERFILES_PROCESO: dict = {}
+MAXIMO_PERFILES_PROCESO: int = 8
+
+def calcular_Claves_Tiempo(fechas) -> dict:
+    """
+    Calcula las claves enteras de tiempo de cada registro, que se usan como etiquetas de grupo de los perfiles.
+
+    Args:
+        fechas (pd.Series | pd.DatetimeIndex | np.ndarray): Fecha y hora de los registros.
+
+    Returns:
+        dict: Arreglos 'hora' (0 a 23), 'dia_Semana' (0 = lunes a 6 = domingo) y 'tipo_Dia' (0 = laborable, 1 = fin de
+        semana), con -1 en los registros sin fecha.
+    """
+    minutos = pd.to_datetime(fechas).to_numpy(dtype='datetime64[m]')
+    registros_Validos = ~np.isnat(minutos)
+
+    dias = minutos.astype('datetime64[D]')
+
+    # El día 0 (1970-01-01) fue jueves
+    horas = (minutos - dias).astype(np.int64) // 60
+    dias_Semana = (dias.astype(np.int64) + 3) % 7
+
+    return {
+        'hora': np.where(registros_Validos, horas, -1),
+        'dia_Semana': np.where(registros_Validos, dias_Semana, -1),
+        'tipo_Dia': np.where(registros_Validos, (dias_Semana >= 5).astype(np.int64), -1)
+    }
+
+def calcular_Perfiles(valores: np.ndarray, claves: dict, percentil: float = 95) -> dict:
+    """
+    Calcula el perfil por hora del día (separado por tipo de día) y el perfil por día de la semana de todas las columnas
+    a la vez, con una reducción agrupada por perfil.
+
+    Args:
+        valores (np.ndarray): Matriz (registros x columnas) de valores.
+        claves (dict): Claves de tiempo de los registros, de 'calcular_Claves_Tiempo'.
+        percentil (float): Percentil que se calcula en cada grupo.
+
+    Returns:
+        dict: 'horario' con matrices (tipos de día x 24 horas x columnas) y 'semanal' con matrices (7 días x columnas),
+        por estadístico ('Media' y 'Percentil').
+    """
+    etiquetas_Horario = np.where(claves['hora'] >= 0, claves['tipo_Dia'] * 24 + claves['hora'], -1)
+
+    estadisticas_Horario = calcular_Estadisticas_Grupos(valores, etiquetas_Horario, len(TIPOS_DIA) * 24, percentil)
+    estadisticas_Semanal = calcular_Estadisticas_Grupos(valores, claves['dia_Semana'], len(DIAS_SEMANA), percentil)
+
+    return {
+        'horario': {estadistico: estadisticas_Horario[estadistico].reshape(len(TIPOS_DIA), 24, -1) for estadistico in ('Media', 'Percentil')},
+        'semanal': {estadistico: estadisticas_Semanal[estadistico] for estadistico in ('Media', 'Percentil')}
+    }
+
+def calcular_Perfiles_Carga(piramide: dict, df_Energias: pd.DataFrame, nivel: str = '15min', percentil: float = 95) -> dict:
+    """
+    Calcula los perfiles de carga típicos (promedio y percentil por hora del día, en días laborables y de fin de semana,
+    y por día de la semana) de las potencias, las corrientes y las energías.
+
+    Las potencias y las corrientes se toman de los promedios del nivel de demanda de la pirámide (sin volver a recorrer
+    los datos de Minuto a Minuto) y las energías del archivo de Hora a Hora; las claves de tiempo se calculan una sola
+    vez por fuente y todas las columnas se agrupan juntas.
+
+    Args:
+        piramide (dict): Pirámide de resoluciones del archivo de Minuto a Minuto.
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora, organizado con 'organizar_DataFrame_H_a_H'.
+        nivel (str): Nivel de la pirámide que define el intervalo de demanda.
+        percentil (float): Percentil que se calcula en cada hora y día.
+
+    Returns:
+        dict: Tablas 'df_Perfil_Horario' (una fila por hora) y 'df_Perfil_Semanal' (una fila por día de la semana), con
+        las columnas '<columna> (Prom)' y '<columna> (P<percentil>)' (en el perfil horario, por tipo de día).
+    """
+    datos_Nivel = piramide[nivel]
+
+    columnas_Demanda = [columna for columna in COLUMNAS_PERFILES_DEMANDA if (columna, 'mean') in datos_Nivel.columns]
+    columnas_Energia = [columna for columna in COLUMNAS_PERFILES_ENERGIA if columna in df_Energias.columns]
+
+    fuentes = [
+        (columnas_Demanda, datos_Nivel[[(columna, 'mean') for columna in columnas_Demanda]].to_numpy(dtype=np.float64), calcular_Claves_Tiempo(datos_Nivel.index)),
+        (columnas_Energia, df_Energias[columnas_Energia].to_numpy(dtype=np.float64), calcular_Claves_Tiempo(pd.to_datetime(df_Energias['Fecha/hora'].astype(str), format='%d/%m/%y %H:%M:%S', errors='coerce')))
+    ]
+
+    nombre_Percentil = f"P{percentil:g}"
+
+    df_Perfil_Horario = pd.DataFrame({'Hora': [f"{hora:02d}:00" for hora in range(24)]})
+    df_Perfil_Semanal = pd.DataFrame({'Día': list(DIAS_SEMANA)})
+
+    for columnas, valores, claves in fuentes:
+        if not columnas:
+            continue
+
+        perfiles = calcular_Perfiles(valores, claves, percentil)
+
+        for posicion, columna in enumerate(columnas):
+            for posicion_Tipo, tipo_Dia in enumerate(TIPOS_DIA):
+                df_Perfil_Horario[f"{columna} - {tipo_Dia} (Prom)"] = perfiles['horario']['Media'][posicion_Tipo, :, posicion].round(2)
+                df_Perfil_Horario[f"{columna} - {tipo_Dia} ({nombre_Percentil})"] = perfiles['horario']['Percentil'][posicion_Tipo, :, posicion].round(2)
+
+            df_Perfil_Semanal[f"{columna} (Prom)"] = perfiles['semanal']['Media'][:, posicion].round(2)
+            df_Perfil_Semanal[f"{columna} ({nombre_Percentil})"] = perfiles['semanal']['Percentil'][:, posicion].round(2)
+
+    return {'df_Perfil_Horario': df_Perfil_Horario, 'df_Perfil_Semanal': df_Perfil_Semanal}
+
+def obtener_Perfiles_Proceso(huella_Archivo: str, piramide: dict, df_Energias: pd.DataFrame, nivel: str = '15min') -> dict:
+    """
+    Devuelve los perfiles de carga de una medición, calculándolos solo la primera vez que se procesa esa medición en
+    el proceso (los perfiles no dependen de los parámetros del informe).
+
+    Args:
+        huella_Archivo (str): Huella de la medición; si es None, los perfiles se calculan sin guardarlos.
+        piramide (dict): Pirámide de resoluciones del archivo de Minuto a Minuto.
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora.
+        nivel (str): Nivel de la pirámide que define el intervalo de demanda.
+
+    Returns:
+        dict: Perfiles de carga (ver 'calcular_Perfiles_Carga').
+    """
+    if huella_Archivo is None:
+        return calcular_Perfiles_Carga(piramide, df_Energias, nivel)
+
+    perfiles = PERFILES_PROCESO.get((huella_Archivo, nivel))
+
+    if perfiles is None:
+        if len(PERFILES_PROCESO) >= MAXIMO_PERFILES_PROCESO:
+            PERFILES_PROCESO.pop(next(iter(PERFILES_PROCESO)))
+
+        perfiles = PERFILES_PROCESO[(huella_Archivo, nivel)] = calcular_Perfiles_Carga(piramide, df_Energias, nivel)
+
+    return perfiles
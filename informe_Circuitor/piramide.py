@@ -0,0 +1,179 @@
+import hashlib
+import numpy as np
+import pandas as pd
+
+# Niveles agregados de la pirámide de resoluciones: {nivel: minutos por intervalo}, del más fino al más grueso
+NIVELES_PIRAMIDE: dict = {'5min': 5, '15min': 15, '1h': 60, '1D': 1440}
+
+def construir_Piramide_Resolucion(dataFrame: pd.DataFrame, fecha_col: str, columnas: list, niveles: dict = None, formato_Fecha: str = None):
+    """
+    Construye una pirámide de resoluciones de los datos de minuto a minuto. El nivel '1min' contiene los datos originales
+    y cada nivel adicional contiene, por intervalo, el mínimo, el promedio y el máximo de cada columna.
+
+    Los datos originales se recorren una sola vez: el primer nivel se agrega con 'np.minimum.reduceat' / 'np.add.reduceat'
+    sobre los datos ordenados por fecha, y cada nivel siguiente se obtiene a partir del anterior (mínimo de mínimos,
+    máximo de máximos y suma / conteo para el promedio), sin volver a leer la serie completa.
+
+    Args:
+        dataFrame (pd.DataFrame): DataFrame con los datos de minuto a minuto.
+        fecha_col (str): Nombre de la columna de fechas.
+        columnas (list): Lista de columnas numéricas a incluir en la pirámide.
+        niveles (dict): Diccionario {nivel: minutos por intervalo}, del más fino al más grueso (por defecto, 'NIVELES_PIRAMIDE'). Cada nivel debe ser múltiplo del anterior.
+        formato_Fecha (str): Formato de la columna de fechas si viene como texto (por ejemplo '%d/%m/%y %H:%M:%S'), opcional.
+
+    Returns:
+        dict: Diccionario {nivel: DataFrame} indexado por fecha. Los niveles agregados tienen columnas (columna, 'min' | 'mean' | 'max').
+    """
+    niveles = NIVELES_PIRAMIDE if niveles is None else niveles
+
+    # Nivel base: datos originales ordenados e indexados por fecha
+    datos_Base = dataFrame[columnas].copy()
+    datos_Base.index = pd.to_datetime(dataFrame[fecha_col], format=formato_Fecha, errors='coerce').rename(fecha_col)
+    datos_Base = datos_Base[datos_Base.index.notna()].sort_index()
+
+    piramide: dict = {'1min': datos_Base}
+
+    if datos_Base.empty:
+        return piramide
+
+    valores = datos_Base.to_numpy(dtype=np.float64)
+    valores_Validos = ~np.isnan(valores)
+
+    # Acumuladores por intervalo; en el nivel base cada fila es su propio intervalo
+    claves_Minutos = datos_Base.index.to_numpy(dtype='datetime64[m]').astype(np.int64)
+    minimos = np.where(valores_Validos, valores, np.inf)
+    maximos = np.where(valores_Validos, valores, -np.inf)
+    sumas = np.where(valores_Validos, valores, 0.0)
+    conteos = valores_Validos.astype(np.int64)
+
+    columnas_Piramide = pd.MultiIndex.from_product([columnas, ['min', 'mean', 'max']])
+
+    for nivel, minutos_Nivel in niveles.items():
+        # Inicio de cada intervalo del nivel y posición donde cambia el intervalo (los datos están ordenados)
+        claves_Minutos = claves_Minutos // minutos_Nivel * minutos_Nivel
+        inicios_Intervalos = np.flatnonzero(np.r_[True, claves_Minutos[1:] != claves_Minutos[:-1]])
+
+        claves_Minutos = claves_Minutos[inicios_Intervalos]
+        minimos = np.minimum.reduceat(minimos, inicios_Intervalos, axis=0)
+        maximos = np.maximum.reduceat(maximos, inicios_Intervalos, axis=0)
+        sumas = np.add.reduceat(sumas, inicios_Intervalos, axis=0)
+        conteos = np.add.reduceat(conteos, inicios_Intervalos, axis=0)
+
+        # Los intervalos sin valores válidos quedan en NaN
+        sin_Datos = conteos == 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            promedios = sumas / conteos
+        estadisticas = np.stack([np.where(sin_Datos, np.nan, minimos), np.where(sin_Datos, np.nan, promedios), np.where(sin_Datos, np.nan, maximos)], axis=2)
+
+        piramide[nivel] = pd.DataFrame(
+            estadisticas.reshape(len(claves_Minutos), -1),
+            index=pd.DatetimeIndex(claves_Minutos.astype('datetime64[m]').astype('datetime64[ns]'), name=fecha_col),
+            columns=columnas_Piramide
+        )
+
+    return piramide
+
+def calcular_Huella_Archivo(archivo_Subido):
+    """
+    Calcula la huella (hash SHA-256) del contenido de un archivo subido, usada como clave de caché por archivo.
+
+    Args:
+        archivo_Subido: Archivo subido con 'st.file_uploader' (o cualquier objeto con el método 'getvalue').
+
+    Returns:
+        str: Huella hexadecimal del contenido del archivo.
+    """
+    return hashlib.sha256(archivo_Subido.getvalue()).hexdigest()
+
+def seleccionar_Nivel_Piramide(piramide: dict, fecha_Inicio, fecha_Fin, max_Puntos: int = 5000):
+    """
+    Selecciona el nivel más fino de la pirámide cuya cantidad de puntos dentro del rango no supera 'max_Puntos'.
+
+    Args:
+        piramide (dict): Pirámide creada con 'construir_Piramide_Resolucion'.
+        fecha_Inicio: Fecha inicial del rango visible.
+        fecha_Fin: Fecha final del rango visible.
+        max_Puntos (int): Cantidad máxima de puntos por traza.
+
+    Returns:
+        str: Nombre del nivel seleccionado (por ejemplo '1min', '5min', '15min', '1h' o '1D').
+    """
+    for nivel, datos_Nivel in piramide.items():
+        cantidad_Puntos = datos_Nivel.index.searchsorted(fecha_Fin, side='right') - datos_Nivel.index.searchsorted(fecha_Inicio, side='left')
+        if cantidad_Puntos <= max_Puntos:
+            return nivel
+
+    # Si ningún nivel cumple, se usa el más grueso
+    return nivel
+
+def obtener_Datos_Ventana_Piramide(piramide: dict, variables: list, fecha_Inicio, fecha_Fin, fecha_col: str = 'fecha_y_Hora', max_Puntos: int = 5000):
+    """
+    Obtiene los datos de las variables para el rango visible, re-muestreados al nivel adecuado de la pirámide.
+    En los niveles agregados se devuelve el promedio de cada intervalo en la columna de la variable y, además,
+    las columnas '<variable> (mín)' y '<variable> (máx)' para dibujar la banda de valores extremos.
+
+    Args:
+        piramide (dict): Pirámide creada con 'construir_Piramide_Resolucion'.
+        variables (list): Lista de columnas a obtener.
+        fecha_Inicio: Fecha inicial del rango visible.
+        fecha_Fin: Fecha final del rango visible.
+        fecha_col (str): Nombre de la columna de fechas en el DataFrame resultante.
+        max_Puntos (int): Cantidad máxima de puntos por traza.
+
+    Returns:
+        tuple: (pd.DataFrame con los datos del rango, str con el nivel utilizado)
+    """
+    nivel = seleccionar_Nivel_Piramide(piramide, fecha_Inicio, fecha_Fin, max_Puntos)
+
+    datos_Nivel = piramide[nivel].loc[fecha_Inicio:fecha_Fin]
+
+    if nivel == '1min':
+        datos_Ventana = datos_Nivel[variables].rename_axis(fecha_col).reset_index()
+    else:
+        datos_Ventana = pd.DataFrame({fecha_col: datos_Nivel.index})
+        for var in variables:
+            datos_Ventana[var] = datos_Nivel[(var, 'mean')].to_numpy()
+            datos_Ventana[f"{var} (mín)"] = datos_Nivel[(var, 'min')].to_numpy()
+            datos_Ventana[f"{var} (máx)"] = datos_Nivel[(var, 'max')].to_numpy()
+
+    return datos_Ventana, nivel
+
+def crear_Resumen_Diario_Piramide(piramide: dict, columnas: list):
+    """
+    Crea la tabla de resumen diario (mínimo, promedio y máximo por día) a partir del nivel '1D' de la pirámide.
+
+    Args:
+        piramide (dict): Pirámide creada con 'construir_Piramide_Resolucion'.
+        columnas (list): Lista de columnas a incluir en el resumen.
+
+    Returns:
+        pd.DataFrame: Un DataFrame con una fila por día y las columnas '<columna> (Mín)', '<columna> (Prom)' y '<columna> (Máx)'.
+    """
+    nombres_Estadisticas: dict = {'min': 'Mín', 'mean': 'Prom', 'max': 'Máx'}
+
+    datos_Diarios = piramide['1D'][columnas]
+
+    df_Resumen_Diario = pd.DataFrame({f"{columna} ({nombres_Estadisticas[estadistica]})": datos_Diarios[(columna, estadistica)].round(2) for columna, estadistica in datos_Diarios.columns})
+    df_Resumen_Diario.insert(0, 'Fecha', datos_Diarios.index.strftime('%d/%m/%Y'))
+
+    return df_Resumen_Diario.reset_index(drop=True)
+
+def calcular_Demanda_Maxima_Piramide(piramide: dict, columna: str = 'P.Activa III', nivel: str = '15min'):
+    """
+    Calcula la demanda máxima como el mayor promedio de la columna en los intervalos del nivel indicado de la pirámide
+    (por defecto, potencia activa promedio en intervalos de 15 minutos).
+
+    Args:
+        piramide (dict): Pirámide creada con 'construir_Piramide_Resolucion'.
+        columna (str): Columna de potencia sobre la que se calcula la demanda.
+        nivel (str): Nivel de la pirámide que define el intervalo de demanda.
+
+    Returns:
+        dict: Diccionario con el valor de la demanda máxima ('valor') y la fecha de inicio del intervalo ('fecha').
+    """
+    promedios_Intervalos = piramide[nivel][(columna, 'mean')].dropna()
+
+    if promedios_Intervalos.empty:
+        return {'valor': 0.0, 'fecha': None}
+
+    return {'valor': float(promedios_Intervalos.max()), 'fecha': promedios_Intervalos.idxmax()}
@@ -0,0 +1,229 @@
+import functools
+import hashlib
+import json
+import os
+import requests
+from io import BytesIO
+from docxtpl import DocxTemplate
+from jinja2 import Environment
+
+# Directorio de plantillas incluidas con la aplicación (opcional) y directorio de caché local de plantillas descargadas
+DIRECTORIO_PLANTILLAS_INCLUIDAS: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plantillas')
+DIRECTORIO_CACHE_PLANTILLAS: str = os.environ.get('CIRCUITOR_CACHE_PLANTILLAS', os.path.join(os.path.expanduser('~'), '.cache', 'circuitor', 'plantillas'))
+
+# Plantillas disponibles: enlace de descarga (fijado a un commit del repositorio) y nombre del archivo local
+PLANTILLAS_INFORME: dict = {
+    'Vatia': {
+        'url': "https://github.com/gigadatagit/GIGA_Data/blob/365a61d9e72f3e175c39d5fa6cb1c189e0c70ffa/vars_Template_ETV_Circuitor_VATIA.docx?raw=true",
+        'archivo': 'vars_Template_ETV_Circuitor_VATIA.docx'
+    },
+    'GIGA': {
+        'url': "https://github.com/gigadatagit/GIGA_Data/blob/365a61d9e72f3e175c39d5fa6cb1c189e0c70ffa/vars_Template_ETV_Circuitor.docx?raw=true",
+        'archivo': 'vars_Template_ETV_Circuitor.docx'
+    }
+}
+
+def leer_Metadatos_Plantilla(ruta_Metadatos: str) -> dict:
+    """
+    Lee los metadatos (url, etag y versión) guardados junto a una plantilla de la caché local.
+
+    Args:
+        ruta_Metadatos (str): Ruta del archivo JSON de metadatos.
+
+    Returns:
+        dict: Metadatos de la plantilla, o un diccionario vacío si no existen o no se pueden leer.
+    """
+    try:
+        with open(ruta_Metadatos, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return {}
+
+def guardar_Plantilla_Cache(nombre_Archivo: str, contenido: bytes, metadatos: dict):
+    """
+    Guarda una plantilla descargada y sus metadatos en la caché local. La escritura se hace sobre un archivo temporal
+    que luego se reemplaza, para no dejar plantillas incompletas si el proceso se interrumpe.
+
+    Args:
+        nombre_Archivo (str): Nombre del archivo .docx de la plantilla.
+        contenido (bytes): Contenido de la plantilla.
+        metadatos (dict): Metadatos de la plantilla (url, etag y versión).
+    """
+    try:
+        os.makedirs(DIRECTORIO_CACHE_PLANTILLAS, exist_ok=True)
+
+        ruta_Plantilla = os.path.join(DIRECTORIO_CACHE_PLANTILLAS, nombre_Archivo)
+
+        with open(ruta_Plantilla + '.tmp', 'wb') as archivo:
+            archivo.write(contenido)
+        os.replace(ruta_Plantilla + '.tmp', ruta_Plantilla)
+
+        with open(ruta_Plantilla + '.json', 'w', encoding='utf-8') as archivo:
+            json.dump(metadatos, archivo)
+    except OSError:
+        # Si el disco no permite escribir, la plantilla se sigue usando desde la memoria
+        pass
+
+def cargar_Plantilla_Repositorio(nombre_Plantilla: str, timeout: float = 10, revalidar: bool = False) -> dict:
+    """
+    Obtiene el contenido de una plantilla de Word buscándola, en orden, en:
+    1. El directorio de plantillas incluidas con la aplicación ('plantillas/').
+    2. La caché local de plantillas descargadas (si no se pide revalidar).
+    3. El repositorio remoto (GitHub), con tiempo de espera y petición condicional por 'ETag'. La copia descargada se
+       guarda en la caché local. Si no hay conexión, se usa la copia de la caché local si existe.
+
+    Args:
+        nombre_Plantilla (str): Nombre de la plantilla ('Vatia' o 'GIGA').
+        timeout (float): Tiempo máximo de espera de la descarga, en segundos.
+        revalidar (bool): Si es True, se consulta el repositorio remoto aunque exista una copia en la caché local.
+
+    Returns:
+        dict: Diccionario con el contenido de la plantilla ('contenido'), su versión ('version') y su origen ('origen').
+
+    Raises:
+        ValueError: Si el nombre de la plantilla no existe.
+        RuntimeError: Si la plantilla no está disponible ni localmente ni en el repositorio remoto.
+    """
+    if nombre_Plantilla not in PLANTILLAS_INFORME:
+        raise ValueError(f"La plantilla '{nombre_Plantilla}' no es válida. Opciones: {', '.join(PLANTILLAS_INFORME)}.")
+
+    info_Plantilla = PLANTILLAS_INFORME[nombre_Plantilla]
+
+    # 1. Plantilla incluida con la aplicación
+    ruta_Incluida = os.path.join(DIRECTORIO_PLANTILLAS_INCLUIDAS, info_Plantilla['archivo'])
+
+    if os.path.isfile(ruta_Incluida):
+        with open(ruta_Incluida, 'rb') as archivo:
+            contenido = archivo.read()
+        return {'contenido': contenido, 'version': hashlib.sha256(contenido).hexdigest()[:16], 'origen': 'incluida'}
+
+    # 2. Copia de la caché local (válida mientras el enlace de descarga no cambie)
+    ruta_Cache = os.path.join(DIRECTORIO_CACHE_PLANTILLAS, info_Plantilla['archivo'])
+    metadatos_Cache = leer_Metadatos_Plantilla(ruta_Cache + '.json')
+    contenido_Cache = None
+
+    if os.path.isfile(ruta_Cache) and metadatos_Cache.get('url') == info_Plantilla['url']:
+        with open(ruta_Cache, 'rb') as archivo:
+            contenido_Cache = archivo.read()
+
+        if not revalidar:
+            return {'contenido': contenido_Cache, 'version': metadatos_Cache.get('version'), 'origen': 'cache'}
+
+    # 3. Descarga desde el repositorio remoto (condicional si ya hay una copia local con 'ETag')
+    encabezados = {}
+    if contenido_Cache is not None and metadatos_Cache.get('etag'):
+        encabezados['If-None-Match'] = metadatos_Cache['etag']
+
+    try:
+        response = requests.get(info_Plantilla['url'], headers=encabezados, timeout=timeout)
+
+        if response.status_code == 304 and contenido_Cache is not None:
+            return {'contenido': contenido_Cache, 'version': metadatos_Cache.get('version'), 'origen': 'cache'}
+
+        response.raise_for_status()
+    except requests.RequestException as error:
+        if contenido_Cache is not None:
+            return {'contenido': contenido_Cache, 'version': metadatos_Cache.get('version'), 'origen': 'cache'}
+
+        raise RuntimeError(f"No fue posible obtener la plantilla '{nombre_Plantilla}': {error}") from error
+
+    contenido = response.content
+    metadatos = {
+        'url': info_Plantilla['url'],
+        'etag': response.headers.get('ETag'),
+        'version': hashlib.sha256(contenido).hexdigest()[:16]
+    }
+
+    guardar_Plantilla_Cache(info_Plantilla['archivo'], contenido, metadatos)
+
+    return {'contenido': contenido, 'version': metadatos['version'], 'origen': 'remota'}
+
+class EntornoJinjaCompilado(Environment):
+    """
+    Entorno de Jinja que conserva las plantillas compiladas por texto fuente. 'DocxTemplate.render' llama a
+    'jinja_env.from_string' con el XML de cada parte del documento (cuerpo, encabezados, pies de página y propiedades);
+    como ese XML es el mismo en cada informe de una misma plantilla, la compilación se hace solo la primera vez.
+    """
+
+    def __init__(self, *args, max_Plantillas: int = 64, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_Plantillas = max_Plantillas
+        self.plantillas_Compiladas = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals=globals, template_class=template_class)
+
+        plantilla = self.plantillas_Compiladas.get(source)
+
+        if plantilla is None:
+            plantilla = super().from_string(source)
+
+            # Descartar la plantilla compilada más antigua si se supera el límite
+            if len(self.plantillas_Compiladas) >= self.max_Plantillas:
+                self.plantillas_Compiladas.pop(next(iter(self.plantillas_Compiladas)), None)
+
+            self.plantillas_Compiladas[source] = plantilla
+
+        return plantilla
+
+class DocxTemplateCompilada(DocxTemplate):
+    """
+    Variante de 'DocxTemplate' que comparte entre informes el XML ya ajustado ('patch_xml') y las plantillas de Jinja
+    compiladas de una misma plantilla de Word. Cada instancia abre su propia copia del documento, por lo que se puede
+    renderizar y guardar sin afectar a las demás.
+    """
+
+    def __init__(self, template_file, entorno_Jinja: EntornoJinjaCompilado, xml_Ajustado: dict):
+        super().__init__(template_file)
+        self.entorno_Jinja = entorno_Jinja
+        self.xml_Ajustado = xml_Ajustado
+
+    def patch_xml(self, src_xml):
+        xml_Ajustado = self.xml_Ajustado.get(src_xml)
+
+        if xml_Ajustado is None:
+            xml_Ajustado = self.xml_Ajustado[src_xml] = super().patch_xml(src_xml)
+
+        return xml_Ajustado
+
+    def render(self, context, jinja_env=None, autoescape: bool = False):
+        super().render(context, jinja_env=jinja_env or self.entorno_Jinja, autoescape=autoescape)
+
+@functools.lru_cache(maxsize=None)
+def obtener_Plantilla_Memoria(nombre_Plantilla: str) -> dict:
+    """
+    Mantiene en memoria (compartida por todo el proceso y sus sesiones) el contenido y la versión de cada plantilla, de modo que solo la
+    primera solicitud del proceso consulta el disco o la red. Junto a cada plantilla se guardan su entorno de Jinja con
+    las plantillas compiladas y el XML ya ajustado, que se llenan en el primer informe generado. Para forzar una nueva
+    consulta se usa 'obtener_Plantilla_Memoria.cache_clear()'.
+
+    Args:
+        nombre_Plantilla (str): Nombre de la plantilla ('Vatia' o 'GIGA').
+
+    Returns:
+        dict: Diccionario con el contenido ('contenido'), la versión ('version'), el origen ('origen'), el entorno de
+        Jinja compilado ('entorno_Jinja') y el XML ajustado ('xml_Ajustado') de la plantilla.
+    """
+    plantilla = cargar_Plantilla_Repositorio(nombre_Plantilla)
+
+    plantilla['entorno_Jinja'] = EntornoJinjaCompilado()
+    plantilla['xml_Ajustado'] = {}
+
+    return plantilla
+
+def obtener_Plantilla_Informe(nombre_Plantilla: str) -> DocxTemplateCompilada:
+    """
+    Devuelve una copia nueva de la plantilla indicada, lista para renderizar, a partir de la copia en memoria del
+    repositorio de plantillas. La copia reutiliza el XML ajustado y las plantillas de Jinja ya compiladas, de modo que
+    'doc.render(context)' no vuelve a procesar la plantilla en cada informe.
+
+    Args:
+        nombre_Plantilla (str): Nombre de la plantilla ('Vatia' o 'GIGA').
+
+    Returns:
+        DocxTemplateCompilada: Plantilla del documento de Word.
+    """
+    plantilla = obtener_Plantilla_Memoria(nombre_Plantilla)
+
+    return DocxTemplateCompilada(BytesIO(plantilla['contenido']), plantilla['entorno_Jinja'], plantilla['xml_Ajustado'])
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from .perfiles import calcular_Claves_Tiempo
+
+# Periodos tarifarios: título y horas (0 a 23) que cubre cada periodo en días laborables (lunes a viernes) y de fin de
+# semana. Cada hora de cada tipo de día debe pertenecer a un solo periodo
+PERIODOS_TARIFARIOS: dict = {
+    'punta': {
+        'titulo': "Punta",
+        'laborable': list(range(18, 21)),
+        'fin_Semana': []
+    },
+    'intermedio': {
+        'titulo': "Intermedio",
+        'laborable': list(range(6, 18)) + [21, 22],
+        'fin_Semana': list(range(18, 21))
+    },
+    'base': {
+        'titulo': "Base",
+        'laborable': list(range(0, 6)) + [23],
+        'fin_Semana': list(range(0, 18)) + list(range(21, 24))
+    }
+}
+
+# Columnas de energía del archivo de Hora a Hora que se agregan por periodo: (activa, inductiva, capacitiva)
+COLUMNAS_ENERGIAS_PERIODOS: list = ['E.Activa T1', 'E.Inductiva T1', 'E.Capacitiva T1']
+
+def crear_Tabla_Periodos(periodos: dict = None) -> np.ndarray:
+    """
+    Crea la tabla de búsqueda de los periodos tarifarios: el periodo de cada hora de cada día de la semana, para asignar
+    el periodo de todos los registros con una sola indexación.
+
+    Args:
+        periodos (dict): Periodos tarifarios (por defecto, 'PERIODOS_TARIFARIOS').
+
+    Returns:
+        np.ndarray: Matriz (7 días x 24 horas) con la posición del periodo en 'periodos' (0 = lunes).
+
+    Raises:
+        ValueError: Si una hora pertenece a más de un periodo o no pertenece a ninguno.
+    """
+    periodos = PERIODOS_TARIFARIOS if periodos is None else periodos
+
+    tabla_Periodos = np.full((7, 24), -1, dtype=np.int8)
+
+    for posicion, (nombre, periodo) in enumerate(periodos.items()):
+        for tipo_Dia, dias in (('laborable', slice(0, 5)), ('fin_Semana', slice(5, 7))):
+            horas = np.asarray(periodo[tipo_Dia], dtype=np.int64)
+            horas_Repetidas = horas[(tabla_Periodos[dias, horas] != -1).any(axis=0)]
+
+            if len(horas_Repetidas):
+                raise ValueError(f"Las horas {sorted(set(horas_Repetidas.tolist()))} del periodo '{nombre}' ({tipo_Dia}) ya pertenecen a otro periodo.")
+
+            tabla_Periodos[dias, horas] = posicion
+
+    if (tabla_Periodos == -1).any():
+        raise ValueError(f"Las horas {sorted(set(np.nonzero(tabla_Periodos == -1)[1].tolist()))} no pertenecen a ningún periodo tarifario.")
+
+    return tabla_Periodos
+
+def agregar_Energias_Periodos(df_Energias: pd.DataFrame, periodos: dict = None, columnas: list = None) -> dict:
+    """
+    Agrega las energías del archivo de Hora a Hora por mes y periodo tarifario. El periodo de cada registro se toma de
+    la tabla de búsqueda con sus claves de hora y día de la semana, los registros se ordenan una sola vez por la clave
+    (mes, periodo) y las energías de cada bloque se suman con 'np.add.reduceat'.
+
+    Args:
+        df_Energias (pd.DataFrame): DataFrame de Hora a Hora, organizado con 'organizar_DataFrame_H_a_H'.
+        periodos (dict): Periodos tarifarios (por defecto, 'PERIODOS_TARIFARIOS').
+        columnas (list): Columnas de energía activa, inductiva y capacitiva (por defecto, 'COLUMNAS_ENERGIAS_PERIODOS').
+
+    Returns:
+        dict: Por grupo (mes y periodo, ordenados): 'mes' (año * 12 + mes - 1), 'periodo' (posición en 'periodos'),
+        'horas' (cantidad de registros) y 'energias' (matriz grupos x columnas), además de 'columnas' y 'titulos' (títulos
+        de los periodos).
+    """
+    periodos = PERIODOS_TARIFARIOS if periodos is None else periodos
+    columnas = COLUMNAS_ENERGIAS_PERIODOS if columnas is None else columnas
+
+    tabla_Periodos = crear_Tabla_Periodos(periodos)
+
+    fechas = pd.to_datetime(df_Energias['Fecha/hora'].astype(str), format='%d/%m/%y %H:%M:%S', errors='coerce')
+    claves = calcular_Claves_Tiempo(fechas)
+    registros_Validos = claves['hora'] >= 0
+
+    # Periodo de cada registro (una indexación de la tabla) y clave de grupo = mes * cantidad de periodos + periodo
+    periodos_Registros = tabla_Periodos[claves['dia_Semana'][registros_Validos], claves['hora'][registros_Validos]].astype(np.int64)
+    meses_Registros = (fechas.dt.year * 12 + fechas.dt.month - 1).to_numpy()[registros_Validos].astype(np.int64)
+    claves_Grupos = meses_Registros * len(periodos) + periodos_Registros
+
+    orden = np.argsort(claves_Grupos, kind='stable')
+    claves_Ordenadas = claves_Grupos[orden]
+    valores_Ordenados = np.nan_to_num(df_Energias[columnas].to_numpy(dtype=np.float64)[registros_Validos][orden], nan=0.0)
+
+    inicios_Grupos = np.flatnonzero(np.r_[True, claves_Ordenadas[1:] != claves_Ordenadas[:-1]]) if len(claves_Ordenadas) else np.zeros(0, dtype=np.int64)
+
+    return {
+        'mes': claves_Ordenadas[inicios_Grupos] // len(periodos),
+        'periodo': claves_Ordenadas[inicios_Grupos] % len(periodos),
+        'horas': np.diff(np.r_[inicios_Grupos, len(claves_Ordenadas)]),
+        'energias': np.add.reduceat(valores_Ordenados, inicios_Grupos, axis=0) if len(inicios_Grupos) else np.zeros((0, len(columnas))),
+        'columnas': list(columnas),
+        'titulos': [periodo['titulo'] for periodo in periodos.values()]
+    }
+
+def crear_Tabla_Energias_Periodos(energias_Periodos: dict) -> pd.DataFrame:
+    """
+    Arma la tabla de energías por periodo tarifario del informe (resumen tipo factura): por cada mes, una fila por
+    periodo y una fila con el total del mes, y al final los totales de la medición completa por periodo. Los totales
+    se obtienen de las sumas por grupo (sin volver a recorrer los registros) y los porcentajes de energía reactiva se
+    calculan como en la tabla de energías ('KARH_IND' y 'KVARH_CAP').
+
+    Args:
+        energias_Periodos (dict): Resultado de 'agregar_Energias_Periodos'.
+
+    Returns:
+        pd.DataFrame: Tabla con las columnas 'Mes', 'Periodo', 'Horas', las columnas de energía, 'KARH_IND' y 'KVARH_CAP'.
+    """
+    meses = energias_Periodos['mes']
+    energias = energias_Periodos['energias']
+    titulos = energias_Periodos['titulos']
+
+    periodos_Grupos = energias_Periodos['periodo']
+    horas = energias_Periodos['horas']
+
+    # Los grupos están ordenados por mes: los totales del mes son una segunda reducción sobre los bloques de cada mes
+    inicios_Meses = np.flatnonzero(np.r_[True, meses[1:] != meses[:-1]]) if len(meses) else np.zeros(0, dtype=np.int64)
+
+    horas_Meses = np.add.reduceat(horas, inicios_Meses) if len(meses) else np.zeros(0, dtype=np.int64)
+    energias_Meses = np.add.reduceat(energias, inicios_Meses, axis=0) if len(meses) else energias
+
+    # Totales de la medición completa por periodo (suma de los grupos de cada periodo)
+    horas_Periodos = np.bincount(periodos_Grupos, weights=horas, minlength=len(titulos))
+    energias_Totales_Periodos = np.zeros((len(titulos), energias.shape[1]))
+    np.add.at(energias_Totales_Periodos, periodos_Grupos, energias)
+
+    # Bloques de filas (mes, periodo, horas, energías); el periodo 'len(titulos)' es el total y el mes -1 la medición completa
+    bloques = [
+        (meses, periodos_Grupos, horas, energias),
+        (meses[inicios_Meses], np.full(len(inicios_Meses), len(titulos)), horas_Meses, energias_Meses),
+        (np.full(len(titulos), -1), np.arange(len(titulos)), horas_Periodos, energias_Totales_Periodos),
+        (np.array([-1]), np.array([len(titulos)]), np.array([horas.sum()]), energias.sum(axis=0, keepdims=True))
+    ]
+
+    meses_Filas, periodos_Filas, horas_Filas, energias_Filas = (np.concatenate(partes) for partes in zip(*bloques))
+
+    # Orden de las filas: meses en orden (la medición completa al final) y, en cada mes, los periodos y luego el total
+    orden = np.lexsort((periodos_Filas, np.where(meses_Filas < 0, np.iinfo(np.int64).max, meses_Filas)))
+
+    meses_Filas, periodos_Filas, horas_Filas, energias_Filas = meses_Filas[orden], periodos_Filas[orden], horas_Filas[orden], energias_Filas[orden]
+
+    df_Energias_Periodos = pd.DataFrame({
+        'Mes': ["Medición completa" if mes < 0 else f"{mes % 12 + 1:02d}/{mes // 12}" for mes in meses_Filas],
+        'Periodo': [titulos[periodo] if periodo < len(titulos) else "Total" for periodo in periodos_Filas],
+        'Horas': horas_Filas.astype(np.int64)
+    })
+
+    for posicion, columna in enumerate(energias_Periodos['columnas']):
+        df_Energias_Periodos[columna] = energias_Filas[:, posicion].round(3)
+
+    # Porcentajes de energía inductiva y capacitiva sobre la activa (0 si no hay energía activa)
+    energia_Activa = energias_Filas[:, 0]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        df_Energias_Periodos['KARH_IND'] = np.where(energia_Activa != 0, energias_Filas[:, 1] / energia_Activa * 100, 0).round(3)
+        df_Energias_Periodos['KVARH_CAP'] = np.where(energia_Activa != 0, energias_Filas[:, 2] / energia_Activa * 100, 0).round(3)
+
+    return df_Energias_Periodos
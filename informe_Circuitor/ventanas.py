@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+from .grupos import codificar_Grupos, calcular_Estadisticas_Grupos
+
+# Ventanas de evaluación del cumplimiento: nombre -> (título en el informe, días de la ventana). Las semanas empiezan
+# el lunes, como en la evaluación semanal de la norma EN 50160
+FRECUENCIAS_VENTANAS: dict = {
+    'dia': ("Día", 1),
+    'semana': ("Semana", 7)
+}
+
+# Estadísticos que se calculan en cada ventana (los mismos de las tablas de medidas del informe)
+ESTADISTICOS_VENTANAS: list = ['Percentil', 'Media', 'Min', 'Max']
+
+def asignar_Ventanas(dias: np.ndarray, frecuencia: str) -> np.ndarray:
+    """
+    Asigna a cada día el día de inicio de su ventana.
+
+    Args:
+        dias (np.ndarray): Días de los registros (datetime64[D]).
+        frecuencia (str): Llave de 'FRECUENCIAS_VENTANAS'.
+
+    Returns:
+        np.ndarray: Día de inicio de la ventana de cada registro (datetime64[D]).
+
+    Raises:
+        ValueError: Si la frecuencia no es válida.
+    """
+    if frecuencia not in FRECUENCIAS_VENTANAS:
+        raise ValueError(f"La ventana '{frecuencia}' no es válida. Use: {', '.join(FRECUENCIAS_VENTANAS)}.")
+
+    if frecuencia == 'semana':
+        # El día 0 (1970-01-01) fue jueves: se restan los días transcurridos desde el lunes anterior
+        return dias - ((dias.astype(np.int64) + 3) % 7).astype('timedelta64[D]')
+
+    return dias
+
+def calcular_Estadisticas_Ventanas(valores: np.ndarray, fechas, frecuencias: list = ('dia', 'semana'), percentil: float = 95) -> dict:
+    """
+    Calcula el percentil, la media, el mínimo y el máximo de cada columna en cada ventana de tiempo.
+
+    Cada registro se etiqueta con su ventana y todas las columnas se resumen juntas con 'calcular_Estadisticas_Grupos'
+    (un ordenamiento por frecuencia y reducciones por bloque de ventana).
+
+    Args:
+        valores (np.ndarray): Matriz (registros x columnas) de valores.
+        fechas (pd.Series | np.ndarray): Fecha y hora de cada registro (los registros sin fecha no se tienen en cuenta).
+        frecuencias (list): Frecuencias de las ventanas (llaves de 'FRECUENCIAS_VENTANAS').
+        percentil (float): Percentil que se calcula en cada ventana.
+
+    Returns:
+        dict: Por frecuencia, un diccionario con el día de inicio de cada ventana ('inicios'), la cantidad de registros
+        ('registros') y una matriz (ventanas x columnas) por estadístico de 'ESTADISTICOS_VENTANAS'.
+    """
+    dias = pd.to_datetime(fechas).to_numpy(dtype='datetime64[D]')
+    registros_Validos = ~np.isnat(dias)
+
+    valores_Validos = np.asarray(valores, dtype=np.float64)[registros_Validos]
+
+    estadisticas_Ventanas: dict = {}
+
+    for frecuencia in frecuencias:
+        inicios_Ventanas, etiquetas = codificar_Grupos(asignar_Ventanas(dias[registros_Validos], frecuencia))
+        estadisticas = calcular_Estadisticas_Grupos(valores_Validos, etiquetas, len(inicios_Ventanas), percentil)
+
+        estadisticas_Ventanas[frecuencia] = {
+            'inicios': inicios_Ventanas,
+            'registros': np.bincount(etiquetas, minlength=len(inicios_Ventanas)),
+            **{estadistico: estadisticas[estadistico] for estadistico in ESTADISTICOS_VENTANAS}
+        }
+
+    return estadisticas_Ventanas
+
+def crear_Matriz_Resumen_Ventanas(tablas_Registros: dict, fechas: pd.Series, frecuencias: list = ('dia', 'semana'), percentil: float = 95) -> tuple:
+    """
+    Crea la matriz de resumen por ventanas (una fila por día y por semana), con las mismas columnas (tabla, columna,
+    estadístico) que 'crear_Matriz_Resumen', para evaluarla con 'evaluar_Reglas_Cumplimiento'. Todas las columnas de
+    todas las tablas se calculan juntas, en una sola pasada. Como en las tablas de medidas del informe, los valores
+    vacíos cuentan como 0.
+
+    Args:
+        tablas_Registros (dict): Llave de la tabla de medidas -> DataFrame de registros de Minuto a Minuto con las
+            columnas a resumir (por ejemplo {'df_Tabla_Calculos_Tension': df_Tabla_Tension[columnas]}).
+        fechas (pd.Series): Fecha y hora de los registros, con el mismo índice de las tablas.
+        frecuencias (list): Frecuencias de las ventanas (llaves de 'FRECUENCIAS_VENTANAS').
+        percentil (float): Percentil que se calcula en cada ventana.
+
+    Returns:
+        tuple: Matriz de resumen (pd.DataFrame con índice (ventana, inicio)) y cantidad de registros por ventana (pd.Series).
+    """
+    columnas_Tablas = [(llave, columna) for llave, tabla in tablas_Registros.items() for columna in tabla.columns]
+
+    valores = np.column_stack([
+        tabla.reindex(fechas.index).to_numpy(dtype=np.float64) for tabla in tablas_Registros.values()
+    ]) if columnas_Tablas else np.empty((len(fechas), 0))
+
+    estadisticas_Ventanas = calcular_Estadisticas_Ventanas(np.nan_to_num(valores, nan=0.0), fechas, frecuencias, percentil)
+
+    indice_Ventanas = pd.MultiIndex.from_tuples(
+        [(frecuencia, pd.Timestamp(inicio)) for frecuencia in frecuencias for inicio in estadisticas_Ventanas[frecuencia]['inicios']],
+        names=['ventana', 'inicio']
+    )
+
+    columnas_Matriz = pd.MultiIndex.from_tuples(
+        [(llave, columna, estadistico) for llave, columna in columnas_Tablas for estadistico in ESTADISTICOS_VENTANAS],
+        names=['tabla', 'columna', 'estadistico']
+    )
+
+    # (ventanas x columnas x estadísticos) -> (ventanas x (columna, estadístico)) en el orden de 'columnas_Matriz'
+    valores_Matriz = np.concatenate([
+        np.stack([estadisticas_Ventanas[frecuencia][estadistico] for estadistico in ESTADISTICOS_VENTANAS], axis=2).reshape(len(estadisticas_Ventanas[frecuencia]['inicios']), -1)
+        for frecuencia in frecuencias
+    ])
+
+    registros_Ventanas = pd.Series(np.concatenate([estadisticas_Ventanas[frecuencia]['registros'] for frecuencia in frecuencias]), index=indice_Ventanas, name='registros')
+
+    return pd.DataFrame(valores_Matriz, index=indice_Ventanas, columns=columnas_Matriz), registros_Ventanas
+
+def crear_Tabla_Cumplimiento_Ventanas(tabla_Cumplimiento_Ventanas: pd.DataFrame, registros_Ventanas: pd.Series, reglas: dict, tabla_Cumplimiento_Total: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Arma la tabla de cumplimiento por ventana que se muestra en el informe: una fila por ventana (y, opcionalmente, una
+    fila con la medición completa) y una columna por regla con "CUMPLE" o "NO CUMPLE".
+
+    Args:
+        tabla_Cumplimiento_Ventanas (pd.DataFrame): Resultado de 'evaluar_Reglas_Cumplimiento' sobre la matriz por ventanas.
+        registros_Ventanas (pd.Series): Cantidad de registros por ventana, de 'crear_Matriz_Resumen_Ventanas'.
+        reglas (dict): Reglas evaluadas (se usa el título de cada regla como nombre de la columna).
+        tabla_Cumplimiento_Total (pd.DataFrame): Resultado de 'evaluar_Reglas_Cumplimiento' para la medición completa, opcional.
+
+    Returns:
+        pd.DataFrame: Tabla con las columnas 'Ventana', 'Inicio', 'Fin', 'Registros' y una columna por regla.
+    """
+    inicios = registros_Ventanas.index.get_level_values('inicio')
+    dias_Ventanas = np.array([FRECUENCIAS_VENTANAS[frecuencia][1] for frecuencia in registros_Ventanas.index.get_level_values('ventana')], dtype=np.int64)
+
+    df_Cumplimiento_Ventanas = pd.DataFrame({
+        'Ventana': [FRECUENCIAS_VENTANAS[frecuencia][0] for frecuencia in registros_Ventanas.index.get_level_values('ventana')],
+        'Inicio': inicios.strftime('%d/%m/%Y'),
+        'Fin': (inicios + pd.to_timedelta(dias_Ventanas, unit='D') - pd.Timedelta(days=1)).strftime('%d/%m/%Y'),
+        'Registros': registros_Ventanas.to_numpy()
+    })
+
+    for nombre_Regla, regla in reglas.items():
+        df_Cumplimiento_Ventanas[regla['titulo']] = np.where(tabla_Cumplimiento_Ventanas[(nombre_Regla, 'cumple')].to_numpy(), "CUMPLE", "NO CUMPLE")
+
+    if tabla_Cumplimiento_Total is not None:
+        # Cada frecuencia cubre todos los registros con fecha, por lo que el total es la suma de cualquiera de ellas; el
+        # final de la medición es el de la última ventana más corta
+        fila_Total = {
+            'Ventana': "Medición completa",
+            'Inicio': df_Cumplimiento_Ventanas['Inicio'].iloc[0] if len(df_Cumplimiento_Ventanas) else '',
+            'Fin': df_Cumplimiento_Ventanas.loc[dias_Ventanas == np.min(dias_Ventanas), 'Fin'].iloc[-1] if len(df_Cumplimiento_Ventanas) else '',
+            'Registros': int(registros_Ventanas.groupby(level='ventana').sum().max()) if len(registros_Ventanas) else 0
+        }
+        fila_Total.update({regla['titulo']: "CUMPLE" if tabla_Cumplimiento_Total[(nombre_Regla, 'cumple')].iloc[0] else "NO CUMPLE" for nombre_Regla, regla in reglas.items()})
+
+        df_Cumplimiento_Ventanas = pd.concat([df_Cumplimiento_Ventanas, pd.DataFrame([fila_Total])], ignore_index=True)
+
+    return df_Cumplimiento_Ventanas
@@ -57,6 +57,8 @@ def generarMenu(usuario):
             st.page_link("pages/paginaCargabilidad.py", label="Informes | Cargabilidad", icon=":material/add_notes:") # Enlace a la página de compras
         if rol in ['admin','informes']:
             st.page_link("pages/paginaGraficosDinamicos.py", label="Informes | Gráficos Dinámicos", icon=":material/monitoring:") # Enlace a la página de personal   
+        if rol in ['admin','informes']:
+            st.page_link("pages/paginaInformesLote.py", label="Informes | Por Lotes", icon=":material/library_books:") # Enlace a la página de informes por lotes
         
         # Botón para cerrar la sesión
         btnSalir=st.button("Salir") # Creamos un botón para salir
@@ -0,0 +1,213 @@
+import argparse
+import io
+import multiprocessing
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from informe_Circuitor import generar_Informe_Circuitor, PARAMETROS_INFORME, ArchivoZipInforme, COMPRESIONES_ZIP, ARCHIVOS_ZIP_INFORME
+from informe_Circuitor.plantillas import cargar_Plantilla_Repositorio
+
+# Columnas del archivo de parámetros del lote: identificación del sitio, par de archivos .TXT y valores de entrada del informe
+COLUMNAS_LOTE: list = ['sitio', 'archivo_Minuto', 'archivo_Hora'] + list(PARAMETROS_INFORME.keys())
+
+def leer_Parametros_Lote(archivo_Parametros) -> pd.DataFrame:
+    """
+    Lee el archivo CSV con los parámetros del lote (una fila por sitio) y valida que tenga todas las columnas necesarias.
+    El separador (',' o ';') se detecta automáticamente. Los valores de entrada del informe se convierten a números
+    antes de iniciar el lote, aceptando la coma como separador decimal (por ejemplo '13,2' en un archivo separado por
+    ';'), para que un valor inválido se reporte con su fila y no como un error de cada sitio durante el lote.
+
+    Args:
+        archivo_Parametros (str | file-like): Ruta o archivo CSV con las columnas de 'COLUMNAS_LOTE' y, opcionalmente,
+        la columna 'plantilla' ('Vatia' o 'GIGA').
+
+    Returns:
+        pd.DataFrame: DataFrame con los parámetros de cada sitio.
+
+    Raises:
+        ValueError: Si faltan columnas, hay sitios repetidos o hay valores de entrada vacíos o no numéricos.
+    """
+    # Todo se lee como texto para convertir los valores de entrada con la coma decimal
+    df_Parametros = pd.read_csv(archivo_Parametros, sep=None, engine='python', encoding='UTF-8-SIG', dtype=str)
+    df_Parametros.columns = [str(columna).strip() for columna in df_Parametros.columns]
+
+    columnas_Faltantes = [columna for columna in COLUMNAS_LOTE if columna not in df_Parametros.columns]
+
+    if columnas_Faltantes:
+        raise ValueError(f"El archivo de parámetros no tiene las columnas: {', '.join(columnas_Faltantes)}.")
+
+    df_Parametros['sitio'] = df_Parametros['sitio'].astype(str).str.strip().str.replace(r'[\\/]', '_', regex=True)
+
+    sitios_Repetidos = df_Parametros.loc[df_Parametros['sitio'].duplicated(), 'sitio'].unique().tolist()
+
+    if sitios_Repetidos:
+        raise ValueError(f"Los siguientes sitios están repetidos en el archivo de parámetros: {', '.join(sitios_Repetidos)}.")
+
+    # Valores de entrada del informe: coma o punto como separador decimal; los vacíos y los no numéricos quedan en NaN
+    for columna in PARAMETROS_INFORME:
+        df_Parametros[columna] = pd.to_numeric(df_Parametros[columna].str.strip().str.replace(',', '.', regex=False), errors='coerce')
+
+    valores_Invalidos = df_Parametros[list(PARAMETROS_INFORME)].isna()
+
+    if valores_Invalidos.any().any():
+        # Número de fila del archivo (la fila 1 es el encabezado)
+        filas_Invalidas = [
+            f"fila {posicion + 2} ({df_Parametros['sitio'].iloc[posicion]}): {', '.join(valores_Invalidos.columns[valores_Invalidos.iloc[posicion].to_numpy()])}"
+            for posicion in np.flatnonzero(valores_Invalidos.any(axis=1).to_numpy())
+        ]
+        raise ValueError(f"Hay valores de entrada vacíos o no numéricos en el archivo de parámetros: {'; '.join(filas_Invalidas)}.")
+
+    if 'plantilla' not in df_Parametros.columns:
+        df_Parametros['plantilla'] = "Vatia"
+
+    df_Parametros['plantilla'] = df_Parametros['plantilla'].fillna("Vatia").astype(str).str.strip()
+
+    return df_Parametros
+
+def crear_Tareas_Lote(origen: str, df_Parametros: pd.DataFrame) -> list:
+    """
+    Crea la lista de tareas del lote (una por sitio). Cada tarea solo contiene la ruta del origen y los nombres de sus
+    archivos, de modo que cada proceso lee sus propios archivos sin copiar el contenido entre procesos.
+
+    Args:
+        origen (str): Ruta del archivo ZIP o de la carpeta con los pares de archivos .TXT.
+        df_Parametros (pd.DataFrame): Parámetros del lote leídos con 'leer_Parametros_Lote'.
+
+    Returns:
+        list: Lista de diccionarios con la información de cada tarea.
+    """
+    tareas = []
+
+    for fila in df_Parametros.to_dict(orient="records"):
+        tareas.append({
+            'sitio': fila['sitio'],
+            'origen': origen,
+            'archivo_Minuto': str(fila['archivo_Minuto']).strip().replace('\\', '/'),
+            'archivo_Hora': str(fila['archivo_Hora']).strip().replace('\\', '/'),
+            'plantilla': fila['plantilla'],
+            'parametros': {llave: fila[llave] for llave in PARAMETROS_INFORME}
+        })
+
+    return tareas
+
+def leer_Archivo_Origen(origen: str, nombre_Archivo: str) -> io.BytesIO:
+    """
+    Lee un archivo del origen del lote, ya sea un archivo ZIP o una carpeta.
+
+    Args:
+        origen (str): Ruta del archivo ZIP o de la carpeta.
+        nombre_Archivo (str): Nombre (ruta relativa) del archivo dentro del origen.
+
+    Returns:
+        io.BytesIO: Contenido del archivo.
+    """
+    if os.path.isdir(origen):
+        with open(os.path.join(origen, nombre_Archivo), 'rb') as archivo:
+            return io.BytesIO(archivo.read())
+
+    with zipfile.ZipFile(origen) as archivo_Zip:
+        return io.BytesIO(archivo_Zip.read(nombre_Archivo))
+
+def procesar_Tarea_Lote(tarea: dict) -> dict:
+    """
+    Genera el informe de un sitio del lote. Se ejecuta en un proceso del pool, por lo que los errores se devuelven en el
+    resultado en lugar de interrumpir el lote completo.
+
+    Args:
+        tarea (dict): Tarea creada con 'crear_Tareas_Lote'.
+
+    Returns:
+        dict: Diccionario con el sitio ('sitio'), el documento de Word ('word'), el Excel ('excel') y el error ('error',
+        None si el informe se generó correctamente).
+    """
+    try:
+        archivo_Minuto = leer_Archivo_Origen(tarea['origen'], tarea['archivo_Minuto'])
+        archivo_Hora = leer_Archivo_Origen(tarea['origen'], tarea['archivo_Hora'])
+
+        resultado_Informe = generar_Informe_Circuitor(archivo_Minuto, archivo_Hora, tarea['parametros'], tarea['plantilla'])
+
+        return {'sitio': tarea['sitio'], 'word': resultado_Informe['word'], 'excel': resultado_Informe['excel'], 'error': None}
+    except Exception as error:
+        return {'sitio': tarea['sitio'], 'word': None, 'excel': None, 'error': f"{type(error).__name__}: {error}"}
+
+def generar_Lote_Informes(origen: str, archivo_Parametros, destino, procesos: int = None, al_Avanzar=None, compresion: str = 'deflate', nivel_Compresion: int = None) -> pd.DataFrame:
+    """
+    Genera los informes de todos los sitios de un lote en un pool de procesos y los guarda en un único archivo ZIP, con
+    una carpeta por sitio (Word y Excel) y un archivo 'resumen_Lote.csv' con el estado de cada sitio.
+
+    Args:
+        origen (str): Ruta del archivo ZIP o de la carpeta con los pares de archivos .TXT (Minuto a Minuto y Hora a Hora).
+        archivo_Parametros (str | file-like): Archivo CSV con los parámetros del lote.
+        destino (str | file-like): Ruta o buffer donde se escribe el archivo ZIP final.
+        procesos (int): Cantidad de procesos del pool (por defecto, la cantidad de núcleos disponibles).
+        al_Avanzar (callable): Función opcional que se llama con (completados, total, sitio) cada vez que termina un sitio.
+        compresion (str): Método de compresión del ZIP (llaves de 'COMPRESIONES_ZIP').
+        nivel_Compresion (int): Nivel de compresión del ZIP, opcional.
+
+    Returns:
+        pd.DataFrame: Resumen del lote con el estado de cada sitio.
+    """
+    df_Parametros = leer_Parametros_Lote(archivo_Parametros)
+    tareas = crear_Tareas_Lote(origen, df_Parametros)
+
+    # Dejar las plantillas en la caché local antes de iniciar los procesos, para que no las descargue cada proceso
+    for plantilla in df_Parametros['plantilla'].unique():
+        try:
+            cargar_Plantilla_Repositorio(plantilla)
+        except (ValueError, RuntimeError):
+            # El error se reporta en cada sitio que use la plantilla
+            pass
+
+    resumen_Lote = []
+
+    # Se usa 'spawn' para no duplicar el estado del servidor de Streamlit en los procesos del pool
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context('spawn')) as pool, ArchivoZipInforme(destino, compresion, nivel_Compresion) as archivo_Zip:
+        futuros = [pool.submit(procesar_Tarea_Lote, tarea) for tarea in tareas]
+
+        for completados, futuro in enumerate(as_completed(futuros), start=1):
+            resultado = futuro.result()
+
+            if resultado['error'] is None:
+                archivo_Zip.agregar(f"{resultado['sitio']}/{ARCHIVOS_ZIP_INFORME['word']}", resultado['word'])
+                archivo_Zip.agregar(f"{resultado['sitio']}/{ARCHIVOS_ZIP_INFORME['excel']}", resultado['excel'])
+
+            resumen_Lote.append({'sitio': resultado['sitio'], 'estado': 'Generado' if resultado['error'] is None else 'Error', 'detalle': resultado['error'] or ''})
+
+            if al_Avanzar is not None:
+                al_Avanzar(completados, len(tareas), resultado['sitio'])
+
+        df_Resumen_Lote = pd.DataFrame(resumen_Lote, columns=['sitio', 'estado', 'detalle'])
+        df_Resumen_Lote = df_Resumen_Lote.set_index('sitio').loc[df_Parametros['sitio']].reset_index()
+
+        archivo_Zip.agregar("resumen_Lote.csv", df_Resumen_Lote.to_csv(index=False, sep=';'))
+
+    return df_Resumen_Lote
+
+def main():
+    """
+    Punto de entrada por línea de comandos del modo por lotes.
+
+    Uso:
+        python lote_Informes.py mediciones.zip parametros.csv -o informes.zip -p 4
+    """
+    parser = argparse.ArgumentParser(description="Generación por lotes de informes del Circuitor (Word y Excel).")
+    parser.add_argument('origen', help="Archivo ZIP o carpeta con los pares de archivos .TXT (Minuto a Minuto y Hora a Hora).")
+    parser.add_argument('parametros', help=f"Archivo CSV con las columnas: {', '.join(COLUMNAS_LOTE)} (y opcionalmente 'plantilla').")
+    parser.add_argument('-o', '--salida', default="informes_Lote.zip", help="Archivo ZIP de salida.")
+    parser.add_argument('-p', '--procesos', type=int, default=None, help="Cantidad de procesos (por defecto, todos los núcleos).")
+    parser.add_argument('-c', '--compresion', choices=list(COMPRESIONES_ZIP), default='deflate', help="Método de compresión del ZIP de salida.")
+    parser.add_argument('-n', '--nivel', type=int, default=None, help="Nivel de compresión del ZIP de salida (por defecto, el del método).")
+    argumentos = parser.parse_args()
+
+    def mostrar_Avance(completados, total, sitio):
+        print(f"[{completados}/{total}] {sitio}")
+
+    df_Resumen_Lote = generar_Lote_Informes(argumentos.origen, argumentos.parametros, argumentos.salida, argumentos.procesos, mostrar_Avance, argumentos.compresion, argumentos.nivel)
+
+    print(df_Resumen_Lote.to_string(index=False))
+    print(f"Informes guardados en: {argumentos.salida}")
+
+if __name__ == "__main__":
+    main()
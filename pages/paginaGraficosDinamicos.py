@@ -4,26 +4,31 @@ import matplotlib.pyplot as plt
 import plotly.express as px
 import io
 import plotly.graph_objects as go
-import requests
 import zipfile
 import login as login
 from docxtpl import DocxTemplate, InlineImage
 from docx.shared import Cm
 from docx.shared import Mm
 from io import BytesIO
-from utilities import organizar_DataFrame_M_a_M, organizar_DataFrame_H_a_H, calcular_Valor_Tension_Nominal, calcular_Valor_Corriente_Nominal, filtrar_DataFrame_Por_Columnas, crear_DataFrame_Desbalance_Tension, crear_DataFrame_Desbalance_Corriente, crear_DataFrame_PQS_Potencias, crear_DataFrame_FactPotencia, crear_DataFrame_FactPotenciaGrupos, crear_DataFrame_DistTension, crear_DataFrame_Armonicos_DistTension, crear_DataFrame_DistCorriente, crear_DataFrame_Armonicos_DistCorriente, crear_DataFrame_Armonicos_CargabilidadTDD, crear_DataFrame_FactorK_Final, crear_Medidas_DataFrame_Tension, crear_Medidas_DataFrame_DesbTension, crear_Medidas_DataFrame_Corriente, crear_Medidas_DataFrame_DesbCorriente, crear_Medidas_DataFrame_PQS, crear_Medidas_DataFrame_FactorPotencia, crear_Medidas_DataFrame_FactorPotenciaGeneral, crear_Medidas_DataFrame_Distorsion_Tension, crear_Medidas_DataFrame_Armonicos_DistTension, crear_Medidas_DataFrame_Distorsion_Corriente, crear_Medidas_DataFrame_Armonicos_DistCorriente, crear_Medidas_DataFrame_FactorK, calcular_Valor_Corriente_Cortacircuito, calcular_Valor_ISC_entre_IL, calcular_Valor_Limite_TDD, calcular_Valores_Limites_Armonicos, crear_DataFrame_CargabilidadTDD_Final, crear_Medidas_DataFrame_CargabilidadTDD, crear_Medidas_DataFrame_Energias, crear_DataFrame_Energias, crear_DataFrame_Tension, crear_DataFrame_Corriente, calcular_Variacion_Tension, calcular_Valor_Cargabilidad_Disponibilidad, calcular_Observacion_Tension, calcular_Observacion_Corriente, calcular_Observacion_DesbTension, calcular_Observacion_DesbCorriente, calcular_Observacion_THDV, calcular_Observacion_Armonicos_Corriente, calcular_Observacion_TDD, graficar_Timeline_Tension, graficar_Timeline_Corriente, graficar_Timeline_DesbTension, graficar_Timeline_DesbCorriente, graficar_Timeline_PQS_ActApa, graficar_Timeline_PQS_CapInd, graficar_Timeline_FactPotencia, graficar_Timeline_Distorsion_Tension, graficar_Timeline_Distorsion_Corriente, graficar_Timeline_CargabilidadTDD, graficar_Timeline_FactorK, generar_Graficos_Barras_Energias, graficar_Timeline_Tension_Plotly, graficar_Timeline_Corriente_Plotly, graficar_Timeline_DesbTension_Plotly, graficar_Timeline_DesbCorriente_Plotly, graficar_Timeline_PQS_ActApa_Plotly, graficar_Timeline_PQS_CapInd_Plotly, graficar_Timeline_FactPotencia_Plotly, graficar_Timeline_Distorsion_Tension_Plotly, graficar_Timeline_Distorsion_Corriente_Plotly, graficar_Timeline_CargabilidadTDD_Plotly, graficar_Timeline_FactorK_Plotly, generar_Graficos_Barras_Energias_Plotly, crear_grafico, generar_Graficos_Barras_Energias2
+from datetime import timedelta
+from datasets_Sesion import seleccionar_Dataset_Sesion
+from utilities import organizar_DataFrame_M_a_M, organizar_DataFrame_H_a_H, calcular_Valor_Tension_Nominal, calcular_Valor_Corriente_Nominal, filtrar_DataFrame_Por_Columnas, crear_DataFrame_Desbalance_Tension, crear_DataFrame_Desbalance_Corriente, crear_DataFrame_PQS_Potencias, crear_DataFrame_FactPotencia, crear_DataFrame_DistTension, crear_DataFrame_Armonicos_DistTension, crear_DataFrame_DistCorriente, crear_DataFrame_Armonicos_DistCorriente, crear_DataFrame_Armonicos_CargabilidadTDD, crear_DataFrame_FactorK_Final, crear_Medidas_DataFrame_Tension, crear_Medidas_DataFrame_DesbTension, crear_Medidas_DataFrame_Corriente, crear_Medidas_DataFrame_DesbCorriente, crear_Medidas_DataFrame_PQS, crear_Medidas_DataFrame_FactorPotencia, contar_Signos_FactorPotencia, calcular_Medidas_FactorPotencia_Grupos, crear_Medidas_DataFrame_Distorsion_Tension, crear_Medidas_DataFrame_Armonicos_DistTension, crear_Medidas_DataFrame_Distorsion_Corriente, crear_Medidas_DataFrame_Armonicos_DistCorriente, crear_Medidas_DataFrame_FactorK, calcular_Valor_Corriente_Cortacircuito, calcular_Valor_ISC_entre_IL, calcular_Valor_Limite_TDD, calcular_Valores_Limites_Armonicos, crear_DataFrame_CargabilidadTDD_Final, crear_Medidas_DataFrame_CargabilidadTDD, crear_Medidas_DataFrame_Energias, crear_DataFrame_Energias, crear_DataFrame_Tension, crear_DataFrame_Corriente, calcular_Variacion_Tension, calcular_Valor_Cargabilidad_Disponibilidad, crear_Matriz_Resumen, evaluar_Reglas_Cumplimiento, crear_Observaciones_Informe, graficar_Timeline_Tension, graficar_Timeline_Corriente, graficar_Timeline_DesbTension, graficar_Timeline_DesbCorriente, graficar_Timeline_PQS_ActApa, graficar_Timeline_PQS_CapInd, graficar_Timeline_FactPotencia, graficar_Timeline_Distorsion_Tension, graficar_Timeline_Distorsion_Corriente, graficar_Timeline_CargabilidadTDD, graficar_Timeline_FactorK, generar_Graficos_Barras_Energias, graficar_Timeline_Tension_Plotly, graficar_Timeline_Corriente_Plotly, graficar_Timeline_DesbTension_Plotly, graficar_Timeline_DesbCorriente_Plotly, graficar_Timeline_PQS_ActApa_Plotly, graficar_Timeline_PQS_CapInd_Plotly, graficar_Timeline_FactPotencia_Plotly, graficar_Timeline_Distorsion_Tension_Plotly, graficar_Timeline_Distorsion_Corriente_Plotly, graficar_Timeline_CargabilidadTDD_Plotly, graficar_Timeline_FactorK_Plotly, generar_Graficos_Barras_Energias_Plotly, crear_grafico, generar_Graficos_Barras_Energias2, construir_Piramide_Resolucion, calcular_Huella_Archivo, obtener_Datos_Ventana_Piramide, obtener_Rango_Seleccion_Plotly, crear_Resumen_Diario_Piramide, calcular_Demanda_Maxima_Piramide, obtener_Plantilla_Informe
 
 archivo = __file__.split("/")[-1]
 login.generarLogin(archivo)
 if 'usuario' in st.session_state:
     st.header('Información | :orange[Página de Gráficos Dinámicos]')
     
-    uploaded_file = st.file_uploader("Elige un archivo de .TXT (Minuto a Minuto)", type=["txt"])
-    uploaded_file2 = st.file_uploader("Elige un archivo de .TXT (Hora a Hora)", type=["txt"])
+    # Par de archivos subido en esta página o medición ya cargada en la sesión desde otra página
+    try:
+        datos_Circuitor = seleccionar_Dataset_Sesion(archivo)
+    except Exception as e:
+        st.error(f"Error al cargar los archivo .txt o procesar los datos: {e}")
+        st.stop()
     
-    if uploaded_file and uploaded_file2:
+    if datos_Circuitor is not None:
         
-        st.success("Archivos subidos correctamente.")
+        st.success(f"Medición cargada correctamente: {datos_Circuitor['nombre']}")
         
         try:
             
@@ -71,6 +76,12 @@ if 'usuario' in st.session_state:
             var6 = st.number_input("Ingrese el Valor de Impedancia de Cortocircuito (Transformador):", min_value=0.0, max_value=1000.0, step=0.1, format="%.1f")
             var7 = st.number_input("Ingrese el Valor de Referencia - PLT (Flicker):", min_value=0.0, max_value=5.0, step=0.1, format="%.1f")
             
+            # El modo compacto usa WebGL (Scattergl), fechas en epoch-ms y valores float32 para reducir el tamaño enviado al navegador
+            modo_Renderizado = st.radio("Modo de renderizado de los gráficos:", ["Compacto (WebGL)", "Estándar"], horizontal=True)
+            
+            # Identificador de la medición, para no mostrar gráficos generados con archivos anteriores
+            id_Archivos_Subidos = datos_Circuitor['huella']
+            
             st.markdown("""
             ---
             
@@ -79,13 +90,11 @@ if 'usuario' in st.session_state:
             ---
             """)
             
-            df_Read_Comparacion = pd.read_csv(uploaded_file, delimiter=';', encoding="UTF-8-SIG", encoding_errors='ignore')
-            #st.dataframe(df_Read.head(5))
-                    
-            df_Comparacion = organizar_DataFrame_M_a_M(df_Read_Comparacion)
+            # Datos organizados de la medición (procesados una sola vez y compartidos con las demás páginas de la sesión)
+            df_Comparacion = datos_Circuitor['df']
             #st.dataframe(df.head(5))
                     
-            crear_grafico(df_Comparacion.copy())
+            crear_grafico(df_Comparacion)
             
             if st.button("Generar Gráficos Dinámicos", type="primary"):
                 
@@ -103,18 +112,14 @@ if 'usuario' in st.session_state:
                     #st.dataframe(df_Read.head(5))
                         
                     #df = organizar_DataFrame_M_a_M(df_Read)
-                    df = df_Comparacion.copy()
+                    # Sin copia: cada tabla lee solo sus columnas con 'filtrar_DataFrame_Por_Columnas'
+                    df = df_Comparacion
                     #st.dataframe(df.head(5))
                         
-                    print("¿Quedan valores NaN en el DataFrame de Minuto a Minuto?", df.isna().any().any())
-                    print(df.head(5))
-                    print(df.index)  # ¿Es continuo? ¿Está vacío?
-                    print(df.shape)  # ¿Tiene filas y columnas?
-                        
-                    df_Energias_Read = pd.read_csv(uploaded_file2, delimiter=';', encoding="UTF-8-SIG", encoding_errors='ignore')
+                    #df_Energias_Read = pd.read_csv(uploaded_file2, delimiter=';', encoding="UTF-8-SIG", encoding_errors='ignore')
                     #st.dataframe(df_Energias_Read.head(5))
 
-                    df_Energias = organizar_DataFrame_H_a_H(df_Energias_Read)
+                    df_Energias = datos_Circuitor['df_Energias'].copy()
                     #st.dataframe(df_Energias.head(5))
                         
                     print("¿Quedan valores NaN en el DataFrame de Hora a Hora?", df_Energias.isna().any().any())
@@ -127,31 +132,8 @@ if 'usuario' in st.session_state:
                     > ## Creando DataFrame - Circuitor            
                     """)
                         
-                    #if plantillaSeleccionada == "Vatia":
-                            
-                        #print("a")
-                    var_Enlace_Plantilla = "https://github.com/gigadatagit/GIGA_Data/blob/365a61d9e72f3e175c39d5fa6cb1c189e0c70ffa/vars_Template_ETV_Circuitor_VATIA.docx?raw=true"
-                        
-                    #elif plantillaSeleccionada == "GIGA":
-                            
-                        #print("a")
-                        #var_Enlace_Plantilla = "https://github.com/gigadatagit/GIGA_Data/blob/365a61d9e72f3e175c39d5fa6cb1c189e0c70ffa/vars_Template_ETV_Circuitor.docx?raw=true"
-                        
-                    #else:
-                            
-                        #print("Por favor seleccione una plantilla válida.")
-                            
-                    # Enlace a la Plantilla del Documento de Word que contiene toda la información del Informe
-                    url = var_Enlace_Plantilla
-
-                    # Petición para Traer la información de esa URL con la Plantilla
-                    response = requests.get(url)
-
-                    # Guardado de contenido de la Plantilla de Word en un el Almacenamiento de Memoria
-                    template_data = BytesIO(response.content)
-
-                    # Crear una instancia de DocxTemplate - Carga el contenido de la Plantilla del Documento de Word
-                    doc = DocxTemplate(template_data)
+                    # Plantilla del Documento de Word (repositorio local de plantillas, sin consulta a la red en cada ejecución)
+                    doc = obtener_Plantilla_Informe("Vatia")
 
                     # Aquí tenemos una lista de las columnas que se van a graficar a través del tiempo para la tensión
                     list_Columns_Grafico_Tension: list = ['Tensin L12', 'Tensin L23', 'Tensin L31']
@@ -284,13 +266,6 @@ if 'usuario' in st.session_state:
                     st.dataframe(df_Tabla_FactPotenciaFinal.head(5))
                         
 
-                    df_Tabla_FactorPotencia_GruposFinal = crear_DataFrame_FactPotenciaGrupos(df_Tabla_FactorPotencia_Grupos)
-                        
-                    #st.markdown("""
-                    #> ## Cabecera - DataFrame de Factor de Potencia Grupos (Capacitivo/Inductivo) Final
-                    #""")
-
-                    #st.dataframe(df_Tabla_FactorPotencia_GruposFinal.head(5))
                         
 
                     df_Tabla_Distorsion_TensionFinal = crear_DataFrame_DistTension(df_Tabla_Distorsion_Tension, var5)
@@ -406,7 +381,7 @@ if 'usuario' in st.session_state:
                     st.dataframe(df_Tabla_Calculos_FactorPotencia)
                         
 
-                    df_Tabla_Calculos_FactorPotenciaGeneral = crear_Medidas_DataFrame_FactorPotenciaGeneral(df_Tabla_FactorPotencia_GruposFinal)
+                    df_Tabla_Calculos_FactorPotenciaGeneral = calcular_Medidas_FactorPotencia_Grupos(df_Tabla_FactorPotencia_Grupos)
 
                     #st.markdown("""
                     #> ## Medidas - DataFrame de Factor de Potencia (Generado/Consumido)
@@ -469,8 +444,6 @@ if 'usuario' in st.session_state:
 
                     print(f'DataFrame - Factor de Potencia {df_Tabla_FactorPotencia_Grupos}')
 
-                    print(f'DataFrame - Factor de Potencia en Grupo Final {df_Tabla_FactorPotencia_GruposFinal}')
-
                     print(f'Diccionario - Medidas de Factor de Potencia {df_Tabla_Calculos_FactorPotenciaGeneral}')
 
                     print('--'*30)
@@ -525,30 +498,9 @@ if 'usuario' in st.session_state:
 
                     # Separamos esta sección ya que es importante distinguir el uso del DataFrame del Factor de Potencia, para aplicarle Filtros de Medición a los Datos
 
-                    filtro_FP_POS_CANTPOS = (df_Tabla_FactPotenciaFinal['F.P. III'] > 0)
-
-                    filtro_FP_POS_CANTZeros = (df_Tabla_FactPotenciaFinal['F.P. III'] == abs(0))
-
-                    filtro_FP_POS_CANTNEG = (df_Tabla_FactPotenciaFinal['F.P. III'] < 0)
-
-                    filtro_FP_NEG_CANTPOS = (df_Tabla_FactPotenciaFinal['F.P. III -'] > 0)
-
-                    filtro_FP_NEG_CANTZeros = (df_Tabla_FactPotenciaFinal['F.P. III -'] == abs(0))
-
-                    filtro_FP_NEG_CANTNEG = (df_Tabla_FactPotenciaFinal['F.P. III -'] < 0)
-
-
-
                     # En este lugar declaramos un diccionario con los Valores negativos, ceros y positivos del Factor de Potencia
 
-                    data_Cantidad_NEG_POS_FactorPotencia: dict = {
-                        'CANT_POSITIVOS_FP_POS': len(df_Tabla_FactPotenciaFinal[filtro_FP_POS_CANTPOS]),
-                        'CANT_CEROS_FP_POS': len(df_Tabla_FactPotenciaFinal[filtro_FP_POS_CANTZeros]),
-                        'CANT_NEGATIVOS_FP_POS': len(df_Tabla_FactPotenciaFinal[filtro_FP_POS_CANTNEG]),
-                        'CANT_POSITIVOS_FP_NEG': len(df_Tabla_FactPotenciaFinal[filtro_FP_NEG_CANTPOS]),
-                        'CANT_CEROS_FP_NEG': len(df_Tabla_FactPotenciaFinal[filtro_FP_NEG_CANTZeros]),
-                        'CANT_NEGATIVOS_FP_NEG': len(df_Tabla_FactPotenciaFinal[filtro_FP_NEG_CANTNEG])
-                    }
+                    data_Cantidad_NEG_POS_FactorPotencia: dict = contar_Signos_FactorPotencia(df_Tabla_FactPotenciaFinal)
 
 
 
@@ -688,110 +640,51 @@ if 'usuario' in st.session_state:
 
 
 
-                    # Aquí vamos a determinar los resultados de cada una de las Observaciones
+                    # Aquí vamos a determinar los resultados de cada una de las Observaciones, con las reglas de cumplimiento evaluadas
+                    # sobre la matriz de resumen de las tablas de medidas
 
                     print('--'*30)
 
-                    listado_Percentiles_Tension: list = [round(df_Tabla_Calculos_Tension['Tensin mn. L12'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin L12'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin mx. L12'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin mn. L23'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin L23'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin mx. L23'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin mn. L31'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin L31'].iloc[0], 2), round(df_Tabla_Calculos_Tension['Tensin mx. L31'].iloc[0], 2),]
-
-                    listado_Limites_Tension: list = [var_Limite_Inferior_Tension, var_Limite_Superior_Tension]
-
-                    observaciones_Tension = calcular_Observacion_Tension(listado_Percentiles_Tension, listado_Limites_Tension)
-
-                    print(f"Observaciones de Tensión: {observaciones_Tension}")
-
-                    diccionario_Percentiles_Corriente: dict = {
-                        'CORRIENTE_L1_MIN': round(df_Tabla_Calculos_Corriente['Corriente mn. L1'].iloc[0], 2),
-                        'CORRIENTE_L1_MED': round(df_Tabla_Calculos_Corriente['Corriente L1'].iloc[0], 2),
-                        'CORRIENTE_L1_MAX': round(df_Tabla_Calculos_Corriente['Corriente mx. L1'].iloc[0], 2),
-                        'CORRIENTE_L2_MIN': round(df_Tabla_Calculos_Corriente['Corriente mn. L2'].iloc[0], 2),
-                        'CORRIENTE_L2_MED': round(df_Tabla_Calculos_Corriente['Corriente L2'].iloc[0], 2),
-                        'CORRIENTE_L2_MAX': round(df_Tabla_Calculos_Corriente['Corriente mx. L2'].iloc[0], 2),
-                        'CORRIENTE_L3_MIN': round(df_Tabla_Calculos_Corriente['Corriente mn. L3'].iloc[0], 2),
-                        'CORRIENTE_L3_MED': round(df_Tabla_Calculos_Corriente['Corriente L3'].iloc[0], 2),
-                        'CORRIENTE_L3_MAX': round(df_Tabla_Calculos_Corriente['Corriente mx. L3'].iloc[0], 2)
-                    }
-
-                    diccionario_Percentiles_CorrienteNeutra: dict = {
-                        'CORRIENTE_NEUTRA_MIN': round(df_Tabla_Calculos_Corriente['Corriente de neutro mn.'].iloc[0], 2),
-                        'CORRIENTE_NEUTRA_MED': round(df_Tabla_Calculos_Corriente['Corriente de neutro'].iloc[0], 2),
-                        'CORRIENTE_NEUTRA_MAX': round(df_Tabla_Calculos_Corriente['Corriente de neutro mx.'].iloc[0], 2)
-                    }
-
-                    valor_Corriente_Nominal = var_Corriente_Nominal_Value
-
-                    observaciones_Corriente = calcular_Observacion_Corriente(diccionario_Percentiles_Corriente, diccionario_Percentiles_CorrienteNeutra, valor_Corriente_Nominal)
-
-                    print(f"Observaciones de Corriente: {observaciones_Corriente}")
-
-                    valor_Percentil_DesbTension = round(df_Tabla_Calculos_Desb_Tension['Desbalance'].iloc[0], 2)
-
-                    valor_Referencia_DesbTension = var3
-
-                    observaciones_DesbTension = calcular_Observacion_DesbTension(valor_Percentil_DesbTension, valor_Referencia_DesbTension)
-
-                    print(f"Observaciones del Desbalance de Tensión: {observaciones_DesbTension}")
-
-                    valor_Percentil_DesbCorriente = round(df_Tabla_Calculos_Desb_Corriente['Desbalance'].iloc[0], 2)
-
-                    valor_Referencia_DesbCorriente = var4
-
-                    observaciones_DesbCorriente = calcular_Observacion_DesbCorriente(valor_Percentil_DesbCorriente, valor_Referencia_DesbCorriente)
-
-                    print(f"Observaciones del Desbalance de Corriente: {observaciones_DesbCorriente}")
-
-                    diccionario_Percentiles_THDV: dict = {
-                        'THDV_DISTTENSION_L1': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L1'].iloc[0], 2),
-                        'THDV_DISTTENSION_L2': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L2'].iloc[0], 2),
-                        'THDV_DISTTENSION_L3': round(df_Tabla_Calculos_DistTension['V THD/d Mx. L3'].iloc[0], 2)
-                    }
+                    matriz_Resumen = crear_Matriz_Resumen({
+                        'df_Tabla_Calculos_Tension': df_Tabla_Calculos_Tension,
+                        'df_Tabla_Calculos_Corriente': df_Tabla_Calculos_Corriente,
+                        'df_Tabla_Calculos_Desb_Tension': df_Tabla_Calculos_Desb_Tension,
+                        'df_Tabla_Calculos_Desb_Corriente': df_Tabla_Calculos_Desb_Corriente,
+                        'df_Tabla_Calculos_DistTension': df_Tabla_Calculos_DistTension,
+                        'df_Tabla_Calculos_Armonicos_DistCorriente': df_Tabla_Calculos_Armonicos_DistCorriente,
+                        'df_Tabla_Calculos_CargabilidadTDD': df_Tabla_Calculos_CargabilidadTDD
+                    })
 
                     valor_Referencia_THDV = var5
 
-                    observaciones_THDV = calcular_Observacion_THDV(diccionario_Percentiles_THDV, valor_Referencia_THDV)
-
-                    print(f"Observaciones del THDV: {observaciones_THDV}")
-
-                    diccionario_Percentiles_Armonicos_3_9: dict = {
-                        'ARMONICO_3_L1': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L1'].iloc[0], 2),
-                        'ARMONICO_3_L2': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L2'].iloc[0], 2),
-                        'ARMONICO_3_L3': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 3 L3'].iloc[0], 2),
-                        'ARMONICO_5_L1': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L1'].iloc[0], 2),
-                        'ARMONICO_5_L2': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L2'].iloc[0], 2),
-                        'ARMONICO_5_L3': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 5 L3'].iloc[0], 2),
-                        'ARMONICO_7_L1': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L1'].iloc[0], 2),
-                        'ARMONICO_7_L2': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L2'].iloc[0], 2),
-                        'ARMONICO_7_L3': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 7 L3'].iloc[0], 2),
-                        'ARMONICO_9_L1': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L1'].iloc[0], 2),
-                        'ARMONICO_9_L2': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L2'].iloc[0], 2),
-                        'ARMONICO_9_L3': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 9 L3'].iloc[0], 2)
-                    }
-
-                    diccionario_Percentiles_Armonicos_11: dict = {
-                        'ARMONICO_11_L1': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L1'].iloc[0], 2),
-                        'ARMONICO_11_L2': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L2'].iloc[0], 2),
-                        'ARMONICO_11_L3': round(df_Tabla_Calculos_Armonicos_DistCorriente['Arm. corriente 11 L3'].iloc[0], 2)
-                    }
-
                     listado_Limites_Armonicos_Corriente: list = list(valores_Limites_Armonicos.values())[:2]
 
-                    observaciones_ArmonicosCorriente = calcular_Observacion_Armonicos_Corriente(diccionario_Percentiles_Armonicos_3_9, diccionario_Percentiles_Armonicos_11, listado_Limites_Armonicos_Corriente)
-
-                    print(f"Listado de Límites de los Armónicos de Corriente: {listado_Limites_Armonicos_Corriente}")
-
-                    print(f"Observaciones de los Armónicos de Corriente: {observaciones_ArmonicosCorriente}")
-
-                    diccionario_Percentiles_TDD: dict = {
-                        'TDD_PERCENTIL_L1': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L1'].iloc[0], 2),
-                        'TDD_PERCENTIL_L2': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L2'].iloc[0], 2),
-                        'TDD_PERCENTIL_L3': round(df_Tabla_Calculos_CargabilidadTDD['resultado_TDD_L3'].iloc[0], 2)
+                    limites_Cumplimiento: dict = {
+                        'tension_Inferior': var_Limite_Inferior_Tension,
+                        'tension_Superior': var_Limite_Superior_Tension,
+                        'corriente_Nominal': var_Corriente_Nominal_Value,
+                        'ref_Desbalance_Tension': var3,
+                        'ref_Desbalance_Corriente': var4,
+                        'limite_THDV': valor_Referencia_THDV,
+                        'limite_Armonicos_3_9': listado_Limites_Armonicos_Corriente[0],
+                        'limite_Armonicos_11': listado_Limites_Armonicos_Corriente[1],
+                        'limite_TDD': valor_Limite_TDD
                     }
 
-                    valor_Referencia_TDD = valor_Limite_TDD
+                    tabla_Cumplimiento, mascaras_No_Cumplen = evaluar_Reglas_Cumplimiento(matriz_Resumen, limites_Cumplimiento)
 
-                    observaciones_TDD = calcular_Observacion_TDD(diccionario_Percentiles_TDD, valor_Referencia_TDD)
+                    observaciones_Informe = crear_Observaciones_Informe(matriz_Resumen, tabla_Cumplimiento, mascaras_No_Cumplen)
 
-                    print(f"Observaciones del TDD: {observaciones_TDD}")
+                    observaciones_Tension = observaciones_Informe['observaciones_Tension']
+                    observaciones_Corriente = observaciones_Informe['observaciones_Corriente']
+                    observaciones_DesbTension = observaciones_Informe['observaciones_DesbTension']
+                    observaciones_DesbCorriente = observaciones_Informe['observaciones_DesbCorriente']
+                    observaciones_THDV = observaciones_Informe['observaciones_THDV']
+                    observaciones_ArmonicosCorriente = observaciones_Informe['observaciones_ArmonicosCorriente']
+                    observaciones_TDD = observaciones_Informe['observaciones_TDD']
+
+                    for nombre_Observacion, observacion in observaciones_Informe.items():
+                        print(f"{nombre_Observacion}: {observacion}")
 
                     print('--'*30)
                     
@@ -1432,32 +1325,43 @@ if 'usuario' in st.session_state:
                     }
                     
                     
-                    graficar_Timeline_Tension_Plotly(dataFrame=var_Tabla_Tensiones, variables=list_Columns_Grafico_Tension, fecha_col='fecha_y_Hora', limites=[var_Tabla_Tensiones['var_Limite_Inferior_Tension'].iloc[0], var_Tabla_Tensiones['var_Limite_Superior_Tension'].iloc[0]], titulo='REGISTROS DE TENSIÓN')
-
-                    graficar_Timeline_Corriente_Plotly(dataFrame=var_Tabla_Corrientes, variables=list_Columns_Grafico_Corriente, fecha_col='fecha_y_Hora', limite=var_Tabla_Corrientes['var_Limite_Corriente_Nominal'].iloc[0], titulo='REGISTROS DE CORRIENTE')
-
-                    graficar_Timeline_DesbTension_Plotly(dataFrame=df_Tabla_Desb_Tension, variables=list_Columns_Grafico_DesbTension, fecha_col='fecha_y_Hora', limite=df_Tabla_Desb_Tension['var_Ref_Desbalance_Tension'].iloc[0], titulo='REGISTROS DESBALANCE DE TENSIÓN')
-                        
-                    graficar_Timeline_DesbCorriente_Plotly(dataFrame=df_Tabla_Desb_Corriente, variables=list_Columns_Grafico_DesbCorriente, fecha_col='fecha_y_Hora', limite=df_Tabla_Desb_Corriente['var_Ref_Desbalance_Corriente'].iloc[0], titulo='REGISTROS DESBALANCE DE CORRIENTE')
-
-                    graficar_Timeline_PQS_ActApa_Plotly(dataFrame=df_Tabla_PQS_Final, variables=list_Columns_Grafico_DesbCorriente_ActApa, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Activa / Aparente (kW / kVA)')
-
-                    graficar_Timeline_PQS_CapInd_Plotly(dataFrame=df_Tabla_PQS_Final, variables=list_Columns_Grafico_DesbCorriente_CapInd, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Capacitiva / Inductiva (kVAR)')
-
-                    graficar_Timeline_FactPotencia_Plotly(dataFrame=df_Tabla_FactPotenciaFinal, variables=list_Columns_Grafico_FactorPot, medidas_dataFrame=data_Cantidad_NEG_POS_FactorPotencia, fecha_col='fecha_y_Hora', titulo='REGISTROS DE POTENCIA - Factor de Potencia')
-
-                    graficar_Timeline_Distorsion_Tension_Plotly(dataFrame=df_Tabla_Distorsion_TensionFinal, variables=list_Columns_Distorsion_Tension, fecha_col='fecha_y_Hora', limite=df_Tabla_Distorsion_TensionFinal['var_Ref_Distorsion_Tension'].iloc[0], titulo='REGISTROS DISTORSIÓN ARMÓNICA DE TENSIÓN - THDV')
-
-                    graficar_Timeline_Distorsion_Corriente_Plotly(dataFrame=df_Tabla_Distorsion_CorrienteFinal, variables=list_Columns_Distorsion_Corriente, fecha_col='fecha_y_Hora', limite=None, titulo='REGISTROS DISTORSIÓN ARMÓNICA DE CORRIENTE - THDI')
-                        
-                    graficar_Timeline_CargabilidadTDD_Plotly(dataFrame=df_Tabla_TDDFinal, variables=list_Columns_Armonicos_Cargabilidad_TDD, fecha_col='fecha_y_Hora', limite=valor_Limite_TDD, titulo='REGISTROS DISTORSIÓN TOTAL DE DEMANDA')
-
-                    graficar_Timeline_FactorK_Plotly(dataFrame=df_Tabla_FactorKFinal, variables=list_Columns_FactorK, fecha_col='fecha_y_Hora', limite=None, titulo='REGISTROS DE FACTOR K')
-                        
-                    #generar_Graficos_Barras_Energias_Plotly(dataFrame=df_Tabla_Energias, variables=list_Columns_Graficos_Consolidado_Energia, fecha_col='Fecha/Hora')
-                
-                    generar_Graficos_Barras_Energias_Plotly(dataFrame=df_Tabla_Energias.copy(), variables=list_Columns_Graficos_Consolidado_Energia, fecha_col='Fecha/hora')
-
+                    # Las series de la medición se leen de la pirámide del dataset (construida una sola vez al cargarlo);
+                    # solo las series calculadas en esta página (desbalances y TDD) necesitan su propia pirámide
+                    piramide_Medicion = datos_Circuitor['piramide']
+                    
+                    df_Derivadas_Graficos = pd.concat([
+                        var_Tabla_Tensiones[['fecha_y_Hora']],
+                        df_Tabla_Desb_Tension[['Desbalance']].rename(columns={'Desbalance': 'Desbalance Tensión'}),
+                        df_Tabla_Desb_Corriente[['Desbalance']].rename(columns={'Desbalance': 'Desbalance Corriente'}),
+                        df_Tabla_TDDFinal[list_Columns_Armonicos_Cargabilidad_TDD]
+                    ], axis=1)
+                    
+                    piramide_Derivadas = construir_Piramide_Resolucion(df_Derivadas_Graficos, 'fecha_y_Hora', [columna for columna in df_Derivadas_Graficos.columns if columna != 'fecha_y_Hora'])
+                    
+                    st.session_state['piramide_Graficos'] = piramide_Medicion
+                    
+                    # Se guardan los argumentos de cada gráfico en la sesión; el renderizado se hace por secciones más abajo
+                    st.session_state['graficos_Dinamicos'] = [
+                        ('REGISTROS DE TENSIÓN', graficar_Timeline_Tension_Plotly, list_Columns_Grafico_Tension, dict(limites=[var_Tabla_Tensiones['var_Limite_Inferior_Tension'].iloc[0], var_Tabla_Tensiones['var_Limite_Superior_Tension'].iloc[0]], titulo='REGISTROS DE TENSIÓN'), piramide_Medicion),
+                        ('REGISTROS DE CORRIENTE', graficar_Timeline_Corriente_Plotly, list_Columns_Grafico_Corriente, dict(limite=var_Tabla_Corrientes['var_Limite_Corriente_Nominal'].iloc[0], titulo='REGISTROS DE CORRIENTE'), piramide_Medicion),
+                        ('REGISTROS DESBALANCE DE TENSIÓN', graficar_Timeline_DesbTension_Plotly, ['Desbalance Tensión'], dict(limite=df_Tabla_Desb_Tension['var_Ref_Desbalance_Tension'].iloc[0], titulo='REGISTROS DESBALANCE DE TENSIÓN'), piramide_Derivadas),
+                        ('REGISTROS DESBALANCE DE CORRIENTE', graficar_Timeline_DesbCorriente_Plotly, ['Desbalance Corriente'], dict(limite=df_Tabla_Desb_Corriente['var_Ref_Desbalance_Corriente'].iloc[0], titulo='REGISTROS DESBALANCE DE CORRIENTE'), piramide_Derivadas),
+                        ('REGISTROS DE POTENCIA - Activa / Aparente', graficar_Timeline_PQS_ActApa_Plotly, list_Columns_Grafico_DesbCorriente_ActApa, dict(titulo='REGISTROS DE POTENCIA - Activa / Aparente (kW / kVA)'), piramide_Medicion),
+                        ('REGISTROS DE POTENCIA - Capacitiva / Inductiva', graficar_Timeline_PQS_CapInd_Plotly, list_Columns_Grafico_DesbCorriente_CapInd, dict(titulo='REGISTROS DE POTENCIA - Capacitiva / Inductiva (kVAR)'), piramide_Medicion),
+                        ('REGISTROS DE POTENCIA - Factor de Potencia', graficar_Timeline_FactPotencia_Plotly, list_Columns_Grafico_FactorPot, dict(medidas_dataFrame=data_Cantidad_NEG_POS_FactorPotencia, titulo='REGISTROS DE POTENCIA - Factor de Potencia'), piramide_Medicion),
+                        ('REGISTROS DISTORSIÓN ARMÓNICA DE TENSIÓN - THDV', graficar_Timeline_Distorsion_Tension_Plotly, list_Columns_Distorsion_Tension, dict(limite=df_Tabla_Distorsion_TensionFinal['var_Ref_Distorsion_Tension'].iloc[0], titulo='REGISTROS DISTORSIÓN ARMÓNICA DE TENSIÓN - THDV'), piramide_Medicion),
+                        ('REGISTROS DISTORSIÓN ARMÓNICA DE CORRIENTE - THDI', graficar_Timeline_Distorsion_Corriente_Plotly, list_Columns_Distorsion_Corriente, dict(limite=None, titulo='REGISTROS DISTORSIÓN ARMÓNICA DE CORRIENTE - THDI'), piramide_Medicion),
+                        ('REGISTROS DISTORSIÓN TOTAL DE DEMANDA', graficar_Timeline_CargabilidadTDD_Plotly, list_Columns_Armonicos_Cargabilidad_TDD, dict(limite=valor_Limite_TDD, titulo='REGISTROS DISTORSIÓN TOTAL DE DEMANDA'), piramide_Derivadas),
+                        ('REGISTROS DE FACTOR K', graficar_Timeline_FactorK_Plotly, list_Columns_FactorK, dict(limite=None, titulo='REGISTROS DE FACTOR K'), piramide_Medicion)
+                    ]
+                    
+                    st.session_state['graficos_Energias_Dinamicos'] = dict(dataFrame=df_Tabla_Energias.copy(), variables=list_Columns_Graficos_Consolidado_Energia, fecha_col='Fecha/hora')
+                    
+                    # Al generar los gráficos se muestra el registro completo (el nivel '1min' de las series calculadas tiene las mismas fechas que la medición)
+                    st.session_state['rango_Graficos'] = (piramide_Derivadas['1min'].index[0].to_pydatetime(), piramide_Derivadas['1min'].index[-1].to_pydatetime())
+                    st.session_state['ventana_Graficos_Pendiente'] = st.session_state['rango_Graficos']
+                    
+                    st.session_state['graficos_Dinamicos_Archivos'] = id_Archivos_Subidos
 
                     st.success("Gráficos generados correctamente.")
                 
@@ -1465,6 +1369,69 @@ if 'usuario' in st.session_state:
                     
                     print(e)
             
+            # Renderizado por secciones: Streamlit ejecuta el contenido de un expander aunque esté cerrado,
+            # por eso cada gráfico solo se construye y se envía al navegador cuando se activa su sección.
+            if st.session_state.get('graficos_Dinamicos_Archivos') == id_Archivos_Subidos:
+                
+                piramide_Graficos = st.session_state['piramide_Graficos']
+                
+                fecha_Inicio_Registro, fecha_Fin_Registro = st.session_state['rango_Graficos']
+                
+                # Una ventana pendiente (zoom por selección o restablecer) se aplica antes de crear el slider
+                if 'ventana_Graficos_Pendiente' in st.session_state:
+                    st.session_state['ventana_Graficos'] = st.session_state.pop('ventana_Graficos_Pendiente')
+                
+                st.markdown("""
+                ---
+                
+                > ## Ventana de visualización. Selecciona un rango con la herramienta de caja (box select) sobre cualquier gráfico para hacer zoom con mayor detalle.
+                
+                ---
+                """)
+                
+                ventana_Graficos = st.slider("Rango de fechas:", min_value=fecha_Inicio_Registro, max_value=fecha_Fin_Registro, step=timedelta(minutes=1), format="DD/MM/YY HH:mm", key='ventana_Graficos')
+                
+                if st.button("Restablecer ventana"):
+                    st.session_state['ventana_Graficos_Pendiente'] = (fecha_Inicio_Registro, fecha_Fin_Registro)
+                    st.rerun()
+                
+                for titulo_Seccion, funcion_Grafico, variables_Grafico, argumentos_Grafico, piramide_Grafico in st.session_state['graficos_Dinamicos']:
+                    
+                    with st.expander(titulo_Seccion):
+                        
+                        if st.toggle("Mostrar gráfico", key=f"mostrar_{titulo_Seccion}"):
+                            
+                            # Datos del rango visible, re-muestreados al nivel de la pirámide que corresponde
+                            df_Ventana, nivel_Resolucion = obtener_Datos_Ventana_Piramide(piramide_Grafico, variables_Grafico, ventana_Graficos[0], ventana_Graficos[1])
+                            
+                            st.caption(f"Resolución mostrada: {nivel_Resolucion}")
+                            
+                            evento_Seleccion = funcion_Grafico(dataFrame=df_Ventana, variables=variables_Grafico, fecha_col='fecha_y_Hora', **argumentos_Grafico, modo_Compacto=(modo_Renderizado == "Compacto (WebGL)"), clave_Grafico=f"grafico_{titulo_Seccion}")
+                            
+                            # La selección se conserva entre ejecuciones, por eso solo se aplica cuando cambia
+                            rango_Seleccion = obtener_Rango_Seleccion_Plotly(evento_Seleccion)
+                            
+                            if rango_Seleccion and rango_Seleccion != st.session_state.get(f"seleccion_{titulo_Seccion}"):
+                                st.session_state[f"seleccion_{titulo_Seccion}"] = rango_Seleccion
+                                st.session_state['ventana_Graficos_Pendiente'] = (max(rango_Seleccion[0].to_pydatetime(), fecha_Inicio_Registro), min(rango_Seleccion[1].to_pydatetime(), fecha_Fin_Registro))
+                                st.rerun()
+                
+                with st.expander('RESUMEN DIARIO Y DEMANDA MÁXIMA'):
+                    
+                    if st.toggle("Mostrar resumen", key="mostrar_RESUMEN DIARIO"):
+                        
+                        demanda_Maxima = calcular_Demanda_Maxima_Piramide(piramide_Graficos, 'P.Activa III', '15min')
+                        
+                        st.metric("Demanda Máxima (promedio de 15 minutos) - P.Activa III", f"{round(demanda_Maxima['valor'], 2)}", help=f"Intervalo que inicia el {demanda_Maxima['fecha']}")
+                        
+                        st.dataframe(crear_Resumen_Diario_Piramide(piramide_Graficos, ['Tensin L12', 'Tensin L23', 'Tensin L31', 'Corriente mx. L1', 'Corriente mx. L2', 'Corriente mx. L3', 'P.Activa III', 'P.Aparente III']))
+                
+                with st.expander('REGISTROS DE ENERGÍA'):
+                    
+                    if st.toggle("Mostrar gráfico", key="mostrar_REGISTROS DE ENERGÍA"):
+                        
+                        generar_Graficos_Barras_Energias_Plotly(**st.session_state['graficos_Energias_Dinamicos'], modo_Compacto=(modo_Renderizado == "Compacto (WebGL)"))
+            
         except Exception as e:
             st.error(f"Error al cargar los archivo .txt o procesar los datos: {e}")
             
@@ -0,0 +1,102 @@
+import streamlit as st
+import pandas as pd
+import io
+import os
+import tempfile
+import login as login
+from informe_Circuitor import PARAMETROS_INFORME
+from lote_Informes import COLUMNAS_LOTE, generar_Lote_Informes
+
+archivo = __file__.split("/")[-1]
+login.generarLogin(archivo)
+if 'usuario' in st.session_state:
+    st.header('Información | :orange[Página de Generación de Informes por Lotes]')
+
+    st.markdown("""
+    ---
+
+    > ## Sube un archivo .ZIP con los pares de archivos .TXT (Minuto a Minuto y Hora a Hora) y el archivo .CSV con los parámetros de cada sitio.
+
+    ---
+    """)
+
+    # Plantilla del archivo de parámetros (una fila por sitio)
+    df_Plantilla_Parametros = pd.DataFrame([{
+        'sitio': 'Sitio_1',
+        'archivo_Minuto': 'Sitio_1/minuto.txt',
+        'archivo_Hora': 'Sitio_1/hora.txt',
+        'tension_Nominal': 220.0,
+        'capacidad_Transformador': 75.0,
+        'ref_Desbalance_Tension': 2.0,
+        'ref_Desbalance_Corriente': 20.0,
+        'limite_THDV': 5.0,
+        'impedancia_Cortocircuito': 4.0,
+        'ref_PLT': 1.0,
+        'plantilla': 'Vatia'
+    }], columns=COLUMNAS_LOTE + ['plantilla'])
+
+    with st.expander("Formato del archivo de parámetros"):
+        st.dataframe(pd.DataFrame({'columna': list(PARAMETROS_INFORME.keys()), 'descripción': list(PARAMETROS_INFORME.values())}), hide_index=True)
+        st.download_button(
+            label="Descargar Plantilla de Parámetros (.CSV)",
+            data=df_Plantilla_Parametros.to_csv(index=False, sep=';'),
+            file_name="parametros_Lote.csv",
+            mime="text/csv"
+        )
+
+    uploaded_file = st.file_uploader("Elige un archivo .ZIP con los archivos .TXT de todos los sitios", type=["zip"])
+    uploaded_file2 = st.file_uploader("Elige el archivo .CSV con los parámetros de cada sitio", type=["csv"])
+
+    if uploaded_file and uploaded_file2:
+
+        st.success("Archivos subidos correctamente.")
+
+        procesos = st.number_input("Cantidad de procesos en paralelo:", min_value=1, max_value=max(os.cpu_count() or 1, 1), value=max(os.cpu_count() or 1, 1), step=1)
+
+        if st.button("Generar Informes del Lote", type="primary"):
+
+            try:
+
+                barra_Avance = st.progress(0.0, text="Generando informes...")
+
+                def mostrar_Avance(completados, total, sitio):
+                    barra_Avance.progress(completados / total, text=f"[{completados}/{total}] Informe generado: {sitio}")
+
+                # El ZIP subido se guarda en un archivo temporal para que cada proceso lea solo los archivos de su sitio
+                with tempfile.TemporaryDirectory() as directorio_Temporal:
+
+                    ruta_Origen = os.path.join(directorio_Temporal, "origen_Lote.zip")
+
+                    with open(ruta_Origen, 'wb') as archivo_Origen:
+                        archivo_Origen.write(uploaded_file.getvalue())
+
+                    zip_buffer = io.BytesIO()
+
+                    df_Resumen_Lote = generar_Lote_Informes(ruta_Origen, uploaded_file2, zip_buffer, int(procesos), mostrar_Avance)
+
+                zip_buffer.seek(0)
+
+                st.markdown("""
+                > ## Resumen del Lote
+                """)
+
+                st.dataframe(df_Resumen_Lote, hide_index=True)
+
+                st.success(f"Informes generados: {(df_Resumen_Lote['estado'] == 'Generado').sum()} de {len(df_Resumen_Lote)}.")
+
+                # Botón para descargar el archivo ZIP
+                st.download_button(
+                    label="Descargar Informes del Lote (Word y Excel)",
+                    data=zip_buffer,
+                    file_name="informesLote.zip",
+                    mime="application/zip"
+                )
+
+            except ValueError as error:
+                st.error(f"Error en el archivo de parámetros: {error}")
+
+            except Exception as e:
+                st.error(f"Error al generar los informes del lote: {e}")
+
+    else:
+        st.write("Por favor, sube el archivo .ZIP y el archivo .CSV para comenzar.")
@@ -0,0 +1,83 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+from informe_Circuitor import almacen
+from informe_Circuitor.almacen import guardar_Dataset_Almacen, abrir_Dataset_Almacen, liberar_Espacio_Almacen, listar_Datasets_Almacen, verificar_Dataset_Almacen, construir_Piramide_Dataset, crear_Resumen_Columnas
+from informe_Circuitor.dispersas import extraer_Series_Dispersas
+
+pytest.importorskip('pyarrow')
+
+@pytest.fixture(autouse=True)
+def almacen_Temporal(tmp_path, monkeypatch):
+    monkeypatch.setattr(almacen, 'DIRECTORIO_ALMACEN_DATOS', str(tmp_path))
+    monkeypatch.setattr(almacen, 'HUELLAS_PROCESO', set())
+
+    return tmp_path
+
+def crear_Medicion_Prueba(dias: int = 2) -> pd.DataFrame:
+    """
+    Crea una medición de Minuto a Minuto organizada, con la fecha como texto y dos columnas numéricas.
+    """
+    fechas = pd.date_range('2024-01-01', periods=dias * 1440, freq='min')
+    minutos = np.arange(len(fechas), dtype=np.float64)
+
+    return pd.DataFrame({
+        'Fecha/hora': fechas.strftime('%d/%m/%y %H:%M:%S'),
+        'Tensin L12': 220 + np.sin(minutos / 60),
+        'Corriente L1': 50 + np.cos(minutos / 90)
+    })
+
+def guardar_Medicion_Prueba(huella: str) -> pd.DataFrame:
+    df = crear_Medicion_Prueba()
+    df_Energias = pd.DataFrame({'Fecha/hora': ['01/01/24 00:00:00'], 'E.Activa III': [1.0]})
+
+    assert guardar_Dataset_Almacen(huella, df, df_Energias, construir_Piramide_Dataset(df), crear_Resumen_Columnas(df), extraer_Series_Dispersas(df))
+
+    return df
+
+def test_liberar_espacio_no_elimina_los_datasets_abiertos_por_el_proceso(almacen_Temporal):
+    guardar_Medicion_Prueba('abierto')
+    guardar_Medicion_Prueba('sin_Abrir')
+
+    # El dataset abierto es el más antiguo del almacén, pero lo sigue usando una sesión de este proceso
+    dataset = abrir_Dataset_Almacen('abierto')
+    os.utime(os.path.join(almacen_Temporal, 'abierto', 'info.json'), (0, 0))
+
+    assert liberar_Espacio_Almacen(cuota=0) == ['sin_Abrir']
+    assert listar_Datasets_Almacen()['huella'].tolist() == ['abierto']
+    assert not dataset['piramide']['15min'].empty
+
+def test_nivel_1min_se_arma_desde_las_columnas_mapeadas(almacen_Temporal):
+    df = guardar_Medicion_Prueba('minuto')
+    ruta_Dataset = os.path.join(almacen_Temporal, 'minuto')
+
+    assert not os.path.exists(os.path.join(ruta_Dataset, 'piramide_1min.parquet'))
+    assert verificar_Dataset_Almacen(ruta_Dataset)
+
+    dataset = abrir_Dataset_Almacen('minuto')
+
+    assert '1min' in dataset['piramide']
+    pd.testing.assert_frame_equal(dataset['piramide']['1min'], construir_Piramide_Dataset(df)['1min'])
+    assert not os.path.exists(os.path.join(ruta_Dataset, 'piramide_1min.parquet'))
+
+def test_nivel_faltante_se_reconstruye_desde_el_minuto_a_minuto(almacen_Temporal):
+    df = guardar_Medicion_Prueba('nivel')
+    dataset = abrir_Dataset_Almacen('nivel')
+
+    ruta_Nivel = os.path.join(almacen_Temporal, 'nivel', 'piramide_15min.parquet')
+    os.remove(ruta_Nivel)
+
+    pd.testing.assert_frame_equal(dataset['piramide']['15min'], construir_Piramide_Dataset(df)['15min'], check_freq=False)
+    assert os.path.isfile(ruta_Nivel)
+
+@pytest.mark.skipif(os.name == 'nt', reason="Windows no permite eliminar archivos mapeados en memoria")
+def test_dataset_eliminado_por_otro_proceso_sigue_disponible(almacen_Temporal):
+    df = guardar_Medicion_Prueba('eliminado')
+    dataset = abrir_Dataset_Almacen('eliminado')
+
+    # Otro proceso libera espacio y borra la carpeta: las columnas mapeadas siguen abiertas y los niveles se reconstruyen
+    shutil.rmtree(os.path.join(almacen_Temporal, 'eliminado'))
+
+    pd.testing.assert_frame_equal(dataset['piramide']['1h'], construir_Piramide_Dataset(df)['1h'], check_freq=False)
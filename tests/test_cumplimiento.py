@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from informe_Circuitor.cumplimiento import REGLAS_CUMPLIMIENTO, crear_Matriz_Resumen, evaluar_Reglas_Cumplimiento
+
+REGLAS_PRUEBA: dict = {nombre_Regla: REGLAS_CUMPLIMIENTO[nombre_Regla] for nombre_Regla in ('thdv', 'tdd')}
+
+def crear_Matriz_Prueba(percentiles_THDV: list, percentiles_TDD: list) -> pd.DataFrame:
+    """
+    Crea la matriz de resumen de una medición con los percentiles indicados para las reglas de THDv y TDD.
+    """
+    def crear_Tabla_Medidas(columnas: list, percentiles: list) -> pd.DataFrame:
+        return pd.DataFrame([percentiles, percentiles, percentiles, percentiles], index=['Percentil', 'Media', 'Min', 'Max'], columns=columnas)
+
+    return crear_Matriz_Resumen({
+        'df_Tabla_Calculos_DistTension': crear_Tabla_Medidas(list(REGLAS_CUMPLIMIENTO['thdv']['columnas'].values()), percentiles_THDV),
+        'df_Tabla_Calculos_CargabilidadTDD': crear_Tabla_Medidas(list(REGLAS_CUMPLIMIENTO['tdd']['columnas'].values()), percentiles_TDD)
+    })
+
+def test_percentiles_bajo_el_limite_cumplen():
+    tabla_Cumplimiento, _ = evaluar_Reglas_Cumplimiento(crear_Matriz_Prueba([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]), {'limite_THDV': 5, 'limite_TDD': 8}, REGLAS_PRUEBA)
+
+    assert tabla_Cumplimiento[('thdv', 'etiqueta_1')].tolist() == ["SÍ CUMPLE"]
+    assert tabla_Cumplimiento[('tdd', 'etiqueta_1')].tolist() == ["SÍ CUMPLEN"]
+
+@pytest.mark.parametrize('valor', [5.0, 7.5])
+def test_percentil_igual_o_mayor_al_limite_no_cumple(valor):
+    tabla_Cumplimiento, mascaras_No_Cumplen = evaluar_Reglas_Cumplimiento(crear_Matriz_Prueba([1.0, valor, 3.0], [4.0, 5.0, 6.0]), {'limite_THDV': 5, 'limite_TDD': 8}, REGLAS_PRUEBA)
+
+    assert tabla_Cumplimiento[('thdv', 'etiqueta_1')].tolist() == ["NO CUMPLE"]
+    assert mascaras_No_Cumplen['thdv'].tolist() == [[False, True, False]]
+
+def test_percentil_vacio_no_cumple():
+    tabla_Cumplimiento, mascaras_No_Cumplen = evaluar_Reglas_Cumplimiento(crear_Matriz_Prueba([1.0, np.nan, 3.0], [np.nan, 5.0, 6.0]), {'limite_THDV': 5, 'limite_TDD': 8}, REGLAS_PRUEBA)
+
+    assert not tabla_Cumplimiento[('thdv', 'cumple')].any()
+    assert tabla_Cumplimiento[('thdv', 'etiqueta_1')].tolist() == ["NO CUMPLE"]
+    assert mascaras_No_Cumplen['thdv'].tolist() == [[False, True, False]]
+
+    assert tabla_Cumplimiento[('tdd', 'etiqueta_1')].tolist() == ["NO CUMPLEN"]
+    assert tabla_Cumplimiento[('tdd', 'etiqueta_2')].tolist() == ["SÍ SUPERAN"]
@@ -0,0 +1,63 @@
+import io
+import zipfile
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from informe_Circuitor.exportacion import exportar_Excel_Informe, ArchivoZipInforme
+
+pytest.importorskip('xlsxwriter')
+
+def crear_Hojas_Prueba() -> dict:
+    """
+    Crea hojas de prueba con los tipos de valores que escribe el informe: números, textos, fechas y vacíos.
+    """
+    return {
+        'Tensión': pd.DataFrame({
+            'fecha_y_Hora': pd.to_datetime(['2024-01-01 00:00', '2024-01-01 00:01', None]),
+            'Tensin L12': [220.5, np.nan, 221.25],
+            'Muestras': [1, 2, 3]
+        }),
+        'Cumplimiento [Día/Semana]': pd.DataFrame({
+            'Ventana': ["01/01/2024", "02/01/2024"],
+            'Cumplimiento': ["CUMPLE", None]
+        })
+    }
+
+def leer_Libro(contenido: bytes) -> dict:
+    libro = load_workbook(io.BytesIO(contenido))
+
+    return {hoja.title: [list(fila) for fila in hoja.iter_rows(values_only=True)] for hoja in libro.worksheets}
+
+def test_xlsxwriter_escribe_lo_mismo_que_openpyxl():
+    hojas = crear_Hojas_Prueba()
+
+    libro_Xlsxwriter = leer_Libro(exportar_Excel_Informe(hojas, 'xlsxwriter'))
+    libro_Openpyxl = leer_Libro(exportar_Excel_Informe(hojas, 'openpyxl'))
+
+    assert list(libro_Xlsxwriter) == ['Tensión', 'Cumplimiento _Día_Semana_']
+    assert libro_Xlsxwriter == libro_Openpyxl
+
+    filas_Tension = libro_Xlsxwriter['Tensión']
+    assert filas_Tension[0] == ['fecha_y_Hora', 'Tensin L12', 'Muestras']
+    assert filas_Tension[1][0] == pd.Timestamp('2024-01-01 00:00').to_pydatetime()
+    assert filas_Tension[2][1] is None
+    assert filas_Tension[3][0] is None
+
+def test_xlsxwriter_es_el_motor_por_defecto():
+    hojas = crear_Hojas_Prueba()
+
+    assert leer_Libro(exportar_Excel_Informe(hojas)) == leer_Libro(exportar_Excel_Informe(hojas, 'xlsxwriter'))
+
+def test_xlsxwriter_escribe_en_un_miembro_del_zip():
+    hojas = crear_Hojas_Prueba()
+    buffer_Zip = io.BytesIO()
+
+    with ArchivoZipInforme(buffer_Zip) as archivo_Zip:
+        with archivo_Zip.abrir_Miembro('excel_Circuitor.xlsx') as miembro:
+            assert exportar_Excel_Informe(hojas, 'xlsxwriter', miembro) is None
+
+    with zipfile.ZipFile(io.BytesIO(buffer_Zip.getvalue())) as archivo_Zip:
+        contenido = archivo_Zip.read('excel_Circuitor.xlsx')
+
+    assert leer_Libro(contenido) == leer_Libro(exportar_Excel_Informe(hojas, 'openpyxl'))
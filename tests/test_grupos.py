@@ -0,0 +1,72 @@
+import warnings
+import numpy as np
+import pytest
+from informe_Circuitor.grupos import calcular_Estadisticas_Grupos, codificar_Grupos
+
+def crear_Valores_Prueba(registros: int = 500, columnas: int = 3, semilla: int = 7) -> tuple:
+    """
+    Crea valores aleatorios con NaN, una columna sin ningún valor en un grupo y etiquetas con registros excluidos (negativas).
+    """
+    generador = np.random.default_rng(semilla)
+
+    valores = generador.normal(100, 20, size=(registros, columnas))
+    valores[generador.random((registros, columnas)) < 0.1] = np.nan
+
+    etiquetas = generador.integers(-2, 6, size=registros)
+    valores[etiquetas == 3, -1] = np.nan
+
+    return valores, etiquetas
+
+def calcular_Estadisticas_Referencia(valores: np.ndarray, etiquetas: np.ndarray, cantidad_Grupos: int, percentil: float) -> dict:
+    """
+    Calcula las estadísticas de cada grupo y columna con 'np.nanpercentile' / 'np.nanmean', un grupo a la vez.
+    """
+    funciones: dict = {'Percentil': lambda datos: np.nanpercentile(datos, percentil, axis=0), 'Media': lambda datos: np.nanmean(datos, axis=0), 'Min': lambda datos: np.nanmin(datos, axis=0), 'Max': lambda datos: np.nanmax(datos, axis=0)}
+    referencia: dict = {estadistico: np.full((cantidad_Grupos, valores.shape[1]), np.nan) for estadistico in funciones}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        for grupo in range(cantidad_Grupos):
+            datos_Grupo = valores[etiquetas == grupo]
+            if len(datos_Grupo):
+                for estadistico, funcion in funciones.items():
+                    referencia[estadistico][grupo] = funcion(datos_Grupo)
+
+    return referencia
+
+@pytest.mark.parametrize('percentil', [95, 50, 0, 100])
+def test_estadisticas_coinciden_con_nanpercentile_y_nanmean(percentil):
+    valores, etiquetas = crear_Valores_Prueba()
+
+    # El grupo 6 no tiene registros y el grupo 3 no tiene valores en la última columna
+    estadisticas = calcular_Estadisticas_Grupos(valores, etiquetas, 7, percentil)
+    referencia = calcular_Estadisticas_Referencia(valores, etiquetas, 7, percentil)
+
+    for estadistico, esperado in referencia.items():
+        np.testing.assert_allclose(estadisticas[estadistico], esperado, rtol=1e-12, equal_nan=True)
+
+    assert np.isnan(estadisticas['Media'][6]).all()
+    assert np.isnan(estadisticas['Percentil'][3, -1])
+    np.testing.assert_array_equal(estadisticas['registros'], [[np.count_nonzero((etiquetas == grupo) & ~np.isnan(valores[:, columna])) for columna in range(valores.shape[1])] for grupo in range(7)])
+
+def test_serie_de_una_columna_y_cantidad_de_grupos_por_defecto():
+    valores, etiquetas = crear_Valores_Prueba(columnas=1)
+
+    estadisticas = calcular_Estadisticas_Grupos(valores[:, 0], etiquetas)
+    referencia = calcular_Estadisticas_Referencia(valores, etiquetas, 6, 95)
+
+    assert estadisticas['Percentil'].shape == (6, 1)
+    np.testing.assert_allclose(estadisticas['Percentil'], referencia['Percentil'], rtol=1e-12, equal_nan=True)
+
+def test_sin_registros_en_ningun_grupo():
+    estadisticas = calcular_Estadisticas_Grupos(np.array([1.0, 2.0]), np.array([-1, -1]), 2)
+
+    assert np.isnan(estadisticas['Percentil']).all()
+    assert not estadisticas['registros'].any()
+
+def test_codificar_grupos_ordena_las_claves():
+    grupos, etiquetas = codificar_Grupos(np.array(['b', 'a', 'b', 'c']))
+
+    assert grupos.tolist() == ['a', 'b', 'c']
+    assert etiquetas.tolist() == [1, 0, 1, 2]
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from informe_Circuitor.intervalos import calcular_Intervalos, combinar_Intervalos
+
+def crear_Mascara_Intervalos(inicios: np.ndarray, finales: np.ndarray, registros: int) -> np.ndarray:
+    """
+    Vuelve a armar la máscara densa de una serie a partir de sus intervalos (final exclusivo).
+    """
+    mascara = np.zeros(registros, dtype=bool)
+    for inicio, final in zip(inicios, finales):
+        mascara[inicio:final] = True
+
+    return mascara
+
+def crear_Mascaras_Prueba(series: int = 3, registros: int = 200, semilla: int = 3) -> np.ndarray:
+    """
+    Crea máscaras de violación con rachas de distinta longitud, incluidas rachas en el primer y el último registro.
+    """
+    generador = np.random.default_rng(semilla)
+
+    mascaras = np.repeat(generador.random((series, registros // 5)) < 0.5, 5, axis=1)
+    mascaras[:, 0] = True
+    mascaras[:, -1] = True
+
+    return mascaras
+
+def test_intervalos_reconstruyen_las_mascaras():
+    mascaras = crear_Mascaras_Prueba()
+
+    filas, inicios, finales = calcular_Intervalos(mascaras)
+
+    for fila, mascara in enumerate(mascaras):
+        np.testing.assert_array_equal(crear_Mascara_Intervalos(inicios[filas == fila], finales[filas == fila], mascaras.shape[1]), mascara)
+
+    # Las rachas del borde no se unen con las de la serie siguiente
+    assert inicios[filas == 1][0] == 0
+    assert finales[filas == 0][-1] == mascaras.shape[1]
+
+@pytest.mark.parametrize('minimo, combinar', [(1, np.any), (3, np.all), (2, lambda mascaras, axis: mascaras.sum(axis) >= 2)])
+def test_combinar_coincide_con_la_mascara_densa(minimo, combinar):
+    mascaras = crear_Mascaras_Prueba()
+
+    filas, inicios, finales = calcular_Intervalos(mascaras)
+    inicios_Combinados, finales_Combinados = combinar_Intervalos([(inicios[filas == fila], finales[filas == fila]) for fila in range(len(mascaras))], minimo)
+
+    np.testing.assert_array_equal(crear_Mascara_Intervalos(inicios_Combinados, finales_Combinados, mascaras.shape[1]), combinar(mascaras, axis=0))
+
+    # Los intervalos combinados están ordenados y no se tocan (los contiguos quedan unidos)
+    assert (inicios_Combinados[1:] > finales_Combinados[:-1]).all()
+
+def test_serie_sin_violaciones_y_serie_vacia():
+    filas, inicios, finales = calcular_Intervalos(np.zeros((2, 10), dtype=bool))
+    assert len(filas) == len(inicios) == len(finales) == 0
+
+    filas, inicios, finales = calcular_Intervalos(np.zeros((2, 0), dtype=bool))
+    assert len(filas) == 0
+
+    filas, inicios, finales = calcular_Intervalos(np.ones(4, dtype=bool))
+    assert filas.tolist() == [0] and inicios.tolist() == [0] and finales.tolist() == [4]
+
+def test_combinar_sin_intervalos():
+    inicios, finales = combinar_Intervalos([])
+    assert len(inicios) == len(finales) == 0
+
+    inicios, finales = combinar_Intervalos([(np.array([0]), np.array([5])), (np.zeros(0), np.zeros(0))], 2)
+    assert len(inicios) == len(finales) == 0
+
+def test_intervalos_contiguos_de_conjuntos_distintos_se_unen():
+    inicios, finales = combinar_Intervalos([(np.array([0]), np.array([5])), (np.array([5]), np.array([9]))], 1)
+
+    assert inicios.tolist() == [0]
+    assert finales.tolist() == [9]
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from informe_Circuitor.cumplimiento import REGLAS_CUMPLIMIENTO, crear_Matriz_Resumen, evaluar_Reglas_Cumplimiento
+from informe_Circuitor.ventanas import asignar_Ventanas, crear_Matriz_Resumen_Ventanas, crear_Tabla_Cumplimiento_Ventanas
+
+REGLAS_PRUEBA: dict = {'thdv': REGLAS_CUMPLIMIENTO['thdv']}
+
+COLUMNAS_THDV: list = list(REGLAS_CUMPLIMIENTO['thdv']['columnas'].values())
+
+def crear_Registros_Prueba() -> tuple:
+    """
+    Crea una medición horaria que empieza un miércoles a mediodía y termina el martes siguiente (dos semanas
+    calendario), con el THDv fuera del límite solo el sábado.
+    """
+    fechas = pd.Series(pd.date_range('2024-01-03 12:00', '2024-01-09 11:00', freq='h'))
+
+    thdv = np.where(fechas.dt.dayofweek.to_numpy() == 5, 8.0, 2.0)
+    df_THDV = pd.DataFrame({columna: thdv for columna in COLUMNAS_THDV})
+
+    return fechas, df_THDV
+
+def test_semanas_empiezan_el_lunes():
+    dias = np.arange('2024-01-01', '2024-01-15', dtype='datetime64[D]')
+
+    inicios = asignar_Ventanas(dias, 'semana')
+
+    assert (pd.DatetimeIndex(inicios).dayofweek == 0).all()
+    assert inicios[:7].tolist() == [np.datetime64('2024-01-01')] * 7
+    assert inicios[7:].tolist() == [np.datetime64('2024-01-08')] * 7
+    assert (asignar_Ventanas(dias, 'dia') == dias).all()
+
+def test_ventana_no_valida():
+    with pytest.raises(ValueError):
+        asignar_Ventanas(np.arange('2024-01-01', '2024-01-02', dtype='datetime64[D]'), 'mes')
+
+def test_tabla_de_cumplimiento_por_dia_y_semana():
+    fechas, df_THDV = crear_Registros_Prueba()
+    limites = {'limite_THDV': 5}
+
+    matriz_Ventanas, registros_Ventanas = crear_Matriz_Resumen_Ventanas({'df_Tabla_Calculos_DistTension': df_THDV}, fechas)
+    tabla_Cumplimiento_Ventanas, _ = evaluar_Reglas_Cumplimiento(matriz_Ventanas, limites, REGLAS_PRUEBA)
+
+    df_Medidas_THDV = pd.DataFrame([df_THDV.quantile(0.95), df_THDV.mean(), df_THDV.min(), df_THDV.max()], index=['Percentil', 'Media', 'Min', 'Max'])
+    tabla_Cumplimiento_Total, _ = evaluar_Reglas_Cumplimiento(crear_Matriz_Resumen({'df_Tabla_Calculos_DistTension': df_Medidas_THDV}), limites, REGLAS_PRUEBA)
+
+    df_Cumplimiento = crear_Tabla_Cumplimiento_Ventanas(tabla_Cumplimiento_Ventanas, registros_Ventanas, REGLAS_PRUEBA, tabla_Cumplimiento_Total)
+    titulo = REGLAS_PRUEBA['thdv']['titulo']
+
+    df_Dias = df_Cumplimiento[df_Cumplimiento['Ventana'] == "Día"]
+    assert df_Dias['Inicio'].tolist() == [f"{dia:02d}/01/2024" for dia in range(3, 10)]
+    assert df_Dias['Registros'].tolist() == [12, 24, 24, 24, 24, 24, 12]
+    assert df_Dias.loc[df_Dias['Inicio'] == "06/01/2024", titulo].tolist() == ["NO CUMPLE"]
+    assert (df_Dias.loc[df_Dias['Inicio'] != "06/01/2024", titulo] == "CUMPLE").all()
+
+    # Las semanas van de lunes a domingo aunque la medición empiece y termine a mitad de semana
+    df_Semanas = df_Cumplimiento[df_Cumplimiento['Ventana'] == "Semana"]
+    assert df_Semanas[['Inicio', 'Fin', 'Registros']].values.tolist() == [["01/01/2024", "07/01/2024", 108], ["08/01/2024", "14/01/2024", 36]]
+    assert df_Semanas[titulo].tolist() == ["NO CUMPLE", "CUMPLE"]
+
+    # La fila de la medición completa va al final, con el primer y el último día medidos y todos los registros
+    fila_Total = df_Cumplimiento.iloc[-1]
+    assert fila_Total['Ventana'] == "Medición completa"
+    assert (fila_Total['Inicio'], fila_Total['Fin'], fila_Total['Registros']) == ("03/01/2024", "09/01/2024", len(fechas))
+    assert fila_Total[titulo] == "NO CUMPLE"